@@ -0,0 +1,61 @@
+'''
+Builds the model of every lattice with the recording stand-in of the Abaqus API (utilities/abaqus_standin) and
+prints the build time per lattice and the time spent in every API call.
+
+The stand-in only stores what the calls create, so the times show the cost of the scripts themselves (geometry,
+selection, equations), not the one of CAE.
+
+    python benchmarks/bench_build.py
+    python benchmarks/bench_build.py --tiling 10 10 --boundary periodic
+'''
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities import abaqus_standin
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--edge', type=float, default=20.0)
+    parser.add_argument('--tiling', type=int, nargs=2, default=[1, 1])
+    parser.add_argument('--boundary', choices=['classic', 'periodic'], default='classic')
+    parser.add_argument('--loadcase', default='shear')
+    parser.add_argument('--axis', default='x')
+    arguments = parser.parse_args()
+
+    # main.py creates its caches in the working directory on import
+    directory = tempfile.mkdtemp(prefix='bench_build_')
+    os.chdir(directory)
+    try:
+        abaqus_standin.install()
+        import main
+        from utilities.lattices import CATALOG
+        from utilities.runspec import complete_run
+
+        main.interactive = False
+        print('%-9s %10s %10s %12s' % ('structure', 'vertices', 'nodes', 'build [ms]'))
+        for structure in sorted(CATALOG):
+            run = complete_run({'structure': structure, 'edge': arguments.edge, 'tiling': arguments.tiling,
+                                'boundary': arguments.boundary, 'loadcase': arguments.loadcase,
+                                'axis': arguments.axis})
+            main.new_start()
+            start = time.time()
+            main.build_model(run)
+            elapsed = time.time() - start
+            part = main.mdb.models['Model-1'].parts['Part-1']
+            print('%-9s %10d %10d %12.1f' % (structure, len(part.vertices), len(part.nodes), 1000.0 * elapsed))
+        print('')
+        print(abaqus_standin.RECORDER.report())
+    finally:
+        os.chdir(os.path.dirname(directory))
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
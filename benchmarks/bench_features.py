@@ -0,0 +1,181 @@
+'''
+Compares the boundary conditions of the former create-and-suppress macro with the ones of the load case table
+(utilities/loadcases.py) for every combination of structure, load case and axis.
+
+Both variants are built with the recording stand-in of the Abaqus API (utilities/abaqus_standin) on the same model
+and the input file of each is written. Reported are the API calls and the build time of the boundary conditions and
+the size of the input file. The macro is imitated here: it created one set per boundary vertex and every load, BC
+and Equation() of all load cases of the structure, and then suppressed what the load case did not need. Suppressed
+features are not written to the input file, the vertex sets are. The loads, BCs and constraints left active have to
+be the same in both variants, otherwise the results would not be comparable; the last column checks that.
+
+    python benchmarks/bench_features.py
+    python benchmarks/bench_features.py --tiling 10 10
+'''
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities import abaqus_standin
+
+
+# The boundary conditions of the former macro: everything of every load case, the unused features suppressed
+def create_and_suppress(main, structure, edge, force, loadcase, axis, tiling, model_name='Model-1'):
+    from abaqusConstants import OFF, UNIFORM, UNSET
+    from utilities.lattices import TOLERANCE, boundary_vertices
+    from utilities.loadcases import FEATURES, ROLE_SIDES, available_features, role_points
+    from utilities.selection import PartSelection
+
+    m = main.mdb.models[model_name]
+    p = m.parts['Part-1']
+    sides = boundary_vertices(structure, edge, tiling)
+    select = PartSelection(p, TOLERANCE * edge)
+    # The macro created one set per boundary vertex and one per region of a load or BC
+    for side, points in sides.items():
+        letter = [key for key, value in ROLE_SIDES.items() if value == side][0]
+        for number in range(1, len(points) + 1):
+            p.Set(vertices=select.vertices(role_points(sides, letter + str(number))), name=letter + str(number))
+    cases = [available_features(structure, key[1], key[2], sides) for key in sorted(FEATURES) if key[0] == structure]
+    for features in cases:
+        for name, roles, direction, sign in features['loads']:
+            points = [point for role in roles for point in role_points(sides, role)]
+            p.Set(vertices=select.vertices(points), name='-'.join(roles))
+        for name, roles, dofs in features['fixed']:
+            points = [point for role in roles for point in role_points(sides, role)]
+            p.Set(vertices=select.vertices(points), name='-'.join(roles))
+    m.rootAssembly.regenerate()
+    sets = m.rootAssembly.instances['Part-1-1'].sets
+
+    for features in cases:
+        for name, roles, direction, sign in features['loads']:
+            if name not in m.loads:
+                m.ConcentratedForce(name=name, createStepName='Step-1', region=sets['-'.join(roles)],
+                                    distributionType=UNIFORM, field='', localCsys=None,
+                                    **{'cf' + str(direction): sign * float(force)})
+        for name, roles, dofs in features['fixed']:
+            if name not in m.boundaryConditions:
+                m.DisplacementBC(name=name, createStepName='Step-1', region=sets['-'.join(roles)], u1=0.0, u2=0.0,
+                                 ur3=0.0, amplitude=UNSET, fixed=OFF, distributionType=UNIFORM, fieldName='',
+                                 localCsys=None)
+        for name, (dependent, first, second), dof in features['equations']:
+            if name not in m.constraints:
+                m.Equation(name=name, terms=((1.0, 'Part-1-1.' + dependent, dof), (-1.0, 'Part-1-1.' + first, dof),
+                                             (-1.0, 'Part-1-1.' + second, dof)))
+
+    # The macro then suppressed what the load case did not need and changed the DOFs of the BCs it kept
+    needed = available_features(structure, loadcase, axis, sides)
+    for name in set(m.loads.keys()) - set(load[0] for load in needed['loads']):
+        m.loads[name].suppress()
+    for name in set(m.boundaryConditions.keys()) - set(condition[0] for condition in needed['fixed']):
+        m.boundaryConditions[name].suppress()
+    for name, roles, dofs in needed['fixed']:
+        m.boundaryConditions[name].setValues(**dict((component, 0.0 if dof in dofs else UNSET)
+                                                    for dof, component in ((1, 'u1'), (2, 'u2'), (6, 'ur3'))))
+    for name in set(m.constraints.keys()) - set(equation[0] for equation in needed['equations']):
+        m.constraints[name].suppress()
+
+
+# The boundary conditions of main.py: only the features of the load case
+def create_needed(main, structure, edge, force, loadcase, axis, tiling, model_name='Model-1'):
+    main.create_boundary_conditions(structure, edge, force, loadcase, axis, tiling, model_name)
+    main.create_periodic_equations(structure, edge, loadcase, axis, tiling, model_name)
+
+
+'''
+Builds the model of a run up to its step, applies the boundary conditions with create and writes the input file.
+Returns the API calls and the fastest time [s] of the boundary conditions, the size [bytes] and lines of the
+input file and the options of every load, BC and constraint which is not suppressed.
+'''
+def measure(main, run, create, repeat):
+    best = None
+    for _ in range(repeat):
+        main.new_start()
+        main.build_template(run, 'Model-1')
+        main.create_material(run['model'], run['young_modulus'], run['poisson_rate'], run['c10'], run['c01'],
+                             run['d1'])
+        main.create_cross_section(run['section'], run['width'], run['width_2'], run['height'], run['radius'],
+                                  run['d'], run['thickness'], run['thickness_2'], run['thickness_3'], run['i'])
+        main.create_step(run['model'])
+
+        calls, start = len(abaqus_standin.RECORDER.calls), time.time()
+        create(main, run['structure'], run['edge'], run['force'], run['loadcase'], run['axis'], run['tiling'])
+        elapsed = time.time() - start
+        calls = len(abaqus_standin.RECORDER.calls) - calls
+        best = elapsed if best is None else min(best, elapsed)
+
+    job_name = main.create_job(main.workdir, 'Model-1')
+    main.mdb.jobs[job_name].writeInput(consistencyChecking=main.OFF)
+    path = os.path.join(main.workdir, job_name + '.inp')
+    with open(path) as deck:
+        lines = sum(1 for line in deck)
+    del main.mdb.jobs[job_name]
+    abaqus_standin.RECORDER.clear()
+    m = main.mdb.models['Model-1']
+    features = dict((name, feature.options) for repository in (m.loads, m.boundaryConditions, m.constraints)
+                    for name, feature in repository.items() if not feature.suppressed)
+    return {'calls': calls, 'build': best, 'size': os.path.getsize(path), 'lines': lines, 'features': features}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--edge', type=float, default=20.0)
+    parser.add_argument('--tiling', type=int, nargs=2, default=[1, 1])
+    parser.add_argument('--repeat', type=int, default=3, help='builds per variant, the fastest counts')
+    arguments = parser.parse_args()
+
+    # main.py creates its caches and the jobs in the working directory
+    directory = tempfile.mkdtemp(prefix='bench_features_')
+    os.chdir(directory)
+    try:
+        abaqus_standin.install()
+        import main as pipeline
+        from utilities.lattices import CATALOG
+        from utilities.runspec import AXES, LOADCASES, complete_run
+
+        pipeline.interactive = False
+        CASES = [(loadcase, axis) for loadcase in LOADCASES for axis in AXES]
+        keys = ('calls', 'build', 'size', 'lines')
+        formats = {'calls': '%d', 'build': '%.1f', 'size': '%.1f', 'lines': '%d'}
+        scales = {'calls': 1.0, 'build': 1000.0, 'size': 1.0 / 1024.0, 'lines': 1.0}
+        totals = {'macro': dict.fromkeys(keys, 0), 'table': dict.fromkeys(keys, 0)}
+        different = 0
+
+        def cells(before, after):
+            return tuple((formats[key] + ' -> ' + formats[key]) % (scales[key] * before[key], scales[key] * after[key])
+                         for key in keys)
+
+        print('%-9s %-12s %16s %18s %18s %18s %9s' % ('structure', 'load case', 'calls', 'build [ms]', 'deck [kB]',
+                                                       'deck lines', 'features'))
+        for structure in sorted(CATALOG):
+            for loadcase, axis in CASES:
+                run = complete_run({'structure': structure, 'edge': arguments.edge, 'tiling': arguments.tiling,
+                                    'loadcase': loadcase, 'axis': axis})
+                macro = measure(pipeline, run, create_and_suppress, max(arguments.repeat, 1))
+                table = measure(pipeline, run, create_needed, max(arguments.repeat, 1))
+                for key in keys:
+                    totals['macro'][key] += macro[key]
+                    totals['table'][key] += table[key]
+                # Both variants have to apply the very same loads, BCs and constraints
+                same = macro['features'] == table['features']
+                different += not same
+                print('%-9s %-12s %16s %18s %18s %18s %9s' % ((structure, loadcase + ' ' + axis) +
+                                                              cells(macro, table) + ('same' if same else 'DIFFERENT',)))
+
+        print('%-22s %16s %18s %18s %18s' % (('all %d' % (len(CATALOG) * len(CASES)),) +
+                                             cells(totals['macro'], totals['table'])))
+        print('%-22s %16s %18s %18s %18s' % (('reduction',) + tuple(
+            '%.0f %%' % (100.0 - 100.0 * totals['table'][key] / totals['macro'][key]) for key in keys)))
+        if different:
+            print('%d load cases apply other features than the macro' % different)
+    finally:
+        os.chdir(os.path.dirname(directory))
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+'''
+Benchmark of the node merging in utilities/spatialhash.py.
+
+Tiles the SHD lattice (the unit cell with the most vertices) to samples of up to about 10^6 nodes and merges the
+translated copies of all unit cell vertices, as utilities/tilings.supercell does. Every point gets a random
+perturbation far below the tolerance to imitate floating point noise, and the number of merged nodes is checked
+against the exact count. The time per point should stay constant with the sample size.
+
+    python benchmarks/bench_merge.py
+    python benchmarks/bench_merge.py --structure g --tilings 10 100 400
+'''
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities import tilings
+from utilities.spatialhash import merge_points
+
+
+def candidate_points(structure, edge, n):
+    vertices, edges, vectors = tilings.unit_cell(structure, edge)
+    grid = np.array([(i, j) for j in range(n) for i in range(n)], dtype=float)
+    points = (vertices[None, :, :] + np.dot(grid, vectors)[:, None, :]).reshape(-1, 2)
+    return points, vertices, vectors
+
+
+# Nodes of an n x n sample: every cell vertex once, plus the cut points on the outer border which have no partner
+def expected_nodes(vertices, vectors, n, tolerance):
+    fractions = np.linalg.solve(vectors.T, vertices.T).T
+    on_first = np.abs(fractions[:, 0]) < tolerance
+    on_second = np.abs(fractions[:, 1]) < tolerance
+    border = (np.abs(fractions - np.round(fractions)) < tolerance).any(axis=1)
+    interior = np.count_nonzero(~border)
+    return n * n * interior + (n * n + n) * np.count_nonzero(on_first) + (n * n + n) * np.count_nonzero(on_second)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--structure', default='k')
+    parser.add_argument('--edge', type=float, default=20.0)
+    parser.add_argument('--tilings', type=int, nargs='+', default=[10, 30, 100, 200])
+    parser.add_argument('--repeat', type=int, default=3)
+    arguments = parser.parse_args()
+
+    tolerance = tilings.TOLERANCE * arguments.edge
+    random = np.random.RandomState(0)
+    print('%8s %12s %12s %10s %12s' % ('tiling', 'points', 'nodes', 'time [s]', 'us / point'))
+    for n in arguments.tilings:
+        points, vertices, vectors = candidate_points(arguments.structure, arguments.edge, n)
+        points += random.uniform(-0.05, 0.05, points.shape) * tolerance
+
+        timings = []
+        for _ in range(arguments.repeat):
+            start = time.time()
+            merged, remap = merge_points(points, tolerance)
+            timings.append(time.time() - start)
+
+        expected = expected_nodes(vertices, vectors, n, tilings.TOLERANCE)
+        if len(merged) != expected or remap.max() != len(merged) - 1:
+            raise RuntimeError('%d x %d: %d nodes merged instead of %d' % (n, n, len(merged), expected))
+        best = min(timings)
+        print('%8s %12d %12d %10.3f %12.3f' % ('%dx%d' % (n, n), len(points), len(merged), best,
+                                                1e6 * best / len(points)))
+
+
+if __name__ == '__main__':
+    main()
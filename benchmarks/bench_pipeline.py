@@ -0,0 +1,177 @@
+'''
+Benchmark of the whole build pipeline: every structure 'a' to 'k', both material models and all four load cases, on
+the unit cell and on a supercell. Every model is built with main.build_model and written as input file; with
+--solve it is also solved.
+
+Reported per model are the build time, the size of the input file, the number of equations and the solver time,
+and in the end the throughput (models built per second). The results are compared with the stored baseline of the
+backend (benchmarks/baselines/pipeline-<backend>.json): models whose input file or equations changed or whose build
+got more than --tolerance slower are marked, and the exit status is 1 if the throughput dropped by more than
+--tolerance. Single models jitter too much to fail on. --update-baseline stores the results as new baseline instead.
+
+Outside CAE the recording stand-in of the API is used (utilities/abaqus_standin), inside CAE the real one:
+    python benchmarks/bench_pipeline.py [--tilings 1x1 4x4] [--boundary periodic]
+    abaqus cae noGUI=benchmarks/bench_pipeline.py -- --solve
+The build times of the stand-in measure the scripts alone, the ones of CAE include the kernel. Baselines are only
+comparable on the same machine.
+'''
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+try:
+    import abaqus
+    BACKEND = 'cae'
+except ImportError:
+    from utilities import abaqus_standin
+    abaqus_standin.install()
+    BACKEND = 'standin'
+
+from utilities.runspec import AXES, LOADCASES, MODELS, STRUCTURES, complete_run
+from utilities.timing import collect_stages
+
+
+# Size of the input file and number of equations, i.e. data lines holding only the number of terms
+def deck_statistics(path):
+    lines = equations = 0
+    in_equation = False
+    with open(path) as deck:
+        for line in deck:
+            lines += 1
+            if line.startswith('*') and not line.startswith('**'):
+                in_equation = line.lower().startswith('*equation')
+            elif in_equation and line.strip().isdigit():
+                equations += 1
+    return os.path.getsize(path), lines, equations
+
+
+# The fastest of repeat builds counts, single builds jitter by far more than the tolerance
+def benchmark(main, run, solve, repeat):
+    build = None
+    for _ in range(repeat):
+        main.new_start()
+        collect_stages()
+        start = time.time()
+        main.build_model(run)
+        elapsed = time.time() - start
+        if build is None or elapsed < build:
+            build, stages = elapsed, collect_stages()
+
+    job_name = main.create_job(main.workdir, 'Model-1')
+    main.mdb.jobs[job_name].writeInput(consistencyChecking=main.OFF)
+    size, lines, equations = deck_statistics(os.path.join(main.workdir, job_name + '.inp'))
+    result = {'build_ms': 1000.0 * build, 'deck_kb': size / 1024.0, 'deck_lines': lines, 'equations': equations,
+              'solve_s': None, 'slowest_stage': max(stages, key=lambda stage: stage['wall'])['stage']}
+    if solve:
+        start = time.time()
+        main.mdb.jobs[job_name].submit(consistencyChecking=main.OFF)
+        main.mdb.jobs[job_name].waitForCompletion()
+        state = main.job_outcome(main.workdir, job_name)
+        result['solve_s'] = time.time() - start if state == 'completed' else None
+    del main.mdb.jobs[job_name]
+    return result
+
+
+# Notes on the changes against the baseline
+def compare(key, result, baseline, tolerance):
+    if key not in baseline:
+        return ['new']
+    notes = []
+    base = baseline[key]
+    for name in ('deck_lines', 'equations'):
+        if result[name] != base[name]:
+            notes.append('%s %d -> %d' % (name, base[name], result[name]))
+    # Builds of a few milliseconds still jitter by more than the tolerance
+    if result['build_ms'] > base['build_ms'] * (1.0 + tolerance) and result['build_ms'] - base['build_ms'] > 2.0:
+        notes.append('build %.1f -> %.1f ms' % (base['build_ms'], result['build_ms']))
+    return notes
+
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--edge', type=float, default=20.0)
+    parser.add_argument('--tilings', nargs='+', default=['1x1', '4x4'], help='cells as NxM, e.g. 1x1 4x4')
+    parser.add_argument('--boundary', choices=['classic', 'periodic'], default='classic')
+    parser.add_argument('--structures', nargs='+', default=STRUCTURES, choices=STRUCTURES)
+    parser.add_argument('--repeat', type=int, default=3, help='builds per model, the fastest counts')
+    parser.add_argument('--solve', action='store_true', help='also solve every model')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown, 0.25 = 25 %%')
+    parser.add_argument('--baseline', default=os.path.join(ROOT, 'benchmarks', 'baselines',
+                                                           'pipeline-' + BACKEND + '.json'))
+    parser.add_argument('--update-baseline', action='store_true')
+    # Inside CAE the arguments of the script follow '--'
+    return parser.parse_args(argv[argv.index('--') + 1:] if '--' in argv else argv[1:])
+
+
+def main(argv):
+    arguments = parse_arguments(argv)
+    tilings = [tuple(int(number) for number in tiling.lower().split('x')) for tiling in arguments.tilings]
+    baseline = {}
+    if os.path.exists(arguments.baseline):
+        with open(arguments.baseline) as source:
+            baseline = json.load(source)['results']
+
+    # main.py creates its caches and the jobs in the working directory, the stand-in solver should not wait
+    os.environ.setdefault('LATTICE_STANDIN_SECONDS', '0')
+    directory = tempfile.mkdtemp(prefix='bench_pipeline_')
+    start_directory = os.getcwd()
+    os.chdir(directory)
+    results = {}
+    try:
+        import main as pipeline
+        pipeline.interactive = False
+        print('%-40s %9s %9s %9s %9s  %s' % ('model', 'build[ms]', 'deck[kB]', 'equations', 'solve[s]', 'changes'))
+        start = time.time()
+        for tiling in tilings:
+            for structure in arguments.structures:
+                for model in MODELS:
+                    for loadcase in LOADCASES:
+                        for axis in AXES:
+                            key = '%s %s %s-%s %dx%d' % (structure, model, loadcase, axis, tiling[0], tiling[1])
+                            run = complete_run({'structure': structure, 'edge': arguments.edge, 'model': model,
+                                                'loadcase': loadcase, 'axis': axis, 'tiling': list(tiling),
+                                                'boundary': arguments.boundary})
+                            result = results[key] = benchmark(pipeline, run, arguments.solve,
+                                                              max(arguments.repeat, 1))
+                            notes = compare(key, result, baseline, arguments.tolerance)
+                            print('%-40s %9.1f %9.1f %9d %9s  %s' % (
+                                key, result['build_ms'], result['deck_kb'], result['equations'],
+                                '-' if result['solve_s'] is None else '%.2f' % result['solve_s'], ', '.join(notes)))
+        elapsed = time.time() - start
+    finally:
+        os.chdir(start_directory)
+        shutil.rmtree(directory)
+
+    build_seconds = sum(result['build_ms'] for result in results.values()) / 1000.0
+    throughput = len(results) / build_seconds if build_seconds else 0.0
+    line = '%d models in %.1f s, %.1f models built per second' % (len(results), elapsed, throughput)
+    slower = False
+    if 'throughput' in baseline.get('_total', {}):
+        base = baseline['_total']['throughput']
+        line += ' (baseline %.1f)' % base
+        if throughput < base / (1.0 + arguments.tolerance):
+            line += ', SLOWER'
+            slower = True
+    print(line)
+
+    if arguments.update_baseline:
+        results['_total'] = {'throughput': throughput}
+        if not os.path.isdir(os.path.dirname(arguments.baseline)):
+            os.makedirs(os.path.dirname(arguments.baseline))
+        with open(arguments.baseline, 'w') as target:
+            json.dump({'backend': BACKEND, 'results': results}, target, indent=1, sort_keys=True)
+            target.write('\n')
+        print('Baseline written to ' + arguments.baseline)
+        return 0
+    return 1 if slower else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -19,10 +19,61 @@ import xyPlot
 import displayGroupOdbToolset as dgo
 import connectorBehavior
 
-import time
+import itertools
+import multiprocessing
 import os
+import shutil
 import sys
 workdir = os.getcwd()
+sys.path.append(workdir)
+
+from utilities.geometrycache import GeometryCache
+from utilities.jobnames import allocate_job_name
+from utilities.jobwatch import wait_for_job, wait_for_release
+from utilities.kernelserver import kernel_port, serve
+from utilities.lattices import CATALOG, TOLERANCE, boundary_vertices, cell_arrays, unit_cell, use_geometry_cache
+from utilities.loadcases import available_features, required_features, role_points
+from utilities.manifest import SweepManifest, has_results, run_key
+from utilities.parallel import command_options, solver_settings
+from utilities.periodic import equation_block, loadcase_stress, macro_equation_block, reference_conditions
+from utilities.resultcache import ResultCache, input_key
+from utilities.runspec import complete_run, load_run_specs, spec_file_from_argv
+from utilities.scheduler import ScheduledJob, Scheduler, report
+from utilities.selection import PartSelection
+from utilities.timing import summary_table, timed, write_run
+from utilities.workqueue import Heartbeat, WorkQueue, worker_name
+
+# The lattice geometry of every (structure, edge, tiling) is only generated once and then loaded from this folder
+use_geometry_cache(GeometryCache(os.environ.get('LATTICE_GEOMETRY_CACHE', os.path.join(workdir, 'geometry_cache'))))
+
+# The ODB of every solved input file is kept in this folder, an identical input file is not solved again.
+# LATTICE_FORCE_RERUN=1 solves every job anyway (and stores the new result).
+result_cache = ResultCache(os.environ.get('LATTICE_RESULT_CACHE', os.path.join(workdir, 'result_cache')))
+force_rerun = os.environ.get('LATTICE_FORCE_RERUN', '0') == '1'
+
+# Seconds to wait for the log file of a job whose status CAE does not know after waitForCompletion
+job_timeout = float(os.environ.get('LATTICE_JOB_TIMEOUT', '300'))
+
+# Wall time, CPU time, peak memory and API calls of every @timed stage, one JSON line per run (utilities/timing.py)
+timings_file = os.environ.get('LATTICE_TIMINGS', os.path.join(workdir, 'timings.jsonl'))
+
+# In batch mode (abaqus cae noGUI=main.py -- runs.json) nobody looks at the viewport. All viewport calls are then
+# routed to a dummy object, so that the model build is not slowed down by redrawing the viewport.
+interactive = True
+
+
+class NullViewport(object):
+    def __getattr__(self, name):
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+
+def viewport():
+    if interactive:
+        return session.viewports['Viewport: 1']
+    return NullViewport()
 
 
 '''
@@ -88,25 +139,280 @@ def main():
     #   - Loads
     #   - Boundary Conditions (fixed and movable bearings)
     #   - Periodic Boundary Conditions (Equations)
-    create_boundary_conditions(structure, force, loadcase, axis)
+    create_boundary_conditions(structure, edge, force, loadcase, axis)
+    create_periodic_equations(structure, edge, loadcase, axis)
 
     # Run the prepared analysis and display the result
-    run_analysis(workdir)
+    job_name = run_analysis(workdir)
+    write_run(timings_file, {'job': job_name, 'structure': structure})
+
+'''
+The batch mode replaces every user input of main() with the values of a run specification file (see
+utilities/runspec.py). All runs of the file are built and analysed one after another without any dialog:
+    abaqus cae noGUI=main.py -- runs.json
+
+Runs on the same lattice (structure, edge and tiling) share one template model holding the part, the mesh and the
+sets. Every run gets a copy of its template and only adds material, section, step, loads and equations, so the
+geometry and the mesh are created once per lattice instead of once per job.
+Setting the environment variable LATTICE_REUSE_MODELS=0 builds every run from scratch instead.
+
+The state of every run is kept in the manifest <spec>.manifest.sqlite next to the spec file (utilities/manifest.py).
+Running the same spec file again after a crash skips the runs which are done and repeats only the others. A run
+whose build or analysis fails is marked failed and the batch goes on with the next one. Several sessions may run the
+same spec file at once, every run is claimed in the manifest before it is built and is run by one of them.
+'''
+def run_batch(spec_file):
+    global interactive
+    interactive = False
+
+    # Read and check all runs first, so that a typo in the last run does not stop the batch after hours
+    runs = load_run_specs(spec_file)
+    manifest = SweepManifest(os.environ.get('LATTICE_MANIFEST', os.path.splitext(spec_file)[0] + '.manifest.sqlite'))
+    try:
+        # The session keeps its runs while it beats, the runs of a crashed session are taken back by the next one
+        with Heartbeat(manifest, manifest.owner):
+            sweep(runs, spec_file, manifest)
+    finally:
+        manifest.close()
+
+
+# Builds and analyses the runs of a spec file which the manifest does not know as done
+def sweep(runs, spec_file, manifest):
+    manifest.recover(workdir)
+    keys = manifest.register(runs)
+    # A run given more than once has one key and is run once
+    unique = set(keys)
+    if len(unique) < len(keys):
+        print(str(len(keys) - len(unique)) + ' runs are repeated in ' + spec_file + ' and are run once')
+    todo = set(manifest.incomplete(unique))
+    if len(todo) < len(unique):
+        print(str(len(unique) - len(todo)) + ' of ' + str(len(unique)) + ' runs are done already and are skipped')
+    concurrent_jobs = len(todo)
+
+    # With LATTICE_CORES set, only the input files are written here and the scheduler (utilities/scheduler.py) runs
+    # as many of them at once as the cores, the memory and the license tokens allow
+    scheduled = [] if os.environ.get('LATTICE_CORES') else None
+    submitted = {}
+    reuse = os.environ.get('LATTICE_REUSE_MODELS', '1') != '0'
+    if reuse:
+        new_start()
+    templates = {}
+    timings = []
+    taken = 0
+    for number, (run, key) in enumerate(zip(runs, keys), 1):
+        if key not in todo:
+            continue
+        todo.discard(key)
+        # Another session working on the same sweep may have taken the run in the meantime
+        if not manifest.claim(key):
+            taken += 1
+            continue
+        model_name = None
+        try:
+            model_name = prepare_run(run, number, templates, reuse)
+            manifest.mark(key, 'built')
+
+            # The job is recorded before it is solved, so that the next session finds its results after a crash
+            job_name = allocate_job_name(str(workdir))
+            manifest.mark(key, 'submitted', job=job_name, odb=os.path.join(workdir, job_name + '.odb'))
+            analyse(workdir, model_name, scheduled, concurrent_jobs, job_name)
+        except Exception as error:
+            # As in run_worker and run_server, a failed run does not stop the sweep
+            print('Run ' + str(number) + ' failed: ' + repr(error))
+            manifest.mark(key, 'failed')
+            if reuse and model_name is not None:
+                delete_model(model_name)
+            continue
+        if scheduled and scheduled[-1].name == job_name:
+            submitted[job_name] = key
+        else:
+            manifest.mark(key, 'done' if has_results(workdir, job_name) else 'failed', job=job_name,
+                          odb=os.path.join(workdir, job_name + '.odb'))
+        timings.append(write_run(timings_file, {'number': number, 'key': key, 'job': job_name}))
+
+        if reuse:
+            # The results are in the odb (or the input file is written), the copy is not needed any more
+            delete_model(model_name)
+    if taken:
+        print(str(taken) + ' runs are taken by another session and are skipped')
+
+    if scheduled:
+        Scheduler(workdir).run(scheduled)
+        print(report(scheduled))
+        for job in scheduled:
+            odb_path = os.path.join(workdir, job.name + '.odb')
+            if job.state == 'completed':
+                result_cache.put(input_key(job.input_file), odb_path)
+            manifest.mark(submitted[job.name], 'done' if job.state == 'completed' else 'failed', odb=odb_path)
+    print('Runs by state: ' + ', '.join(state + ' ' + str(count) for state, count in manifest.summary()))
+    if timings:
+        print(summary_table(timings))
+
+
+'''
+Builds the model of a run and returns its name. With reuse, the model is a copy of the template of its lattice,
+which is built first if it is not in templates yet, otherwise the run is built from scratch as Model-1.
+'''
+def prepare_run(run, number, templates, reuse=True):
+    if not reuse:
+        new_start()
+        build_model(run)
+        return 'Model-1'
+
+    lattice = (run['structure'], run['edge'], run['tiling'])
+    if lattice not in templates:
+        template_name = 'Template-' + str(len(templates) + 1)
+        mdb.Model(name=template_name)
+        try:
+            build_template(run, template_name)
+        except Exception:
+            # A half-built template must not be copied by the next runs on the lattice
+            del mdb.models[template_name]
+            raise
+        templates[lattice] = template_name
+
+    model_name = 'Run-' + str(number)
+    mdb.Model(name=model_name, objectToCopy=mdb.models[templates[lattice]])
+    try:
+        build_variant(run, model_name)
+    except Exception:
+        delete_model(model_name)
+        raise
+    return model_name
+
+
+# Deletes a model together with its jobs
+def delete_model(model_name):
+    for job_name in [name for name, job in mdb.jobs.items() if job.model == model_name]:
+        del mdb.jobs[job_name]
+    del mdb.models[model_name]
+
+
+'''
+Worker of a sweep shared by several workstations (utilities/workqueue.py), started on every workstation with
+    LATTICE_QUEUE=/shared/queue abaqus cae noGUI=main.py
+It claims runs from the queue until it is empty, builds and solves them in the working directory and copies the ODB
+to the results folder of the queue.
+'''
+def run_worker(queue_directory):
+    global interactive
+    interactive = False
+
+    queue = WorkQueue(queue_directory)
+    results = os.path.join(queue_directory, 'results')
+    if not os.path.isdir(results):
+        try:
+            os.makedirs(results)
+        except OSError:
+            if not os.path.isdir(results):
+                raise
+    new_start()
+    templates = {}
+    numbers = itertools.count(1)
+
+    # The runs come as JSON, complete_run turns the lists back into the tuples of a run specification
+    def process(run):
+        result = solve_run(complete_run(run), next(numbers), templates)
+        if result['state'] == 'done':
+            result['odb'] = os.path.join(results, run_key(run) + '.odb')
+            shutil.copyfile(os.path.join(workdir, result['job'] + '.odb'), result['odb'])
+        return result
+
+    print(str(queue.work(worker_name(), process)) + ' runs processed')
+
+
+'''
+Kernel serving runs over a local socket (utilities/kernelserver.py), started once with
+    LATTICE_KERNEL_PORT=47001 abaqus cae noGUI=main.py
+and fed with "python utilities/kernelserver.py submit runs.json". The templates are kept between the requests.
+'''
+def run_server(port):
+    global interactive
+    interactive = False
+
+    new_start()
+    templates = {}
+    numbers = itertools.count(1)
+    print(str(serve(lambda run: solve_run(run, next(numbers), templates), port)) + ' runs served')
+
+
+# Builds and solves a run on a copy of its template, returns {'state': 'done' or 'failed', 'job': ..., 'odb': ...}
+def solve_run(run, number, templates):
+    model_name = prepare_run(run, number, templates)
+    try:
+        job_name = run_analysis(workdir, model_name)
+    finally:
+        # Also after a failed analysis, the worker or the server goes on with the next run
+        delete_model(model_name)
+    write_run(timings_file, {'number': number, 'key': run_key(run), 'job': job_name})
+    return {'state': 'done' if has_results(workdir, job_name) else 'failed', 'job': job_name,
+            'odb': os.path.join(workdir, job_name + '.odb')}
+
+
+'''
+Runs the job of a model right away, or writes its input file and adds it to the scheduled jobs. A job whose input
+file has been solved before is not scheduled, it gets the cached ODB.
+'''
+def analyse(workdir, model_name, scheduled=None, concurrent_jobs=1, job_name=None):
+    if scheduled is None:
+        return run_analysis(workdir, model_name, job_name=job_name)
+    settings = job_settings(model_name, concurrent_jobs)
+    job_name = create_job(workdir, model_name, settings, job_name)
+    mdb.jobs[job_name].writeInput(consistencyChecking=OFF)
+    if not force_rerun and result_cache.restore(input_key(os.path.join(workdir, job_name + '.inp')),
+                                                os.path.join(workdir, job_name + '.odb')):
+        print('The job ' + job_name + ' has been solved before, its ODB is taken from the result cache')
+        return job_name
+    scheduled.append(ScheduledJob(job_name, cpus=settings['cpus'], options=command_options(settings)))
+    return job_name
+
+
+# Calls the create_* functions with the values of one run specification
+def build_model(run, model_name='Model-1'):
+    build_template(run, model_name)
+    build_variant(run, model_name)
+
+
+# Everything which only depends on the lattice: part, boundary sets, mesh and instance
+def build_template(run, model_name):
+    create_structure(run['structure'], run['edge'], run['tiling'], model_name)
+    create_mesh(run['edge'], model_name)
+    create_assembly(model_name)
+
+
+# Everything which changes between the runs on the same lattice
+def build_variant(run, model_name):
+    create_material(run['model'], run['young_modulus'], run['poisson_rate'], run['c10'], run['c01'], run['d1'],
+                    model_name)
+    create_cross_section(run['section'], run['width'], run['width_2'], run['height'], run['radius'], run['d'],
+                         run['thickness'], run['thickness_2'], run['thickness_3'], run['i'], model_name)
+    if run['loadcases']:
+        create_load_cases(run['structure'], run['edge'], run['model'], run['force'], run['loadcases'], run['tiling'],
+                          model_name)
+        return
+
+    create_step(run['model'], model_name)
+    if run['boundary'] == 'periodic':
+        create_macro_strain_conditions(run['structure'], run['edge'], run['force'], run['loadcase'], run['axis'],
+                                       run['tiling'], run['strain'], run['stress'], model_name)
+    else:
+        create_boundary_conditions(run['structure'], run['edge'], run['force'], run['loadcase'], run['axis'],
+                                   run['tiling'], model_name)
+        create_periodic_equations(run['structure'], run['edge'], run['loadcase'], run['axis'], run['tiling'],
+                                  model_name)
 
 # Makro to delete everything and open a new file
 def new_start():
     Mdb()
-    session.viewports['Viewport: 1'].setValues(displayedObject=None)
+    viewport().setValues(displayedObject=None)
 
 # This function queries the user to choose between the 11 possible Structures and returns the chosen value.
 # Takes in the chosen structure from the user input and checks if it is one of the 11 possible structures.
 # If it is not, the user gets queried again
-# We have left the option for the "Mapple Leaf" in the selectable strucutures, but we did not include it.
-# We therefore added a repeat if the user chooses this structure
 def select_structure():
-    possible_structures = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'k']
+    possible_structures = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k']
     structure = str(getInput("Please choose one of the 11 Structures presented in the attached documentation."
-                             " [Choose from a to k] excluding 'j'", "g"))
+                             " [Choose from a to k]", "g"))
 
     if structure in possible_structures:
         pass
@@ -148,1148 +454,50 @@ def select_edge_length(structure):
     return edge_length
 
 '''
-Creation of the 10 available lattices using periodic smalles unit cells.
-Mapple leaf has once again been excluded as the RVE is too large.
+Creation of the 11 available lattices using periodic smallest unit cells.
+The vertices and edges of every unit cell are computed analytically (utilities/tilings.py). They are already at
+their final position, so the part is created directly from them as wires, without a sketch and its constraint
+solver: one WirePolyLine call for all edges, however large the lattice is.
+Mapple leaf is turned against the other lattices, as its smallest rectangular unit cell is only small when one of
+its axes follows the rows of hexagons.
+For size effect studies the unit cell can be repeated to a finite sample of n x m cells (tiling). The whole sample
+is still a single part.
 '''
-def create_structure(structure, edge):
-    # Create a bunch of if statements to create the corresponing structure.
-    # If the time permits, change this to a more sophisticated method of selection
-
-    # The created points get multiplied by the user-selected edge length to scale the lattice accordingly
-    # In a second run the Oblique Dimension Restrain gets scaled to the proper value as well.
-
-    # Square
-    if structure == 'a':
-        s1 = mdb.models['Model-1'].ConstrainedSketch(name='__profile__',
-                                                     sheetSize=edge * 2)
-        g, v, d, c = s1.geometry, s1.vertices, s1.dimensions, s1.constraints
-        s1.setPrimaryObject(option=STANDALONE)
-        s1.Spot(point=(0.0, edge * 0.5))
-        s1.Spot(point=(edge * 0.5, edge * 0.5))
-        s1.Spot(point=(edge * 0.5, edge * 0.0))
-        s1.Spot(point=(edge * 1.0, edge * 0.5))
-        s1.Spot(point=(edge * 0.5, edge * 1.0))
-        s1.Line(point1=(0.0, edge * 0.5), point2=(edge * 0.5, edge * 0.5))
-        s1.HorizontalConstraint(entity=g[2], addUndoState=False)
-        s1.Line(point1=(edge * 0.5, edge * 0.5), point2=(edge * 1.0, edge * 0.5))
-        s1.HorizontalConstraint(entity=g[3], addUndoState=False)
-        s1.ParallelConstraint(entity1=g[2], entity2=g[3], addUndoState=False)
-        s1.Line(point1=(edge * 0.5, edge * 1.0), point2=(edge * 0.5, edge * 0.5))
-        s1.VerticalConstraint(entity=g[4], addUndoState=False)
-        s1.Line(point1=(edge * 0.5, edge * 0.5), point2=(edge * 0.5, 0.0))
-        s1.VerticalConstraint(entity=g[5], addUndoState=False)
-        s1.ParallelConstraint(entity1=g[4], entity2=g[5], addUndoState=False)
-        p = mdb.models['Model-1'].Part(name='Part-1', dimensionality=TWO_D_PLANAR,
-                                       type=DEFORMABLE_BODY)
-        p = mdb.models['Model-1'].parts['Part-1']
-        p.BaseWire(sketch=s1)
-        s1.unsetPrimaryObject()
-        p = mdb.models['Model-1'].parts['Part-1']
-        del mdb.models['Model-1'].sketches['__profile__']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p)
-
-    # Honeycomb
-    if structure == 'b':
-        session.viewports['Viewport: 1'].setValues(displayedObject=None)
-        s = mdb.models['Model-1'].ConstrainedSketch(name='__profile__',
-                                                    sheetSize=200.0)
-        g, v, d, c = s.geometry, s.vertices, s.dimensions, s.constraints
-        s.setPrimaryObject(option=STANDALONE)
-        s.Spot(point=(edge * 20.0, edge * 10.0))
-        s.Spot(point=(edge * 20.0, edge * 12.5))
-        s.Line(point1=(edge * 20.0, edge * 10.0), point2=(edge * 20.0, edge * 12.5))
-        s.VerticalConstraint(entity=g[2], addUndoState=False)
-        s.ObliqueDimension(vertex1=v[2], vertex2=v[3], textPoint=(edge * 19.0659027099609,
-                                                                  edge * 11.248706817627), value=edge * 0.5)
-        s.Spot(point=(edge * 19.6390190124512, edge * 12.7782030105591))
-        s.Line(point1=(edge * 20.0, edge * 12.5), point2=(edge * 19.6390190124512, edge * 12.7782030105591))
-        s.AngularDimension(line1=g[3], line2=g[2], textPoint=(edge * 19.9206638336182,
-                                                              edge * 12.3458127975464), value=120.0)
-        s.ObliqueDimension(vertex1=v[5], vertex2=v[6], textPoint=(edge * 19.6173553466797,
-                                                                  edge * 12.3458127975464), value=edge)
-        s.Spot(point=(edge * 19.3032131195068, edge * 13.7943201065063))
-        s.Line(point1=(edge * 19.1339745962156, edge * 13.0), point2=(edge * 19.3032131195068,
-                                                                      edge * 13.7943201065063))
-        s.AngularDimension(line1=g[4], line2=g[3], textPoint=(edge * 19.3790397644043,
-                                                              edge * 13.0592565536499), value=120.0)
-        s.ObliqueDimension(vertex1=v[8], vertex2=v[9], textPoint=(edge * 18.7940864562988,
-                                                                  edge * 13.3727397918701), value=edge)
-        s.Spot(point=(edge * 20.0, edge * 15.0))
-        s.Line(point1=(edge * 19.1339745962156, edge * 14.0), point2=(edge * 20.0, edge * 15.0))
-        s.AngularDimension(line1=g[4], line2=g[5], textPoint=(edge * 19.3248767852783,
-                                                              edge * 13.9888954162598), value=120.0)
-        s.ObliqueDimension(vertex1=v[11], vertex2=v[12], textPoint=(edge * 19.5631923675537,
-                                                                    edge * 14.5942420959473), value=edge)
-        s.Spot(point=(edge * 20.0, edge * 15.0))
-        s.Line(point1=(edge * 20.0, edge * 14.5), point2=(edge * 20.0, edge * 15.0))
-        s.VerticalConstraint(entity=g[6], addUndoState=False)
-        s.ObliqueDimension(vertex1=v[14], vertex2=v[15], textPoint=(edge * 19.6173553466797,
-                                                                    edge * 14.7131490707397), value=edge * 0.5)
-        s.Spot(point=(edge * 20.7222671508789, edge * 13.9888954162598))
-        s.Line(point1=(edge * 20.0, edge * 14.5), point2=(edge * 20.7222671508789, edge * 13.9888954162598))
-        s.AngularDimension(line1=g[5], line2=g[7], textPoint=(edge * 19.9748268127441,
-                                                              edge * 14.3239974975586), value=120.0)
-        s.ObliqueDimension(vertex1=v[17], vertex2=v[18], textPoint=(edge * 20.5381145477295,
-                                                                    edge * 14.5834321975708), value=edge)
-        s.Spot(point=(edge * 20.689769744873, edge * 12.8863000869751))
-        s.Line(point1=(edge * 20.0, edge * 12.5), point2=(edge * 20.689769744873, edge * 12.8863000869751))
-        s.AngularDimension(line1=g[3], line2=g[8], textPoint=(edge * 20.0506534576416,
-                                                              edge * 12.6809148788452), value=120.0)
-        s.ObliqueDimension(vertex1=v[20], vertex2=v[21], textPoint=(edge * 20.5814437866211,
-                                                                    edge * 12.4430999755859), value=edge)
-        p = mdb.models['Model-1'].Part(name='Part-1', dimensionality=TWO_D_PLANAR,
-                                       type=DEFORMABLE_BODY)
-        p = mdb.models['Model-1'].parts['Part-1']
-        p.BaseWire(sketch=s)
-        s.unsetPrimaryObject()
-        p = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p)
-        del mdb.models['Model-1'].sketches['__profile__']
-
-    # Triangular
-    if structure == 'c':
-        s = mdb.models['Model-1'].ConstrainedSketch(name='__profile__',
-                                                    sheetSize=200.0)
-        g, v, d, c = s.geometry, s.vertices, s.dimensions, s.constraints
-        s.setPrimaryObject(option=STANDALONE)
-        s.Spot(point=(10.0, 0.0))
-        s.Spot(point=(0.0, 15.0))
-        s.Spot(point=(20.0, 15.0))
-        s.Spot(point=(10.0, 30.0))
-        s.Spot(point=(0.0, 30.0))
-        s.Spot(point=(20.0, 30.0))
-        s.Line(point1=(0.0, 30.0), point2=(10.0, 30.0))
-        s.HorizontalConstraint(entity=g[2], addUndoState=False)
-        s.Line(point1=(10.0, 30.0), point2=(20.0, 15.0))
-        s.Line(point1=(20.0, 15.0), point2=(10.0, 0.0))
-        s.Line(point1=(10.0, 0.0), point2=(0.0, 15.0))
-        s.Line(point1=(0.0, 15.0), point2=(10.0, 30.0))
-        s.Line(point1=(10.0, 30.0), point2=(20.0, 30.0))
-        s.HorizontalConstraint(entity=g[7], addUndoState=False)
-        s.Line(point1=(0.0, 15.0), point2=(20.0, 15.0))
-        s.HorizontalConstraint(entity=g[8], addUndoState=False)
-        s.ParallelConstraint(entity1=g[7], entity2=g[8])
-        s.ParallelConstraint(entity1=g[8], entity2=g[2], addUndoState=False)
-        s.ParallelConstraint(entity1=g[5], entity2=g[3])
-        s.ParallelConstraint(entity1=g[6], entity2=g[4])
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=181.281,
-                                                        farPlane=195.843, width=80.3786, height=33.8403,
-                                                        cameraPosition=(
-                                                            5.95156, 5.88341, 188.562),
-                                                        cameraTarget=(5.95156, 5.88341, 0))
-        s.AngularDimension(line1=g[5], line2=g[4], textPoint=(10.8604125976563,
-                                                              10.0025482177734), value=60.0)
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=181.281,
-                                                        farPlane=195.843, width=90.9672, height=38.2982,
-                                                        cameraPosition=(
-                                                            5.23814, 5.22391, 188.562),
-                                                        cameraTarget=(5.23814, 5.22391, 0))
-        s.AngularDimension(line1=g[5], line2=g[8], textPoint=(6.06251096725464,
-                                                              11.0331859588623), value=60.0)
-        s.ObliqueDimension(vertex1=v[18], vertex2=v[19], textPoint=(12.1556587219238,
-                                                                    9.52707672119141), value=edge)
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=187.424,
-                                                        farPlane=189.7, width=12.5596, height=5.28773, cameraPosition=(
-                0.238087, 15.0835, 188.562), cameraTarget=(0.238087, 15.0835, 0))
-        s.ObliqueDimension(vertex1=v[6], vertex2=v[7], textPoint=(-0.598231256008148,
-                                                                  16.3410797119141), value=0.5*edge)
-        s.ObliqueDimension(vertex1=v[16], vertex2=v[17], textPoint=(0.361802160739899,
-                                                                    16.420295715332), value=0.5*edge)
-        p = mdb.models['Model-1'].Part(name='Part-1', dimensionality=TWO_D_PLANAR,
-                                       type=DEFORMABLE_BODY)
-        p = mdb.models['Model-1'].parts['Part-1']
-        p.BaseWire(sketch=s)
-        s.unsetPrimaryObject()
-        p = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p)
-        del mdb.models['Model-1'].sketches['__profile__']
-
-    # CaVo
-    if structure == 'd':
-        s = mdb.models['Model-1'].ConstrainedSketch(name='__profile__',
-                                                    sheetSize=200.0)
-        g, v, d, c = s.geometry, s.vertices, s.dimensions, s.constraints
-        s.setPrimaryObject(option=STANDALONE)
-        s.Spot(point=(30.0, 25.0))
-        s.Spot(point=(30.0, 20.0))
-        s.Spot(point=(35.0, 15.0))
-        s.Spot(point=(25.0, 15.0))
-        s.Spot(point=(30.0, 10.0))
-        s.Spot(point=(40.0, 15.0))
-        s.Spot(point=(30.0, 5.0))
-        s.Spot(point=(20.0, 15.0))
-        s.Line(point1=(30.0, 25.0), point2=(30.0, 20.0))
-        s.VerticalConstraint(entity=g[2], addUndoState=False)
-        s.Line(point1=(30.0, 20.0), point2=(35.0, 15.0))
-        s.Line(point1=(35.0, 15.0), point2=(30.0, 10.0))
-        s.PerpendicularConstraint(entity1=g[3], entity2=g[4], addUndoState=False)
-        s.Line(point1=(30.0, 10.0), point2=(25.0, 15.0))
-        s.PerpendicularConstraint(entity1=g[4], entity2=g[5], addUndoState=False)
-        s.Line(point1=(25.0, 15.0), point2=(30.0, 20.0))
-        s.PerpendicularConstraint(entity1=g[5], entity2=g[6], addUndoState=False)
-        s.Line(point1=(20.0, 15.0), point2=(25.0, 15.0))
-        s.HorizontalConstraint(entity=g[7], addUndoState=False)
-        s.Line(point1=(40.0, 15.0), point2=(35.0, 15.0))
-        s.HorizontalConstraint(entity=g[8], addUndoState=False)
-        s.Line(point1=(30.0, 10.0), point2=(30.0, 5.0))
-        s.VerticalConstraint(entity=g[9], addUndoState=False)
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=179.294,
-                                                        farPlane=197.829, width=60.805, height=31.3156,
-                                                        cameraPosition=(23.733,
-                                                                        12.253, 188.562),
-                                                        cameraTarget=(23.733, 12.253, 0))
-        s.ObliqueDimension(vertex1=v[14], vertex2=v[15], textPoint=(25.1149806976318,
-                                                                    10.4430112838745), value=edge)
-        s.ObliqueDimension(vertex1=v[12], vertex2=v[13], textPoint=(35.5946273803711,
-                                                                    10.5579309463501), value=edge)
-        s.ObliqueDimension(vertex1=v[20], vertex2=v[21], textPoint=(33.9247970581055,
-                                                                    12.9137811660767), value=0.5*edge)
-        s.ObliqueDimension(vertex1=v[8], vertex2=v[9], textPoint=(27.8212642669678,
-                                                                  14.2928152084351), value=0.5*edge)
-        s.ObliqueDimension(vertex1=v[18], vertex2=v[19], textPoint=(25.1725616455078,
-                                                                    8.20208168029785), value=0.5*edge)
-        s.ObliqueDimension(vertex1=v[22], vertex2=v[23], textPoint=(31.7367343902588,
-                                                                    7.22526550292969), value=0.5*edge)
-        p = mdb.models['Model-1'].Part(name='Part-1', dimensionality=TWO_D_PLANAR,
-                                       type=DEFORMABLE_BODY)
-        p = mdb.models['Model-1'].parts['Part-1']
-        p.BaseWire(sketch=s)
-        s.unsetPrimaryObject()
-        p = mdb.models['Model-1'].parts['Part-1']
-        del mdb.models['Model-1'].sketches['__profile__']
-        p = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p)
-
-    # Star
-    if structure == 'e':
-        s = mdb.models['Model-1'].ConstrainedSketch(name='__profile__',
-                                                    sheetSize=200.0)
-        g, v, d, c = s.geometry, s.vertices, s.dimensions, s.constraints
-        s.setPrimaryObject(option=STANDALONE)
-        s.Spot(point=(edge * 40.0, edge * 20.0))
-        s.Spot(point=(edge * 42.5, edge * 20.0))
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=184.898,
-                                                        farPlane=192.225, width=24.0357, height=12.3788,
-                                                        cameraPosition=(
-                                                            40.8794, 21.5074, 188.562),
-                                                        cameraTarget=(40.8794, 21.5074, 0))
-        s.Line(point1=(edge * 40.0, edge * 20.0), point2=(edge * 42.5, edge * 20.0))
-        s.HorizontalConstraint(entity=g[2], addUndoState=False)
-        s.ObliqueDimension(vertex1=v[2], vertex2=v[3], textPoint=(edge * 41.2890586853027,
-                                                                  edge * 20.7465476989746), value=edge)
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=186.818,
-                                                        farPlane=190.305, width=11.4391, height=5.89132,
-                                                        cameraPosition=(
-                                                            41.8348, 20.251, 188.562),
-                                                        cameraTarget=(41.8348, 20.251, 0))
-        s.Spot(point=(edge * 41.997257232666, edge * 19.2619190216064))
-        s.Line(point1=(edge * 41.5, edge * 20.0), point2=(edge * 41.997257232666, edge * 19.2619190216064))
-        s.Line(point1=(edge * 42.5, edge * 20.0), point2=(edge * 41.997257232666, edge * 19.2619190216064))
-        s.AngularDimension(line1=g[2], line2=g[3], textPoint=(edge * 41.661449432373,
-                                                              edge * 19.8564548492432), value=60.0)
-        s.AngularDimension(line1=g[2], line2=g[4], textPoint=(edge * 42.3113975524902,
-                                                              edge * 19.8564548492432), value=60.0)
-        s.Spot(point=(edge * 42.0839157104492, edge * 18.3538990020752))
-        s.Line(point1=(edge * 42.0, edge * 19.1339745962156), point2=(edge * 42.0839157104492,
-                                                                      edge * 18.3538990020752))
-        s.AngularDimension(line1=g[4], line2=g[5], textPoint=(edge * 42.1489105224609,
-                                                              edge * 19.0457229614258), value=150.0)
-        s.ObliqueDimension(vertex1=v[10], vertex2=v[11], textPoint=(edge * 41.7806091308594,
-                                                                    edge * 18.7862892150879), value=edge * 0.5)
-        s.Spot(point=(edge * 43.0913352966309, edge * 20.2780361175537))
-        s.Line(point1=(edge * 42.5, edge * 20.0), point2=(edge * 43.0913352966309, edge * 20.2780361175537))
-        s.AngularDimension(line1=g[4], line2=g[6], textPoint=(edge * 42.603874206543,
-                                                              edge * 19.921314239502), value=150.0)
-        s.ObliqueDimension(vertex1=v[13], vertex2=v[14], textPoint=(edge * 42.9396820068359,
-                                                                    edge * 19.8888835906982), value=edge)
-        s.Spot(point=(edge * 43.9362678527832, edge * 21.0671463012695))
-        s.Line(point1=(edge * 43.3660254037844, edge * 20.5), point2=(edge * 43.9362678527832,
-                                                                      edge * 21.0671463012695))
-        s.AngularDimension(line1=g[6], line2=g[7], textPoint=(edge * 43.2754898071289,
-                                                              edge * 20.6347579956055), value=150.0)
-        s.ObliqueDimension(vertex1=v[16], vertex2=v[17], textPoint=(edge * 43.849609375,
-                                                                    edge * 20.6563758850098), value=edge)
-        s.Spot(point=(edge * 40.8490142822266, edge * 20.3428936004639))
-        s.Line(point1=(edge * 41.5, edge * 20.0), point2=(edge * 40.8490142822266, edge * 20.3428936004639))
-        s.AngularDimension(line1=g[2], line2=g[8], textPoint=(edge * 41.1848220825195,
-                                                              edge * 20.083459854126), value=30.0)
-        s.ObliqueDimension(vertex1=v[19], vertex2=v[20], textPoint=(edge * 41.0548324584961,
-                                                                    edge * 19.9105033874512), value=edge)
-        s.Spot(point=(edge * 40.1990661621094, edge * 21.1536254882813))
-        s.Line(point1=(edge * 40.6339745962156, edge * 20.5), point2=(edge * 40.1990661621094,
-                                                                      edge * 21.1536254882813))
-        s.AngularDimension(line1=g[8], line2=g[9], textPoint=(edge * 40.3182258605957,
-                                                              edge * 20.7860946655273), value=30.0)
-        s.ObliqueDimension(vertex1=v[22], vertex2=v[23], textPoint=(edge * 40.144905090332,
-                                                                    edge * 20.7104244232178), value=edge)
-        s.Spot(point=(edge * 40.0582466125488, edge * 20.429370880127))
-        s.Line(point1=(edge * 40.6339745962156, edge * 20.5), point2=(edge * 40.0582466125488,
-                                                                      edge * 20.429370880127))
-        s.AngularDimension(line1=g[10], line2=g[9], textPoint=(edge * 40.2098999023438,
-                                                               edge * 20.6888065338135), value=60.0)
-        s.ObliqueDimension(vertex1=v[25], vertex2=v[26], textPoint=(edge * 40.3182258605957,
-                                                                    edge * 20.2347965240479), value=edge * 0.5)
-        s.Spot(point=(edge * 40.144905090332, edge * 22.0832633972168))
-        s.Line(point1=(edge * 40.1339745962156, edge * 21.3660254037844), point2=(edge * 40.144905090332,
-                                                                                  edge * 22.0832633972168))
-        s.AngularDimension(line1=g[9], line2=g[11], textPoint=(edge * 40.0474128723145,
-                                                               edge * 21.640064239502), value=30.0)
-        s.ObliqueDimension(vertex1=v[28], vertex2=v[29], textPoint=(edge * 39.8524284362793,
-                                                                    edge * 21.726541519165), value=edge)
-        s.Spot(point=(edge * 40.5565376281738, edge * 23.0453319549561))
-        s.Line(point1=(edge * 40.1339745962156, edge * 22.3660254037844), point2=(edge * 40.5565376281738,
-                                                                                  edge * 23.0453319549561))
-        s.AngularDimension(line1=g[11], line2=g[12], textPoint=(edge * 40.3073921203613,
-                                                                edge * 22.3426990509033), value=150.0)
-        s.ObliqueDimension(vertex1=v[31], vertex2=v[32], textPoint=(edge * 40.5998687744141,
-                                                                    edge * 22.5805130004883), value=edge)
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=187.282,
-                                                        farPlane=189.841, width=8.39519, height=4.32366,
-                                                        cameraPosition=(
-                                                            42.3066, 22.8246, 188.562),
-                                                        cameraTarget=(42.3066, 22.8246, 0))
-        s.Spot(point=(edge * 41.1935691833496, edge * 23.9472007751465))
-        s.Line(point1=(edge * 40.6339745962156, edge * 23.2320508075688), point2=(edge * 41.1935691833496,
-                                                                                  edge * 23.9472007751465))
-        s.AngularDimension(line1=g[12], line2=g[13], textPoint=(edge * 40.9391708374023,
-                                                                edge * 23.756799697876), value=30.0)
-        s.ObliqueDimension(vertex1=v[34], vertex2=v[35], textPoint=(edge * 41.1220207214355,
-                                                                    edge * 23.2332000732422), value=edge)
-        s.Spot(point=(edge * 42.401969909668, edge * 23.756799697876))
-        s.Line(point1=(edge * 41.5, edge * 23.7320508075688), point2=(edge * 42.401969909668,
-                                                                      edge * 23.756799697876))
-        s.AngularDimension(line1=g[13], line2=g[14], textPoint=(edge * 41.8136672973633,
-                                                                edge * 23.8202667236328), value=30.0)
-        s.ObliqueDimension(vertex1=v[37], vertex2=v[38], textPoint=(edge * 41.9249687194824,
-                                                                    edge * 23.5664005279541), value=edge)
-        s.Spot(point=(edge * 43.2764663696289, edge * 23.3601341247559))
-        s.Line(point1=(edge * 42.5, edge * 23.7320508075688), point2=(edge * 43.2764663696289,
-                                                                      edge * 23.3601341247559))
-        s.AngularDimension(line1=g[14], line2=g[15], textPoint=(edge * 42.8551177978516,
-                                                                edge * 23.661600112915), value=30.0)
-        s.ObliqueDimension(vertex1=v[40], vertex2=v[41], textPoint=(edge * 42.7517700195313,
-                                                                    edge * 23.3283996582031), value=edge)
-        s.Spot(point=(edge * 43.9045181274414, edge * 22.3922691345215))
-        s.Line(point1=(edge * 43.3660254037844, edge * 23.2320508075688), point2=(edge * 43.9045181274414,
-                                                                                  edge * 22.3922691345215))
-        s.AngularDimension(line1=g[15], line2=g[16], textPoint=(edge * 43.5865173339844,
-                                                                edge * 23.0190010070801), value=30.0)
-        s.ObliqueDimension(vertex1=v[43], vertex2=v[44], textPoint=(edge * 43.3639183044434,
-                                                                    edge * 22.6699352264404), value=edge)
-        s.Spot(point=(edge * 40.1839218139648, edge * 23.1935348510742))
-        s.Line(point1=(edge * 40.6339745962156, edge * 23.2320508075688), point2=(edge * 40.1839218139648,
-                                                                                  edge * 23.1935348510742))
-        s.AngularDimension(line1=g[17], line2=g[12], textPoint=(edge * 40.4621696472168,
-                                                                edge * 23.1380004882813), value=60.0)
-        s.ObliqueDimension(vertex1=v[46], vertex2=v[47], textPoint=(edge * 40.3667678833008,
-                                                                    edge * 23.4394664764404), value=edge * 0.5)
-        s.Spot(point=(edge * 43.8329658508301, edge * 23.2332000732422))
-        s.Line(point1=(edge * 43.3660254037844, edge * 23.2320508075688), point2=(edge * 43.8329658508301,
-                                                                                  edge * 23.2332000732422))
-        s.AngularDimension(line1=g[18], line2=g[16], textPoint=(edge * 43.6501159667969,
-                                                                edge * 23.0745334625244), value=60.0)
-        s.ObliqueDimension(vertex1=v[49], vertex2=v[50], textPoint=(edge * 43.6342163085938,
-                                                                    edge * 23.4394664764404), value=edge * 0.5)
-        s.Spot(point=(edge * 42.0203666687012, edge * 24.3597316741943))
-        s.Line(point1=(edge * 41.5, edge * 23.7320508075688), point2=(edge * 42.0203666687012,
-                                                                      edge * 24.3597316741943))
-        s.AngularDimension(line1=g[19], line2=g[14], textPoint=(edge * 41.7262191772461,
-                                                                edge * 23.8519992828369), value=60.0)
-        s.Line(point1=(edge * 41.9076655308654, edge * 24.4381482195221), point2=(edge * 42.5,
-                                                                                  edge * 23.7320508075688))
-        s.AngularDimension(line1=g[20], line2=g[14], textPoint=(edge * 42.2986183166504,
-                                                                edge * 23.8281993865967), value=60.0)
-        s.Spot(point=(edge * 42.0203666687012, edge * 24.9309310913086))
-        s.Line(point1=(edge * 42.0203666687012, edge * 24.9309310913086), point2=(edge * 42.0,
-                                                                                  edge * 24.5980762113532))
-        s.AngularDimension(line1=g[21], line2=g[19], textPoint=(edge * 41.8454666137695,
-                                                                edge * 24.5501327514648), value=150.0)
-        s.ObliqueDimension(vertex1=v[57], vertex2=v[58], textPoint=(edge * 42.2588691711426,
-                                                                    edge * 24.7167320251465), value=edge * 0.5)
-        s.Spot(point=(edge * 44.0031471252441, edge * 20.6134433746338))
-        s.Line(point1=(edge * 43.3660254037844, edge * 20.5), point2=(edge * 44.0031471252441,
-                                                                      edge * 20.6134433746338))
-        s.AngularDimension(line1=g[22], line2=g[7], textPoint=(edge * 43.560359954834,
-                                                               edge * 20.6632308959961), value=60.0)
-        s.ObliqueDimension(vertex1=v[60], vertex2=v[61], textPoint=(edge * 43.6788520812988,
-                                                                    edge * 20.246265411377), value=edge * 0.5)
-        p = mdb.models['Model-1'].Part(name='Part-1', dimensionality=TWO_D_PLANAR,
-                                       type=DEFORMABLE_BODY)
-        p = mdb.models['Model-1'].parts['Part-1']
-        p.BaseWire(sketch=s)
-        s.unsetPrimaryObject()
-        p = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p)
-        del mdb.models['Model-1'].sketches['__profile__']
-
-    # SrCuBO
-    if structure == 'f':
-        s = mdb.models['Model-1'].ConstrainedSketch(name='__profile__',
-                                                    sheetSize=200.0)
-        g, v, d, c = s.geometry, s.vertices, s.dimensions, s.constraints
-        s.setPrimaryObject(option=STANDALONE)
-        s.Spot(point=(edge * 45.0, edge * 25.0))
-        s.Spot(point=(edge * 45.0, edge * 22.5))
-        s.Line(point1=(edge * 45.0, edge * 25.0), point2=(edge * 45.0, edge * 22.5))
-        s.VerticalConstraint(entity=g[2], addUndoState=False)
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=182.168,
-                                                        farPlane=194.955, width=41.9475, height=21.6037,
-                                                        cameraPosition=(
-                                                            45.2945, 22.9523, 188.562),
-                                                        cameraTarget=(45.2945, 22.9523, 0))
-        s.ObliqueDimension(vertex1=v[2], vertex2=v[3], textPoint=(edge * 44.0630722045898,
-                                                                  edge * 23.6856727600098), value=edge)
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=185.873,
-                                                        farPlane=191.25, width=17.6399, height=9.08484, cameraPosition=(
-                45.7044, 23.0366, 188.562), cameraTarget=(45.7044, 23.0366, 0))
-        s.Spot(point=(edge * 46.0886306762695, edge * 23.1282997131348))
-        s.Line(point1=(edge * 45.0, edge * 23.5), point2=(edge * 46.0886306762695, edge * 23.1282997131348))
-        s.AngularDimension(line1=g[2], line2=g[3], textPoint=(edge * 45.1865882873535,
-                                                              edge * 23.2283172607422), value=60.0)
-        s.ObliqueDimension(vertex1=v[5], vertex2=v[6], textPoint=(edge * 45.9215850830078,
-                                                                  edge * 23.5450344085693), value=edge)
-        s.Line(point1=(edge * 45.0, edge * 22.5), point2=(edge * 45.8660254037844, edge * 23.0))
-        s.Spot(point=(edge * 43.9504585266113, edge * 23.0449523925781))
-        s.Line(point1=(edge * 45.0, edge * 23.5), point2=(edge * 43.9504585266113, edge * 23.0449523925781))
-        s.AngularDimension(line1=g[5], line2=g[2], textPoint=(edge * 44.9193153381348,
-                                                              edge * 23.3616714477539), value=60.0)
-        s.ObliqueDimension(vertex1=v[10], vertex2=v[11], textPoint=(edge * 44.234432220459,
-                                                                    edge * 23.595043182373), value=edge)
-        s.Line(point1=(edge * 45.0, edge * 22.5), point2=(edge * 44.1339745962156, edge * 23.0))
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=186.818,
-                                                        farPlane=190.305, width=11.4391, height=5.89132,
-                                                        cameraPosition=(
-                                                            45.5038, 23.2199, 188.562),
-                                                        cameraTarget=(45.5038, 23.2199, 0))
-        s.Spot(point=(edge * 43.6297378540039, edge * 23.8955001831055))
-        s.Line(point1=(edge * 44.1339745962156, edge * 23.0), point2=(edge * 43.6297378540039,
-                                                                      edge * 23.8955001831055))
-        s.AngularDimension(line1=g[7], line2=g[5], textPoint=(edge * 44.1605262756348,
-                                                              edge * 23.23610496521), value=90.0)
-        s.ObliqueDimension(vertex1=v[15], vertex2=v[16], textPoint=(edge * 43.6189041137695,
-                                                                    edge * 23.3009643554688), value=edge)
-        s.Spot(point=(edge * 44.431339263916, edge * 24.0252170562744))
-        s.Line(point1=(edge * 43.6339745962156, edge * 23.8660254037844), point2=(edge * 44.431339263916,
-                                                                                  edge * 24.0252170562744))
-        s.AngularDimension(line1=g[8], line2=g[7], textPoint=(edge * 43.8355522155762,
-                                                              edge * 23.7657833099365), value=90.0)
-        s.Line(point1=(edge * 44.3381402703574, edge * 24.2725756453043), point2=(edge * 45.0, edge * 23.5))
-        s.AngularDimension(line1=g[8], line2=g[9], textPoint=(edge * 44.3338470458984,
-                                                              edge * 24.1116943359375), value=90.0)
-        s.Spot(point=(edge * 45.4712562561035, edge * 24.1225051879883))
-        s.Line(point1=(edge * 45.0, edge * 23.5), point2=(edge * 45.4712562561035, edge * 24.1225051879883))
-        s.AngularDimension(line1=g[10], line2=g[3], textPoint=(edge * 45.1896133422852,
-                                                               edge * 23.4955387115479), value=90.0)
-        s.ObliqueDimension(vertex1=v[23], vertex2=v[24], textPoint=(edge * 45.5037536621094,
-                                                                    edge * 23.7117347717285), value=edge)
-        s.Spot(point=(edge * 46.6303291320801, edge * 24.1981735229492))
-        s.Line(point1=(edge * 45.5, edge * 24.3660254037844), point2=(edge * 46.6303291320801,
-                                                                      edge * 24.1981735229492))
-        s.Line(point1=(edge * 46.6303291320801, edge * 24.1981735229492), point2=(edge * 45.8660254037844,
-                                                                                  edge * 23.0))
-        s.AngularDimension(line1=g[11], line2=g[12], textPoint=(edge * 46.3270225524902,
-                                                                edge * 24.0684566497803), value=90.0)
-        s.Spot(point=(edge * 46.4895095825195, edge * 22.4902324676514))
-        s.Line(point1=(edge * 45.8660254037844, edge * 23.0), point2=(edge * 46.4895095825195,
-                                                                      edge * 22.4902324676514))
-        s.AngularDimension(line1=g[4], line2=g[13], textPoint=(edge * 45.9153861999512,
-                                                               edge * 22.8469543457031), value=90.0)
-        s.ObliqueDimension(vertex1=v[31], vertex2=v[32], textPoint=(edge * 45.8178939819336,
-                                                                    edge * 22.4253730773926), value=edge)
-        s.Spot(point=(edge * 45.3087692260742, edge * 21.387638092041))
-        s.Line(point1=(edge * 46.3660254037844, edge * 22.1339745962156), point2=(edge * 45.3087692260742,
-                                                                                  edge * 21.387638092041))
-        s.Line(point1=(edge * 45.3087692260742, edge * 21.387638092041), point2=(edge * 45.0, edge * 22.5))
-        s.AngularDimension(line1=g[15], line2=g[14], textPoint=(edge * 45.4387588500977,
-                                                                edge * 21.6903095245361), value=90.0)
-        s.AngularDimension(line1=g[13], line2=g[14], textPoint=(edge * 46.1537017822266,
-                                                                edge * 22.1983680725098), value=90.0)
-        s.Spot(point=(edge * 44.431339263916, edge * 21.9173145294189))
-        s.Line(point1=(edge * 45.0, edge * 22.5), point2=(edge * 44.431339263916, edge * 21.9173145294189))
-        s.AngularDimension(line1=g[6], line2=g[16], textPoint=(edge * 44.7454795837402,
-                                                               edge * 22.3821353912354), value=90.0)
-        s.ObliqueDimension(vertex1=v[39], vertex2=v[40], textPoint=(edge * 44.5071678161621,
-                                                                    edge * 22.3497047424316), value=edge)
-        s.Spot(point=(edge * 43.2289352416992, edge * 22.1659393310547))
-        s.Line(point1=(edge * 44.5, edge * 21.6339745962156), point2=(edge * 43.2289352416992,
-                                                                      edge * 22.1659393310547))
-        s.Line(point1=(edge * 43.2289352416992, edge * 22.1659393310547), point2=(edge * 44.1339745962156,
-                                                                                  edge * 23.0))
-        s.AngularDimension(line1=g[18], line2=g[17], textPoint=(edge * 43.4455833435059,
-                                                                edge * 22.2091789245605), value=90.0)
-        s.AngularDimension(line1=g[17], line2=g[16], textPoint=(edge * 44.4205055236816,
-                                                                edge * 21.8740768432617), value=90.0)
-        s.Line(point1=(edge * 44.5, edge * 21.6339745962156), point2=(edge * 45.5, edge * 21.6339745962156))
-        s.HorizontalConstraint(entity=g[19], addUndoState=False)
-        s.delete(objectList=(d[14],))
-        s.Spot(point=(edge * 43.5105781555176, edge * 21.6362609863281))
-        s.Line(point1=(edge * 43.6339745962156, edge * 22.1339745962156), point2=(edge * 43.5105781555176,
-                                                                                  edge * 21.6362609863281))
-        s.AngularDimension(line1=g[20], line2=g[17], textPoint=(edge * 43.7705574035645,
-                                                                edge * 21.8632659912109), value=60.0)
-        s.ObliqueDimension(vertex1=v[49], vertex2=v[50], textPoint=(edge * 43.3805885314941,
-                                                                    edge * 21.8200283050537), value=edge * 0.5)
-        s.Spot(point=(edge * 43.6838989257813, edge * 24.317081451416))
-        s.Line(point1=(edge * 43.6339745962156, edge * 23.8660254037844), point2=(edge * 43.6838989257813,
-                                                                                  edge * 24.317081451416))
-        s.AngularDimension(line1=g[21], line2=g[8], textPoint=(edge * 43.8030548095703,
-                                                               edge * 24.1116943359375), value=60.0)
-        s.ObliqueDimension(vertex1=v[52], vertex2=v[53], textPoint=(edge * 43.3589248657227,
-                                                                    edge * 24.0576457977295), value=edge * 0.5)
-        s.Spot(point=(edge * 43.4997482299805, edge * 23.0199108123779))
-        s.Line(point1=(edge * 44.1339745962156, edge * 23.0), point2=(edge * 43.4997482299805,
-                                                                      edge * 23.0199108123779))
-        s.AngularDimension(line1=g[22], line2=g[18], textPoint=(edge * 43.8788833618164,
-                                                                edge * 22.814525604248), value=60.0)
-        s.ObliqueDimension(vertex1=v[55], vertex2=v[56], textPoint=(edge * 43.5539093017578,
-                                                                    edge * 23.3658218383789), value=edge * 0.5)
-        s.Spot(point=(edge * 46.4786758422852, edge * 22.998291015625))
-        s.Line(point1=(edge * 45.8660254037844, edge * 23.0), point2=(edge * 46.4786758422852,
-                                                                      edge * 22.998291015625))
-        s.AngularDimension(line1=g[23], line2=g[13], textPoint=(edge * 46.0887069702148,
-                                                                edge * 22.8793830871582), value=60.0)
-        s.ObliqueDimension(vertex1=v[58], vertex2=v[59], textPoint=(edge * 46.4245147705078,
-                                                                    edge * 23.268533706665), value=edge * 0.5)
-        p = mdb.models['Model-1'].Part(name='Part-1', dimensionality=TWO_D_PLANAR,
-                                       type=DEFORMABLE_BODY)
-        p = mdb.models['Model-1'].parts['Part-1']
-        p.BaseWire(sketch=s)
-        s.unsetPrimaryObject()
-        p = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p)
-        del mdb.models['Model-1'].sketches['__profile__']
-
-    # Kagome
-    if structure == 'g':
-        s = mdb.models['Model-1'].ConstrainedSketch(name='__profile__',
-                                                    sheetSize=200.0)
-        g, v, d, c = s.geometry, s.vertices, s.dimensions, s.constraints
-        s.setPrimaryObject(option=STANDALONE)
-        s.Spot(point=(edge*25.0, edge*10.0))
-        s.Spot(point=(edge*30.0, edge*10.0))
-        s.Line(point1=(edge*25.0, edge*10.0), point2=(edge*30.0, edge*10.0))
-        s.HorizontalConstraint(entity=g[2], addUndoState=False)
-        s.ObliqueDimension(vertex1=v[2], vertex2=v[3], textPoint=(edge*27.3458099365234,
-                                                                  edge*12.7896881103516), value=edge)
-        s.Spot(point=(edge*29.4940586090088, edge*9.61226367950439))
-        s.Line(point1=(edge*30.0, edge*10.0), point2=(edge*29.4940586090088, edge*9.61226367950439))
-        s.Line(point1=(edge*29.4940586090088, edge*9.61226367950439), point2=(edge*29.0, edge*10.0))
-        s.AngularDimension(line1=g[2], line2=g[4], textPoint=(edge*29.2078590393066,
-                                                              edge*9.89786338806152), value=60.0)
-        s.AngularDimension(line1=g[2], line2=g[3], textPoint=(edge*29.7405071258545,
-                                                              edge*9.92166328430176), value=60.0)
-        s.Spot(point=(edge*30.6468067169189, edge*9.90579605102539))
-        s.Line(point1=(edge*30.0, edge*10.0), point2=(edge*30.6468067169189, edge*9.90579605102539))
-        s.HorizontalConstraint(entity=g[5])
-        s.ObliqueDimension(vertex1=v[10], vertex2=v[11], textPoint=(edge*30.320858001709,
-                                                                    edge*9.78679656982422), value=0.5*edge)
-        s.Spot(point=(edge*28.3174591064453, edge*10.0961961746216))
-        s.Line(point1=(edge*28.3174591064453, edge*10.0961961746216), point2=(edge*29.0, edge*10.0))
-        s.HorizontalConstraint(entity=g[6])
-        s.ObliqueDimension(vertex1=v[13], vertex2=v[14], textPoint=(edge*28.6990585327148,
-                                                                    edge*9.79472923278809), value=0.5*edge)
-        s.Spot(point=(edge*30.3466510772705, edge*10.7745780944824))
-        s.Line(point1=(edge*30.0, edge*10.0), point2=(edge*30.3466510772705, edge*10.7745780944824))
-        s.AngularDimension(line1=g[7], line2=g[5], textPoint=(edge*30.1891174316406,
-                                                              edge*10.1050138473511), value=60.0)
-        s.ObliqueDimension(vertex1=v[16], vertex2=v[17], textPoint=(edge*30.066593170166,
-                                                                    edge*10.4892854690552), value=edge)
-        s.Spot(point=(edge*28.61962890625, edge*10.8793792724609))
-        s.Line(point1=(edge*29.0, edge*10.0), point2=(edge*28.61962890625, edge*10.8793792724609))
-        s.AngularDimension(line1=g[8], line2=g[6], textPoint=(edge*28.7946643829346,
-                                                              edge*10.128303527832), value=60.0)
-        s.ObliqueDimension(vertex1=v[19], vertex2=v[20], textPoint=(edge*28.5729522705078,
-                                                                    edge*10.3437280654907), value=edge)
-        s.Spot(point=(edge*28.9228687286377, edge*11.6237344741821))
-        s.Line(point1=(edge*28.5, edge*10.8660254037844), point2=(edge*28.9228687286377,
-                                                        edge*11.6237344741821))
-        s.AngularDimension(line1=g[9], line2=g[8], textPoint=(edge*28.6901092529297,
-                                                              edge*10.8283767700195), value=120.0)
-        s.ObliqueDimension(vertex1=v[22], vertex2=v[23], textPoint=(edge*28.5490417480469,
-                                                                    edge*11.3421926498413), value=edge)
-        s.Spot(point=(edge*30.2841663360596, edge*11.7222747802734))
-        s.Line(point1=(edge*30.5, edge*10.8660254037844), point2=(edge*30.2841663360596,
-                                                        edge*11.7222747802734))
-        s.AngularDimension(line1=g[7], line2=g[10], textPoint=(edge*30.3264865875244,
-                                                               edge*10.8776473999023), value=120.0)
-        s.ObliqueDimension(vertex1=v[25], vertex2=v[26], textPoint=(edge*30.0937252044678,
-                                                                    edge*11.1521511077881), value=edge)
-        s.Line(point1=(edge*29.0, edge*11.7320508075688), point2=(edge*30.0, edge*11.7320508075688))
-        s.HorizontalConstraint(entity=g[11], addUndoState=False)
-        s.delete(objectList=(d[12],))
-        s.Spot(point=(edge*28.5631484985352, edge*11.6026191711426))
-        s.Line(point1=(edge*29.0, edge*11.7320508075688), point2=(edge*28.5631484985352,
-                                                        edge*11.6026191711426))
-        s.HorizontalConstraint(entity=g[12])
-        s.ObliqueDimension(vertex1=v[30], vertex2=v[31], textPoint=(edge*28.7637672424316, edge*11.6482591629028), value=0.5*edge)
-        s.Spot(point=(edge*30.6245670318604, edge*11.6456441879272))
-        s.Line(point1=(edge*30.0, edge*11.7320508075688), point2=(edge*30.6245670318604,
-                                                        edge*11.6456441879272))
-        s.HorizontalConstraint(entity=g[13])
-        s.ObliqueDimension(vertex1=v[33], vertex2=v[34], textPoint=(edge*30.3310317993164,
-                                                                    edge*11.6508750915527), value=0.5*edge)
-        s.Spot(point=(edge*29.4585571289063, edge*12.0890169143677))
-        s.Line(point1=(edge*29.4585571289063, edge*12.0890169143677), point2=(edge*30.0,
-                                                                    edge*11.7320508075688))
-        s.AngularDimension(line1=g[14], line2=g[11], textPoint=(edge*29.7822399139404,
-                                                                edge*11.7817687988281), value=60.0)
-        s.ObliqueDimension(vertex1=v[36], vertex2=v[37], textPoint=(edge*29.7480278015137,
-                                                                    edge*11.9708442687988), value=edge)
-        s.Line(point1=(edge*29.5, edge*12.5980762113532), point2=(edge*29.0, edge*11.7320508075688))
-
-        p = mdb.models['Model-1'].Part(name='Part-1', dimensionality=TWO_D_PLANAR,
-                                       type=DEFORMABLE_BODY)
-        p = mdb.models['Model-1'].parts['Part-1']
-        p.BaseWire(sketch=s)
-        s.unsetPrimaryObject()
-        p = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p)
-        del mdb.models['Model-1'].sketches['__profile__']
-
-    # Bounce
-    if structure == 'h':
-        mdb.models.changeKey(fromName='Model-1', toName='Model-1')
-        session.viewports['Viewport: 1'].setValues(displayedObject=None)
-        s = mdb.models['Model-1'].ConstrainedSketch(name='__profile__',
-                                                    sheetSize=200.0)
-        g, v, d, c = s.geometry, s.vertices, s.dimensions, s.constraints
-        s.setPrimaryObject(option=STANDALONE)
-        s.Spot(point=(edge * 47.5, edge * 35.0))
-        s.Spot(point=(edge * 45.0, edge * 30.0))
-        s.Spot(point=(edge * 50.0, edge * 30.0))
-        s.Spot(point=(edge * 45.0, edge * 25.0))
-        s.Spot(point=(edge * 50.0, edge * 25.0))
-        s.Spot(point=(edge * 47.5, edge * 20.0))
-        s.Line(point1=(edge * 45.0, edge * 25.0), point2=(edge * 45.0, edge * 30.0))
-        s.VerticalConstraint(entity=g[2], addUndoState=False)
-        s.Line(point1=(edge * 45.0, edge * 30.0), point2=(edge * 47.5, edge * 35.0))
-        s.Line(point1=(edge * 47.5, edge * 35.0), point2=(edge * 50.0, edge * 30.0))
-        s.Line(point1=(edge * 50.0, edge * 30.0), point2=(edge * 50.0, edge * 25.0))
-        s.VerticalConstraint(entity=g[5], addUndoState=False)
-        s.Line(point1=(edge * 50.0, edge * 25.0), point2=(edge * 47.5, edge * 20.0))
-        s.Line(point1=(edge * 47.5, edge * 20.0), point2=(edge * 45.0, edge * 25.0))
-        s.Line(point1=(edge * 45.0, edge * 30.0), point2=(edge * 50.0, edge * 30.0))
-        s.HorizontalConstraint(entity=g[8], addUndoState=False)
-        s.Line(point1=(edge * 45.0, edge * 25.0), point2=(edge * 50.0, edge * 25.0))
-        s.HorizontalConstraint(entity=g[9], addUndoState=False)
-        s.ObliqueDimension(vertex1=v[6], vertex2=v[7], textPoint=(edge * 43.3270835876465,
-                                                                  edge * 27.537712097168), value=edge)
-        s.ObliqueDimension(vertex1=v[8], vertex2=v[9], textPoint=(edge * 44.6553268432617,
-                                                                  edge * 30.3415641784668), value=edge)
-        s.ObliqueDimension(vertex1=v[10], vertex2=v[11], textPoint=(edge * 48.2824516296387,
-                                                                    edge * 28.7102317810059), value=edge)
-        s.ObliqueDimension(vertex1=v[14], vertex2=v[15], textPoint=(edge * 47.8226776123047,
-                                                                    edge * 22.8986129760742), value=edge)
-        s.ObliqueDimension(vertex1=v[16], vertex2=v[17], textPoint=(edge * 44.7161979675293,
-                                                                    edge * 24.3010540008545), value=edge)
-        s.ObliqueDimension(vertex1=v[20], vertex2=v[21], textPoint=(edge * 45.2375106811523,
-                                                                    edge * 25.2971286773682), value=edge)
-        s.Spot(point=(edge * 46.5862312316895, edge * 24.7652835845947))
-        s.Spot(point=(edge * 46.1076545715332, edge * 23.8426952362061))
-        s.Spot(point=(edge * 44.8241958618164, edge * 23.7450103759766))
-        s.Spot(point=(edge * 44.2803535461426, edge * 24.6350364685059))
-        s.Spot(point=(edge * 44.323860168457, edge * 26.3282566070557))
-        s.Spot(point=(edge * 44.9003295898438, edge * 27.1857204437256))
-        s.Spot(point=(edge * 46.1729164123535, edge * 27.1965751647949))
-        s.Spot(point=(edge * 46.6623687744141, edge * 26.3282566070557))
-        s.Line(point1=(edge * 45.0, edge * 25.0), point2=(edge * 44.2803535461426, edge * 24.6350364685059))
-        s.Line(point1=(edge * 44.2803535461426, edge * 24.6350364685059), point2=(edge * 44.8241958618164,
-                                                                                  edge * 23.7450103759766))
-        s.Line(point1=(edge * 44.8241958618164, edge * 23.7450103759766), point2=(edge * 45.5,
-                                                                                  edge * 24.1339745962156))
-        s.Line(point1=(edge * 45.5, edge * 24.1339745962156), point2=(edge * 46.1076545715332,
-                                                                      edge * 23.8426952362061))
-        s.Line(point1=(edge * 46.1076545715332, edge * 23.8426952362061), point2=(edge * 46.5862312316895,
-                                                                                  edge * 24.7652835845947))
-        s.Line(point1=(edge * 46.5862312316895, edge * 24.7652835845947), point2=(edge * 46.0, edge * 25.0))
-        s.Line(point1=(edge * 45.0, edge * 26.0), point2=(edge * 44.323860168457, edge * 26.3282566070557))
-        s.Line(point1=(edge * 44.323860168457, edge * 26.3282566070557), point2=(edge * 44.9003295898438,
-                                                                                 edge * 27.1857204437256))
-        s.Line(point1=(edge * 44.9003295898438, edge * 27.1857204437256), point2=(edge * 45.5,
-                                                                                  edge * 26.8660254037844))
-        s.Line(point1=(edge * 45.5, edge * 26.8660254037844), point2=(edge * 46.1729164123535,
-                                                                      edge * 27.1965751647949))
-        s.Line(point1=(edge * 46.1729164123535, edge * 27.1965751647949), point2=(edge * 46.6623687744141,
-                                                                                  edge * 26.3282566070557))
-        s.Line(point1=(edge * 46.6623687744141, edge * 26.3282566070557), point2=(edge * 46.0, edge * 26.0))
-        s.AngularDimension(line1=g[10], line2=g[11], textPoint=(edge * 44.3927917480469,
-                                                                edge * 24.5817852020264), value=90.0)
-        s.AngularDimension(line1=g[11], line2=g[12], textPoint=(edge * 44.8614616394043,
-                                                                edge * 23.8919429779053), value=90.0)
-        s.AngularDimension(line1=g[10], line2=g[7], textPoint=(edge * 45.0137825012207,
-                                                               edge * 24.8974761962891), value=90.0)
-        s.ObliqueDimension(vertex1=v[30], vertex2=v[31], textPoint=(edge * 44.4923820495605,
-                                                                    edge * 24.9676284790039), value=edge)
-        s.AngularDimension(line1=g[15], line2=g[14], textPoint=(edge * 46.4900970458984,
-                                                                edge * 24.7162456512451), value=90.0)
-        s.AngularDimension(line1=g[13], line2=g[14], textPoint=(edge * 46.0741539001465,
-                                                                edge * 24.0030193328857), value=90.0)
-        s.AngularDimension(line1=g[13], line2=g[6], textPoint=(edge * 45.6347732543945,
-                                                               edge * 24.2368640899658), value=90.0)
-        s.ObliqueDimension(vertex1=v[36], vertex2=v[37], textPoint=(edge * 45.6582069396973,
-                                                                    edge * 23.7691745758057), value=edge)
-        s.AngularDimension(line1=g[19], line2=g[20], textPoint=(edge * 46.1500434875488,
-                                                                edge * 27.127779006958), value=90.0)
-        s.AngularDimension(line1=g[20], line2=g[21], textPoint=(edge * 46.5798606872559,
-                                                                edge * 26.3327121734619), value=90.0)
-        s.AngularDimension(line1=g[4], line2=g[21], textPoint=(edge * 46.0504493713379,
-                                                               edge * 26.0685615539551), value=90.0)
-        s.ObliqueDimension(vertex1=v[52], vertex2=v[53], textPoint=(edge * 46.3964042663574,
-                                                                    edge * 26.0502548217773), value=edge)
-        s.AngularDimension(line1=g[16], line2=g[17], textPoint=(edge * 44.408447265625,
-                                                                edge * 26.3664321899414), value=90.0)
-        s.AngularDimension(line1=g[17], line2=g[18], textPoint=(edge * 44.9307289123535,
-                                                                edge * 27.1211700439453), value=90.0)
-        s.AngularDimension(line1=g[3], line2=g[18], textPoint=(edge * 45.4062042236328,
-                                                               edge * 26.8605766296387), value=90.0)
-        s.ObliqueDimension(vertex1=v[46], vertex2=v[47], textPoint=(edge * 45.14013671875,
-                                                                    edge * 26.8679523468018), value=edge)
-        s.Spot(point=(edge * 44.1605949401855, edge * 27.2073268890381))
-        s.Spot(point=(edge * 44.6507415771484, edge * 27.5763092041016))
-        s.Spot(point=(edge * 46.3490447998047, edge * 27.60205078125))
-        s.Spot(point=(edge * 46.8176918029785, edge * 27.3617839813232))
-        s.Line(point1=(edge * 44.1605949401855, edge * 27.2073268890381), point2=(edge * 44.6339745962156,
-                                                                                  edge * 27.3660254037844))
-        s.Line(point1=(edge * 44.6339745962156, edge * 27.3660254037844), point2=(edge * 44.6507415771484,
-                                                                                  edge * 27.5763092041016))
-        s.AngularDimension(line1=g[22], line2=g[17], textPoint=(edge * 44.4572639465332,
-                                                                edge * 27.2244873046875), value=60.0)
-        s.ObliqueDimension(vertex1=v[58], vertex2=v[59], textPoint=(edge * 44.2207908630371,
-                                                                    edge * 27.2116165161133), value=edge * 0.5)
-        s.AngularDimension(line1=g[23], line2=g[22], textPoint=(edge * 44.5475540161133,
-                                                                edge * 27.4132690429688), value=90.0)
-        s.ObliqueDimension(vertex1=v[60], vertex2=v[61], textPoint=(edge * 44.7625274658203,
-                                                                    edge * 27.4690456390381), value=edge * 0.5)
-        s.Line(point1=(edge * 46.3490447998047, edge * 27.60205078125), point2=(edge * 46.3660254037844,
-                                                                                edge * 27.3660254037844))
-        s.Line(point1=(edge * 46.3660254037844, edge * 27.3660254037844), point2=(edge * 46.8176918029785,
-                                                                                  edge * 27.3617839813232))
-        s.AngularDimension(line1=g[25], line2=g[20], textPoint=(edge * 46.486629486084,
-                                                                edge * 27.2545223236084), value=60.0)
-        s.AngularDimension(line1=g[24], line2=g[25], textPoint=(edge * 46.4436340332031,
-                                                                edge * 27.4132690429688), value=90.0)
-        s.ObliqueDimension(vertex1=v[64], vertex2=v[65], textPoint=(edge * 46.6973075866699,
-                                                                    edge * 27.1086444854736), value=edge * 0.5)
-        s.ObliqueDimension(vertex1=v[62], vertex2=v[63], textPoint=(edge * 46.2544593811035,
-                                                                    edge * 27.4947891235352), value=edge * 0.5)
-        s.Spot(point=(edge * 44.1319313049316, edge * 23.6154727935791))
-        s.Spot(point=(edge * 44.620231628418, edge * 23.068775177002))
-        s.Spot(point=(edge * 46.8354415893555, edge * 23.6273574829102))
-        s.Spot(point=(edge * 46.3650054931641, edge * 23.1103706359863))
-        s.Line(point1=(edge * 44.1319313049316, edge * 23.6154727935791), point2=(edge * 44.6339745962156,
-                                                                                  edge * 23.6339745962156))
-        s.Line(point1=(edge * 44.6339745962156, edge * 23.6339745962156), point2=(edge * 44.620231628418,
-                                                                                  edge * 23.068775177002))
-        s.Line(point1=(edge * 46.8354415893555, edge * 23.6273574829102), point2=(edge * 46.3660254037844,
-                                                                                  edge * 23.6339745962156))
-        s.Line(point1=(edge * 46.3660254037844, edge * 23.6339745962156), point2=(edge * 46.3650054931641,
-                                                                                  edge * 23.1103706359863))
-        s.AngularDimension(line1=g[26], line2=g[11], textPoint=(edge * 44.4813232421875,
-                                                                edge * 23.7532444000244), value=60.0)
-        s.ObliqueDimension(vertex1=v[70], vertex2=v[71], textPoint=(edge * 44.306510925293,
-                                                                    edge * 23.4872150421143), value=edge * 0.5)
-        s.AngularDimension(line1=g[27], line2=g[26], textPoint=(edge * 44.5337677001953,
-                                                                edge * 23.5482711791992), value=90.0)
-        s.ObliqueDimension(vertex1=v[72], vertex2=v[73], textPoint=(edge * 44.7653923034668,
-                                                                    edge * 23.3258533477783), value=edge * 0.5)
-        s.AngularDimension(line1=g[28], line2=g[14], textPoint=(edge * 46.5135154724121,
-                                                                edge * 23.7532444000244), value=60.0)
-        s.ObliqueDimension(vertex1=v[74], vertex2=v[75], textPoint=(edge * 46.6271438598633,
-                                                                    edge * 23.4654102325439), value=edge * 0.5)
-        s.AngularDimension(line1=g[29], line2=g[28], textPoint=(edge * 46.4654426574707,
-                                                                edge * 23.5657157897949), value=90.0)
-        s.ObliqueDimension(vertex1=v[76], vertex2=v[77], textPoint=(edge * 46.2294464111328,
-                                                                    edge * 23.3127708435059), value=edge * 0.5)
-        p = mdb.models['Model-1'].Part(name='Part-1',
-                                       dimensionality=TWO_D_PLANAR, type=DEFORMABLE_BODY)
-        p = mdb.models['Model-1'].parts['Part-1']
-        p.BaseWire(sketch=s)
-        s.unsetPrimaryObject()
-        p = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p)
-        del mdb.models['Model-1'].sketches['__profile__']
-
-    # Trellis
-    if structure == 'i':
-        s1 = mdb.models['Model-1'].ConstrainedSketch(name='__profile__',
-                                                              sheetSize=200.0)
-        g, v, d, c = s1.geometry, s1.vertices, s1.dimensions, s1.constraints
-        s1.setPrimaryObject(option=STANDALONE)
-        s1.Spot(point=(30.0, 30.0))
-        s1.Spot(point=(35.0, 30.0))
-        s1.Spot(point=(32.5, 35.0))
-        s1.Spot(point=(30.0, 25.0))
-        s1.Spot(point=(35.0, 25.0))
-        s1.Spot(point=(32.5, 20.0))
-        s1.Spot(point=(30.0, 20.0))
-        s1.Spot(point=(35.0, 20.0))
-        s1.Spot(point=(32.5, 17.5))
-        s1.Spot(point=(35.0, 35.0))
-        s1.Spot(point=(30.0, 35.0))
-        s1.Spot(point=(32.5, 37.5))
-        s1.Line(point1=(35.0, 30.0), point2=(32.5, 35.0))
-        s1.Line(point1=(32.5, 35.0), point2=(30.0, 30.0))
-        s1.Line(point1=(30.0, 30.0), point2=(30.0, 25.0))
-        s1.VerticalConstraint(entity=g[4], addUndoState=False)
-        s1.Line(point1=(30.0, 25.0), point2=(32.5, 20.0))
-        s1.Line(point1=(32.5, 20.0), point2=(35.0, 25.0))
-        s1.Line(point1=(35.0, 25.0), point2=(30.0, 25.0))
-        s1.HorizontalConstraint(entity=g[7], addUndoState=False)
-        s1.Line(point1=(30.0, 30.0), point2=(35.0, 30.0))
-        s1.HorizontalConstraint(entity=g[8], addUndoState=False)
-        s1.Line(point1=(32.5, 35.0), point2=(30.0, 35.0))
-        s1.HorizontalConstraint(entity=g[9], addUndoState=False)
-        s1.Line(point1=(32.5, 37.5), point2=(32.5, 35.0))
-        s1.VerticalConstraint(entity=g[10], addUndoState=False)
-        s1.Line(point1=(32.5, 35.0), point2=(35.0, 35.0))
-        s1.HorizontalConstraint(entity=g[11], addUndoState=False)
-        s1.PerpendicularConstraint(entity1=g[10], entity2=g[11], addUndoState=False)
-        s1.Line(point1=(30.0, 20.0), point2=(32.5, 20.0))
-        s1.HorizontalConstraint(entity=g[12], addUndoState=False)
-        s1.Line(point1=(32.5, 20.0), point2=(32.5, 17.5))
-        s1.VerticalConstraint(entity=g[13], addUndoState=False)
-        s1.PerpendicularConstraint(entity1=g[12], entity2=g[13], addUndoState=False)
-        s1.Line(point1=(32.5, 20.0), point2=(35.0, 20.0))
-        s1.HorizontalConstraint(entity=g[14], addUndoState=False)
-        s1.ObliqueDimension(vertex1=v[16], vertex2=v[17], textPoint=(28.5407028198242,
-                                                                     27.4260063171387), value=edge)
-        s1.ObliqueDimension(vertex1=v[28], vertex2=v[29], textPoint=(31.6618881225586,
-                                                                     32.0797729492188), value=0.5*edge)
-        s1.ObliqueDimension(vertex1=v[30], vertex2=v[31], textPoint=(34.0949020385742,
-                                                                     32.1991767883301), value=0.5*edge)
-        s1.ObliqueDimension(vertex1=v[26], vertex2=v[27], textPoint=(30.9838333129883,
-                                                                     32.1195755004883), value=0.5*edge)
-        s1.ObliqueDimension(vertex1=v[36], vertex2=v[37], textPoint=(33.7758178710938,
-                                                                     19.263557434082), value=0.5*edge)
-        s1.ObliqueDimension(vertex1=v[34], vertex2=v[35], textPoint=(31.4225730895996,
-                                                                     18.5869235992432), value=0.5*edge)
-        s1.ObliqueDimension(vertex1=v[32], vertex2=v[33], textPoint=(30.9838333129883,
-                                                                     18.2287063598633), value=0.5*edge)
-        s1.ObliqueDimension(vertex1=v[22], vertex2=v[23], textPoint=(32.3294982910156,
-                                                                     24.3677749633789), value=edge)
-        s1.ObliqueDimension(vertex1=v[20], vertex2=v[21], textPoint=(32.4945907592773,
-                                                                     23.2694492340088), value=edge)
-        s1.ObliqueDimension(vertex1=v[18], vertex2=v[19], textPoint=(29.3853015899658,
-                                                                     23.077241897583), value=edge)
-        s1.ObliqueDimension(vertex1=v[24], vertex2=v[25], textPoint=(44.1129112243652,
-                                                                     2.4116268157959), value=edge)
-        s1.ObliqueDimension(vertex1=v[12], vertex2=v[13], textPoint=(43.9024353027344,
-                                                                     4.40695905685425), value=edge)
-        s1.ObliqueDimension(vertex1=v[14], vertex2=v[15], textPoint=(41.67138671875,
-                                                                     3.9028754234314), value=edge)
-        p = mdb.models['Model-1'].Part(name='Part-1',
-                                                dimensionality=TWO_D_PLANAR, type=DEFORMABLE_BODY)
-        p = mdb.models['Model-1'].parts['Part-1']
-        p.BaseWire(sketch=s1)
-        s1.unsetPrimaryObject()
-        p = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p)
-        del mdb.models['Model-1'].sketches['__profile__']
-
-    # TODO create j: Mapple Leaf Structure
-    # If the user somehow does manage to select the mapple leaf letter "j"
+@timed
+def create_structure(structure, edge, tiling=(1, 1), model_name='Model-1'):
+    # If the user somehow does manage to select an unknown structure
     # the script will recall the main() file to query the user for new inputs.
     # This should never happen but adds an additional layer of savety
-    if structure == 'j':
+    if structure not in CATALOG:
         getWarningReply('The chosen strucutre is not yet available.\n'
                         'Please choose one of the following structures: \n'
-                        "'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i'\n"
+                        "'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k'\n"
                         , buttons=(YES,))
         main()
+        return
+
+    # The catalog coordinates are multiplied by the user-selected edge length to scale the lattice accordingly
+    vertices, edges = unit_cell(structure, edge, tiling)[:2]
+
+    # All edges are created in a single call, the common end points of the wires are merged into one vertex
+    p = mdb.models[model_name].Part(name='Part-1', dimensionality=TWO_D_PLANAR, type=DEFORMABLE_BODY)
+    p.WirePolyLine(points=tuple((vertices[i] + (0.0,), vertices[j] + (0.0,)) for i, j in edges), mergeType=MERGE,
+                   meshable=ON)
+
+    create_boundary_sets(structure, edge, tiling, model_name)
+    viewport().setValues(displayedObject=p)
+
 
-    # SHD
-    if structure == 'k':
-        s = mdb.models['Model-1'].ConstrainedSketch(name='__profile__',
-                                                    sheetSize=200.0)
-        g, v, d, c = s.geometry, s.vertices, s.dimensions, s.constraints
-        s.setPrimaryObject(option=STANDALONE)
-        s.Spot(point=(edge * 45.0, edge * 30.0))
-        s.Spot(point=(edge * 47.5, edge * 30.0))
-        s.Line(point1=(edge * 45.0, edge * 30.0), point2=(edge * 47.5, edge * 30.0))
-        s.HorizontalConstraint(entity=g[2], addUndoState=False)
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=182.913,
-                                                        farPlane=194.211, width=37.0648, height=19.089, cameraPosition=(
-                45.4831, 28.1021, 188.562), cameraTarget=(45.4831, 28.1021, 0))
-        s.ObliqueDimension(vertex1=v[2], vertex2=v[3], textPoint=(edge * 45.9745216369629,
-                                                                  edge * 31.0617179870605), value=edge)
-        s.Spot(point=(edge * 47.5, edge * 28.75))
-        s.Line(point1=(edge * 47.5, edge * 30.0), point2=(edge * 47.5, edge * 28.75))
-        s.VerticalConstraint(entity=g[3], addUndoState=False)
-        s.ObliqueDimension(vertex1=v[5], vertex2=v[6], textPoint=(edge * 48.5016708374023,
-                                                                  edge * 29.4155120849609), value=edge)
-        s.Spot(point=(edge * 46.25, edge * 28.75))
-        s.Line(point1=(edge * 46.5, edge * 30.0), point2=(edge * 46.25, edge * 28.75))
-        s.Line(point1=(edge * 46.25, edge * 28.75), point2=(edge * 47.5, edge * 29.0))
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=186.035,
-                                                        farPlane=191.089, width=16.5815, height=8.53975,
-                                                        cameraPosition=(
-                                                            46.2356, 28.76, 188.562), cameraTarget=(46.2356, 28.76, 0))
-        s.AngularDimension(line1=g[4], line2=g[5], textPoint=(edge * 46.5967636108398,
-                                                              edge * 29.0028839111328), value=90.0)
-        s.AngularDimension(line1=g[2], line2=g[4], textPoint=(edge * 46.6752777099609,
-                                                              edge * 29.8020153045654), value=90.0)
-        s.Spot(point=(edge * 45.9372711181641, edge * 28.3604431152344))
-        s.Line(point1=(edge * 46.5, edge * 29.0), point2=(edge * 45.9372711181641, edge * 28.3604431152344))
-        s.AngularDimension(line1=g[6], line2=g[5], textPoint=(edge * 46.643871307373,
-                                                              edge * 28.7991828918457), value=130.0)
-        s.ObliqueDimension(vertex1=v[13], vertex2=v[14], textPoint=(edge * 45.8430595397949,
-                                                                    edge * 29.0498905181885), value=edge)
-        s.Spot(point=(edge * 48.1983871459961, edge * 28.2194194793701))
-        s.Line(point1=(edge * 47.5, edge * 29.0), point2=(edge * 48.1983871459961, edge * 28.2194194793701))
-        s.AngularDimension(line1=g[5], line2=g[7], textPoint=(edge * 47.397575378418,
-                                                              edge * 28.8148517608643), value=130.0)
-        s.ObliqueDimension(vertex1=v[16], vertex2=v[17], textPoint=(edge * 48.2769012451172,
-                                                                    edge * 28.8618602752686), value=edge)
-        s.Spot(point=(edge * 46.4868507385254, edge * 27.3576107025146))
-        s.Line(point1=(edge * 45.8572123903135, edge * 28.233955556881), point2=(edge * 46.4868507385254,
-                                                                                 edge * 27.3576107025146))
-        s.AngularDimension(line1=g[6], line2=g[8], textPoint=(edge * 46.1256980895996,
-                                                              edge * 28.188081741333), value=120.0)
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=187.359,
-                                                        farPlane=189.765, width=7.89148, height=4.06424,
-                                                        cameraPosition=(
-                                                            46.7667, 28.4079, 188.562),
-                                                        cameraTarget=(46.7667, 28.4079, 0))
-        s.delete(objectList=(d[4],))
-        s.delete(objectList=(d[6],))
-        s.AngularDimension(line1=g[5], line2=g[6], textPoint=(edge * 46.4901695251465,
-                                                              edge * 28.8665142059326), value=120.0)
-        s.AngularDimension(line1=g[5], line2=g[7], textPoint=(edge * 47.4616584777832,
-                                                              edge * 28.8366851806641), value=120.0)
-        s.ObliqueDimension(vertex1=v[19], vertex2=v[20], textPoint=(edge * 46.4004936218262,
-                                                                    edge * 27.9045181274414), value=edge)
-        s.Spot(point=(edge * 47.603645324707, edge * 27.2855606079102))
-        s.Line(point1=(edge * 48.0, edge * 28.1339745962156), point2=(edge * 47.603645324707,
-                                                                      edge * 27.2855606079102))
-        s.AngularDimension(line1=g[7], line2=g[9], textPoint=(edge * 47.8427810668945,
-                                                              edge * 28.09840965271), value=120.0)
-        s.ObliqueDimension(vertex1=v[22], vertex2=v[23], textPoint=(edge * 47.5737533569336,
-                                                                    edge * 27.8970623016357), value=edge)
-        s.Line(point1=(edge * 46.5, edge * 27.2679491924311), point2=(edge * 47.5, edge * 27.2679491924312))
-        s.HorizontalConstraint(entity=g[10], addUndoState=False)
-        s.delete(objectList=(d[13],))
-        s.Spot(point=(edge * 45.294490814209, edge * 27.8523178100586))
-        s.Line(point1=(edge * 46.0, edge * 28.1339745962156), point2=(edge * 45.294490814209,
-                                                                      edge * 27.8523178100586))
-        s.AngularDimension(line1=g[11], line2=g[8], textPoint=(edge * 45.9969520568848,
-                                                               edge * 27.9418048858643), value=90.0)
-        s.ObliqueDimension(vertex1=v[27], vertex2=v[28], textPoint=(edge * 45.8624382019043,
-                                                                    edge * 27.7329998016357), value=edge)
-        s.Spot(point=(edge * 45.7503433227539, edge * 27.2557315826416))
-        s.Line(point1=(edge * 45.1339745962156, edge * 27.6339745962156), point2=(edge * 45.7503433227539,
-                                                                                  edge * 27.2557315826416))
-        s.Line(point1=(edge * 45.7503433227539, edge * 27.2557315826416), point2=(edge * 46.5,
-                                                                                  edge * 27.2679491924311))
-        s.AngularDimension(line1=g[12], line2=g[13], textPoint=(edge * 45.8474922180176,
-                                                                edge * 27.3601341247559), value=90.0)
-        s.AngularDimension(line1=g[8], line2=g[13], textPoint=(edge * 46.2883987426758,
-                                                               edge * 27.4123363494873), value=90.0)
-        s.Spot(point=(edge * 48.851634979248, edge * 28.01637840271))
-        s.Line(point1=(edge * 48.0, edge * 28.1339745962156), point2=(edge * 48.851634979248,
-                                                                      edge * 28.01637840271))
-        s.AngularDimension(line1=g[14], line2=g[9], textPoint=(edge * 47.9922409057617,
-                                                               edge * 28.01637840271), value=9.0)
-        s.undo()
-        s.AngularDimension(line1=g[9], line2=g[14], textPoint=(edge * 48.0893898010254,
-                                                               edge * 28.0611228942871), value=90.0)
-        s.ObliqueDimension(vertex1=v[35], vertex2=v[36], textPoint=(edge * 48.2164306640625,
-                                                                    edge * 27.7479152679443), value=edge)
-        s.Spot(point=(edge * 48.1192817687988, edge * 27.4123363494873))
-        s.Line(point1=(edge * 48.8660254037844, edge * 27.6339745962156), point2=(edge * 48.1192817687988,
-                                                                                  edge * 27.4123363494873))
-        s.Line(point1=(edge * 48.1192817687988, edge * 27.4123363494873), point2=(edge * 47.5,
-                                                                                  edge * 27.2679491924312))
-        s.AngularDimension(line1=g[15], line2=g[14], textPoint=(edge * 48.5004043579102,
-                                                                edge * 27.6957130432129), value=90.0)
-        s.AngularDimension(line1=g[9], line2=g[16], textPoint=(edge * 47.6559562683105,
-                                                               edge * 27.3974208831787), value=90.0)
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=187.277,
-                                                        farPlane=189.847, width=8.42954, height=4.34135,
-                                                        cameraPosition=(
-                                                            46.966, 31.6681, 188.562),
-                                                        cameraTarget=(46.966, 31.6681, 0))
-        s.Spot(point=(edge * 45.8564338684082, edge * 30.7320728302002))
-        s.Line(point1=(edge * 46.5, edge * 30.0), point2=(edge * 45.8564338684082, edge * 30.7320728302002))
-        s.AngularDimension(line1=g[17], line2=g[2], textPoint=(edge * 46.5988082885742,
-                                                               edge * 30.1585369110107), value=120.0)
-        s.ObliqueDimension(vertex1=v[43], vertex2=v[44], textPoint=(edge * 46.4631042480469,
-                                                                    edge * 30.5329284667969), value=edge)
-        s.Spot(point=(edge * 47.9239044189453, edge * 30.9630813598633))
-        s.Line(point1=(edge * 47.5, edge * 30.0), point2=(edge * 47.9239044189453, edge * 30.9630813598633))
-        s.AngularDimension(line1=g[2], line2=g[18], textPoint=(edge * 47.4609184265137,
-                                                               edge * 30.1665019989014), value=120.0)
-        s.ObliqueDimension(vertex1=v[46], vertex2=v[47], textPoint=(edge * 47.5088157653809,
-                                                                    edge * 30.5568256378174), value=edge)
-        s.Spot(point=(edge * 46.4471397399902, edge * 31.6003437042236))
-        s.Line(point1=(edge * 46.0, edge * 30.8660254037844), point2=(edge * 46.4471397399902,
-                                                                      edge * 31.6003437042236))
-        s.AngularDimension(line1=g[17], line2=g[19], textPoint=(edge * 46.1597671508789,
-                                                                edge * 30.8754577636719), value=120.0)
-        s.ObliqueDimension(vertex1=v[49], vertex2=v[50], textPoint=(edge * 46.415210723877,
-                                                                    edge * 31.0507049560547), value=edge)
-        s.Spot(point=(edge * 47.5407447814941, edge * 31.5206851959229))
-        s.Line(point1=(edge * 48.0, edge * 30.8660254037844), point2=(edge * 47.5407447814941,
-                                                                      edge * 31.5206851959229))
-        s.Line(point1=(edge * 47.5407447814941, edge * 31.5206851959229), point2=(edge * 46.5,
-                                                                                  edge * 31.7320508075688))
-        s.AngularDimension(line1=g[20], line2=g[18], textPoint=(edge * 47.8520660400391,
-                                                                edge * 30.8356285095215), value=120.0)
-        s.AngularDimension(line1=g[21], line2=g[20], textPoint=(edge * 47.5646934509277,
-                                                                edge * 31.3613700866699), value=120.0)
-        s.Spot(point=(edge * 45.3535346984863, edge * 31.0347728729248))
-        s.Line(point1=(edge * 46.0, edge * 30.8660254037844), point2=(edge * 45.3535346984863,
-                                                                      edge * 31.0347728729248))
-        s.AngularDimension(line1=g[22], line2=g[19], textPoint=(edge * 45.9202919006348,
-                                                                edge * 31.0188407897949), value=90.0)
-        s.ObliqueDimension(vertex1=v[57], vertex2=v[58], textPoint=(edge * 45.8644142150879,
-                                                                    edge * 31.2737464904785), value=edge)
-        s.Spot(point=(edge * 45.4493255615234, edge * 32.4606475830078))
-        s.Line(point1=(edge * 45.1339745962156, edge * 31.3660254037844), point2=(edge * 45.4493255615234,
-                                                                                  edge * 32.4606475830078))
-        s.Line(point1=(edge * 45.4493255615234, edge * 32.4606475830078), point2=(edge * 46.5,
-                                                                                  edge * 31.7320508075688))
-        s.AngularDimension(line1=g[23], line2=g[24], textPoint=(edge * 45.5530967712402,
-                                                                edge * 32.2296409606934), value=90.0)
-        s.AngularDimension(line1=g[24], line2=g[19], textPoint=(edge * 46.3752975463867,
-                                                                edge * 31.6720352172852), value=90.0)
-        s.Spot(point=(edge * 48.1234703063965, edge * 31.9986324310303))
-        s.Line(point1=(edge * 47.5, edge * 31.7320508075689), point2=(edge * 48.1234703063965,
-                                                                      edge * 31.9986324310303))
-        s.AngularDimension(line1=g[25], line2=g[20], textPoint=(edge * 47.6285514831543,
-                                                                edge * 31.6800003051758), value=90.0)
-        s.ObliqueDimension(vertex1=v[65], vertex2=v[66], textPoint=(edge * 47.9079399108887,
-                                                                    edge * 31.6322059631348), value=edge)
-        s.Spot(point=(edge * 49.1053199768066, edge * 31.456958770752))
-        s.Line(point1=(edge * 48.3660254037844, edge * 32.2320508075689), point2=(edge * 49.1053199768066,
-                                                                                  edge * 31.456958770752))
-        s.Line(point1=(edge * 49.1053199768066, edge * 31.456958770752), point2=(edge * 48.0,
-                                                                                 edge * 30.8660254037844))
-        s.AngularDimension(line1=g[25], line2=g[26], textPoint=(edge * 48.4028587341309,
-                                                                edge * 32.0782890319824), value=90.0)
-        s.AngularDimension(line1=g[26], line2=g[27], textPoint=(edge * 48.7540893554688,
-                                                                edge * 31.3773021697998), value=90.0)
-        s.Spot(point=(edge * 45.2497596740723, edge * 32.9943542480469))
-        s.Line(point1=(edge * 45.6339745962156, edge * 32.2320508075688), point2=(edge * 45.2497596740723,
-                                                                                  edge * 32.9943542480469))
-        s.AngularDimension(line1=g[28], line2=g[23], textPoint=(edge * 45.3934478759766,
-                                                                edge * 32.237606048584), value=120.0)
-        s.ObliqueDimension(vertex1=v[73], vertex2=v[74], textPoint=(edge * 45.2417793273926,
-                                                                    edge * 32.4367523193359), value=edge)
-        s.Spot(point=(edge * 45.1459884643555, edge * 33.5917892456055))
-        s.Line(point1=(edge * 45.1339745962156, edge * 33.0980762113532), point2=(edge * 45.1459884643555,
-                                                                                  edge * 33.5917892456055))
-        s.AngularDimension(line1=g[29], line2=g[28], textPoint=(edge * 45.2816925048828,
-                                                                edge * 33.0899467468262), value=150.0)
-        s.ObliqueDimension(vertex1=v[76], vertex2=v[77], textPoint=(edge * 45.3934478759766,
-                                                                    edge * 33.2731590270996), value=edge * 0.5)
-        s.Spot(point=(edge * 44.6830024719238, edge * 32.9784240722656))
-        s.Line(point1=(edge * 45.1339745962156, edge * 33.0980762113532), point2=(edge * 44.6830024719238,
-                                                                                  edge * 32.9784240722656))
-        s.AngularDimension(line1=g[29], line2=g[30], textPoint=(edge * 45.0501976013184,
-                                                                edge * 33.2014656066895), value=90.0)
-        s.ObliqueDimension(vertex1=v[79], vertex2=v[80], textPoint=(edge * 44.8985290527344,
-                                                                    edge * 32.874870300293), value=edge * 0.5)
-        s.Spot(point=(edge * 44.7069511413574, edge * 31.2179851531982))
-        s.Line(point1=(edge * 45.1339745962156, edge * 31.3660254037844), point2=(edge * 44.7069511413574,
-                                                                                  edge * 31.2179851531982))
-        s.AngularDimension(line1=g[23], line2=g[31], textPoint=(edge * 45.0182685852051,
-                                                                edge * 31.4410285949707), value=120.0)
-        s.ObliqueDimension(vertex1=v[82], vertex2=v[83], textPoint=(edge * 44.8825645446777,
-                                                                    edge * 31.1781578063965), value=edge * 0.5)
-        s.Spot(point=(edge * 48.8179473876953, edge * 32.9943542480469))
-        s.Line(point1=(edge * 48.3660254037844, edge * 32.2320508075689), point2=(edge * 48.8179473876953,
-                                                                                  edge * 32.9943542480469))
-        s.AngularDimension(line1=g[32], line2=g[26], textPoint=(edge * 48.5625076293945,
-                                                                edge * 32.1659126281738), value=120.0)
-        s.ObliqueDimension(vertex1=v[85], vertex2=v[86], textPoint=(edge * 48.7620697021484,
-                                                                    edge * 32.4765815734863), value=edge)
-        s.Spot(point=(edge * 48.75, edge * 33.75))
-        s.Line(point1=(edge * 48.8660254037844, edge * 33.0980762113533), point2=(edge * 48.75, edge * 33.75))
-        s.AngularDimension(line1=g[33], line2=g[32], textPoint=(edge * 48.7461051940918,
-                                                                edge * 33.0819778442383), value=150.0)
-        s.ObliqueDimension(vertex1=v[88], vertex2=v[89], textPoint=(edge * 48.6263694763184,
-                                                                    edge * 33.4484062194824), value=edge * 0.5)
-        s.Spot(point=(edge * 49.3447952270508, edge * 33.0341835021973))
-        s.Line(point1=(edge * 48.8660254037844, edge * 33.0980762113533), point2=(edge * 49.3447952270508,
-                                                                                  edge * 33.0341835021973))
-        s.AngularDimension(line1=g[33], line2=g[34], textPoint=(edge * 49.0494422912598,
-                                                                edge * 33.1775703430176), value=90.0)
-        s.ObliqueDimension(vertex1=v[91], vertex2=v[92], textPoint=(edge * 49.08935546875,
-                                                                    edge * 32.8509712219238), value=edge * 0.5)
-        s.Spot(point=(edge * 49.4086570739746, edge * 31.2259521484375))
-        s.Line(point1=(edge * 48.8660254037844, edge * 31.3660254037844), point2=(edge * 49.4086570739746,
-                                                                                  edge * 31.2259521484375))
-        s.AngularDimension(line1=g[26], line2=g[35], textPoint=(edge * 48.9696159362793,
-                                                                edge * 31.4410285949707), value=120.0)
-        s.ObliqueDimension(vertex1=v[94], vertex2=v[95], textPoint=(edge * 49.1053199768066,
-                                                                    edge * 31.1861228942871), value=edge * 0.5)
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=186.91,
-                                                        farPlane=190.214, width=12.269, height=6.31875, cameraPosition=(
-                46.9014, 26.7204, 188.562), cameraTarget=(46.9014, 26.7204, 0))
-        s.Spot(point=(edge * 45.205135345459, edge * 25.9146366119385))
-        s.Line(point1=(edge * 45.6339745962156, edge * 26.7679491924311), point2=(edge * 45.205135345459,
-                                                                                  edge * 25.9146366119385))
-        s.AngularDimension(line1=g[12], line2=g[36], textPoint=(edge * 45.4026489257813,
-                                                                edge * 26.6798439025879), value=120.0)
-        s.ObliqueDimension(vertex1=v[97], vertex2=v[98], textPoint=(edge * 45.7279624938965,
-                                                                    edge * 26.2856464385986), value=edge)
-        s.Spot(point=(edge * 45.0773315429688, edge * 25.3697185516357))
-        s.Line(point1=(edge * 45.1339745962156, edge * 25.9019237886467), point2=(edge * 45.0773315429688,
-                                                                                  edge * 25.3697185516357))
-        s.AngularDimension(line1=g[36], line2=g[37], textPoint=(edge * 45.2516098022461,
-                                                                edge * 25.8102912902832), value=150.0)
-        s.ObliqueDimension(vertex1=v[100], vertex2=v[101], textPoint=(edge * 45.4491195678711,
-                                                                      edge * 25.636381149292), value=edge * 0.5)
-        s.Spot(point=(edge * 44.5545043945313, edge * 25.7175388336182))
-        s.Line(point1=(edge * 45.1339745962156, edge * 25.9019237886467), point2=(edge * 44.5545043945313,
-                                                                                  edge * 25.7175388336182))
-        s.AngularDimension(line1=g[38], line2=g[37], textPoint=(edge * 45.0192413330078,
-                                                                edge * 25.7407264709473), value=90.0)
-        s.ObliqueDimension(vertex1=v[103], vertex2=v[104], textPoint=(edge * 44.7984924316406,
-                                                                      edge * 25.5668163299561), value=edge * 0.5)
-        s.Spot(point=(edge * 44.7055435180664, edge * 27.4682388305664))
-        s.Line(point1=(edge * 45.1339745962156, edge * 27.6339745962156), point2=(edge * 44.7055435180664,
-                                                                                  edge * 27.4682388305664))
-        s.AngularDimension(line1=g[39], line2=g[12], textPoint=(edge * 45.0540962219238,
-                                                                edge * 27.4334564208984), value=120.0)
-        s.ObliqueDimension(vertex1=v[106], vertex2=v[107], textPoint=(edge * 44.8565826416016,
-                                                                      edge * 27.931999206543), value=edge * 0.5)
-        s.Spot(point=(edge * 48.8649291992188, edge * 25.8450736999512))
-        s.Line(point1=(edge * 48.3660254037844, edge * 26.7679491924312), point2=(edge * 48.8649291992188,
-                                                                                  edge * 25.8450736999512))
-        s.AngularDimension(line1=g[15], line2=g[40], textPoint=(edge * 48.5744705200195,
-                                                                edge * 26.7494087219238), value=120.0)
-        s.ObliqueDimension(vertex1=v[109], vertex2=v[110], textPoint=(edge * 48.2956275939941,
-                                                                      edge * 26.2044887542725), value=edge)
-        s.Spot(point=(edge * 48.8997840881348, edge * 25.3233413696289))
-        s.Line(point1=(edge * 48.8660254037844, edge * 25.9019237886468), point2=(edge * 48.8997840881348,
-                                                                                  edge * 25.3233413696289))
-        s.AngularDimension(line1=g[40], line2=g[41], textPoint=(edge * 48.7022705078125,
-                                                                edge * 25.8218860626221), value=150.0)
-        s.ObliqueDimension(vertex1=v[112], vertex2=v[113], textPoint=(edge * 48.5396156311035,
-                                                                      edge * 25.5552215576172), value=edge * 0.5)
-        s.Spot(point=(edge * 49.4109954833984, edge * 25.7755088806152))
-        s.Line(point1=(edge * 48.8660254037844, edge * 25.9019237886468), point2=(edge * 49.4109954833984,
-                                                                                  edge * 25.7755088806152))
-        s.AngularDimension(line1=g[42], line2=g[41], textPoint=(edge * 49.0043487548828,
-                                                                edge * 25.7871036529541), value=90.0)
-        s.ObliqueDimension(vertex1=v[115], vertex2=v[116], textPoint=(edge * 49.2018623352051,
-                                                                      edge * 25.5900039672852), value=edge * 0.5)
-        s.Spot(point=(edge * 49.3296661376953, edge * 27.7812767028809))
-        s.Line(point1=(edge * 48.8660254037844, edge * 27.6339745962156), point2=(edge * 49.3296661376953,
-                                                                                  edge * 27.7812767028809))
-        s.AngularDimension(line1=g[43], line2=g[15], textPoint=(edge * 48.8765487670898,
-                                                                edge * 27.4914264678955), value=120.0)
-        s.ObliqueDimension(vertex1=v[118], vertex2=v[119], textPoint=(edge * 49.132152557373,
-                                                                      edge * 28.0015640258789), value=edge * 0.5)
-        p = mdb.models['Model-1'].Part(name='Part-1', dimensionality=TWO_D_PLANAR,
-                                       type=DEFORMABLE_BODY)
-        p = mdb.models['Model-1'].parts['Part-1']
-        p.BaseWire(sketch=s)
-        s.unsetPrimaryObject()
-        p = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p)
-        del mdb.models['Model-1'].sketches['__profile__']
+'''
+The vertices on the boundary of the unit cell are collected in one set per side ('Left', 'Right', 'Bottom', 'Top')
+for loads and boundary conditions. The vertices are found by their coordinates in an index of the part
+(utilities/selection.py) instead of one findAt per vertex, which keeps large tilings fast.
+'''
+def create_boundary_sets(structure, edge, tiling=(1, 1), model_name='Model-1'):
+    p = mdb.models[model_name].parts['Part-1']
+    select = PartSelection(p, TOLERANCE * edge)
+    for side, points in boundary_vertices(structure, edge, tiling).items():
+        p.Set(vertices=select.vertices(points), name=side)
 
 '''
 The material selection is pretty straight forward. The user can choose between linear and nonlinear
@@ -1342,14 +550,15 @@ def select_material():
 This function assigns the selected model to the previously built structure
 It does not require the structure model as input as all functions are executed inside the Abaqus program.
 '''
-def create_material(model, young_modulus, poisson_rate, c10, c01, d1):
+@timed
+def create_material(model, young_modulus, poisson_rate, c10, c01, d1, model_name='Model-1'):
     if model == 'linear':
-        mdb.models['Model-1'].Material(name='Material-1')
-        mdb.models['Model-1'].materials['Material-1'].Elastic(table=((float(young_modulus), float(poisson_rate)),))
+        mdb.models[model_name].Material(name='Material-1')
+        mdb.models[model_name].materials['Material-1'].Elastic(table=((float(young_modulus), float(poisson_rate)),))
 
     elif model == 'nonlinear':
-        mdb.models['Model-1'].Material(name='Material-1')
-        mdb.models['Model-1'].materials['Material-1'].Hyperelastic(
+        mdb.models[model_name].Material(name='Material-1')
+        mdb.models[model_name].materials['Material-1'].Hyperelastic(
             materialType=ISOTROPIC, testData=OFF, type=MOONEY_RIVLIN,
             moduliTimeScale=INSTANTANEOUS, volumetricResponse=VOLUMETRIC_DATA,
             table=((float(c10), float(c01), float(d1)),))
@@ -1600,48 +809,44 @@ def select_cross_section(edge, structure):
 '''
 Depending on the users choices this function creates the cross section for the beams in the selected structure.
 '''
-def create_cross_section(section, width, width_2, height, radius, d, thickness, thickness_2, thickness_3, i):
+@timed
+def create_cross_section(section, width, width_2, height, radius, d, thickness, thickness_2, thickness_3, i,
+                         model_name='Model-1'):
     if section == 'box':
-        mdb.models['Model-1'].BoxProfile(name='Profile-1', b=float(width), a=float(height),
-                                                 uniformThickness=ON, t1=float(thickness))
+        mdb.models[model_name].BoxProfile(name='Profile-1', b=float(width), a=float(height),
+                                                  uniformThickness=ON, t1=float(thickness))
     if section == 'circular':
-        mdb.models['Model-1'].CircularProfile(name='Profile-1', r=float(radius))
+        mdb.models[model_name].CircularProfile(name='Profile-1', r=float(radius))
     if section == 'pipe':
-        mdb.models['Model-1'].PipeProfile(name='Profile-1', r=float(radius), t=float(thickness))
+        mdb.models[model_name].PipeProfile(name='Profile-1', r=float(radius), t=float(thickness))
     if section == 'rectangular':
-        mdb.models['Model-1'].RectangularProfile(name='Profile-1', a=float(width), b=float(height))
+        mdb.models[model_name].RectangularProfile(name='Profile-1', a=float(width), b=float(height))
     if section == 'hexagonal':
-        mdb.models['Model-1'].HexagonalProfile(name='Profile-1', r=float(radius), t=float(thickness))
+        mdb.models[model_name].HexagonalProfile(name='Profile-1', r=float(radius), t=float(thickness))
     if section == 'trapezoidal':
-        mdb.models['Model-1'].TrapezoidalProfile(name='Profile-1', a=float(width), b=float(height),
-                                                 c=float(width_2), d=float(d))
+        mdb.models[model_name].TrapezoidalProfile(name='Profile-1', a=float(width), b=float(height),
+                                                  c=float(width_2), d=float(d))
     if section == 'i':
-        mdb.models['Model-1'].IProfile(name='Profile-1', l=float(i), h=float(height), b1=float(width),
-                                       b2=float(width_2), t1=float(thickness), t2=float(thickness_2),
-                                       t3=float(thickness_3))
+        mdb.models[model_name].IProfile(name='Profile-1', l=float(i), h=float(height), b1=float(width),
+                                        b2=float(width_2), t1=float(thickness), t2=float(thickness_2),
+                                        t3=float(thickness_3))
     if section == 't':
-        mdb.models['Model-1'].TProfile(name='Profile-1', b=float(width), h=float(height), l=float(i),
-                                       tf=float(thickness), tw=float(thickness_2))
+        mdb.models[model_name].TProfile(name='Profile-1', b=float(width), h=float(height), l=float(i),
+                                        tf=float(thickness), tw=float(thickness_2))
     if section == 'l':
-        mdb.models['Model-1'].LProfile(name='Profile-1', a=float(width), b=float(height), t1=float(thickness),
-                                       t2=float(thickness_2))
-
-    mdb.models['Model-1'].BeamSection(name='Section-1', integration=DURING_ANALYSIS, poissonRatio=0.0,
-                                      profile='Profile-1', material='Material-1', temperatureVar=LINEAR,
-                                      consistentMassMatrix=False)
-    p = mdb.models['Model-1'].parts['Part-1']
-    e = p.edges
-    edges = e.getSequenceFromMask(mask=('[#ffffffff #3ff ]',), )
-    region = p.Set(edges=edges, name='Set-1')
-    p = mdb.models['Model-1'].parts['Part-1']
+        mdb.models[model_name].LProfile(name='Profile-1', a=float(width), b=float(height), t1=float(thickness),
+                                        t2=float(thickness_2))
+
+    mdb.models[model_name].BeamSection(name='Section-1', integration=DURING_ANALYSIS, poissonRatio=0.0,
+                                       profile='Profile-1', material='Material-1', temperatureVar=LINEAR,
+                                       consistentMassMatrix=False)
+    # Every edge of the lattice is a beam with the same section
+    p = mdb.models[model_name].parts['Part-1']
+    region = p.Set(edges=p.edges, name='Set-1')
     p.SectionAssignment(region=region, sectionName='Section-1', offset=0.0,
                         offsetType=MIDDLE_SURFACE, offsetField='',
                         thicknessAssignment=FROM_SECTION)
-    p = mdb.models['Model-1'].parts['Part-1']
-    e = p.edges
-    edges = e.getSequenceFromMask(mask=('[#ffffffff #3ff ]',), )
-    region = p.Set(edges=edges, name='Set-2')
-    p = mdb.models['Model-1'].parts['Part-1']
+    region = p.Set(edges=p.edges, name='Set-2')
     p.assignBeamSectionOrientation(region=region, method=N1_COSINES, n1=(0.0, 0.0,
                                                                          -1.0))
 
@@ -1649,25 +854,28 @@ def create_cross_section(section, width, width_2, height, radius, d, thickness,
 Simple function to mesh the model with a size of 0.1 times the selected edge size to ensure proper meshes even for very
 small or very large lattices.
 '''
-def create_mesh(edge):
-    p = mdb.models['Model-1'].parts['Part-1']
+@timed
+def create_mesh(edge, model_name='Model-1'):
+    p = mdb.models[model_name].parts['Part-1']
     p.seedPart(size=0.1*edge, deviationFactor=0.1, minSizeFactor=0.1)
     p.generateMesh()
 
 # Self explanatory
-def create_assembly():
-    a = mdb.models['Model-1'].rootAssembly
+@timed
+def create_assembly(model_name='Model-1'):
+    a = mdb.models[model_name].rootAssembly
     a.DatumCsysByDefault(CARTESIAN)
-    p = mdb.models['Model-1'].parts['Part-1']
+    p = mdb.models[model_name].parts['Part-1']
     a.Instance(name='Part-1-1', part=p, dependent=ON)
 
 # The Step size for the non linear model needs a smaller initial step size if the loads get high
-def create_step(model):
+@timed
+def create_step(model, model_name='Model-1'):
     if model == 'linear':
-        mdb.models['Model-1'].StaticStep(name='Step-1', previous='Initial', initialInc=0.1)
+        mdb.models[model_name].StaticStep(name='Step-1', previous='Initial', initialInc=0.1)
     if model == 'nonlinear':
-        mdb.models['Model-1'].StaticStep(name='Step-1', previous='Initial', initialInc=0.001, minInc=1e-09)
-        mdb.models['Model-1'].steps['Step-1'].setValues(nlgeom=ON)
+        mdb.models[model_name].StaticStep(name='Step-1', previous='Initial', initialInc=0.001, minInc=1e-09)
+        mdb.models[model_name].steps['Step-1'].setValues(nlgeom=ON)
 
 '''
 The user can select the load cases.
@@ -1688,1964 +896,311 @@ def select_boundary_conditions(model):
 '''
 This function applies the selected conditions to the selected lattice.
 
-We have decided to use a macro which maps all possible forces, boundary conditions and equations onto the lattice
-and in a second step we deactivate or suppress all conditions not used in the selected load case.
+Only the loads, boundary conditions and equations the selected load case of the structure needs are created, as
+listed in utilities/loadcases.py. These are the ones of the former macro, which created every condition of every load
+case and suppressed the unused ones afterwards. The vertices of the macro (L1, L2, ..., R1, ..., B1, ..., T1, ...) are
+found by their coordinates on the sides of the cell and collected in part sets named after them, a load or BC on
+several of them gets one set named like 'T3-R1'. The periodic equations of the Maple Leaf lattice are added afterwards
+by create_periodic_equations.
 '''
-def create_boundary_conditions(structure, force, loadcase, axis):
-
-    # Square
-    if structure == 'a':
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#4 ]',), )
-        p.Set(vertices=verts, name='L1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#1 ]',), )
-        p.Set(vertices=verts, name='R1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#10 ]',), )
-        p.Set(vertices=verts, name='T1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#8 ]',), )
-        p.Set(vertices=verts, name='B1')
-        a1 = mdb.models['Model-1'].rootAssembly
-        a1.regenerate()
-        a = mdb.models['Model-1'].rootAssembly
-        session.viewports['Viewport: 1'].setValues(displayedObject=a)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(mesh=OFF, loads=ON,
-                                                                   bcs=ON, predefinedFields=ON, connectors=ON)
-        session.viewports['Viewport: 1'].assemblyDisplay.meshOptions.setValues(
-            meshTechnique=OFF)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#10 ]',), )
-        region = a.Set(vertices=verts1, name='Set-1')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-1', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#10 ]',), )
-        region = a.Set(vertices=verts1, name='Set-2')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-2', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#8 ]',), )
-        region = a.Set(vertices=verts1, name='Set-3')
-        mdb.models['Model-1'].DisplacementBC(name='BC-1', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                   predefinedFields=OFF, interactions=ON,
-                                                                   constraints=ON,
-                                                                   engineeringFeatures=ON)
-        mdb.models['Model-1'].Equation(name='Constraint-1', terms=((1.0, 'Part-1-1.L1',
-                                                                    2), (-1.0, 'Part-1-1.R1', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-
-
-        if loadcase == 'uniaxial':
-            mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-            session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                       predefinedFields=ON, interactions=OFF,
-                                                                       constraints=OFF,
-                                                                       engineeringFeatures=OFF)
-            mdb.models['Model-1'].loads['Load-1'].suppress()
-
-        if loadcase == 'shear':
-            session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                       predefinedFields=ON, interactions=OFF,
-                                                                       constraints=OFF,
-                                                                       engineeringFeatures=OFF)
-            mdb.models['Model-1'].loads['Load-2'].suppress()
-
-    # Honeycomb
-    if structure == 'b':
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#1 ]',), )
-        region = a.Set(vertices=verts1, name='Set-1')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-1', createStepName='Step-1',
-                                                region=region, cf1=-float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#1 ]',), )
-        region = a.Set(vertices=verts1, name='Set-2')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-2', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#80 ]',), )
-        region = a.Set(vertices=verts1, name='Set-3')
-        mdb.models['Model-1'].DisplacementBC(name='BC-1', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#18 ]',), )
-        region = a.Set(vertices=verts1, name='Set-4')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-3', createStepName='Step-1',
-                                                region=region, cf1=-float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#18 ]',), )
-        region = a.Set(vertices=verts1, name='Set-5')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-4', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#4 ]',), )
-        region = a.Set(vertices=verts1, name='Set-6')
-        mdb.models['Model-1'].DisplacementBC(name='BC-2', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#40 ]',), )
-        region = a.Set(vertices=verts1, name='Set-7')
-        mdb.models['Model-1'].DisplacementBC(name='BC-3', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        session.viewports['Viewport: 1'].partDisplay.setValues(sectionAssignments=OFF,
-                                                               engineeringFeatures=OFF)
-        session.viewports['Viewport: 1'].partDisplay.geometryOptions.setValues(
-            referenceRepresentation=ON)
-        p1 = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p1)
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#8 ]',), )
-        p.Set(vertices=verts, name='L1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#10 ]',), )
-        p.Set(vertices=verts, name='L2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#4 ]',), )
-        p.Set(vertices=verts, name='R1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#40 ]',), )
-        p.Set(vertices=verts, name='R2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#1 ]',), )
-        p.Set(vertices=verts, name='T1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#80 ]',), )
-        p.Set(vertices=verts, name='B1')
-        a1 = mdb.models['Model-1'].rootAssembly
-        a1.regenerate()
-        a = mdb.models['Model-1'].rootAssembly
-        session.viewports['Viewport: 1'].setValues(displayedObject=a)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                   predefinedFields=OFF, interactions=ON,
-                                                                   constraints=ON,
-                                                                   engineeringFeatures=ON)
-        mdb.models['Model-1'].Equation(name='Constraint-1', terms=((1.0, 'Part-1-1.L1',
-                                                                    2), (-1.0, 'Part-1-1.R1', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-2', terms=((1.0, 'Part-1-1.L2',
-                                                                    2), (-1.0, 'Part-1-1.R2', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-1-Copy', terms=((1.0, 'Part-1-1.L1',
-                                                                    1), (-1.0, 'Part-1-1.R1', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-2-Copy', terms=((1.0, 'Part-1-1.L2',
-                                                                    1), (-1.0, 'Part-1-1.R2', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-3', terms=((1.0, 'Part-1-1.T1',
-                                                                    1), (-1.0, 'Part-1-1.B1', 1),
-                                                                   (-1.0, 'Part-1-1.R1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-3-Copy', terms=((1.0, 'Part-1-1.T1',
-                                                                    2), (-1.0, 'Part-1-1.B1', 2),
-                                                                   (-1.0, 'Part-1-1.R1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-shear-y', terms=((1.0, 'Part-1-1.L1',
-                                                                    1), (-1.0, 'Part-1-1.L2', 1),
-                                                                   (-1.0, 'Part-1-1.R1', 1)))
-
-
-        if loadcase == 'uniaxial':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-1-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-shear-y'].suppress()
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-1-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3-Copy'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].setValues(u2=UNSET, ur3=UNSET)
-                mdb.models['Model-1'].constraints['Constraint-shear-y'].suppress()
-
-        if loadcase == 'shear':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-1-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2-Copy'].suppress()
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-shear-y'].suppress()
-
-    # Triangular
-    if structure == 'c':
-        session.viewports['Viewport: 1'].partDisplay.setValues(sectionAssignments=OFF,
-                                                               engineeringFeatures=OFF)
-        session.viewports['Viewport: 1'].partDisplay.geometryOptions.setValues(
-            referenceRepresentation=ON)
-        p1 = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p1)
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#8 ]',), )
-        p.Set(vertices=verts, name='L1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#10 ]',), )
-        p.Set(vertices=verts, name='R1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#4 ]',), )
-        p.Set(vertices=verts, name='T1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#2 ]',), )
-        p.Set(vertices=verts, name='T2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#1 ]',), )
-        p.Set(vertices=verts, name='T3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#20 ]',), )
-        p.Set(vertices=verts, name='B1')
-        a1 = mdb.models['Model-1'].rootAssembly
-        a1.regenerate()
-        a = mdb.models['Model-1'].rootAssembly
-        session.viewports['Viewport: 1'].setValues(displayedObject=a)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#20 ]',), )
-        region = a.Set(vertices=verts1, name='Set-1')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-1', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#20 ]',), )
-        region = a.Set(vertices=verts1, name='Set-2')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-2', createStepName='Step-1',
-                                                region=region, cf2=-float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#11 ]',), )
-        region = a.Set(vertices=verts1, name='Set-3')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-3', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#11 ]',), )
-        region = a.Set(vertices=verts1, name='Set-4')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-4', createStepName='Step-1',
-                                                region=region, cf2=-float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#2 ]',), )
-        region = a.Set(vertices=verts1, name='Set-5')
-        mdb.models['Model-1'].DisplacementBC(name='BC-1', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#4 ]',), )
-        region = a.Set(vertices=verts1, name='Set-6')
-        mdb.models['Model-1'].DisplacementBC(name='BC-2', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#1 ]',), )
-        region = a.Set(vertices=verts1, name='Set-7')
-        mdb.models['Model-1'].DisplacementBC(name='BC-3', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#8 ]',), )
-        region = a.Set(vertices=verts1, name='Set-8')
-        mdb.models['Model-1'].DisplacementBC(name='BC-4', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                   predefinedFields=OFF, interactions=ON,
-                                                                   constraints=ON,
-                                                                   engineeringFeatures=ON)
-        mdb.models['Model-1'].Equation(name='Constraint-1', terms=((1.0, 'Part-1-1.L1',
-                                                                    2), (-1.0, 'Part-1-1.R1', 2),
-                                                                   (-1.0, 'Part-1-1.T2', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-1-Copy', terms=((1.0, 'Part-1-1.L1',
-                                                                    1), (-1.0, 'Part-1-1.R1', 1),
-                                                                   (-1.0, 'Part-1-1.T2', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-2', terms=((1.0, 'Part-1-1.T2',
-                                                                    1), (-1.0, 'Part-1-1.B1', 1),
-                                                                   (-1.0, 'Part-1-1.L1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-2-Copy', terms=((1.0, 'Part-1-1.T2',
-                                                                    2), (-1.0, 'Part-1-1.B1', 2),
-                                                                   (-1.0, 'Part-1-1.L1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-uni-y-L', terms=((1.0, 'Part-1-1.T1',
-                                                                    1), (-1.0, 'Part-1-1.L1', 1),
-                                                                   (-1.0, 'Part-1-1.T2', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-uni-y-R', terms=((1.0, 'Part-1-1.T3',
-                                                                    1), (-1.0, 'Part-1-1.R1', 1),
-                                                                   (-1.0, 'Part-1-1.T2', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-shear-y', terms=((1.0, 'Part-1-1.T3',
-                                                                    2), (-1.0, 'Part-1-1.R1', 2),
-                                                                   (-1.0, 'Part-1-1.L1', 2)))
-
-
-        if loadcase == 'uniaxial':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-1-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-shear-y'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].setValues(u1=UNSET, ur3=UNSET)
-                mdb.models['Model-1'].boundaryConditions['BC-3'].setValues(u1=UNSET, ur3=UNSET)
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-1-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2-Copy'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].setValues(u2=UNSET, ur3=UNSET)
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-L'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-R'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-shear-y'].suppress()
-
-        if loadcase == 'shear':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-1-Copy'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-L'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-R'].suppress()
-
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2-Copy'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-L'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-R'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-shear-y'].suppress()
-
-    # CaVo
-    if structure == 'd':
-        session.viewports['Viewport: 1'].view.setValues(nearPlane=858.195,
-                                                        farPlane=878.817, width=69.9693, height=33.0268,
-                                                        viewOffsetX=185.367,
-                                                        viewOffsetY=61.5612)
-        p1 = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p1)
-        session.viewports['Viewport: 1'].partDisplay.setValues(sectionAssignments=OFF,
-                                                               engineeringFeatures=OFF, mesh=ON)
-        session.viewports['Viewport: 1'].partDisplay.meshOptions.setValues(
-            meshTechnique=ON)
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#80 ]',), )
-        p.Set(vertices=verts, name='L1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#40 ]',), )
-        p.Set(vertices=verts, name='R1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#20 ]',), )
-        p.Set(vertices=verts, name='T1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#1 ]',), )
-        p.Set(vertices=verts, name='B1')
-        a1 = mdb.models['Model-1'].rootAssembly
-        a1.regenerate()
-        a = mdb.models['Model-1'].rootAssembly
-        session.viewports['Viewport: 1'].setValues(displayedObject=a)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(mesh=OFF, loads=ON,
-                                                                   bcs=ON, predefinedFields=ON, connectors=ON)
-        session.viewports['Viewport: 1'].assemblyDisplay.meshOptions.setValues(
-            meshTechnique=OFF)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#20 ]',), )
-        region = a.Set(vertices=verts1, name='Set-1')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-1', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#20 ]',), )
-        region = a.Set(vertices=verts1, name='Set-2')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-2', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#1 ]',), )
-        region = a.Set(vertices=verts1, name='Set-3')
-        mdb.models['Model-1'].DisplacementBC(name='BC-1', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                   predefinedFields=OFF, interactions=ON,
-                                                                   constraints=ON,
-                                                                   engineeringFeatures=ON)
-        mdb.models['Model-1'].Equation(name='Constraint-1', terms=((1.0, 'Part-1-1.L1',
-                                                                    2), (-1.0, 'Part-1-1.R1', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-
-
-        if loadcase == 'uniaxial':
-            mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-            session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                       predefinedFields=ON, interactions=OFF,
-                                                                       constraints=OFF,
-                                                                       engineeringFeatures=OFF)
-            mdb.models['Model-1'].loads['Load-1'].suppress()
-
-        if loadcase == 'shear':
-            session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                       predefinedFields=ON, interactions=OFF,
-                                                                       constraints=OFF,
-                                                                       engineeringFeatures=OFF)
-            mdb.models['Model-1'].loads['Load-2'].suppress()
-
-    # Star
-    if structure == 'e':
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#100 ]',), )
-        p.Set(vertices=verts, name='L1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#200 ]',), )
-        p.Set(vertices=verts, name='L2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#400 ]',), )
-        p.Set(vertices=verts, name='L3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#1000 ]',), )
-        p.Set(vertices=verts, name='L4')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#10 ]',), )
-        p.Set(vertices=verts, name='R1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#40 ]',), )
-        p.Set(vertices=verts, name='R2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#80000 ]',), )
-        p.Set(vertices=verts, name='R3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#40000 ]',), )
-        p.Set(vertices=verts, name='R4')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#1 ]',), )
-        p.Set(vertices=verts, name='T1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#20000 ]',), )
-        p.Set(vertices=verts, name='B1')
-        a1 = mdb.models['Model-1'].rootAssembly
-        a1.regenerate()
-        a = mdb.models['Model-1'].rootAssembly
-        session.viewports['Viewport: 1'].setValues(displayedObject=a)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                   predefinedFields=ON, connectors=ON,
-                                                                   adaptiveMeshConstraints=OFF)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#1 ]',), )
-        region = a.Set(vertices=verts1, name='Set-1')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-1', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#1 ]',), )
-        region = a.Set(vertices=verts1, name='Set-2')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-2', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#100 ]',), )
-        region = a.Set(vertices=verts1, name='Set-3')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-3', createStepName='Step-1',
-                                                region=region, cf1=-float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#200 ]',), )
-        region = a.Set(vertices=verts1, name='Set-4')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-4', createStepName='Step-1',
-                                                region=region, cf1=-float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#400 ]',), )
-        region = a.Set(vertices=verts1, name='Set-5')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-5', createStepName='Step-1',
-                                                region=region, cf1=-float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#1000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-6')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-6', createStepName='Step-1',
-                                                region=region, cf1=-float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#20000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-7')
-        mdb.models['Model-1'].DisplacementBC(name='BC-1', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#10 ]',), )
-        region = a.Set(vertices=verts1, name='Set-8')
-        mdb.models['Model-1'].DisplacementBC(name='BC-2', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#40 ]',), )
-        region = a.Set(vertices=verts1, name='Set-9')
-        mdb.models['Model-1'].DisplacementBC(name='BC-3', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#80000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-10')
-        mdb.models['Model-1'].DisplacementBC(name='BC-4', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#40000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-11')
-        mdb.models['Model-1'].DisplacementBC(name='BC-5', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                   predefinedFields=OFF, interactions=ON,
-                                                                   constraints=ON,
-                                                                   engineeringFeatures=ON)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#100 ]',), )
-        region = a.Set(vertices=verts1, name='Set-12')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-7', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#200 ]',), )
-        region = a.Set(vertices=verts1, name='Set-13')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-8', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#400 ]',), )
-        region = a.Set(vertices=verts1, name='Set-14')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-9', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#1000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-15')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-10',
-                                                createStepName='Step-1', region=region, cf2=float(force),
-                                                distributionType=UNIFORM, field='', localCsys=None)
-        mdb.models['Model-1'].Equation(name='Constraint-1', terms=((1.0, 'Part-1-1.L1',
-                                                                    1), (-1.0, 'Part-1-1.R1', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-2', terms=((1.0, 'Part-1-1.L1',
-                                                                    2), (-1.0, 'Part-1-1.R1', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-3', terms=((1.0, 'Part-1-1.L2',
-                                                                    1), (-1.0, 'Part-1-1.R2', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-4', terms=((1.0, 'Part-1-1.L2',
-                                                                    2), (-1.0, 'Part-1-1.R2', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-5', terms=((1.0, 'Part-1-1.L3',
-                                                                    1), (-1.0, 'Part-1-1.R3', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-6', terms=((1.0, 'Part-1-1.L3',
-                                                                    2), (-1.0, 'Part-1-1.R3', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-7', terms=((1.0, 'Part-1-1.L4',
-                                                                    1), (-1.0, 'Part-1-1.R4', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-8', terms=((1.0, 'Part-1-1.L4',
-                                                                    2), (-1.0, 'Part-1-1.R4', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-9', terms=((1.0, 'Part-1-1.T1',
-                                                                    1), (-1.0, 'Part-1-1.B1', 1),
-                                                                   (-1.0, 'Part-1-1.R2', 1)))
-
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                   predefinedFields=ON, interactions=OFF,
-                                                                   constraints=OFF,
-                                                                   engineeringFeatures=OFF)
-
-        if loadcase == 'uniaxial':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-7'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-9'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-5'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].loads['Load-5'].suppress()
-                mdb.models['Model-1'].loads['Load-6'].suppress()
-                mdb.models['Model-1'].loads['Load-7'].suppress()
-                mdb.models['Model-1'].loads['Load-8'].suppress()
-                mdb.models['Model-1'].loads['Load-9'].suppress()
-                mdb.models['Model-1'].loads['Load-10'].suppress()
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-6'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-7'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-8'].suppress()
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-7'].suppress()
-                mdb.models['Model-1'].loads['Load-8'].suppress()
-                mdb.models['Model-1'].loads['Load-9'].suppress()
-                mdb.models['Model-1'].loads['Load-10'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-
-        if loadcase == 'shear':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-9'].suppress()
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].loads['Load-5'].suppress()
-                mdb.models['Model-1'].loads['Load-6'].suppress()
-                mdb.models['Model-1'].loads['Load-7'].suppress()
-                mdb.models['Model-1'].loads['Load-8'].suppress()
-                mdb.models['Model-1'].loads['Load-9'].suppress()
-                mdb.models['Model-1'].loads['Load-10'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-5'].suppress()
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-6'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-7'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-8'].suppress()
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].loads['Load-5'].suppress()
-                mdb.models['Model-1'].loads['Load-6'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-
-    # SrCuBO
-    if structure == 'f':
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#4000 ]',), )
-        p.Set(vertices=verts, name='L1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#40 ]',), )
-        p.Set(vertices=verts, name='L2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#100 ]',), )
-        p.Set(vertices=verts, name='L3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#2 ]',), )
-        p.Set(vertices=verts, name='L4')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#1 ]',), )
-        p.Set(vertices=verts, name='L5')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#1000 ]',), )
-        p.Set(vertices=verts, name='R1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#8000 ]',), )
-        p.Set(vertices=verts, name='R2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#400 ]',), )
-        p.Set(vertices=verts, name='R3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#80 ]',), )
-        p.Set(vertices=verts, name='T1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#2000 ]',), )
-        p.Set(vertices=verts, name='T2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#8 ]',), )
-        p.Set(vertices=verts, name='B1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#800 ]',), )
-        p.Set(vertices=verts, name='B2')
-        a1 = mdb.models['Model-1'].rootAssembly
-        a1.regenerate()
-        a = mdb.models['Model-1'].rootAssembly
-        session.viewports['Viewport: 1'].setValues(displayedObject=a)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#6080 ]',), )
-        region = a.Set(vertices=verts1, name='Set-1')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-1', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#6080 ]',), )
-        region = a.Set(vertices=verts1, name='Set-2')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-2', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#9400 ]',), )
-        region = a.Set(vertices=verts1, name='Set-3')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-3', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#9400 ]',), )
-        region = a.Set(vertices=verts1, name='Set-4')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-4', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#4000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-5')
-        mdb.models['Model-1'].DisplacementBC(name='BC-1', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#40 ]',), )
-        region = a.Set(vertices=verts1, name='Set-6')
-        mdb.models['Model-1'].DisplacementBC(name='BC-2', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#100 ]',), )
-        region = a.Set(vertices=verts1, name='Set-7')
-        mdb.models['Model-1'].DisplacementBC(name='BC-3', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#2 ]',), )
-        region = a.Set(vertices=verts1, name='Set-8')
-        mdb.models['Model-1'].DisplacementBC(name='BC-4', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#1 ]',), )
-        region = a.Set(vertices=verts1, name='Set-9')
-        mdb.models['Model-1'].DisplacementBC(name='BC-5', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#8 ]',), )
-        region = a.Set(vertices=verts1, name='Set-10')
-        mdb.models['Model-1'].DisplacementBC(name='BC-6', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#800 ]',), )
-        region = a.Set(vertices=verts1, name='Set-11')
-        mdb.models['Model-1'].DisplacementBC(name='BC-7', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                   predefinedFields=OFF, interactions=ON,
-                                                                   constraints=ON,
-                                                                   engineeringFeatures=ON)
-        mdb.models['Model-1'].Equation(name='Constraint-1', terms=((1.0, 'Part-1-1.L2',
-                                                                    2), (-1.0, 'Part-1-1.R1', 2),
-                                                                   (-1.0, 'Part-1-1.B2', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-2', terms=((1.0, 'Part-1-1.L3',
-                                                                    2), (-1.0, 'Part-1-1.R2', 2),
-                                                                   (-1.0, 'Part-1-1.B2', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-3', terms=((1.0, 'Part-1-1.L4',
-                                                                    2), (-1.0, 'Part-1-1.R3', 2),
-                                                                   (-1.0, 'Part-1-1.B2', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-4', terms=((1.0, 'Part-1-1.B2',
-                                                                    1), (-1.0, 'Part-1-1.T2', 1),
-                                                                   (-1.0, 'Part-1-1.L3', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-5', terms=((1.0, 'Part-1-1.B1',
-                                                                    1), (-1.0, 'Part-1-1.T1', 1),
-                                                                   (-1.0, 'Part-1-1.L3', 1)))
-
-
-        if loadcase == 'uniaxial':
-            if axis == 'y':
-                mmdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                    predefinedFields=ON, interactions=OFF, constraints=OFF,
-                    engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-6'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-7'].suppress()
-
-        if loadcase == 'shear':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-6'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-7'].suppress()
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-
-    # Kagome
-    if structure == 'g':
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#1 ]',), )
-        p.Set(vertices=verts, name='L1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#4 ]',), )
-        p.Set(vertices=verts, name='L2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#10 ]',), )
-        p.Set(vertices=verts, name='L3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#200 ]',), )
-        p.Set(vertices=verts, name='R1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#400 ]',), )
-        p.Set(vertices=verts, name='R2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#800 ]',), )
-        p.Set(vertices=verts, name='R3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#40 ]',), )
-        p.Set(vertices=verts, name='T1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#100 ]',), )
-        p.Set(vertices=verts, name='B1')
-        a1 = mdb.models['Model-1'].rootAssembly
-        a1.regenerate()
-        a = mdb.models['Model-1'].rootAssembly
-        session.viewports['Viewport: 1'].setValues(displayedObject=a)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(mesh=OFF, loads=ON,
-                                                                   bcs=ON, predefinedFields=ON, connectors=ON)
-        session.viewports['Viewport: 1'].assemblyDisplay.meshOptions.setValues(
-            meshTechnique=OFF)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#40 ]',), )
-        region = a.Set(vertices=verts1, name='Set-1')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-1', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#40 ]',), )
-        region = a.Set(vertices=verts1, name='Set-2')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-2', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#e00 ]',), )
-        region = a.Set(vertices=verts1, name='Set-3')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-3', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#e00 ]',), )
-        region = a.Set(vertices=verts1, name='Set-4')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-4', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#100 ]',), )
-        region = a.Set(vertices=verts1, name='Set-5')
-        mdb.models['Model-1'].DisplacementBC(name='BC-1', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#4 ]',), )
-        region = a.Set(vertices=verts1, name='Set-6')
-        mdb.models['Model-1'].DisplacementBC(name='BC-2', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#1 ]',), )
-        region = a.Set(vertices=verts1, name='Set-7')
-        mdb.models['Model-1'].DisplacementBC(name='BC-3', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=UNSET, ur3=UNSET, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#10 ]',), )
-        region = a.Set(vertices=verts1, name='Set-8')
-        mdb.models['Model-1'].DisplacementBC(name='BC-4', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=UNSET, ur3=UNSET, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                   predefinedFields=OFF, interactions=ON,
-                                                                   constraints=ON,
-                                                                   engineeringFeatures=ON)
-        mdb.models['Model-1'].Equation(name='Constraint-1', terms=((1.0, 'Part-1-1.L1',
-                                                                    2), (-1.0, 'Part-1-1.R1', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-2', terms=((1.0, 'Part-1-1.L2',
-                                                                    2), (-1.0, 'Part-1-1.R2', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-3', terms=((1.0, 'Part-1-1.L3',
-                                                                    2), (-1.0, 'Part-1-1.R3', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-1-Copy', terms=((1.0, 'Part-1-1.L1',
-                                                                    1), (-1.0, 'Part-1-1.R1', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-2-Copy', terms=((1.0, 'Part-1-1.L2',
-                                                                    1), (-1.0, 'Part-1-1.R2', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-3-Copy', terms=((1.0, 'Part-1-1.L3',
-                                                                    1), (-1.0, 'Part-1-1.R3', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-4', terms=((1.0, 'Part-1-1.B1',
-                                                                    1), (-1.0, 'Part-1-1.T1', 1),
-                                                                   (-1.0, 'Part-1-1.L2', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-uni-y-L1', terms=((1.0, 'Part-1-1.L1',
-                                                                    1), (-1.0, 'Part-1-1.L2', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-uni-y-L3', terms=((1.0, 'Part-1-1.L3',
-                                                                    1), (-1.0, 'Part-1-1.L2', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-uni-y-R1', terms=((1.0, 'Part-1-1.R1',
-                                                                    1), (-1.0, 'Part-1-1.R2', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-uni-y-R3', terms=((1.0, 'Part-1-1.R3',
-                                                                    1), (-1.0, 'Part-1-1.R2', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-shear-y-R1', terms=((1.0, 'Part-1-1.R1',
-                                                                    2), (-1.0, 'Part-1-1.R2', 2),
-                                                                   (-1.0, 'Part-1-1.L2', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-shear-y-R3', terms=((1.0, 'Part-1-1.R3',
-                                                                    2), (-1.0, 'Part-1-1.R2', 2),
-                                                                   (-1.0, 'Part-1-1.L2', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-uni-x-R1', terms=((1.0, 'Part-1-1.R1',
-                                                                    1), (-1.0, 'Part-1-1.R2', 1),
-                                                                   (-1.0, 'Part-1-1.L2', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-uni-x-R3', terms=((1.0, 'Part-1-1.R3',
-                                                                    1), (-1.0, 'Part-1-1.R2', 1),
-                                                                   (-1.0, 'Part-1-1.L2', 1)))
-
-        if loadcase == 'uniaxial':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-1-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-shear-y-R1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-shear-y-R3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-x-R1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-x-R3'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-1-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-L1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-L3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-R1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-R3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-shear-y-R1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-shear-y-R3'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-
-        if loadcase == 'shear':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-1-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3-Copy'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-L1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-L3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-R1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-R3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-x-R1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-x-R3'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-L1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-L3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-R1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-y-R3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-shear-y-R1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-shear-y-R3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-x-R1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-uni-x-R3'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-
-    # Bounce
-    if structure == 'h':
-        a = mdb.models['Model-1'].rootAssembly
-        session.viewports['Viewport: 1'].setValues(displayedObject=a)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#104 ]',), )
-        region = a.Set(vertices=verts1, name='Set-1')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-1', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#104 ]',), )
-        region = a.Set(vertices=verts1, name='Set-2')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-2', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#210009 ]',), )
-        region = a.Set(vertices=verts1, name='Set-3')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-3', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#210009 ]',), )
-        region = a.Set(vertices=verts1, name='Set-4')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-4', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#40000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-5')
-        mdb.models['Model-1'].DisplacementBC(name='BC-1', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#100000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-6')
-        mdb.models['Model-1'].DisplacementBC(name='BC-2', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#80000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-7')
-        mdb.models['Model-1'].DisplacementBC(name='BC-3', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#4000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-8')
-        mdb.models['Model-1'].DisplacementBC(name='BC-4', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#40 ]',), )
-        region = a.Set(vertices=verts1, name='Set-9')
-        mdb.models['Model-1'].DisplacementBC(name='BC-5', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#8000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-10')
-        mdb.models['Model-1'].DisplacementBC(name='BC-6', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                   predefinedFields=OFF, interactions=ON,
-                                                                   constraints=ON,
-                                                                   engineeringFeatures=ON)
-        p1 = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p1)
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#8000 ]',), )
-        p.Set(vertices=verts, name='L1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#40 ]',), )
-        p.Set(vertices=verts, name='L2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#4000 ]',), )
-        p.Set(vertices=verts, name='L3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#80000 ]',), )
-        p.Set(vertices=verts, name='L4')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#1 ]',), )
-        p.Set(vertices=verts, name='R1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#8 ]',), )
-        p.Set(vertices=verts, name='R2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#10000 ]',), )
-        p.Set(vertices=verts, name='R3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#200000 ]',), )
-        p.Set(vertices=verts, name='R4')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#100 ]',), )
-        p.Set(vertices=verts, name='T1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#4 ]',), )
-        p.Set(vertices=verts, name='T2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#40000 ]',), )
-        p.Set(vertices=verts, name='B1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#100000 ]',), )
-        p.Set(vertices=verts, name='B2')
-        a1 = mdb.models['Model-1'].rootAssembly
-        a1.regenerate()
-        a = mdb.models['Model-1'].rootAssembly
-        session.viewports['Viewport: 1'].setValues(displayedObject=a)
-        mdb.models['Model-1'].Equation(name='Constraint-1', terms=((1.0, 'Part-1-1.L1',
-                                                                    2), (-1.0, 'Part-1-1.R1', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-2', terms=((1.0, 'Part-1-1.L2',
-                                                                    2), (-1.0, 'Part-1-1.R2', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-3', terms=((1.0, 'Part-1-1.L3',
-                                                                    2), (-1.0, 'Part-1-1.R3', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-4', terms=((1.0, 'Part-1-1.L4',
-                                                                    2), (-1.0, 'Part-1-1.R4', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-5', terms=((1.0, 'Part-1-1.B1',
-                                                                    1), (-1.0, 'Part-1-1.T1', 1),
-                                                                   (-1.0, 'Part-1-1.L3', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-6', terms=((1.0, 'Part-1-1.B2',
-                                                                    1), (-1.0, 'Part-1-1.T2', 1),
-                                                                   (-1.0, 'Part-1-1.L3', 1)))
-
-        if loadcase == 'uniaxial':
-            if axis == 'y':
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-5'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-6'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-6'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                           predefinedFields=OFF, interactions=ON,
-                                                                           constraints=ON,
-                                                                           engineeringFeatures=ON)
-
-            if axis == 'x':
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-6'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                           predefinedFields=OFF, interactions=ON,
-                                                                           constraints=ON,
-                                                                           engineeringFeatures=ON)
-
-        if loadcase == 'shear':
-            if axis == 'y':
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                           predefinedFields=OFF, interactions=ON,
-                                                                           constraints=ON,
-                                                                           engineeringFeatures=ON)
-
-            if axis == 'x':
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-5'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-6'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-6'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                           predefinedFields=OFF, interactions=ON,
-                                                                           constraints=ON,
-                                                                           engineeringFeatures=ON)
-
-    # Trellis
-    if structure == 'i':
-        p1 = mdb.models['Model-1'].parts['Part-1']
-        session.viewports['Viewport: 1'].setValues(displayedObject=p1)
-        session.viewports['Viewport: 1'].partDisplay.setValues(sectionAssignments=OFF,
-                                                               engineeringFeatures=OFF, mesh=ON)
-        session.viewports['Viewport: 1'].partDisplay.meshOptions.setValues(
-            meshTechnique=ON)
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#100 ]',), )
-        p.Set(vertices=verts, name='L1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#40 ]',), )
-        p.Set(vertices=verts, name='L2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#4 ]',), )
-        p.Set(vertices=verts, name='L3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#1 ]',), )
-        p.Set(vertices=verts, name='L4')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#400 ]',), )
-        p.Set(vertices=verts, name='R1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#200 ]',), )
-        p.Set(vertices=verts, name='R2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#8 ]',), )
-        p.Set(vertices=verts, name='R3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#10 ]',), )
-        p.Set(vertices=verts, name='R4')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#800 ]',), )
-        p.Set(vertices=verts, name='T1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#20 ]',), )
-        p.Set(vertices=verts, name='B1')
-        a1 = mdb.models['Model-1'].rootAssembly
-        a1.regenerate()
-        a = mdb.models['Model-1'].rootAssembly
-        session.viewports['Viewport: 1'].setValues(displayedObject=a)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(mesh=OFF, loads=ON,
-                                                                   bcs=ON, predefinedFields=ON, connectors=ON)
-        session.viewports['Viewport: 1'].assemblyDisplay.meshOptions.setValues(
-            meshTechnique=OFF)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#800 ]',), )
-        region = a.Set(vertices=verts1, name='Set-1')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-1', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#800 ]',), )
-        region = a.Set(vertices=verts1, name='Set-2')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-2', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#145 ]',), )
-        region = a.Set(vertices=verts1, name='Set-3')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-3', createStepName='Step-1',
-                                                region=region, cf1=-float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#145 ]',), )
-        region = a.Set(vertices=verts1, name='Set-4')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-4', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#20 ]',), )
-        region = a.Set(vertices=verts1, name='Set-5')
-        mdb.models['Model-1'].DisplacementBC(name='BC-1', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#400 ]',), )
-        region = a.Set(vertices=verts1, name='Set-6')
-        mdb.models['Model-1'].DisplacementBC(name='BC-2', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=UNSET, ur3=UNSET, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        mdb.models['Model-1'].DisplacementBC(name='BC-6', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#200 ]',), )
-        region = a.Set(vertices=verts1, name='Set-7')
-        mdb.models['Model-1'].DisplacementBC(name='BC-3', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=UNSET, ur3=UNSET, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        mdb.models['Model-1'].DisplacementBC(name='BC-7', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#8 ]',), )
-        region = a.Set(vertices=verts1, name='Set-8')
-        mdb.models['Model-1'].DisplacementBC(name='BC-4', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#10 ]',), )
-        region = a.Set(vertices=verts1, name='Set-9')
-        mdb.models['Model-1'].DisplacementBC(name='BC-5', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=UNSET, ur3=UNSET, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        mdb.models['Model-1'].DisplacementBC(name='BC-8', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                   predefinedFields=OFF, interactions=ON,
-                                                                   constraints=ON,
-                                                                   engineeringFeatures=ON)
-        mdb.models['Model-1'].Equation(name='Constraint-1', terms=((1.0, 'Part-1-1.L1',
-                                                                    2), (-1.0, 'Part-1-1.R1', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-2', terms=((1.0, 'Part-1-1.L2',
-                                                                    2), (-1.0, 'Part-1-1.R2', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-3', terms=((1.0, 'Part-1-1.L3',
-                                                                    2), (-1.0, 'Part-1-1.R3', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-4', terms=((1.0, 'Part-1-1.L4',
-                                                                    2), (-1.0, 'Part-1-1.R4', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-5', terms=((1.0, 'Part-1-1.B1',
-                                                                    1), (-1.0, 'Part-1-1.T1', 1),
-                                                                   (-1.0, 'Part-1-1.R2', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-6', terms=((1.0, 'Part-1-1.L1',
-                                                                    1), (-1.0, 'Part-1-1.L2', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-7', terms=((1.0, 'Part-1-1.L3',
-                                                                    1), (-1.0, 'Part-1-1.L4', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-8', terms=((1.0, 'Part-1-1.R1',
-                                                                    1), (-1.0, 'Part-1-1.R2', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-9', terms=((1.0, 'Part-1-1.R3',
-                                                                    1), (-1.0, 'Part-1-1.R4', 1),
-                                                                   (-1.0, 'Part-1-1.B1', 1)))
-
-        if loadcase == 'uniaxial':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-5'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-6'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-7'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-8'].suppress()
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-6'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-7'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-8'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-9'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-6'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-7'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-8'].suppress()
-
-        if loadcase == 'shear':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-5'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-6'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-7'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-8'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-6'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-7'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-8'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-9'].suppress()
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-6'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-7'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-8'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-9'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-5'].suppress()
-
-    # No!
-    if structure == 'j':
-        pass
+@timed
+def create_boundary_conditions(structure, edge, force, loadcase, axis, tiling=(1, 1), model_name='Model-1'):
+    m = mdb.models[model_name]
+    p = m.parts['Part-1']
+    sides = boundary_vertices(structure, edge, tiling)
+    features = available_features(structure, loadcase, axis, sides)
+    select = PartSelection(p, TOLERANCE * edge)
+    regions = ([roles for name, roles, direction, sign in features['loads']] +
+               [roles for name, roles, dofs in features['fixed']] +
+               [(role,) for name, roles, dof in features['equations'] for role in roles])
+    for roles in sorted(set(regions)):
+        points = [point for role in roles for point in role_points(sides, role)]
+        p.Set(vertices=select.vertices(points), name='-'.join(roles))
+
+    a = m.rootAssembly
+    a.regenerate()
+    sets = a.instances['Part-1-1'].sets
+    viewport().setValues(displayedObject=a)
+    viewport().assemblyDisplay.setValues(loads=ON, bcs=ON, predefinedFields=ON, interactions=OFF,
+                                         constraints=OFF, engineeringFeatures=OFF)
+
+    for name, roles, direction, sign in features['loads']:
+        m.ConcentratedForce(name=name, createStepName='Step-1', region=sets['-'.join(roles)],
+                            distributionType=UNIFORM, field='', localCsys=None,
+                            **{'cf' + str(direction): sign * float(force)})
+    for name, roles, dofs in features['fixed']:
+        m.DisplacementBC(name=name, createStepName='Step-1', region=sets['-'.join(roles)], amplitude=UNSET, fixed=OFF,
+                         distributionType=UNIFORM, fieldName='', localCsys=None,
+                         **dict((component, 0.0 if dof in dofs else UNSET)
+                                for dof, component in ((1, 'u1'), (2, 'u2'), (6, 'ur3'))))
+    for name, (dependent, first, second), dof in features['equations']:
+        m.Equation(name=name, terms=((1.0, 'Part-1-1.' + dependent, dof), (-1.0, 'Part-1-1.' + first, dof),
+                                     (-1.0, 'Part-1-1.' + second, dof)))
+
+
+'''
+Periodic equations of the Maple Leaf lattice, whose cell was not part of the former macro: in shear x every left node
+follows its periodic image on the right side in y, in shear y every top node follows its image on the bottom side
+in x. The node pairs come from utilities/periodic.py and all equations are written as one *Equation block into the
+keyword block of the model, which takes milliseconds even for large tilings. As the keyword block is synchronised
+here, this has to be the last change to the model before the job is created.
+'''
+@timed
+def create_periodic_equations(structure, edge, loadcase, axis, tiling=(1, 1), model_name='Model-1'):
+    periodic = required_features(structure, loadcase, axis).get('periodic')
+    if periodic is None:
+        return
+
+    dependent, independent, dof = periodic
+    m = mdb.models[model_name]
+    sides = boundary_vertices(structure, edge, tiling)
+    select = PartSelection(m.parts['Part-1'], TOLERANCE * edge)
+    insert_keywords(model_name, equation_block(select.node_labels(sides[dependent]),
+                                               select.node_labels(sides[independent]), dof))
+
+
+'''
+Periodic formulation with a macroscopic strain (see utilities/periodic.py): every node on the right and top side is
+tied to its image on the left and bottom side plus the displacement of a dummy reference point, RP-1 for left/right
+and RP-2 for bottom/top. Any combination of macroscopic strain and stress components is then applied to the two
+reference points alone, and their reaction forces give the effective stress. Without a given strain or stress, the
+classic load case is applied as a resultant force on the matching reference point DOF (uniaxial x: 11,
+uniaxial y: 22, shear x: 12, shear y: 21).
+'''
+@timed
+def create_macro_strain_conditions(structure, edge, force, loadcase, axis, tiling=(1, 1), strain=None, stress=None,
+                                   model_name='Model-1'):
+    width, height, equations = create_reference_points(structure, edge, tiling, model_name)
+    request_reference_output('Step-1', model_name)
+    if not strain and not stress:
+        stress = loadcase_stress(loadcase, axis, force, width, height)
+    create_reference_conditions(reference_conditions(width, height, strain, stress), 'Step-1', '', model_name)
+    insert_keywords(model_name, equations)
+
+
+'''
+Creates the reference points RP-1 and RP-2 next to the right and the top side and pins one node of the left side
+against the rigid body translation. Returns the width and height of the cell and the periodic equations, which have
+to be inserted into the keyword block after all other changes to the model.
+'''
+def create_reference_points(structure, edge, tiling, model_name='Model-1'):
+    m = mdb.models[model_name]
+    a = m.rootAssembly
+    a.regenerate()
+    vertices, edges, vectors = cell_arrays(structure, edge, tiling)
+    width, height = float(vectors[0][0]), float(vectors[1][1])
+
+    for name, point in (('RP-1', (1.1 * width, 0.5 * height, 0.0)), ('RP-2', (0.5 * width, 1.1 * height, 0.0))):
+        reference = a.ReferencePoint(point=point)
+        a.Set(referencePoints=(a.referencePoints[reference.id],), name=name)
+
+    sides = boundary_vertices(structure, edge, tiling)
+    select = PartSelection(m.parts['Part-1'], TOLERANCE * edge)
+    left, right = select.node_labels(sides['Left']), select.node_labels(sides['Right'])
+    bottom, top = select.node_labels(sides['Bottom']), select.node_labels(sides['Top'])
+
+    a.Set(nodes=a.instances['Part-1-1'].nodes.sequenceFromLabels(labels=(int(left[0]),)), name='Pin')
+    m.DisplacementBC(name='BC-Pin', createStepName='Initial', region=a.sets['Pin'], u1=SET, u2=SET,
+                     amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
+
+    equations = macro_equation_block(right, left, 'RP-1') + '\n' + macro_equation_block(top, bottom, 'RP-2')
+    return width, height, equations
+
+
+# Requests the displacements and reaction forces of the reference points from the given step on, which has to exist
+def request_reference_output(step_name, model_name='Model-1'):
+    m = mdb.models[model_name]
+    for name in ('RP-1', 'RP-2'):
+        m.HistoryOutputRequest(name='H-Output-' + name, createStepName=step_name, variables=('U1', 'U2', 'RF1', 'RF2'),
+                               region=m.rootAssembly.sets[name])
+
+
+# Applies the conditions of periodic.reference_conditions in a step, returns the names of the BCs and of the loads
+def create_reference_conditions(conditions, step_name, prefix='', model_name='Model-1'):
+    m = mdb.models[model_name]
+    sets = m.rootAssembly.sets
+    bcs, loads = [], []
+    for reference, dof, kind, value in conditions:
+        name = prefix + reference + '-' + str(dof)
+        if kind == 'displacement':
+            m.DisplacementBC(name='BC-' + name, createStepName=step_name, region=sets[reference],
+                             amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None,
+                             **{'u' + str(dof): value})
+            bcs.append('BC-' + name)
+        else:
+            m.ConcentratedForce(name='Load-' + name, createStepName=step_name, region=sets[reference],
+                                distributionType=UNIFORM, field='', localCsys=None, **{'cf' + str(dof): value})
+            loads.append('Load-' + name)
+    return bcs, loads
 
-    # SHD
-    if structure == 'k':
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#0 #1 ]',), )
-        p.Set(vertices=verts, name='L1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#10000000 ]',), )
-        p.Set(vertices=verts, name='L2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#10000 ]',), )
-        p.Set(vertices=verts, name='L3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#0 #4 ]',), )
-        p.Set(vertices=verts, name='L4')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#20000000 ]',), )
-        p.Set(vertices=verts, name='R1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#2000000 ]',), )
-        p.Set(vertices=verts, name='R2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#20000 ]',), )
-        p.Set(vertices=verts, name='R3')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#4 ]',), )
-        p.Set(vertices=verts, name='R4')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#0 #2 ]',), )
-        p.Set(vertices=verts, name='T1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#40000000 ]',), )
-        p.Set(vertices=verts, name='T2')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#0 #8 ]',), )
-        p.Set(vertices=verts, name='B1')
-        p = mdb.models['Model-1'].parts['Part-1']
-        v = p.vertices
-        verts = v.getSequenceFromMask(mask=('[#1000 ]',), )
-        p.Set(vertices=verts, name='B2')
-        a1 = mdb.models['Model-1'].rootAssembly
-        a1.regenerate()
-        a = mdb.models['Model-1'].rootAssembly
-        session.viewports['Viewport: 1'].setValues(displayedObject=a)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(mesh=OFF, loads=ON,
-                                                                   bcs=ON, predefinedFields=ON, connectors=ON)
-        session.viewports['Viewport: 1'].assemblyDisplay.meshOptions.setValues(
-            meshTechnique=OFF)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#40000000 #2 ]',), )
-        region = a.Set(vertices=verts1, name='Set-1')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-1', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#40000000 #2 ]',), )
-        region = a.Set(vertices=verts1, name='Set-2')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-2', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#22020004 ]',), )
-        region = a.Set(vertices=verts1, name='Set-3')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-3', createStepName='Step-1',
-                                                region=region, cf1=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#22020004 ]',), )
-        region = a.Set(vertices=verts1, name='Set-4')
-        mdb.models['Model-1'].ConcentratedForce(name='Load-4', createStepName='Step-1',
-                                                region=region, cf2=float(force), distributionType=UNIFORM, field='',
-                                                localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#0 #8 ]',), )
-        region = a.Set(vertices=verts1, name='Set-5')
-        mdb.models['Model-1'].DisplacementBC(name='BC-1', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#1000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-6')
-        mdb.models['Model-1'].DisplacementBC(name='BC-2', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#0 #1 ]',), )
-        region = a.Set(vertices=verts1, name='Set-7')
-        mdb.models['Model-1'].DisplacementBC(name='BC-3', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#10000000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-8')
-        mdb.models['Model-1'].DisplacementBC(name='BC-4', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#10000 ]',), )
-        region = a.Set(vertices=verts1, name='Set-9')
-        mdb.models['Model-1'].DisplacementBC(name='BC-5', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        a = mdb.models['Model-1'].rootAssembly
-        v1 = a.instances['Part-1-1'].vertices
-        verts1 = v1.getSequenceFromMask(mask=('[#0 #4 ]',), )
-        region = a.Set(vertices=verts1, name='Set-10')
-        mdb.models['Model-1'].DisplacementBC(name='BC-6', createStepName='Step-1',
-                                             region=region, u1=0.0, u2=0.0, ur3=0.0, amplitude=UNSET, fixed=OFF,
-                                             distributionType=UNIFORM, fieldName='', localCsys=None)
-        session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-                                                                   predefinedFields=OFF, interactions=ON,
-                                                                   constraints=ON,
-                                                                   engineeringFeatures=ON)
-        mdb.models['Model-1'].Equation(name='Constraint-1', terms=((1.0, 'Part-1-1.L1',
-                                                                    2), (-1.0, 'Part-1-1.R1', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-2', terms=((1.0, 'Part-1-1.L2',
-                                                                    2), (-1.0, 'Part-1-1.R2', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-3', terms=((1.0, 'Part-1-1.L3',
-                                                                    2), (-1.0, 'Part-1-1.R3', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-4', terms=((1.0, 'Part-1-1.L4',
-                                                                    2), (-1.0, 'Part-1-1.R4', 2),
-                                                                   (-1.0, 'Part-1-1.B1', 2)))
-        mdb.models['Model-1'].Equation(name='Constraint-5', terms=((1.0, 'Part-1-1.B1',
-                                                                    1), (-1.0, 'Part-1-1.T1', 1),
-                                                                   (-1.0, 'Part-1-1.L3', 1)))
-        mdb.models['Model-1'].Equation(name='Constraint-6', terms=((1.0, 'Part-1-1.B2',
-                                                                    1), (-1.0, 'Part-1-1.T2', 1),
-                                                                   (-1.0, 'Part-1-1.L3', 1)))
-
-        if loadcase == 'uniaxial':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-6'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-5'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-6'].suppress()
-
-            if axis == 'x':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-6'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-
-        if loadcase == 'shear':
-            if axis == 'y':
-                mdb.models['Model-1'].constraints['Constraint-1'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-2'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-3'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-4'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-1'].suppress()
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-1'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-2'].suppress()
-
-            if axis == 'x':
-                session.viewports['Viewport: 1'].view.setValues(nearPlane=1518.81,
-                                                                farPlane=1586.35, width=229.861, height=108.103,
-                                                                viewOffsetX=281.592,
-                                                                viewOffsetY=160.727)
-                mdb.models['Model-1'].constraints['Constraint-5'].suppress()
-                mdb.models['Model-1'].constraints['Constraint-6'].suppress()
-                session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=ON, bcs=ON,
-                                                                           predefinedFields=ON, interactions=OFF,
-                                                                           constraints=OFF,
-                                                                           engineeringFeatures=OFF)
-                mdb.models['Model-1'].loads['Load-2'].suppress()
-                mdb.models['Model-1'].loads['Load-3'].suppress()
-                mdb.models['Model-1'].loads['Load-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-3'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-4'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-5'].suppress()
-                mdb.models['Model-1'].boundaryConditions['BC-6'].suppress()
-
-
-
-def run_analysis(workdir):
-    job_number = 1
-    session.viewports['Viewport: 1'].assemblyDisplay.setValues(loads=OFF, bcs=OFF,
-        predefinedFields=OFF, connectors=OFF)
 
-    while os.path.exists(str(workdir)+'/Job-'+str(job_number)+'.odb'):
-        job_number += 1
-    mdb.Job(name='Job-'+str(job_number), model='Model-1', description='', type=ANALYSIS,
+'''
+Runs several load cases of the periodic formulation in one job, as they all share the same mesh and equations.
+The force of every case is the resultant on the loaded side of the cell, as in create_macro_strain_conditions.
+    - linear: one linear perturbation step with one load case per case, so the stiffness matrix is only
+      factorized once
+    - nonlinear: one general step per case followed by a reset step, in which the loads of the case are removed
+      again, so every case starts from the undeformed lattice
+'''
+@timed
+def create_load_cases(structure, edge, model, force, cases, tiling=(1, 1), model_name='Model-1'):
+    m = mdb.models[model_name]
+    width, height, equations = create_reference_points(structure, edge, tiling, model_name)
+    if model == 'linear':
+        m.StaticLinearPerturbationStep(name='Step-1', previous='Initial')
+        request_reference_output('Step-1', model_name)
+
+    previous_step, previous_bcs = 'Initial', []
+    for loadcase, axis in cases:
+        label = loadcase + '-' + axis
+        conditions = reference_conditions(width, height, stress=loadcase_stress(loadcase, axis, force, width, height))
+
+        if model == 'linear':
+            bcs, loads = create_reference_conditions(conditions, 'Step-1', label + '-', model_name)
+            m.steps['Step-1'].LoadCase(name=label, boundaryConditions=tuple((name, 1.0) for name in bcs),
+                                       loads=tuple((name, 1.0) for name in loads), includeActiveBaseStateBC=ON)
+
+        if model == 'nonlinear':
+            step_name = 'Case-' + label
+            m.StaticStep(name=step_name, previous=previous_step, initialInc=0.001, minInc=1e-09, nlgeom=ON)
+            if previous_step == 'Initial':
+                # The output is requested from the first case on, which only exists from here on
+                request_reference_output(step_name, model_name)
+            for name in previous_bcs:
+                m.boundaryConditions[name].deactivate(step_name)
+            previous_bcs, loads = create_reference_conditions(conditions, step_name, label + '-', model_name)
+
+            reset_name = 'Reset-' + label
+            m.StaticStep(name=reset_name, previous=step_name, initialInc=0.001, minInc=1e-09, nlgeom=ON)
+            for name in loads:
+                m.loads[name].deactivate(reset_name)
+            previous_step = reset_name
+
+    insert_keywords(model_name, equations)
+
+
+# Inserts keywords into the input file of a model right before the end of the assembly
+def insert_keywords(model_name, text):
+    if not text:
+        return
+    block = mdb.models[model_name].keywordBlock
+    block.synchVersions(storeNodesAndElements=False)
+    for position, keywords in enumerate(block.sieveBlocks):
+        if keywords.startswith('*End Assembly'):
+            block.insert(position - 1, text)
+            return
+    raise ValueError('The model ' + model_name + ' has no assembly to insert the keywords into')
+
+
+'''
+Parallel settings of the job of a model (utilities/parallel.py). They are read from the environment variables
+LATTICE_JOB_CPUS (a number or 'auto', the default), LATTICE_JOB_DOMAINS, LATTICE_JOB_THREADS and LATTICE_JOB_MP_MODE
+('default', 'threads' or 'mpi'). 'auto' chooses the CPUs from the elements and equations of the model, the cores
+(LATTICE_CORES or all cores of the machine) and the number of jobs running at the same time.
+'''
+def job_settings(model_name='Model-1', concurrent_jobs=1):
+    model = mdb.models[model_name]
+    elements = sum(len(instance.elements) for instance in model.rootAssembly.instances.values())
+    # Every equation of an inserted *Equation block starts with a line holding only its number of terms
+    model.keywordBlock.synchVersions(storeNodesAndElements=False)
+    equations = len(model.constraints) + sum(
+        sum(1 for line in keywords.splitlines()[1:] if line.strip().isdigit())
+        for keywords in model.keywordBlock.sieveBlocks if keywords.startswith('*Equation'))
+    return solver_settings(elements, equations, int(os.environ.get('LATTICE_CORES') or multiprocessing.cpu_count()),
+                           concurrent_jobs, os.environ.get('LATTICE_JOB_CPUS', 'auto'),
+                           os.environ.get('LATTICE_JOB_DOMAINS'), os.environ.get('LATTICE_JOB_THREADS'),
+                           os.environ.get('LATTICE_JOB_MP_MODE'))
+
+
+'''
+Creates a job under a new name Job-N, claimed from the counter of the working directory (utilities/jobnames.py),
+or under the given name, claimed before.
+'''
+def create_job(workdir, model_name='Model-1', settings=None, job_name=None):
+    settings = settings or job_settings(model_name)
+    job_name = job_name or allocate_job_name(str(workdir))
+    mdb.Job(name=job_name, model=model_name, description='', type=ANALYSIS,
         atTime=None, waitMinutes=0, waitHours=0, queue=None, memory=90,
         memoryUnits=PERCENTAGE, getMemoryFromAnalysis=True,
         explicitPrecision=SINGLE, nodalOutputPrecision=SINGLE, echoPrint=OFF,
         modelPrint=OFF, contactPrint=OFF, historyPrint=OFF, userSubroutine='',
-        scratch='', resultsFormat=ODB)
-    mdb.jobs['Job-'+str(job_number)].submit(consistencyChecking=OFF)
-    session.mdbData.summary()
+        scratch='', resultsFormat=ODB, numCpus=settings['cpus'],
+        numDomains=settings['domains'], numThreadsPerMpiProcess=settings['threads'],
+        multiprocessingMode={'default': DEFAULT, 'threads': THREADS, 'mpi': MPI}[settings['method']])
+    return job_name
 
-    while not os.path.exists(str(workdir)+'/Job-'+str(job_number)+'.odb'):
-        time.sleep(1)
 
-    time.sleep(3)
+'''
+Solves the model and opens the ODB. The input file is written and hashed first (utilities/resultcache.py), if it has
+been solved before, the cached ODB is opened instead. force=True (or LATTICE_FORCE_RERUN=1) always solves it.
+job_name is a name claimed before with allocate_job_name, by default a new one is claimed.
+'''
+@timed
+def run_analysis(workdir, model_name='Model-1', force=None, job_name=None):
+    viewport().assemblyDisplay.setValues(loads=OFF, bcs=OFF,
+        predefinedFields=OFF, connectors=OFF)
+
+    job_name = create_job(workdir, model_name, job_name=job_name)
+    odb_path = str(workdir)+'/'+job_name+'.odb'
+    mdb.jobs[job_name].writeInput(consistencyChecking=OFF)
+    key = input_key(str(workdir)+'/'+job_name+'.inp')
+    if force is None:
+        force = force_rerun
+    if force or not result_cache.restore(key, odb_path):
+        mdb.jobs[job_name].submit(consistencyChecking=OFF)
+        session.mdbData.summary()
+
+        mdb.jobs[job_name].waitForCompletion()
+        if job_outcome(workdir, job_name) != 'completed':
+            message = ('The job ' + job_name + ' has been aborted.\nPlease see ' + job_name + '.msg and ' + job_name +
+                       '.dat')
+            if interactive:
+                getWarningReply(message, buttons=(YES,))
+            else:
+                print(message)
+            return job_name
+        result_cache.put(key, odb_path)
+
+    o3 = session.openOdb(name=odb_path)
+    viewport().setValues(displayedObject=o3)
+    viewport().odbDisplay.display.setValues(plotState=(
+        UNDEFORMED, DEFORMED, ))
+    viewport().odbDisplay.display.setValues(plotState=(
+        UNDEFORMED, DEFORMED, CONTOURS_ON_DEF, ))
+    return job_name
+
+'''
+Returns 'completed' or 'aborted' for a job after waitForCompletion, which returns with the JOB_COMPLETED or
+JOB_ABORTED message of the job. The status of the job tells how it ended, and after a completed job only the lock of
+the ODB has to be released by the solver (utilities/jobwatch.py). Only if CAE does not know the status, the log file
+of the job is read, for at most LATTICE_JOB_TIMEOUT seconds, so an unexpected log cannot block the batch.
+'''
+def job_outcome(workdir, job_name):
+    status = mdb.jobs[job_name].status
+    if status == COMPLETED:
+        if not wait_for_release(str(workdir), job_name, 60.0):
+            print('The solver of ' + job_name + ' still holds the lock of its ODB')
+        return 'completed'
+    if status in (ABORTED, TERMINATED):
+        return 'aborted'
+    try:
+        return wait_for_job(str(workdir), job_name, timeout=job_timeout)
+    except RuntimeError as error:
+        print(str(error))
+        return 'aborted'
 
-    execution = 0
-    while execution == 0:
-        try:
-            o3 = session.openOdb(name=str(workdir)+'/Job-'+str(job_number)+'.odb')
-            session.viewports['Viewport: 1'].setValues(displayedObject=o3)
-            session.viewports['Viewport: 1'].odbDisplay.display.setValues(plotState=(
-                UNDEFORMED, DEFORMED, ))
-            session.viewports['Viewport: 1'].odbDisplay.display.setValues(plotState=(
-                UNDEFORMED, DEFORMED, CONTOURS_ON_DEF, ))
-            execution = 1
-        except:
-            time.sleep(1)
 
 if __name__ == "__main__":
-    main()
-else:
+    spec_file = spec_file_from_argv(sys.argv)
+    if os.environ.get('LATTICE_QUEUE'):
+        run_worker(os.environ['LATTICE_QUEUE'])
+    elif os.environ.get('LATTICE_KERNEL_PORT'):
+        run_server(kernel_port())
+    elif spec_file:
+        run_batch(spec_file)
+    else:
+        main()
+# Imported by the stand-in (utilities/abaqus_standin), e.g. by the benchmarks, main.py stays silent
+elif not getattr(sys.modules['abaqus'], 'STANDIN', False):
     print("Please run main.py via Abaqus CAE by using 'File > Run Script... > main.py'")
 
@@ -0,0 +1,50 @@
+'''
+Shared fixtures of the tests. They run in plain Python: main.py is imported with the recording stand-in of the
+Abaqus API (utilities/abaqus_standin), whose jobs run utilities/standin_solver.py without waiting.
+
+    python -m pytest -q
+'''
+import os
+import socket
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+# main.py with the stand-in, imported once in a working directory of its own for its caches and jobs
+@pytest.fixture(scope='session')
+def main_module(tmp_path_factory):
+    from utilities import abaqus_standin
+
+    os.environ['LATTICE_STANDIN_SECONDS'] = '0'
+    start_directory = os.getcwd()
+    os.chdir(str(tmp_path_factory.mktemp('workdir')))
+    try:
+        abaqus_standin.install()
+        import main
+    finally:
+        os.chdir(start_directory)
+    main.interactive = False
+    return main
+
+
+# main.py in its working directory with an empty model database; the stand-in writes the jobs to the current one
+@pytest.fixture
+def pipeline(main_module, monkeypatch):
+    monkeypatch.chdir(main_module.workdir)
+    main_module.new_start()
+    return main_module
+
+
+# A port on 127.0.0.1 which is free right now, for a kernel (utilities/kernelserver.py)
+@pytest.fixture
+def free_port():
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.bind(('127.0.0.1', 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    return port
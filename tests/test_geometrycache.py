@@ -0,0 +1,63 @@
+import os
+import time
+
+import numpy as np
+
+from utilities import lattices, tilings
+from utilities.geometrycache import GeometryCache
+
+
+def _build(structure, edge, tiling):
+    vertices, edges, vectors = tilings.unit_cell(structure, edge)
+    return tilings.supercell(vertices, edges, vectors, tiling[0], tiling[1])
+
+
+def test_a_stored_geometry_is_loaded_unchanged(tmp_path):
+    cache = GeometryCache(str(tmp_path))
+    built = cache.load_or_build('k', 20.0, (2, 1), lambda: _build('k', 20.0, (2, 1)))
+    loaded = cache.load_or_build('k', 20.0, (2, 1), lambda: None)
+    for first, second in zip(built, loaded):
+        assert np.array_equal(first, second)
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert [name for name in os.listdir(str(tmp_path)) if not name.endswith('.npz')] == []
+
+
+def test_every_part_of_the_key_counts(tmp_path):
+    cache = GeometryCache(str(tmp_path))
+    cache.put('a', 20.0, (1, 1), *_build('a', 20.0, (1, 1)))
+    assert cache.get('a', 20.0, (1, 1)) is not None
+    assert cache.get('a', 10.0, (1, 1)) is None and cache.get('a', 20.0, (1, 2)) is None
+    assert cache.get('b', 20.0, (1, 1)) is None
+    cache.version = 'changed-code'
+    assert cache.get('a', 20.0, (1, 1)) is None
+
+
+def test_the_least_recently_used_entries_are_evicted(tmp_path):
+    cache = GeometryCache(str(tmp_path), max_entries=2)
+    for age, structure in ((300, 'a'), (200, 'b')):
+        cache.put(structure, 20.0, (1, 1), *_build(structure, 20.0, (1, 1)))
+        old = time.time() - age
+        os.utime(cache.path(structure, 20.0, (1, 1)), (old, old))
+    # The hit makes 'a' the most recently used entry, so 'b' goes when 'c' is added
+    assert cache.get('a', 20.0, (1, 1)) is not None
+    cache.put('c', 20.0, (1, 1), *_build('c', 20.0, (1, 1)))
+    assert cache.get('b', 20.0, (1, 1)) is None
+    assert cache.get('a', 20.0, (1, 1)) is not None and cache.get('c', 20.0, (1, 1)) is not None
+
+
+def test_the_size_budget_is_kept(tmp_path, monkeypatch):
+    monkeypatch.setenv('LATTICE_GEOMETRY_CACHE_MB', '0')
+    cache = GeometryCache(str(tmp_path))
+    cache.put('a', 20.0, (1, 1), *_build('a', 20.0, (1, 1)))
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_unit_cells_are_taken_from_the_cache(tmp_path):
+    cache = GeometryCache(str(tmp_path))
+    lattices.use_geometry_cache(cache)
+    try:
+        first = lattices.unit_cell('h', 20.0, (2, 2))
+        second = lattices.unit_cell('h', 20.0, (2, 2))
+    finally:
+        lattices.use_geometry_cache(None)
+    assert first == second and (cache.misses, cache.hits) == (1, 1)
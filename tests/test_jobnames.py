@@ -0,0 +1,105 @@
+import multiprocessing
+import os
+import threading
+import time
+
+from utilities import jobnames
+from utilities.jobnames import COUNTER, LOCK_TIMEOUT, allocate_job_name, allocate_job_names
+
+
+def _claim(directory):
+    return allocate_job_names(directory, 3)
+
+
+def test_concurrent_sessions_never_share_a_name(tmp_path):
+    directory = str(tmp_path)
+    pool = multiprocessing.Pool(8)
+    try:
+        names = sum(pool.map(_claim, [directory] * 64), [])
+    finally:
+        pool.close()
+        pool.join()
+    assert len(set(names)) == len(names) == 192
+    assert sorted(int(name.split('-')[1]) for name in names) == list(range(1, 193))
+    assert sorted(os.listdir(directory)) == [COUNTER]
+
+
+def test_counter_starts_after_existing_results(tmp_path):
+    for name in ('Job-4.odb', 'Job-7.inp', 'Job-9.odb'):
+        (tmp_path / name).write_text(u'')
+    assert allocate_job_name(str(tmp_path)) == 'Job-10'
+
+
+def test_numbers_with_results_are_skipped(tmp_path):
+    assert allocate_job_name(str(tmp_path)) == 'Job-1'
+    (tmp_path / 'Job-2.odb').write_text(u'')
+    assert allocate_job_names(str(tmp_path), 2) == ['Job-3', 'Job-4']
+
+
+def _stale_lock(tmp_path, name=COUNTER + '.lock'):
+    lock = str(tmp_path / name)
+    with open(lock, 'w') as owner:
+        owner.write('crashed-host 1 1 0.0\n')
+    old = time.time() - 2 * LOCK_TIMEOUT
+    os.utime(lock, (old, old))
+    return lock
+
+
+def test_stale_lock_is_broken(tmp_path):
+    _stale_lock(tmp_path)
+    assert allocate_job_name(str(tmp_path)) == 'Job-1'
+    assert sorted(os.listdir(str(tmp_path))) == [COUNTER]
+
+
+def test_stale_break_lock_is_removed(tmp_path):
+    _stale_lock(tmp_path)
+    _stale_lock(tmp_path, COUNTER + '.lock.break')
+    assert allocate_job_name(str(tmp_path)) == 'Job-1'
+    assert sorted(os.listdir(str(tmp_path))) == [COUNTER]
+
+
+def test_fresh_lock_is_not_broken(tmp_path):
+    lock = tmp_path / (COUNTER + '.lock')
+    lock.write_text(u'other-host 1 1 0.0\n')
+    jobnames._CounterLock(str(lock))._break_stale()
+    assert lock.read_text() == u'other-host 1 1 0.0\n'
+
+
+# A session holding the lock longer than LOCK_TIMEOUT keeps it fresh, the other sessions wait for it
+def test_lock_held_longer_than_the_timeout_is_kept(tmp_path, monkeypatch):
+    monkeypatch.setattr(jobnames, 'LOCK_TIMEOUT', 0.2)
+    path = str(tmp_path / (COUNTER + '.lock'))
+    events = []
+
+    def hold():
+        with jobnames._CounterLock(path):
+            events.append('taken')
+            time.sleep(0.8)
+            events.append('released')
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    while not events:
+        time.sleep(0.01)
+    with jobnames._CounterLock(path):
+        events.append('second')
+    holder.join()
+    assert events == ['taken', 'released', 'second']
+
+
+def test_a_broken_lock_is_not_released_by_its_former_owner(tmp_path):
+    path = str(tmp_path / (COUNTER + '.lock'))
+    with jobnames._CounterLock(path):
+        # Broken and taken by another session in the meantime
+        os.remove(path)
+        with open(path, 'w') as owner:
+            owner.write('other-host 1 1 0.0\n')
+    assert os.path.exists(path)
+
+
+def test_counter_is_replaced_not_rewritten(tmp_path):
+    allocate_job_name(str(tmp_path))
+    counter = tmp_path / COUNTER
+    before = os.stat(str(counter)).st_ino
+    allocate_job_name(str(tmp_path))
+    assert os.stat(str(counter)).st_ino != before and counter.read_text().strip() == '3'
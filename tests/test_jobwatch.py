@@ -0,0 +1,75 @@
+import os
+import threading
+import time
+
+import pytest
+
+from utilities import jobwatch
+from utilities.jobwatch import (ABORTED, COMPLETED, RUNNING, DirectoryEvents, job_state, wait_for_job,
+                                wait_for_release)
+
+
+def _write(path, text):
+    with open(path, 'w') as target:
+        target.write(text)
+
+
+def test_state_follows_the_lock_and_the_last_log_line(tmp_path):
+    directory = str(tmp_path)
+    assert job_state(directory, 'Job-1') is None
+    _write(os.path.join(directory, 'Job-1.log'), 'Abaqus JOB Job-1\nBegin Abaqus/Standard Analysis\n')
+    assert job_state(directory, 'Job-1') == RUNNING
+    _write(os.path.join(directory, 'Job-1.log'), 'Abaqus JOB Job-1\nAbaqus JOB Job-1 COMPLETED\n')
+    _write(os.path.join(directory, 'Job-1.lck'), '')
+    assert job_state(directory, 'Job-1') == RUNNING
+    os.remove(os.path.join(directory, 'Job-1.lck'))
+    assert job_state(directory, 'Job-1') == COMPLETED
+    _write(os.path.join(directory, 'Job-2.log'), 'Abaqus/Analysis exited with errors\n')
+    assert job_state(directory, 'Job-2') == ABORTED
+
+
+def test_waiting_ends_when_the_job_writes_its_end(tmp_path):
+    directory = str(tmp_path)
+
+    def solve():
+        time.sleep(0.1)
+        _write(os.path.join(directory, 'Job-1.lck'), '')
+        _write(os.path.join(directory, 'Job-1.log'), 'Abaqus JOB Job-1 COMPLETED\n')
+        time.sleep(0.1)
+        os.remove(os.path.join(directory, 'Job-1.lck'))
+
+    solver = threading.Thread(target=solve)
+    solver.start()
+    try:
+        assert wait_for_job(directory, 'Job-1', timeout=10.0) == COMPLETED
+    finally:
+        solver.join()
+
+
+def test_waiting_has_a_timeout(tmp_path):
+    with pytest.raises(RuntimeError):
+        wait_for_job(str(tmp_path), 'Job-1', timeout=0.05)
+
+
+def test_polling_is_the_fallback_without_inotify(tmp_path, monkeypatch):
+    monkeypatch.setattr(jobwatch, '_inotify_library', lambda: None)
+    events = DirectoryEvents(str(tmp_path))
+    try:
+        assert events.descriptor is None
+        events.wait(1.0)
+        events.wait(1.0)
+        assert events.delay == 0.04
+    finally:
+        events.close()
+
+
+def test_the_release_of_the_lock_is_waited_for(tmp_path):
+    lock = os.path.join(str(tmp_path), 'Job-1.lck')
+    _write(lock, '')
+    assert not wait_for_release(str(tmp_path), 'Job-1', 0.05)
+    remover = threading.Timer(0.1, os.remove, (lock,))
+    remover.start()
+    try:
+        assert wait_for_release(str(tmp_path), 'Job-1', 10.0)
+    finally:
+        remover.join()
@@ -0,0 +1,59 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from utilities.kernelserver import KernelClient, serve
+
+
+# Starts serve(process) in a thread, returns a client connected to it and the list the thread puts its result in
+def start_kernel(process, port):
+    served = []
+    thread = threading.Thread(target=lambda: served.append(serve(process, port)))
+    thread.daemon = True
+    thread.start()
+    for _ in range(100):
+        try:
+            return thread, KernelClient(port, timeout=30.0), served
+        except socket.error:
+            time.sleep(0.05)
+    raise RuntimeError('The kernel did not start')
+
+
+def test_round_trip(free_port):
+    thread, client, served = start_kernel(lambda run: {'state': 'done', 'job': 'Job-' + run['structure'],
+                                                       'tiling': list(run['tiling'])}, free_port)
+    try:
+        # The runs are completed like the ones of a spec file
+        assert client.run({'structure': 'a', 'tiling': '2 x 2'}) == {'state': 'done', 'job': 'Job-a',
+                                                                      'tiling': [2, 2]}
+        with pytest.raises(RuntimeError) as error:
+            client.run({'structure': 'z'})
+        assert "structure = 'z'" in str(error.value)
+        with pytest.raises(RuntimeError):
+            client.request('restart')
+        # Refused requests do not stop the kernel
+        assert client.run({'structure': 'b'})['job'] == 'Job-b'
+        assert client.request('ping') == {'runs': 2}
+        assert client.request('shutdown') is None
+    finally:
+        client.close()
+    thread.join(10.0)
+    assert served == [2]
+
+
+def test_failing_run_is_sent_back(free_port):
+    def process(run):
+        raise ValueError('The mesh of ' + run['structure'] + ' failed')
+
+    thread, client, served = start_kernel(process, free_port)
+    try:
+        with pytest.raises(RuntimeError) as error:
+            client.run({'structure': 'c'})
+        assert str(error.value) == 'The mesh of c failed'
+        client.request('shutdown')
+    finally:
+        client.close()
+    thread.join(10.0)
+    assert served == [0]
@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from utilities.lattices import CATALOG, TOLERANCE, boundary_vertices
+
+EDGE = 20.0
+
+
+@pytest.mark.parametrize('structure', sorted(CATALOG))
+def test_every_boundary_vertex_faces_its_image(structure):
+    sides = boundary_vertices(structure, EDGE)
+    assert all(len(sides[side]) for side in ('Left', 'Right', 'Bottom', 'Top'))
+    assert np.allclose([y for x, y in sides['Left']], [y for x, y in sides['Right']], atol=TOLERANCE * EDGE)
+    assert np.allclose([x for x, y in sides['Bottom']], [x for x, y in sides['Top']], atol=TOLERANCE * EDGE)
+
+
+@pytest.mark.parametrize('structure', sorted(CATALOG))
+def test_the_cell_scales_with_the_edge_length(structure):
+    small, large = boundary_vertices(structure, 1.0), boundary_vertices(structure, EDGE)
+    for side in small:
+        assert np.allclose(EDGE * np.array(small[side]), large[side])
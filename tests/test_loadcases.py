@@ -0,0 +1,72 @@
+import pytest
+
+from utilities.lattices import boundary_vertices
+from utilities.loadcases import FEATURES, available_features, required_features, role_points
+from utilities.runspec import AXES, LOADCASES, STRUCTURES
+
+CASES = [(loadcase, axis) for loadcase in LOADCASES for axis in AXES]
+
+
+def test_every_structure_has_every_load_case():
+    assert sorted(FEATURES) == sorted((structure, loadcase, axis) for structure in STRUCTURES
+                                      for loadcase, axis in CASES)
+
+
+# Every vertex DOF is loaded, fixed or the dependent one of an equation at most once
+@pytest.mark.parametrize('structure', STRUCTURES)
+@pytest.mark.parametrize('loadcase, axis', CASES)
+def test_the_available_features_do_not_contradict_each_other(structure, loadcase, axis):
+    sides = boundary_vertices(structure, 20.0)
+    features = available_features(structure, loadcase, axis, sides)
+    assert len(features['loads']) and len(features['fixed'])
+
+    fixed, dependent = set(), set()
+    for name, roles, dofs in features['fixed']:
+        for role in roles:
+            for point in role_points(sides, role):
+                assert not fixed & set((point, dof) for dof in dofs)
+                fixed.update((point, dof) for dof in dofs)
+    for name, roles, direction, sign in features['loads']:
+        for role in roles:
+            assert not [point for point in role_points(sides, role) if (point, direction) in fixed]
+    for name, roles, dof in features['equations']:
+        point, = role_points(sides, roles[0])
+        assert (point, dof) not in fixed | dependent
+        dependent.add((point, dof))
+
+
+# The square and the octagonal lattice have one vertex per side, exactly as in the cells of the macro
+@pytest.mark.parametrize('structure', ['a', 'd'])
+def test_roles_of_cells_with_one_vertex_per_side_are_these_vertices(structure):
+    sides = boundary_vertices(structure, 20.0)
+    for letter, side in (('L', 'Left'), ('R', 'Right'), ('B', 'Bottom'), ('T', 'Top')):
+        assert role_points(sides, letter + '1') == sides[side]
+        assert role_points(sides, letter + '2') == []
+
+
+def test_roles_count_from_the_bottom_and_from_the_left():
+    sides = boundary_vertices('c', 1.0)
+    assert [point[1] for role in ('L1', 'L2', 'L3', 'L4') for point in role_points(sides, role)] == \
+        sorted(point[1] for point in sides['Left'])
+    assert role_points(sides, 'T1')[0][0] < role_points(sides, 'T2')[0][0]
+    assert role_points(sides, 'Top') == sides['Top']
+
+
+def test_missing_roles_are_left_out():
+    features = available_features('c', 'uniaxial', 'y', boundary_vertices('c', 20.0))
+    assert [name for name, roles, dofs in features['fixed']] == ['BC-1', 'BC-2']
+    assert [name for name, roles, dof in features['equations']] == ['Constraint-uni-y-L']
+    features = available_features('c', 'uniaxial', 'x', boundary_vertices('c', 20.0))
+    assert features['loads'] == [('Load-3', ('R1',), 1, 1)]
+
+
+def test_the_macro_loads_the_square_in_y_in_both_uniaxial_cases():
+    assert required_features('a', 'uniaxial', 'x') == required_features('a', 'uniaxial', 'y')
+    assert required_features('a', 'uniaxial', 'x')['loads'] == [('Load-2', ('T1',), 2, 1)]
+
+
+def test_an_unknown_load_case_is_refused():
+    with pytest.raises(ValueError):
+        required_features('a', 'torsion', 'x')
+    with pytest.raises(ValueError):
+        required_features('z', 'shear', 'x')
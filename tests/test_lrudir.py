@@ -0,0 +1,57 @@
+import os
+import time
+
+import pytest
+
+from utilities.lrudir import LRUDirectory
+
+
+def _fill(store, names, size=10):
+    old = time.time() - 100
+    for number, name in enumerate(names):
+        path = os.path.join(store.directory, name + '.bin')
+        store.write(path, lambda target: target.write(b'x' * size))
+        os.utime(path, (old + number, old + number))
+
+
+def _names(store):
+    return sorted(name for name in os.listdir(store.directory))
+
+
+def test_the_least_recently_used_files_go_first(tmp_path):
+    store = LRUDirectory(str(tmp_path / 'store'), '.bin', max_bytes=1000, max_entries=2)
+    _fill(store, ['a', 'b'])
+    store.touch(os.path.join(store.directory, 'a.bin'))
+    _fill(store, ['c'])
+    assert _names(store) == ['a.bin', 'c.bin']
+
+
+def test_the_size_budget_is_kept(tmp_path):
+    store = LRUDirectory(str(tmp_path / 'store'), '.bin', max_bytes=25)
+    _fill(store, ['a', 'b', 'c'])
+    assert _names(store) == ['b.bin', 'c.bin']
+
+
+def test_a_failed_write_leaves_the_old_file(tmp_path):
+    store = LRUDirectory(str(tmp_path / 'store'), '.bin', max_bytes=1000)
+    _fill(store, ['a'])
+
+    def failing(target):
+        target.write(b'half')
+        raise IOError('disk full')
+
+    with pytest.raises(IOError):
+        store.write(os.path.join(store.directory, 'a.bin'), failing)
+    assert _names(store) == ['a.bin']
+    with open(os.path.join(store.directory, 'a.bin'), 'rb') as cached:
+        assert cached.read() == b'x' * 10
+
+
+def test_other_files_are_left_alone(tmp_path):
+    store = LRUDirectory(str(tmp_path / 'store'), '.bin', max_bytes=1000, max_entries=1)
+    with open(os.path.join(store.directory, 'notes.txt'), 'w') as notes:
+        notes.write('keep')
+    _fill(store, ['a', 'b'])
+    assert _names(store) == ['b.bin', 'notes.txt']
+    store.clear()
+    assert _names(store) == ['notes.txt']
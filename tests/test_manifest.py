@@ -0,0 +1,99 @@
+import os
+import time
+
+import pytest
+
+from utilities.manifest import SweepManifest, run_key
+from utilities.runspec import complete_run
+
+RUNS = [complete_run({'structure': structure}) for structure in ('a', 'b')]
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    manifest = SweepManifest(str(tmp_path / 'runs.manifest.sqlite'))
+    yield manifest
+    manifest.close()
+
+
+def _touch(path, text=''):
+    with open(str(path), 'w') as target:
+        target.write(text)
+
+
+def test_the_key_does_not_depend_on_the_order_of_the_values():
+    assert run_key({'structure': 'a', 'edge': 20.0}) == run_key({'edge': 20.0, 'structure': 'a'})
+    assert run_key(RUNS[0]) != run_key(RUNS[1])
+
+
+def test_runs_are_registered_once(manifest):
+    keys = manifest.register(RUNS)
+    manifest.mark(keys[0], 'done', job='Job-1', odb='Job-1.odb')
+    assert manifest.register(RUNS) == keys
+    assert manifest.incomplete(keys) == keys[1:]
+    assert dict(manifest.summary()) == {'pending': 1, 'claimed': 0, 'built': 0, 'submitted': 0, 'done': 1,
+                                         'failed': 0}
+    with pytest.raises(ValueError):
+        manifest.mark(keys[1], 'solved')
+
+
+def test_submitted_runs_are_settled_after_a_crash(manifest, tmp_path):
+    keys = manifest.register(RUNS)
+    manifest.mark(keys[0], 'submitted', job='Job-1')
+    manifest.mark(keys[1], 'submitted', job='Job-2')
+    # Job-1 completed before the crash, Job-2 was aborted
+    _touch(tmp_path / 'Job-1.odb')
+    _touch(tmp_path / 'Job-1.log', 'Abaqus JOB Job-1 COMPLETED\n')
+    _touch(tmp_path / 'Job-2.odb')
+    _touch(tmp_path / 'Job-2.log', 'Abaqus/Analysis exited with errors\n')
+
+    manifest.recover(str(tmp_path))
+    assert [manifest.state(key) for key in keys] == ['done', 'pending']
+    assert manifest.connection.execute('SELECT odb FROM runs WHERE key = ?', (keys[0],)).fetchone()[0] == \
+        os.path.join(str(tmp_path), 'Job-1.odb')
+
+
+# Job-1 is still solving, the crashed session left a lock file and an unfinished log
+def test_a_running_job_stays_submitted(manifest, tmp_path):
+    keys = manifest.register(RUNS)
+    manifest.mark(keys[0], 'submitted', job='Job-1')
+    manifest.mark(keys[1], 'submitted', job='Job-2')
+    _touch(tmp_path / 'Job-1.lck')
+    _touch(tmp_path / 'Job-2.log', 'Abaqus JOB Job-2\nBegin Abaqus/Standard Analysis\n')
+
+    manifest.recover(str(tmp_path))
+    assert [manifest.state(key) for key in keys] == ['submitted', 'submitted']
+
+
+def test_a_run_is_claimed_by_one_session(manifest, tmp_path):
+    keys = manifest.register(RUNS)
+    other = SweepManifest(manifest.path, owner='other-host-1')
+    try:
+        assert manifest.claim(keys[0]) and not other.claim(keys[0])
+        manifest.mark(keys[0], 'done')
+        assert not other.claim(keys[0])
+        manifest.mark(keys[1], 'failed')
+        assert other.claim(keys[1]) and not manifest.claim(keys[1])
+    finally:
+        other.close()
+
+
+# The runs of a session with a recent heartbeat are left alone, the ones of a crashed session are taken back
+def test_only_the_runs_of_crashed_sessions_are_taken_back(manifest, tmp_path):
+    keys = manifest.register(RUNS)
+    alive = SweepManifest(manifest.path, owner='alive-host-1')
+    crashed = SweepManifest(manifest.path, owner='crashed-host-1')
+    try:
+        alive.beat(alive.owner)
+        crashed.beat(crashed.owner)
+        assert alive.claim(keys[0]) and crashed.claim(keys[1])
+        crashed.mark(keys[1], 'built')
+        with crashed.connection:
+            crashed.connection.execute('UPDATE sessions SET beat = ? WHERE owner = ?',
+                                       (time.time() - 2 * crashed.stale_after, crashed.owner))
+
+        manifest.recover(str(tmp_path))
+        assert [manifest.state(key) for key in keys] == ['claimed', 'pending']
+    finally:
+        alive.close()
+        crashed.connection.close()
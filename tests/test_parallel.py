@@ -0,0 +1,38 @@
+import pytest
+
+from utilities.parallel import PER_CORE, auto_cpus, command_options, solver_settings
+
+
+def test_a_small_model_runs_on_one_core():
+    assert solver_settings(500, 100, 16) == {'cpus': 1, 'domains': 1, 'threads': 1, 'method': 'threads'}
+
+
+def test_concurrent_jobs_share_the_cores():
+    assert auto_cpus(8 * PER_CORE, 0, 16) == 8
+    assert auto_cpus(8 * PER_CORE, 0, 16, concurrent_jobs=4) == 4
+    # A model large enough for all cores takes them all, however many jobs wait
+    assert auto_cpus(100 * PER_CORE, 0, 16, concurrent_jobs=4) == 16
+
+
+def test_more_cpus_than_threads_of_one_process_run_as_mpi():
+    settings = solver_settings(10 ** 6, 0, 24)
+    assert settings == {'cpus': 24, 'domains': 24, 'threads': 8, 'method': 'mpi'}
+    assert command_options(settings) == ['cpus=24', 'domains=24', 'mp_mode=mpi', 'threads_per_mpi_process=8']
+
+
+def test_explicit_settings_are_kept():
+    settings = solver_settings(0, 0, 16, cpus=4, domains=8, method='default')
+    assert settings == {'cpus': 4, 'domains': 8, 'threads': 1, 'method': 'default'}
+    assert command_options(settings) == ['cpus=4', 'domains=8']
+
+
+@pytest.mark.parametrize('settings, message', [
+    ({'cpus': 0}, 'at least 1'),
+    ({'cpus': 4, 'method': 'openmp'}, 'openmp'),
+    ({'cpus': 12, 'threads': 8, 'method': 'mpi'}, 'threads'),
+    ({'cpus': 12, 'threads': 4, 'method': 'mpi', 'domains': 4}, 'multiple of the MPI processes'),
+])
+def test_impossible_settings_are_refused(settings, message):
+    with pytest.raises(ValueError) as error:
+        solver_settings(0, 0, 16, **settings)
+    assert message in str(error.value)
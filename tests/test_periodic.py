@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from utilities.lattices import TOLERANCE, boundary_vertices, cell_arrays
+from utilities.periodic import (equation_block, loadcase_stress, macro_equation_block, periodic_pairs,
+                                reference_conditions, unpaired_vertices)
+from utilities.runspec import STRUCTURES
+
+EDGE = 20.0
+
+
+@pytest.mark.parametrize('tiling', [(1, 1), (2, 3)])
+@pytest.mark.parametrize('structure', STRUCTURES)
+def test_every_boundary_vertex_has_its_image(structure, tiling):
+    vertices, edges, vectors = cell_arrays(structure, EDGE, tiling)
+    pairs = periodic_pairs(vertices, vectors, TOLERANCE * EDGE)
+
+    assert len(unpaired_vertices(vertices, vectors, pairs, TOLERANCE * EDGE)) == 0
+    for vector, pair in zip(vectors, pairs):
+        assert len(pair)
+        assert len(np.unique(pair[:, 0])) == len(pair) and len(np.unique(pair[:, 1])) == len(pair)
+        assert np.allclose(vertices[pair[:, 1]] - vertices[pair[:, 0]], vector, atol=TOLERANCE * EDGE)
+
+
+@pytest.mark.parametrize('structure', STRUCTURES)
+def test_opposite_sides_are_sorted_alike(structure):
+    sides = boundary_vertices(structure, EDGE, (2, 2))
+    vectors = cell_arrays(structure, EDGE, (2, 2))[2]
+    for (first, second), vector in zip((('Left', 'Right'), ('Bottom', 'Top')), vectors):
+        assert np.allclose(np.array(sides[second]) - np.array(sides[first]), vector, atol=TOLERANCE * EDGE)
+
+
+def test_oblique_cell_vectors():
+    vertices, edges, vectors = cell_arrays('g', EDGE)
+    shear = np.array([[1.0, 0.4], [0.0, 1.0]])
+    expected = periodic_pairs(vertices, vectors, TOLERANCE * EDGE)
+    for pair, sheared in zip(expected, periodic_pairs(vertices.dot(shear.T), vectors.dot(shear.T), TOLERANCE * EDGE)):
+        assert np.array_equal(pair, sheared)
+
+
+def test_a_missing_image_is_reported():
+    vertices, edges, vectors = cell_arrays('a', EDGE)
+    pairs = periodic_pairs(vertices, vectors, TOLERANCE * EDGE)
+    lost = pairs[0][0, 1]
+    vertices = np.delete(vertices, lost, axis=0)
+    pairs = periodic_pairs(vertices, vectors, TOLERANCE * EDGE)
+    unpaired = unpaired_vertices(vertices, vectors, pairs, TOLERANCE * EDGE)
+    assert len(unpaired) == 1
+    assert np.allclose(vertices[unpaired[0]] + vectors[0], cell_arrays('a', EDGE)[0][lost])
+
+
+def test_equation_block_eliminates_the_first_node_of_every_pair():
+    block = equation_block([4, 7], [12, 15], 2)
+    assert block == ('*Equation\n'
+                     '2\nPart-1-1.4, 2, 1.\nPart-1-1.12, 2, -1.\n'
+                     '2\nPart-1-1.7, 2, 1.\nPart-1-1.15, 2, -1.')
+    assert equation_block([], [], 1) == ''
+    with pytest.raises(ValueError):
+        equation_block([1, 2], [3], 1)
+
+
+def test_macro_equations_tie_both_displacements_to_the_reference_point():
+    assert macro_equation_block([4], [12], 'RP-1') == ('*Equation\n'
+                                                       '3\nPart-1-1.4, 1, 1.\nPart-1-1.12, 1, -1.\nRP-1, 1, -1.\n'
+                                                       '3\nPart-1-1.4, 2, 1.\nPart-1-1.12, 2, -1.\nRP-1, 2, -1.\n'
+                                                       '2\nPart-1-1.4, 6, 1.\nPart-1-1.12, 6, -1.')
+    assert macro_equation_block([], [], 'RP-2') == ''
+
+
+def test_strain_and_stress_are_scaled_by_the_cell_size():
+    conditions = reference_conditions(20.0, 10.0, strain={'11': 0.01}, stress={'22': 2.0})
+    assert conditions == [('RP-1', 1, 'displacement', 0.2), ('RP-2', 2, 'force', 40.0),
+                          ('RP-1', 2, 'displacement', 0.0)]
+
+
+def test_the_rigid_rotation_is_restrained_by_the_other_shear_component():
+    assert reference_conditions(1.0, 1.0, strain={'21': 0.1})[-1] == ('RP-2', 1, 'displacement', 0.0)
+    with pytest.raises(ValueError):
+        reference_conditions(1.0, 1.0, stress={'12': 1.0, '21': 1.0})
+
+
+@pytest.mark.parametrize('strain, stress', [({'13': 0.1}, None), ({'11': 0.1}, {'11': 1.0})])
+def test_invalid_macro_conditions_are_refused(strain, stress):
+    with pytest.raises(ValueError):
+        reference_conditions(1.0, 1.0, strain, stress)
+
+
+def test_a_load_case_force_is_the_resultant_on_the_loaded_side():
+    assert loadcase_stress('uniaxial', 'x', 10.0, 20.0, 5.0) == {'11': 2.0}
+    assert loadcase_stress('shear', 'x', 10.0, 20.0, 5.0) == {'12': 0.5}
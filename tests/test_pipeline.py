@@ -0,0 +1,229 @@
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from utilities.abaqus_standin.recording import RECORDER
+from utilities.kernelserver import KernelClient
+from utilities.lattices import unit_cell
+from utilities.loadcases import required_features
+from utilities.runspec import STRUCTURES, complete_run
+from utilities.timing import collect_stages
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_main_is_imported_silently(tmp_path):
+    environment = dict(os.environ, PYTHONPATH=ROOT, LATTICE_STANDIN_SECONDS='0')
+    output = subprocess.check_output([sys.executable, '-c', 'from utilities import abaqus_standin; '
+                                      'abaqus_standin.install(); import main'],
+                                     cwd=str(tmp_path), env=environment, stderr=subprocess.STDOUT)
+    assert output == b''
+
+
+# Every feature of the model lies in a step which exists, the history output from the first loaded step on
+@pytest.mark.parametrize('values, first_step', [
+    ({'model': 'linear', 'boundary': 'periodic', 'loadcases': 'all'}, 'Step-1'),
+    ({'model': 'nonlinear', 'boundary': 'periodic', 'loadcases': 'shear y, uniaxial x'}, 'Case-shear-y'),
+    ({'model': 'nonlinear', 'boundary': 'periodic', 'strain': {'11': 0.01}}, 'Step-1'),
+])
+def test_reference_output_starts_in_an_existing_step(pipeline, values, first_step):
+    run = complete_run(dict(values, structure='a', tiling=[2, 2]))
+    pipeline.build_model(run)
+    m = pipeline.mdb.models['Model-1']
+    for name in ('H-Output-RP-1', 'H-Output-RP-2'):
+        assert m.historyOutputRequests[name].options['step'] == first_step
+    for repository in (m.loads, m.boundaryConditions, m.historyOutputRequests):
+        for feature in repository.values():
+            assert feature.options['step'] in m.steps
+
+    job_name = pipeline.create_job(pipeline.workdir)
+    pipeline.mdb.jobs[job_name].writeInput()
+    with open(job_name + '.inp') as deck:
+        text = deck.read()
+    step = text.index(', name=' + first_step + '\n')
+    assert step < text.index('*Output, history') < text.index('*End Step', step)
+
+
+def test_the_part_is_created_in_one_call(pipeline):
+    RECORDER.clear()
+    pipeline.create_structure('k', 20.0, (3, 2))
+    vertices, edges = unit_cell('k', 20.0, (3, 2))[:2]
+    call, = RECORDER.named('Part.WirePolyLine')
+    assert len(call.kwargs['points']) == len(edges)
+    part = pipeline.mdb.models['Model-1'].parts['Part-1']
+    assert (len(part.vertices), len(part.edges)) == (len(vertices), len(edges))
+
+
+def test_a_failed_build_leaves_no_model_behind(pipeline, monkeypatch):
+    run = complete_run({'structure': 'b', 'model': 'linear'})
+    build_template = pipeline.build_template
+
+    def failing(*args):
+        raise RuntimeError('no mesh')
+
+    templates = {}
+    monkeypatch.setattr(pipeline, 'build_template', failing)
+    with pytest.raises(RuntimeError):
+        pipeline.prepare_run(run, 1, templates)
+    assert templates == {} and sorted(pipeline.mdb.models.keys()) == ['Model-1']
+
+    monkeypatch.setattr(pipeline, 'build_template', build_template)
+    monkeypatch.setattr(pipeline, 'build_variant', failing)
+    with pytest.raises(RuntimeError):
+        pipeline.prepare_run(run, 2, templates)
+    assert list(templates.values()) == ['Template-1'] and sorted(pipeline.mdb.models.keys()) == ['Model-1',
+                                                                                                'Template-1']
+
+
+@pytest.mark.parametrize('structure', ['b', 'j'])
+@pytest.mark.parametrize('loadcase, axis', [('uniaxial', 'x'), ('shear', 'y')])
+def test_only_the_features_of_the_load_case_are_created(pipeline, structure, loadcase, axis):
+    RECORDER.clear()
+    pipeline.build_model(complete_run({'structure': structure, 'model': 'linear', 'loadcase': loadcase,
+                                       'axis': axis}))
+    m = pipeline.mdb.models['Model-1']
+    needed = required_features(structure, loadcase, axis)
+    assert sorted(m.loads.keys()) == sorted(name for name, roles, direction, sign in needed['loads'])
+    assert sorted(m.boundaryConditions.keys()) == sorted(name for name, roles, dofs in needed['fixed'])
+    assert sorted(m.constraints.keys()) == sorted(name for name, roles, dof in needed['equations'])
+    assert not [call for call in RECORDER.calls if call.name.endswith('.suppress')]
+
+
+# Honeycomb in uniaxial x as the macro built it: pushed in -x on the left, the second right vertex only fixed in x
+def test_the_conditions_of_the_macro_are_rebuilt(pipeline):
+    pipeline.build_model(complete_run({'structure': 'b', 'model': 'linear', 'force': 10.0}))
+    m = pipeline.mdb.models['Model-1']
+    assert m.loads['Load-3'].options['cf1'] == -10.0 and m.loads['Load-3'].options['region'] == 'L1-L2'
+    assert m.boundaryConditions['BC-3'].options['u1'] == 0.0
+    assert m.boundaryConditions['BC-3'].options['u2'] == pipeline.UNSET
+    assert m.constraints['Constraint-3'].options['terms'] == ((1.0, 'Part-1-1.T1', 1), (-1.0, 'Part-1-1.B1', 1),
+                                                              (-1.0, 'Part-1-1.R1', 1))
+    assert len(m.parts['Part-1'].sets['L1-L2'].items['vertices']) == 2
+
+
+# The stand-in counts the API calls of every stage of utilities/timing.py
+def test_the_stages_count_the_api_calls(pipeline):
+    collect_stages()
+    RECORDER.clear()
+    pipeline.create_structure('a', 20.0)
+    stages = dict((stage['stage'], stage) for stage in collect_stages())
+    assert stages['create_structure']['api_calls'] == len(RECORDER.calls) > 0
+
+
+def test_a_job_without_status_and_with_a_truncated_log_is_aborted(pipeline, monkeypatch):
+    pipeline.build_model(complete_run({'structure': 'a', 'model': 'linear'}))
+    job_name = pipeline.create_job(pipeline.workdir)
+    pipeline.mdb.jobs[job_name].status = None
+    with open(job_name + '.log', 'w') as log:
+        log.write('Abaqus JOB ' + job_name + '\nBegin Abaqus/Standard Analysis\n')
+    monkeypatch.setattr(pipeline, 'job_timeout', 0.05)
+    assert pipeline.job_outcome(pipeline.workdir, job_name) == 'aborted'
+
+
+def _write_spec(directory, runs):
+    path = os.path.join(str(directory), 'runs.json')
+    with open(path, 'w') as spec:
+        json.dump(runs, spec)
+    return path
+
+
+def _manifest(spec_file):
+    connection = sqlite3.connect(os.path.splitext(spec_file)[0] + '.manifest.sqlite')
+    try:
+        return connection.execute('SELECT state, job FROM runs ORDER BY job').fetchall()
+    finally:
+        connection.close()
+
+
+def test_repeated_runs_are_run_once(pipeline, tmp_path, monkeypatch, capsys):
+    monkeypatch.delenv('LATTICE_CORES', raising=False)
+    spec_file = _write_spec(tmp_path, [{'structure': 'a'}, {'structure': 'a'}, {'structure': 'd'}])
+    pipeline.run_batch(spec_file)
+    assert [state for state, job in _manifest(spec_file)] == ['done', 'done']
+    assert '1 runs are repeated' in capsys.readouterr().out
+
+    pipeline.run_batch(spec_file)
+    assert '2 of 2 runs are done already' in capsys.readouterr().out
+
+
+def test_a_job_solved_before_a_crash_is_recovered(pipeline, tmp_path, monkeypatch, capsys):
+    monkeypatch.delenv('LATTICE_CORES', raising=False)
+    spec_file = _write_spec(tmp_path, [{'structure': 'k', 'model': 'linear'}])
+    analyse = pipeline.analyse
+
+    def crash(*args, **kwargs):
+        analyse(*args, **kwargs)
+        raise KeyboardInterrupt('CAE crashed')
+
+    monkeypatch.setattr(pipeline, 'analyse', crash)
+    with pytest.raises(KeyboardInterrupt):
+        pipeline.run_batch(spec_file)
+    (state, job_name), = _manifest(spec_file)
+    assert state == 'submitted' and os.path.exists(job_name + '.odb')
+
+    monkeypatch.setattr(pipeline, 'analyse', analyse)
+    pipeline.run_batch(spec_file)
+    assert _manifest(spec_file) == [('done', job_name)]
+    assert '1 of 1 runs are done already' in capsys.readouterr().out
+
+
+# As in the worker and the kernel, a run which cannot be built is failed and the others are still run
+def test_a_failed_run_does_not_stop_the_batch(pipeline, tmp_path, monkeypatch, capsys):
+    monkeypatch.delenv('LATTICE_CORES', raising=False)
+    spec_file = _write_spec(tmp_path, [{'structure': 'a', 'model': 'linear'}, {'structure': 'd', 'model': 'linear'}])
+    build_variant = pipeline.build_variant
+
+    def failing(run, model_name):
+        if run['structure'] == 'a':
+            raise RuntimeError('no mesh')
+        build_variant(run, model_name)
+
+    monkeypatch.setattr(pipeline, 'build_variant', failing)
+    pipeline.run_batch(spec_file)
+    assert sorted(state for state, job in _manifest(spec_file)) == ['done', 'failed']
+    assert "Run 1 failed: RuntimeError('no mesh'" in capsys.readouterr().out
+    assert sorted(name for name in pipeline.mdb.models.keys() if name.startswith('Run-')) == []
+
+    monkeypatch.setattr(pipeline, 'build_variant', build_variant)
+    pipeline.run_batch(spec_file)
+    assert [state for state, job in _manifest(spec_file)] == ['done', 'done']
+
+
+def test_kernel_round_trip(pipeline, free_port):
+    thread = threading.Thread(target=pipeline.run_server, args=(free_port,))
+    thread.daemon = True
+    thread.start()
+    client = None
+    for _ in range(100):
+        try:
+            client = KernelClient(free_port, timeout=60.0)
+            break
+        except OSError:
+            thread.join(0.05)
+    try:
+        result = client.run({'structure': 'a', 'model': 'linear'})
+        assert result['state'] == 'done' and os.path.exists(result['odb'])
+        # The model copy is deleted, the template is kept for the next run
+        assert sorted(pipeline.mdb.models.keys()) == ['Model-1', 'Template-1']
+        assert client.run({'structure': 'a', 'model': 'linear', 'force': 500})['state'] == 'done'
+        assert client.request('ping') == {'runs': 2}
+        client.request('shutdown')
+    finally:
+        client.close()
+    thread.join(30.0)
+    assert not thread.is_alive()
+
+
+@pytest.mark.parametrize('boundary', ['classic', 'periodic'])
+def test_every_structure_is_built_and_solved(pipeline, tmp_path, monkeypatch, boundary):
+    monkeypatch.delenv('LATTICE_CORES', raising=False)
+    runs = [{'structure': structure, 'model': 'linear', 'boundary': boundary, 'tiling': [2, 1]}
+            for structure in STRUCTURES]
+    spec_file = _write_spec(tmp_path, runs)
+    pipeline.run_batch(spec_file)
+    assert [state for state, job in _manifest(spec_file)] == ['done'] * len(STRUCTURES)
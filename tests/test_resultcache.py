@@ -0,0 +1,42 @@
+import os
+import time
+
+from utilities.resultcache import ResultCache, input_key
+
+
+def _write(path, data):
+    with open(str(path), 'wb') as target:
+        target.write(data)
+
+
+def test_comment_lines_are_not_part_of_the_key(tmp_path):
+    _write(tmp_path / 'Job-1.inp', b'*Heading\n** Job name: Job-1 Model name: Model-1\n*Node\n1, 0., 0.\n')
+    _write(tmp_path / 'Job-2.inp', b'*Heading\r\n** Job name: Job-2 Model name: Model-2\r\n*Node\r\n1, 0., 0.\r\n')
+    _write(tmp_path / 'Job-3.inp', b'*Heading\n*Node\n1, 0., 1.\n')
+    first, second, third = [input_key(str(tmp_path / name)) for name in ('Job-1.inp', 'Job-2.inp', 'Job-3.inp')]
+    assert first == second != third
+
+
+def test_a_stored_result_is_restored_as_a_copy(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache'))
+    _write(tmp_path / 'Job-1.odb', b'results')
+    assert not cache.restore('key', str(tmp_path / 'Job-2.odb'))
+    cache.put('key', str(tmp_path / 'Job-1.odb'))
+    assert cache.restore('key', str(tmp_path / 'Job-2.odb'))
+    with open(str(tmp_path / 'Job-2.odb'), 'rb') as restored:
+        assert restored.read() == b'results'
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert os.listdir(str(tmp_path / 'cache')) == ['key.odb']
+
+
+def test_the_least_recently_used_results_are_evicted(tmp_path):
+    cache = ResultCache(str(tmp_path / 'cache'), max_megabytes=2.5 / 1024)
+    _write(tmp_path / 'Job-1.odb', b'x' * 1024)
+    for age, key in ((300, 'first'), (200, 'second')):
+        cache.put(key, str(tmp_path / 'Job-1.odb'))
+        old = time.time() - age
+        os.utime(cache.path(key), (old, old))
+    # Restoring makes 'first' the most recently used result, so 'second' goes when 'third' is added
+    assert cache.restore('first', str(tmp_path / 'Job-2.odb'))
+    cache.put('third', str(tmp_path / 'Job-1.odb'))
+    assert sorted(os.listdir(str(tmp_path / 'cache'))) == ['first.odb', 'third.odb']
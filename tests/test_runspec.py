@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from utilities.runspec import complete_run, load_run_specs, spec_file_from_argv
+
+
+def test_defaults_match_the_dialogs():
+    run = complete_run({})
+    assert run['structure'] == 'g' and run['model'] == 'nonlinear' and run['section'] == 'circular'
+    assert run['edge'] == 20.0 and run['force'] == 1.0 and run['radius'] == 2.0
+    assert run['loadcase'] == 'uniaxial' and run['axis'] == 'x' and run['tiling'] == (1, 1)
+    assert run['boundary'] == 'classic' and run['strain'] == {} and run['stress'] == {}
+    assert run['loadcases'] == []
+
+
+def test_json_defaults_are_merged_into_every_run(tmp_path):
+    path = tmp_path / 'runs.json'
+    path.write_text(json.dumps({'defaults': {'structure': 'a', 'model': 'linear'},
+                                'runs': [{'edge': 10}, {'structure': 'B', 'loadcase': 'Shear', 'tiling': [2, 3]}]}))
+    first, second = load_run_specs(str(path))
+    assert (first['structure'], first['edge'], first['force']) == ('a', 10.0, 1000.0)
+    assert (second['structure'], second['model'], second['loadcase']) == ('b', 'linear', 'shear')
+    assert second['tiling'] == (2, 3)
+
+
+def test_ini_sections_are_runs(tmp_path):
+    path = tmp_path / 'runs.ini'
+    path.write_text(u'[DEFAULT]\nstructure = d\n\n[first]\naxis = y\ntiling = 2 x 2\n\n'
+                    u'[second]\nedge = 12.5\nboundary = periodic\nstrain = 11: 0.01, 12: 0\n\n'
+                    u'[third]\nboundary = periodic\nloadcases = all\n')
+    first, second, third = load_run_specs(str(path))
+    assert first['name'] == 'first' and first['structure'] == 'd' and first['axis'] == 'y'
+    assert first['tiling'] == (2, 2)
+    assert second['name'] == 'second' and second['edge'] == 12.5 and second['strain'] == {'11': 0.01, '12': 0.0}
+    assert third['structure'] == 'd' and len(third['loadcases']) == 4
+
+
+@pytest.mark.parametrize('raw, message', [
+    ({'structure': 'z'}, 'structure'),
+    ({'edge': 'long'}, 'edge'),
+    ({'edge': 0}, 'edge length'),
+    ({'loadcase': 'torsion'}, 'loadcase'),
+    ({'tiling': '2 by 2'}, 'tiling'),
+    ({'tiling': '0 x 2'}, 'at least one cell'),
+    ({'strain': {'11': 0.01}}, 'boundary = periodic'),
+    ({'boundary': 'periodic', 'strain': {'13': 0.01}}, "'13'"),
+    ({'boundary': 'periodic', 'strain': '11 = 0.01'}, 'not of the form'),
+    ({'boundary': 'periodic', 'strain': {'11': 0.01}, 'stress': {'11': 1.0}}, 'as strain and as stress'),
+    ({'boundary': 'periodic', 'loadcases': 'uniaxial z'}, 'uniaxial z'),
+    ({'loadcases': 'all'}, 'boundary = periodic'),
+    ({'structure': 'b', 'radius': 7.0}, 'too large'),
+])
+def test_invalid_runs_name_the_value(raw, message):
+    with pytest.raises(ValueError) as error:
+        complete_run(dict(raw, name='broken'))
+    assert str(error.value).startswith('Run broken: ') and message in str(error.value)
+
+
+def test_empty_spec_file_is_refused(tmp_path):
+    path = tmp_path / 'runs.json'
+    path.write_text(u'[]')
+    with pytest.raises(ValueError):
+        load_run_specs(str(path))
+
+
+def test_spec_file_follows_the_double_dash(monkeypatch):
+    monkeypatch.delenv('LATTICE_RUN_SPEC', raising=False)
+    assert spec_file_from_argv(['main.py', '--', 'runs.json']) == 'runs.json'
+    assert spec_file_from_argv(['main.py']) is None
+    monkeypatch.setenv('LATTICE_RUN_SPEC', 'sweep.ini')
+    assert spec_file_from_argv(['main.py']) == 'sweep.ini'
+
+
+def test_load_cases_are_listed_in_the_given_order():
+    run = complete_run({'boundary': 'periodic', 'loadcases': ['Shear-y', 'uniaxial x']})
+    assert run['loadcases'] == [('shear', 'y'), ('uniaxial', 'x')]
+
+
+def test_a_completed_run_sent_as_json_is_completed_alike():
+    run = complete_run({'boundary': 'periodic', 'tiling': '2 x 1', 'loadcases': 'all'})
+    assert complete_run(json.loads(json.dumps(run))) == run
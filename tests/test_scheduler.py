@@ -0,0 +1,103 @@
+import os
+import sys
+
+import pytest
+
+from utilities import standin_solver
+from utilities.jobwatch import ABORTED, COMPLETED
+from utilities.scheduler import ScheduledJob, Scheduler, license_tokens, report
+
+SOLVER = [sys.executable, os.path.splitext(standin_solver.__file__)[0] + '.py']
+
+
+# Keeps track of how many jobs and license tokens are in use at the same time
+class CountingScheduler(Scheduler):
+    def __init__(self, *args, **kwargs):
+        Scheduler.__init__(self, *args, **kwargs)
+        self.running = []
+        self.peak_cpus = 0
+        self.peak_tokens = 0
+        self.started = []
+
+    def start(self, job):
+        Scheduler.start(self, job)
+        self.running.append(job)
+        self.started.append(job.name)
+        self.peak_cpus = max(self.peak_cpus, sum(other.cpus for other in self.running))
+        self.peak_tokens = max(self.peak_tokens, sum(other.tokens for other in self.running))
+
+    def finish(self, job):
+        Scheduler.finish(self, job)
+        self.running.remove(job)
+
+
+@pytest.fixture
+def jobs(tmp_path, monkeypatch):
+    monkeypatch.setenv('LATTICE_STANDIN_SECONDS', '0.3')
+    monkeypatch.delenv('LATTICE_STANDIN_ABORT', raising=False)
+
+    def prepare(*cpus):
+        prepared = []
+        for number, count in enumerate(cpus, 1):
+            name = 'Job-' + str(number)
+            (tmp_path / (name + '.inp')).write_text(u'*Heading\n')
+            prepared.append(ScheduledJob(name, cpus=count))
+        return prepared
+    return prepare
+
+
+def test_jobs_share_the_cores(tmp_path, jobs):
+    scheduler = CountingScheduler(str(tmp_path), cores=2, memory_percent=90.0, command=SOLVER)
+    finished = scheduler.run(jobs(1, 1, 1, 1))
+    assert scheduler.peak_cpus == 2
+    assert [job.state for job in finished] == [COMPLETED] * 4
+    assert all(os.path.exists(str(tmp_path / (job.name + '.odb'))) for job in finished)
+    # Each job gets the memory share of its cores
+    assert [job.memory for job in finished] == [45] * 4
+    with open(str(tmp_path / 'Job-1.log')) as log:
+        assert 'cpus=1, memory=45%' in log.read()
+    # Two at a time: the four jobs take about two solver runs, not four
+    assert max(job.start + job.wall_time for job in finished) - min(job.start for job in finished) < 4 * 0.3
+
+
+def test_the_license_limits_the_jobs_before_the_cores(tmp_path, jobs):
+    assert license_tokens(2) == 6
+    scheduler = CountingScheduler(str(tmp_path), cores=8, license_limit=12, command=SOLVER)
+    finished = scheduler.run(jobs(2, 2, 2, 2))
+    assert scheduler.peak_tokens == 12 and scheduler.peak_cpus == 4
+    assert [job.state for job in finished] == [COMPLETED] * 4
+
+
+def test_a_small_job_goes_ahead_of_one_that_does_not_fit(tmp_path, jobs):
+    scheduler = CountingScheduler(str(tmp_path), cores=4, command=SOLVER)
+    scheduler.run(jobs(3, 3, 1))
+    assert scheduler.started == ['Job-1', 'Job-3', 'Job-2'] and scheduler.peak_cpus == 4
+
+
+def test_fits_counts_cores_and_tokens_of_the_running_jobs():
+    scheduler = Scheduler('.', cores=4, license_limit=12, command=SOLVER)
+    one, two, four = ScheduledJob('one', cpus=1), ScheduledJob('two', cpus=2), ScheduledJob('four', cpus=4)
+    assert scheduler.fits(two, [one]) and scheduler.fits(four, [])
+    assert not scheduler.fits(four, [one])
+    # 5 + 5 + 6 tokens are more than the license, although the cores would do
+    assert not scheduler.fits(two, [one, ScheduledJob('other', cpus=1)])
+    assert Scheduler('.', cores=4, command=SOLVER).fits(two, [one, ScheduledJob('other', cpus=1)])
+
+
+@pytest.mark.parametrize('cpus, license_limit, message', [(8, None, 'CPUs'), (2, 5, 'license tokens')])
+def test_a_job_beyond_the_limits_is_refused(tmp_path, jobs, cpus, license_limit, message):
+    scheduler = Scheduler(str(tmp_path), cores=4, license_limit=license_limit, command=SOLVER)
+    with pytest.raises(ValueError) as error:
+        scheduler.run(jobs(1, cpus))
+    assert str(error.value).startswith('The job Job-2 needs') and message in str(error.value)
+
+
+def test_a_failing_job_does_not_stop_the_others(tmp_path, jobs, monkeypatch):
+    monkeypatch.setenv('LATTICE_STANDIN_ABORT', 'Job-2')
+    finished = Scheduler(str(tmp_path), cores=2, command=SOLVER).run(jobs(1, 1, 1))
+    assert [job.state for job in finished] == [COMPLETED, ABORTED, COMPLETED]
+
+    lines = report(finished).splitlines()
+    assert lines[0].split()[:5] == ['job', 'cpus', 'memory', 'state', 'wall']
+    assert lines[2].split()[:4] == ['Job-2', '1', '45%', ABORTED]
+    assert all(float(line.split()[-1]) > 0.0 for line in lines[1:])
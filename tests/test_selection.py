@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from utilities.selection import PartSelection, PointIndex, mask_from_indices
+
+
+@pytest.mark.parametrize('indices, mask', [
+    ([0], '[#1 ]'),
+    ([0, 1, 4], '[#13 ]'),
+    ([31], '[#80000000 ]'),
+    ([32, 0], '[#1 #1 ]'),
+    (range(40), '[#ffffffff #ff ]'),
+    ([70], '[#0 #0 #40 ]'),
+])
+def test_mask_words_hold_32_indices_lowest_first(indices, mask):
+    assert mask_from_indices(indices) == mask
+
+
+def test_an_empty_selection_has_no_mask():
+    with pytest.raises(ValueError):
+        mask_from_indices([])
+
+
+def test_points_are_found_within_the_tolerance():
+    index = PointIndex([(0.0, 0.0), (10.0, 0.0), (10.0, 5.0), (-3.0, 7.5)], 1e-3)
+    found = index.find([(10.0, 5.0 + 4e-4), (-3.0 - 4e-4, 7.5 + 4e-4), (0.0, 0.0), (10.0, 5.01), (1e9, 0.0)])
+    assert found.tolist() == [2, 3, 0, -1, -1]
+
+
+def test_the_closest_point_wins_when_several_are_in_range():
+    index = PointIndex([(0.0, 0.0), (0.6, 0.0), (1.5, 0.0)], 1.0)
+    assert index.find([(0.5, 0.0), (1.2, 0.0), (-0.9, 0.0)]).tolist() == [1, 2, 0]
+
+
+def test_an_empty_index_finds_nothing():
+    assert PointIndex(np.zeros((0, 2)), 1e-3).find([(0.0, 0.0)]).tolist() == [-1]
+
+
+class _Vertex(object):
+    def __init__(self, x, y):
+        self.pointOn = ((x, y, 0.0),)
+
+
+class _Vertices(list):
+    def getSequenceFromMask(self, mask):
+        return mask[0]
+
+
+class _Part(object):
+    name = 'Part-1'
+
+    def __init__(self, points):
+        self.vertices = _Vertices(_Vertex(x, y) for x, y in points)
+
+
+def test_a_part_selection_is_one_mask():
+    select = PartSelection(_Part([(0.0, 0.0), (20.0, 0.0), (0.0, 20.0), (20.0, 20.0)]), 1e-5)
+    assert select.vertices([(0.0, 20.0), (20.0, 20.0)]) == '[#c ]'
+    with pytest.raises(ValueError) as error:
+        select.vertices([(0.0, 20.0), (10.0, 10.0)])
+    assert str(error.value) == 'There is no vertex of Part-1 at (10.0, 10.0)'
+
+
+class _Node(object):
+    def __init__(self, label, x, y):
+        self.label = label
+        self.coordinates = (x, y, 0.0)
+
+
+def test_mesh_nodes_are_found_by_their_labels():
+    part = _Part([(0.0, 0.0), (20.0, 0.0)])
+    part.nodes = [_Node(1, 0.0, 0.0), _Node(5, 10.0, 0.0), _Node(9, 20.0, 0.0)]
+    select = PartSelection(part, 1e-5)
+    assert select.node_labels([(20.0, 0.0), (10.0, 0.0)]).tolist() == [9, 5]
+    with pytest.raises(ValueError) as error:
+        select.node_labels([(5.0, 0.0)])
+    assert str(error.value) == 'There is no node of Part-1 at (5.0, 0.0)'
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from utilities.spatialhash import bucket_keys, merge_points
+
+
+def test_copies_are_merged_in_order_of_first_occurrence():
+    points = [(0.0, 0.0), (1.0, 0.0), (1e-9, -1e-9), (2.0, 0.0), (1.0 - 1e-9, 1e-9)]
+    merged, remap = merge_points(points, 1e-6)
+    assert np.allclose(merged, [(0.0, 0.0), (1.0, 0.0), (2.0, 0.0)])
+    assert remap.tolist() == [0, 1, 0, 2, 1]
+
+
+# Close points on both sides of a bucket border, in every direction of the neighbouring buckets
+@pytest.mark.parametrize('offset', [(1, 0), (0, 1), (1, 1), (1, -1), (-1, 0), (0, -1), (-1, -1), (-1, 1)])
+def test_close_points_in_neighbouring_buckets_are_merged(offset):
+    tolerance = 1e-3
+    border = np.array([5.0, 7.0])
+    first = border - 0.3 * tolerance * np.array(offset)
+    second = border + 0.3 * tolerance * np.array(offset)
+    merged, remap = merge_points([first, (9.0, 9.0), second], tolerance)
+    assert len(merged) == 2 and remap[0] == remap[2]
+
+
+def test_all_points_of_two_buckets_are_compared():
+    # Only the last points of the two buckets are within the tolerance of each other
+    points = [(0.01, 0.5), (0.99, 0.5), (1.99, 0.5), (1.01, 0.5)]
+    merged, remap = merge_points(points, 1.0)
+    assert len(merged) == 1 and remap.tolist() == [0, 0, 0, 0]
+
+
+def test_points_farther_than_the_tolerance_stay_apart():
+    merged, remap = merge_points([(0.9, 0.5), (2.1, 0.5)], 1.0)
+    assert len(merged) == 2 and remap.tolist() == [0, 1]
+
+
+def test_no_points():
+    merged, remap = merge_points(np.zeros((0, 2)), 1.0)
+    assert merged.shape == (0, 2) and len(remap) == 0
+
+
+def test_a_tolerance_too_small_for_the_extent_is_refused():
+    with pytest.raises(ValueError):
+        bucket_keys([(0.0, 0.0), (1e6, 0.0)], 1e-6)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from utilities import tilings
+from utilities.tilings import TILINGS, TOLERANCE, check_vertex_configuration, join_cut_bonds, supercell, unit_cell
+
+EDGE = 20.0
+
+
+@pytest.mark.parametrize('structure', sorted(TILINGS))
+def test_every_vertex_matches_the_configuration(structure):
+    vectors, basis = tilings.lattice(structure)
+    check_vertex_configuration(structure, vectors, basis, tilings.bonds(vectors, basis))
+
+
+def test_a_wrong_configuration_is_reported(monkeypatch):
+    monkeypatch.setitem(TILINGS, 'g', dict(TILINGS['g'], configuration='3.3.6.6'))
+    vectors, basis = tilings.lattice('g')
+    with pytest.raises(ValueError) as error:
+        check_vertex_configuration('g', vectors, basis, tilings.bonds(vectors, basis))
+    assert str(error.value).endswith('structure g is surrounded by 6.3.6.3 instead of 3.3.6.6')
+
+
+def test_a_wrong_lattice_never_becomes_a_unit_cell(monkeypatch):
+    def kagome_without_a_vertex():
+        vectors, basis = tilings._kagome()
+        return vectors, basis[1:]
+
+    monkeypatch.setitem(TILINGS, 'g', dict(TILINGS['g'], lattice=kagome_without_a_vertex))
+    with pytest.raises(ValueError):
+        unit_cell('g', EDGE)
+
+
+@pytest.mark.parametrize('structure', sorted(TILINGS))
+def test_unit_cell_edges_have_the_edge_length_or_end_on_the_boundary(structure):
+    vertices, edges, vectors = unit_cell(structure, EDGE)
+    fractions = np.linalg.solve(vectors.T, vertices.T).T
+    assert (fractions > -TOLERANCE).all() and (fractions < 1.0 + TOLERANCE).all()
+
+    lengths = np.sqrt(((vertices[edges[:, 0]] - vertices[edges[:, 1]]) ** 2).sum(axis=1))
+    on_boundary = (np.minimum(fractions, 1.0 - fractions) < TOLERANCE).any(axis=1)
+    whole = ~(on_boundary[edges[:, 0]] | on_boundary[edges[:, 1]])
+    assert np.allclose(lengths[whole], EDGE) and (lengths < EDGE + TOLERANCE * EDGE).all()
+
+
+def test_polygon_vertices_lie_on_the_circumcircle():
+    corners = tilings._polygon((1.0, 2.0), 0.5, 6, 30.0)
+    assert np.allclose(np.sqrt(((corners - (1.0, 2.0)) ** 2).sum(axis=1)), 0.5)
+    assert np.allclose(corners[0], (1.0 + 0.5 * np.cos(np.radians(30.0)), 2.0 + 0.25))
+
+
+@pytest.mark.parametrize('structure', sorted(TILINGS))
+def test_supercell_repeats_the_vertices_and_bonds_of_the_cell(structure):
+    vertices, edges, vectors = unit_cell(structure, EDGE)
+    tiled_vertices, tiled_edges, tiled_vectors = supercell(vertices, edges, vectors, 2, 3)
+    assert np.allclose(tiled_vectors, [2 * vectors[0], 3 * vectors[1]])
+
+    # Every interior vertex of the cell is found once in each copy, no cut point is left inside the sample
+    interior = len(tilings.lattice(structure)[1])
+    degree = np.bincount(tiled_edges.ravel(), minlength=len(tiled_vertices))
+    assert (degree >= 3).sum() == 6 * interior and (degree == 1).sum() + (degree >= 3).sum() == len(tiled_vertices)
+    lengths = np.sqrt(((tiled_vertices[tiled_edges[:, 0]] - tiled_vertices[tiled_edges[:, 1]]) ** 2).sum(axis=1))
+    whole = (degree[tiled_edges] >= 3).all(axis=1)
+    assert np.allclose(lengths[whole], EDGE)
+
+
+def test_a_single_cell_is_returned_unchanged():
+    vertices, edges, vectors = unit_cell('b', EDGE)
+    assert supercell(vertices, edges, vectors, 1, 1)[0] is vertices
+
+
+def test_bonds_cut_once_and_twice_are_joined():
+    # A vertex with three bonds, two of them cut once and one cut twice
+    vertices = np.array([(0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (0.0, 1.0), (0.0, 2.0),
+                         (-1.0, 0.0), (-2.0, 0.0), (-3.0, 0.0)])
+    edges = np.array([(0, 1), (1, 2), (0, 3), (3, 4), (0, 5), (5, 6), (6, 7)])
+    joined_vertices, joined_edges = join_cut_bonds(vertices, edges)
+    assert np.allclose(joined_vertices, [(0.0, 0.0), (2.0, 0.0), (0.0, 2.0), (-3.0, 0.0)])
+    assert sorted(map(tuple, np.sort(joined_edges, axis=1).tolist())) == [(0, 1), (0, 2), (0, 3)]
+
+
+def test_maple_leaf_cell_holds_two_primitive_cells():
+    vertices, edges, vectors = unit_cell('j', 1.0)
+    assert len(tilings.lattice('j')[1]) == 12 and (len(vertices), len(edges)) == (32, 40)
+    assert np.allclose(vectors, [[np.sqrt(7.0), 0.0], [0.0, np.sqrt(21.0)]])
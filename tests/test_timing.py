@@ -0,0 +1,96 @@
+import pytest
+
+from utilities import timing
+
+
+@pytest.fixture(autouse=True)
+def no_stages():
+    counter = timing._call_counter[0]
+    timing.set_call_counter(None)
+    del timing._stages[:]
+    yield
+    del timing._stages[:]
+    timing.set_call_counter(counter)
+
+
+@timing.timed
+def _inner(calls=None):
+    if calls is not None:
+        calls.extend([None] * 3)
+
+
+@timing.timed
+def _outer(calls=None):
+    if calls is not None:
+        calls.append(None)
+    _inner(calls)
+
+
+def test_nested_stages_include_the_calls_of_the_inner_ones():
+    calls = []
+    timing.set_call_counter(lambda: len(calls))
+    _outer(calls)
+    inner, outer = timing._stages
+    assert (inner['stage'], inner['api_calls']) == ('_inner', 3)
+    assert (outer['stage'], outer['api_calls']) == ('_outer', 4)
+    assert outer['wall'] >= inner['wall'] >= 0.0 and outer['cpu'] >= 0.0
+
+
+def test_without_a_counter_the_calls_are_unknown():
+    _outer()
+    assert [stage['api_calls'] for stage in timing._stages] == [None, None]
+
+
+def test_the_peak_memory_is_known_here():
+    assert timing.peak_rss() > 0.0
+
+
+def test_windows_asks_for_the_peak_working_set(monkeypatch):
+    monkeypatch.setattr(timing, 'resource', None)
+    monkeypatch.setattr(timing.sys, 'platform', 'win32')
+    monkeypatch.setattr(timing, '_windows_peak_rss', lambda: 12.5)
+    assert timing.peak_rss() == 12.5
+    monkeypatch.setattr(timing.sys, 'platform', 'cygwin')
+    assert timing.peak_rss() is None
+
+
+def test_a_failing_stage_is_recorded():
+    @timing.timed
+    def failing():
+        raise RuntimeError('no mesh')
+
+    with pytest.raises(RuntimeError):
+        failing()
+    assert timing._stages[0]['stage'] == 'failing'
+
+
+def test_runs_are_appended_and_summed_up(tmp_path):
+    path = str(tmp_path / 'timings.jsonl')
+    calls = []
+    timing.set_call_counter(lambda: len(calls))
+    for structure in ('a', 'b'):
+        _outer(calls)
+        record = timing.write_run(path, {'structure': structure})
+        assert len(record['stages']) == 2 and timing._stages == []
+
+    records = timing.read_runs(path)
+    assert [record['run']['structure'] for record in records] == ['a', 'b']
+    table = timing.summary_table(records).splitlines()
+    assert table[0].split() == ['stage', 'calls', 'wall', '[s]', 'mean', '[s]', 'cpu', '[s]', 'api', 'calls', 'peak',
+                                '[MB]']
+    rows = dict((line.split()[0], line.split()) for line in table[1:])
+    assert rows['_outer'][1] == rows['_inner'][1] == '2'
+    assert (rows['_outer'][5], rows['_inner'][5]) == ('8', '6')
+
+
+# Timings files written without the API calls are still summed up
+def test_stages_without_api_calls_are_read(tmp_path):
+    record = {'run': {}, 'stages': [{'stage': 'old', 'wall': 1.0, 'cpu': 0.5, 'peak_rss_mb': None}]}
+    row = timing.summary_table([record]).splitlines()[1].split()
+    assert row[0] == 'old' and row[5:] == ['-', '-']
+
+
+def test_collected_stages_start_over():
+    _outer()
+    assert [stage['stage'] for stage in timing.collect_stages()] == ['_inner', '_outer']
+    assert timing.collect_stages() == []
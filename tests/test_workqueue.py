@@ -0,0 +1,96 @@
+import json
+import os
+import time
+
+from utilities.manifest import run_key
+from utilities.runspec import complete_run
+from utilities.workqueue import WorkQueue
+
+RUNS = [complete_run({'structure': structure}) for structure in ('a', 'b', 'c')]
+
+
+def _age(path, seconds):
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+def test_every_run_is_claimed_once(tmp_path):
+    queue = WorkQueue(str(tmp_path))
+    assert queue.enqueue(RUNS + RUNS[:1]) == 3
+    claims = [queue.claim(worker) for worker in ('first', 'second', 'first', 'second')]
+    assert claims[-1] is None
+    assert sorted(entry['key'] for claimed, entry in claims[:3]) == sorted(run_key(run) for run in RUNS)
+    assert dict(queue.status())['claimed'] == 3
+    # Claimed runs are not queued twice
+    assert queue.enqueue(RUNS) == 0
+
+
+def test_claims_with_heartbeat_are_kept(tmp_path):
+    queue = WorkQueue(str(tmp_path), stale_after=60.0)
+    queue.enqueue(RUNS[:1])
+    claimed, entry = queue.claim('first')
+    _age(claimed, 120.0)
+    queue.beat('first')
+    assert queue.recover_stale() == 0 and os.path.exists(claimed)
+
+
+def test_claims_of_silent_workers_are_queued_again(tmp_path):
+    queue = WorkQueue(str(tmp_path), stale_after=60.0)
+    queue.enqueue(RUNS[:2])
+    with_heartbeat = queue.claim('first')[0]
+    queue.beat('first')
+    _age(os.path.join(str(tmp_path), 'heartbeats', 'first'), 120.0)
+    # Never got to its first heartbeat
+    without_heartbeat = queue.claim('second')[0]
+    _age(without_heartbeat, 120.0)
+
+    assert queue.recover_stale() == 2
+    assert not os.path.exists(with_heartbeat) and not os.path.exists(without_heartbeat)
+    assert dict(queue.status())['pending'] == 2
+    assert queue.claim('third') is not None
+
+
+def test_a_late_worker_completes_a_claim_taken_back(tmp_path):
+    queue = WorkQueue(str(tmp_path), stale_after=60.0)
+    queue.enqueue(RUNS[:1])
+    claimed, entry = queue.claim('first')
+    _age(claimed, 120.0)
+    queue.recover_stale()
+    queue.complete(claimed, entry, {'state': 'done'})
+    # The run taken back is not run a second time
+    assert dict(queue.status()) == {'pending': 0, 'claimed': 0, 'done': 1, 'failed': 0}
+    assert queue.claim('second') is None
+
+
+# The late worker completes the run after another one has claimed it again: the pending copy of a done run is dropped
+def test_a_done_run_is_not_claimed_again(tmp_path):
+    queue = WorkQueue(str(tmp_path), stale_after=60.0)
+    queue.enqueue(RUNS[:2])
+    claimed, entry = queue.claim('first')
+    queue.complete(claimed, entry, {'state': 'done'})
+    with open(os.path.join(str(tmp_path), 'pending', entry['key'] + '.json'), 'w') as pending:
+        json.dump(entry, pending)
+
+    claimed, other = queue.claim('second')
+    assert other['key'] != entry['key'] and queue.claim('second') is None
+    assert dict(queue.status()) == {'pending': 0, 'claimed': 1, 'done': 1, 'failed': 0}
+
+
+def test_work_processes_all_runs_and_records_failures(tmp_path):
+    queue = WorkQueue(str(tmp_path), heartbeat=0.01)
+    queue.enqueue(RUNS)
+
+    def process(run):
+        if run['structure'] == 'b':
+            raise ValueError('no mesh')
+        time.sleep(0.05)
+        return {'state': 'done', 'job': 'Job-' + run['structure']}
+
+    assert queue.work('first', process) == 3
+    assert dict(queue.status()) == {'pending': 0, 'claimed': 0, 'done': 2, 'failed': 1}
+    failed = os.listdir(os.path.join(str(tmp_path), 'failed'))[0]
+    with open(os.path.join(str(tmp_path), 'failed', failed)) as source:
+        result = json.load(source)['result']
+    assert result['worker'] == 'first' and 'no mesh' in result['error']
+    # The background thread kept the heartbeat of the worker
+    assert os.path.exists(os.path.join(str(tmp_path), 'heartbeats', 'first'))
@@ -0,0 +1,40 @@
+'''
+Recording stand-in for the Abaqus CAE scripting API, so that main.py builds its models in plain Python:
+
+    from utilities import abaqus_standin
+    abaqus_standin.install()
+    import main
+    main.build_model(run)
+    print(abaqus_standin.RECORDER.report())
+
+install() puts the modules abaqus and abaqusConstants of this folder in front of the import path and registers
+empty modules for the other CAE modules main.py imports (part, mesh, step, ...). Every call into the API is recorded
+with its arguments and duration (recording.py) and counted by the stages of utilities/timing.py. The model itself is
+kept as far as the scripts read it back (abaqus.py). The jobs run utilities/standin_solver.py in the working
+directory.
+'''
+import os
+import sys
+import types
+
+from utilities.abaqus_standin.recording import RECORDER
+from utilities.timing import set_call_counter
+
+
+# CAE modules which main.py and abaqusMacros.py import without using them directly
+MODULES = ['section', 'regionToolset', 'displayGroupMdbToolset', 'part', 'material', 'assembly', 'step',
+           'interaction', 'load', 'mesh', 'optimization', 'job', 'sketch', 'visualization', 'xyPlot',
+           'displayGroupOdbToolset', 'connectorBehavior']
+
+
+# Makes "from abaqus import *" and the other CAE imports use the stand-in, returns the abaqus module
+def install():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    for name in MODULES:
+        sys.modules.setdefault(name, types.ModuleType(name))
+    # The stages of utilities/timing.py count the recorded calls
+    set_call_counter(lambda: RECORDER.count)
+    import abaqus
+    return abaqus
@@ -0,0 +1,541 @@
+'''
+Stand-in for the abaqus module of CAE: mdb, session and the dialog functions.
+
+Only the part of the API used by main.py is modelled, but that part behaves like CAE where the scripts depend on it:
+a wire part gets the vertices and edges of its sketch or wires, getSequenceFromMask selects by the mask bits, the
+mesh has nodes at the vertices and along the edges, the keyword block can be synchronised and edited, a model can be
+copied, and a job writes an input file and runs utilities/standin_solver.py. Everything else is recorded and
+ignored.
+'''
+import copy
+import math
+import os
+
+import numpy as np
+
+from abaqusConstants import ABORTED, COMPLETED, YES
+from utilities import standin_solver
+from utilities.abaqus_standin.recording import RECORDER, Recorded, Stub
+from utilities.spatialhash import merge_points
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    OrderedDict = dict
+
+
+__all__ = ['Mdb', 'getInput', 'getInputs', 'getWarningReply', 'mdb', 'session']
+
+# Tells main.py that it is imported outside CAE on purpose
+STANDIN = True
+
+
+class Repository(OrderedDict):
+    pass
+
+
+# A feature which only has a name and options, e.g. a load, a BC, a material behaviour or a section
+class Feature(Recorded):
+    def __init__(self, kind, name, options):
+        self.kind = kind
+        self.name = name
+        self.options = dict(options)
+        self.suppressed = False
+        self.deactivated = []
+
+    def setValues(self, **options):
+        self.options.update(options)
+
+    def deactivate(self, stepName):
+        self.deactivated.append(stepName)
+
+    def suppress(self):
+        self.suppressed = True
+
+    def resume(self):
+        self.suppressed = False
+
+    def _keywords(self):
+        options = ', '.join('%s=%r' % item for item in sorted(self.options.items()) if item[0] != 'name')
+        return '*' + self.kind + ', name=' + self.name + ('\n' + options if options else '')
+
+
+# An Equation() constraint, written like CAE: the number of terms, then one line per term
+class EquationConstraint(Feature):
+    def _keywords(self):
+        terms = self.options['terms']
+        return '\n'.join(['*Equation', str(len(terms))] + ['%s, %d, %r' % (region, dof, coefficient)
+                                                             for coefficient, region, dof in terms])
+
+
+class Sketch(Recorded):
+    def __init__(self, name):
+        self.name = name
+        self.lines = []
+
+    def Line(self, point1, point2):
+        self.lines.append((tuple(point1[:2]), tuple(point2[:2])))
+
+
+class Vertex(object):
+    def __init__(self, index, point):
+        self.index = index
+        self.pointOn = ((float(point[0]), float(point[1]), 0.0),)
+
+
+class Edge(object):
+    def __init__(self, index, vertices):
+        self.index = index
+        self._vertices = vertices
+
+    def getVertices(self):
+        return self._vertices
+
+
+# Vertices, edges or nodes of a part; slicing and masks give arrays again
+class GeometryArray(list):
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return type(self)(list.__getitem__(self, item))
+        return list.__getitem__(self, item)
+
+    def __getslice__(self, start, stop):
+        return self.__getitem__(slice(start, stop))
+
+    def getSequenceFromMask(self, mask):
+        indices = []
+        for word_number, word in enumerate(mask[0].strip('[] ').split()):
+            bits = int(word.lstrip('#'), 16)
+            indices.extend(32 * word_number + bit for bit in range(32) if bits >> bit & 1)
+        return type(self)(self[index] for index in indices)
+
+    def sequenceFromLabels(self, labels):
+        by_label = dict((item.label, item) for item in self)
+        return type(self)(by_label[label] for label in labels)
+
+
+class Node(object):
+    def __init__(self, label, coordinates):
+        self.label = label
+        self.coordinates = (float(coordinates[0]), float(coordinates[1]), 0.0)
+
+
+class Element(object):
+    def __init__(self, label, connectivity):
+        self.label = label
+        self.connectivity = connectivity
+
+
+class Region(Recorded):
+    def __init__(self, name, items):
+        self.name = name
+        self.items = items
+
+    def _keywords(self):
+        return '*Set, name=' + self.name + '\n' + ', '.join('%s: %d' % (kind, len(items))
+                                                            for kind, items in sorted(self.items.items()))
+
+
+class Part(Recorded):
+    def __init__(self, name, options):
+        self.name = name
+        self.options = options
+        self.vertices = GeometryArray()
+        self.edges = GeometryArray()
+        self.nodes = GeometryArray()
+        self.elements = GeometryArray()
+        self.sets = Repository()
+        self.features = []
+        self.seed = None
+
+    def BaseWire(self, sketch):
+        self._wire([point for line in sketch.lines for point in line])
+
+    # points holds one pair of points per wire, all given as coordinates
+    def WirePolyLine(self, points, mergeType=None, meshable=None):
+        self._wire([tuple(point[:2]) for pair in points for point in pair])
+
+    # Vertices at the merged end points, one edge per pair of consecutive points
+    def _wire(self, points):
+        points = np.array(points, dtype=float).reshape(-1, 2)
+        extent = float(np.abs(points).max()) if len(points) else 1.0
+        merged, remap = merge_points(points, 1e-9 * max(extent, 1.0))
+        self.vertices = GeometryArray(Vertex(index, point) for index, point in enumerate(merged.tolist()))
+        pairs = remap.reshape(-1, 2).tolist()
+        self.edges = GeometryArray(Edge(index, tuple(pair)) for index, pair in enumerate(pairs))
+
+    def Set(self, name, **items):
+        region = Region(name, dict((kind, list(value)) for kind, value in items.items()))
+        self.sets[name] = region
+        return region
+
+    def SectionAssignment(self, region, sectionName, **options):
+        self.features.append(Feature('Section Assignment', sectionName, dict(options, elset=region.name)))
+
+    def assignBeamSectionOrientation(self, region, method, n1):
+        self.features.append(Feature('Beam Orientation', region.name, {'n1': tuple(n1)}))
+
+    def seedPart(self, size, deviationFactor=0.1, minSizeFactor=0.1):
+        self.seed = float(size)
+
+    # Nodes at the vertices (labels 1 to n) and along every edge, two node beam elements in between
+    def generateMesh(self):
+        nodes = [Node(vertex.index + 1, vertex.pointOn[0]) for vertex in self.vertices]
+        elements = []
+        for edge in self.edges:
+            start, end = edge.getVertices()
+            first, last = np.array(self.vertices[start].pointOn[0][:2]), np.array(self.vertices[end].pointOn[0][:2])
+            count = max(1, int(math.ceil(np.sqrt(((last - first) ** 2).sum()) / self.seed))) if self.seed else 1
+            labels = [start + 1]
+            for step in range(1, count):
+                nodes.append(Node(len(nodes) + 1, first + (last - first) * step / float(count)))
+                labels.append(len(nodes))
+            labels.append(end + 1)
+            for pair in zip(labels[:-1], labels[1:]):
+                elements.append(Element(len(elements) + 1, pair))
+        self.nodes = GeometryArray(nodes)
+        self.elements = GeometryArray(elements)
+
+    def _keywords(self):
+        lines = ['*Part, name=' + self.name, '*Node']
+        lines.extend('%d, %.6g, %.6g' % ((node.label,) + node.coordinates[:2]) for node in self.nodes)
+        lines.append('*Element, type=B21')
+        lines.extend('%d, %d, %d' % ((element.label,) + element.connectivity) for element in self.elements)
+        lines.extend(region._keywords() for region in self.sets.values())
+        lines.extend(feature._keywords() for feature in self.features)
+        lines.append('*End Part')
+        return '\n'.join(lines)
+
+
+# A dependent instance shares the geometry, the mesh and the sets of its part
+class Instance(Recorded):
+    def __init__(self, name, part):
+        self.name = name
+        self.part = part
+
+    @property
+    def vertices(self):
+        return self.part.vertices
+
+    @property
+    def edges(self):
+        return self.part.edges
+
+    @property
+    def nodes(self):
+        return self.part.nodes
+
+    @property
+    def elements(self):
+        return self.part.elements
+
+    @property
+    def sets(self):
+        return self.part.sets
+
+
+class ReferencePoint(object):
+    def __init__(self, id, point):
+        self.id = id
+        self.point = tuple(point)
+
+
+class Assembly(Recorded):
+    def __init__(self):
+        self.instances = Repository()
+        self.sets = Repository()
+        self.referencePoints = Repository()
+
+    def DatumCsysByDefault(self, coordSysType):
+        pass
+
+    def Instance(self, name, part, dependent=None):
+        self.instances[name] = Instance(name, part)
+        return self.instances[name]
+
+    def regenerate(self):
+        pass
+
+    def ReferencePoint(self, point):
+        feature = ReferencePoint(len(self.referencePoints) + 1, point)
+        self.referencePoints[feature.id] = feature
+        return feature
+
+    def Set(self, name, **items):
+        region = Region(name, dict((kind, list(value)) for kind, value in items.items()))
+        self.sets[name] = region
+        return region
+
+    def _keywords(self):
+        lines = ['*Assembly, name=Assembly']
+        lines.extend('*Instance, name=' + instance.name + ', part=' + instance.part.name + '\n*End Instance'
+                     for instance in self.instances.values())
+        lines.extend('*Node\n%d, %.6g, %.6g' % ((point.id,) + point.point[:2])
+                     for point in self.referencePoints.values())
+        lines.extend(region._keywords() for region in self.sets.values())
+        return '\n'.join(lines)
+
+
+class Step(Feature):
+    def __init__(self, kind, name, options):
+        Feature.__init__(self, kind, name, options)
+        self.loadCases = Repository()
+
+    def LoadCase(self, name, **options):
+        self.loadCases[name] = Feature('Load Case', name, options)
+        return self.loadCases[name]
+
+
+'''
+Keyword block of a model. synchVersions builds the blocks from the model, insert adds a block after the given
+position. The inserted blocks are kept and placed again after every synchronisation, as in CAE.
+'''
+class KeywordBlock(Recorded):
+    def __init__(self, model):
+        self._model = model
+        self._blocks = []
+        self._insertions = []
+
+    def synchVersions(self, storeNodesAndElements=True):
+        self._blocks = self._model._keywords()
+
+    @property
+    def sieveBlocks(self):
+        blocks = list(self._blocks)
+        for position, text in self._insertions:
+            blocks.insert(position + 1, text)
+        return blocks
+
+    def insert(self, position, text):
+        if not 0 <= position < len(self.sieveBlocks):
+            raise IndexError('There is no keyword block ' + str(position))
+        self._insertions.append((position, text))
+
+
+class Model(Recorded):
+    def __init__(self, name):
+        self.name = name
+        self.sketches = Repository()
+        self.parts = Repository()
+        self.materials = Repository()
+        self.profiles = Repository()
+        self.sections = Repository()
+        self.steps = Repository([('Initial', Step('Step', 'Initial', {}))])
+        self.loads = Repository()
+        self.boundaryConditions = Repository()
+        self.constraints = Repository()
+        self.historyOutputRequests = Repository()
+        self.rootAssembly = Assembly()
+        self.keywordBlock = KeywordBlock(self)
+
+    def ConstrainedSketch(self, name, sheetSize=None, **options):
+        self.sketches[name] = Sketch(name)
+        return self.sketches[name]
+
+    def Part(self, name, **options):
+        self.parts[name] = Part(name, options)
+        return self.parts[name]
+
+    def Material(self, name, **options):
+        self.materials[name] = Material(name)
+        return self.materials[name]
+
+    def BeamSection(self, name, **options):
+        self.sections[name] = Feature('Beam Section', name, options)
+        return self.sections[name]
+
+    def StaticStep(self, name, previous, **options):
+        self._step(previous)
+        self.steps[name] = Step('Static Step', name, dict(options, previous=previous))
+        return self.steps[name]
+
+    def StaticLinearPerturbationStep(self, name, previous, **options):
+        self._step(previous)
+        self.steps[name] = Step('Static Linear Perturbation Step', name, dict(options, previous=previous))
+        return self.steps[name]
+
+    def ConcentratedForce(self, name, createStepName, region, **options):
+        self._step(createStepName)
+        self.loads[name] = Feature('Cload', name, dict(options, step=createStepName, region=region.name))
+        return self.loads[name]
+
+    def DisplacementBC(self, name, createStepName, region, **options):
+        self._step(createStepName)
+        self.boundaryConditions[name] = Feature('Boundary', name, dict(options, step=createStepName,
+                                                                       region=region.name))
+        return self.boundaryConditions[name]
+
+    def HistoryOutputRequest(self, name, createStepName, region=None, **options):
+        self._step(createStepName)
+        self.historyOutputRequests[name] = Feature('Output, history', name, dict(
+            options, step=createStepName, region=region.name if region is not None else None))
+        return self.historyOutputRequests[name]
+
+    # Like CAE, features can only be created in a step which exists already
+    def _step(self, name):
+        if name not in self.steps:
+            raise KeyError('The model ' + self.name + ' has no step ' + repr(name))
+        return self.steps[name]
+
+    def Equation(self, name, terms):
+        self.constraints[name] = EquationConstraint('Equation', name, {'terms': tuple(terms)})
+        return self.constraints[name]
+
+    def _profile(self, kind, name, options):
+        self.profiles[name] = Feature(kind, name, options)
+        return self.profiles[name]
+
+    def BoxProfile(self, name, **options):
+        return self._profile('Box Profile', name, options)
+
+    def CircularProfile(self, name, **options):
+        return self._profile('Circular Profile', name, options)
+
+    def PipeProfile(self, name, **options):
+        return self._profile('Pipe Profile', name, options)
+
+    def RectangularProfile(self, name, **options):
+        return self._profile('Rectangular Profile', name, options)
+
+    def HexagonalProfile(self, name, **options):
+        return self._profile('Hexagonal Profile', name, options)
+
+    def TrapezoidalProfile(self, name, **options):
+        return self._profile('Trapezoidal Profile', name, options)
+
+    def IProfile(self, name, **options):
+        return self._profile('I Profile', name, options)
+
+    def TProfile(self, name, **options):
+        return self._profile('T Profile', name, options)
+
+    def LProfile(self, name, **options):
+        return self._profile('L Profile', name, options)
+
+    # The blocks of the input file in the order CAE writes them
+    def _keywords(self):
+        blocks = ['*Heading']
+        blocks.extend(part._keywords() for part in self.parts.values())
+        blocks.append(self.rootAssembly._keywords())
+        blocks.extend(constraint._keywords() for constraint in self.constraints.values() if not constraint.suppressed)
+        blocks.append('*End Assembly')
+        blocks.extend(material._keywords() for material in self.materials.values())
+        blocks.extend(feature._keywords() for feature in list(self.profiles.values()) + list(self.sections.values()))
+        for step in self.steps.values():
+            blocks.append(step._keywords())
+            for repository in (self.loads, self.boundaryConditions, self.historyOutputRequests):
+                blocks.extend(feature._keywords() for feature in repository.values()
+                              if feature.options.get('step') == step.name and not feature.suppressed)
+            blocks.extend(case._keywords() for case in step.loadCases.values())
+            if step.name != 'Initial':
+                blocks.append('*End Step')
+        return blocks
+
+
+class Material(Recorded):
+    def __init__(self, name):
+        self.name = name
+        self.behaviours = []
+
+    def Elastic(self, table, **options):
+        self.behaviours.append(Feature('Elastic', self.name, dict(options, table=table)))
+
+    def Hyperelastic(self, table, **options):
+        self.behaviours.append(Feature('Hyperelastic', self.name, dict(options, table=table)))
+
+    def _keywords(self):
+        return '\n'.join(['*Material, name=' + self.name] + [behaviour._keywords() for behaviour in self.behaviours])
+
+
+'''
+A job writes <name>.inp into the working directory. submit writes the input file and runs the stand-in solver
+(utilities/standin_solver.py), which leaves the .log and .odb behind and takes LATTICE_STANDIN_SECONDS.
+'''
+class Job(Recorded):
+    def __init__(self, name, model, options):
+        self.name = name
+        self.model = model
+        self.options = options
+        self.status = None
+
+    def writeInput(self, consistencyChecking=None):
+        model = mdb.models[self.model]
+        model.keywordBlock.synchVersions()
+        with open(self.name + '.inp', 'w') as deck:
+            deck.write('** Job name: ' + self.name + ' Model name: ' + self.model + '\n')
+            deck.write('\n'.join(model.keywordBlock.sieveBlocks) + '\n')
+
+    def submit(self, consistencyChecking=None):
+        self.writeInput()
+        code = standin_solver.main(['job=' + self.name, 'input=' + self.name + '.inp'])
+        self.status = COMPLETED if code == 0 else ABORTED
+
+    def waitForCompletion(self):
+        pass
+
+
+class Mdb(Recorded):
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.models = Repository([('Model-1', Model('Model-1'))])
+        self.jobs = Repository()
+
+    def Model(self, name, objectToCopy=None, **options):
+        model = copy.deepcopy(objectToCopy) if objectToCopy is not None else Model(name)
+        model.name = name
+        self.models[name] = model
+        return model
+
+    def Job(self, name, model, **options):
+        self.jobs[name] = Job(name, model, options)
+        return self.jobs[name]
+
+
+class Odb(Recorded):
+    def __init__(self, path):
+        self.name = path
+        self.path = path
+
+
+class Session(Recorded):
+    def __init__(self):
+        self.viewports = Repository([('Viewport: 1', Stub('Viewport'))])
+        self.odbs = Repository()
+
+    def openOdb(self, name, **options):
+        if not os.path.exists(name):
+            raise IOError('There is no ODB ' + name)
+        self.odbs[name] = Odb(name)
+        return self.odbs[name]
+
+
+mdb = Mdb()
+session = Session()
+
+# Answers for getInput and getInputs, taken one by one, the default value is used when there is none left
+ANSWERS = []
+
+
+# Starts a new model database, the names imported with "from abaqus import *" keep pointing to it
+def _new_mdb():
+    mdb._reset()
+
+
+def _get_input(prompt, default=''):
+    return ANSWERS.pop(0) if ANSWERS else default
+
+
+def _get_inputs(fields, label='', dialogTitle=''):
+    return tuple(ANSWERS.pop(0) if ANSWERS else default for _, default in fields)
+
+
+def _get_warning_reply(message, buttons=None):
+    return YES
+
+
+Mdb = RECORDER.wrap('Mdb', _new_mdb)
+getInput = RECORDER.wrap('getInput', _get_input)
+getInputs = RECORDER.wrap('getInputs', _get_inputs)
+getWarningReply = RECORDER.wrap('getWarningReply', _get_warning_reply)
@@ -0,0 +1,23 @@
+'''
+Stand-in for the symbolic constants of Abaqus used by main.py and abaqusMacros.py.
+'''
+
+
+class SymbolicConstant(object):
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+__all__ = [
+    'ABORTED', 'ANALYSIS', 'B21', 'CARTESIAN', 'COMPLETED', 'CONTOURS_ON_DEF', 'DEFAULT', 'DEFORMABLE_BODY',
+    'DEFORMED', 'DURING_ANALYSIS', 'FROM_SECTION', 'INSTANTANEOUS', 'ISOTROPIC', 'JOB_ABORTED', 'JOB_COMPLETED',
+    'LINEAR', 'MERGE', 'MIDDLE_SURFACE', 'MOONEY_RIVLIN', 'MPI', 'N1_COSINES', 'NO', 'ODB', 'OFF', 'ON', 'PERCENTAGE',
+    'SET', 'SINGLE', 'STANDALONE', 'TERMINATED', 'THREADS', 'TWO_D_PLANAR', 'UNDEFORMED', 'UNIFORM', 'UNSET',
+    'VOLUMETRIC_DATA', 'YES',
+]
+
+for _name in __all__:
+    globals()[_name] = SymbolicConstant(_name)
@@ -0,0 +1,87 @@
+'''
+Records every call into the stand-in Abaqus API with its arguments and duration.
+'''
+import time
+from collections import namedtuple
+
+
+Call = namedtuple('Call', 'name args kwargs seconds')
+
+
+class Recorder(object):
+    def __init__(self):
+        self.calls = []
+        # Number of calls ever recorded, clear() does not reset it
+        self.count = 0
+
+    def record(self, call):
+        self.calls.append(call)
+        self.count += 1
+
+    # Wraps a bound method, so that every call of it is recorded under the given name
+    def wrap(self, name, method):
+        def recorded(*args, **kwargs):
+            start = time.time()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.record(Call(name, args, kwargs, time.time() - start))
+        return recorded
+
+    def clear(self):
+        del self.calls[:]
+
+    # The calls with the given name, e.g. 'Model.ConcentratedForce'
+    def named(self, name):
+        return [call for call in self.calls if call.name == name]
+
+    # (name, number of calls, total time [s]) for every name, the most expensive first
+    def summary(self):
+        totals = {}
+        for call in self.calls:
+            count, seconds = totals.get(call.name, (0, 0.0))
+            totals[call.name] = (count + 1, seconds + call.seconds)
+        return sorted(((name, count, seconds) for name, (count, seconds) in totals.items()),
+                      key=lambda entry: (-entry[2], entry[0]))
+
+    def report(self):
+        lines = ['%-45s %8s %12s' % ('call', 'count', 'time [ms]')]
+        for name, count, seconds in self.summary():
+            lines.append('%-45s %8d %12.3f' % (name, count, 1000.0 * seconds))
+        return '\n'.join(lines)
+
+
+RECORDER = Recorder()
+
+
+'''
+Base class of the stand-in objects. Public methods are recorded as '<class>.<method>'. Any other public attribute
+is a Stub, so that calls the stand-in does not model (viewport settings, display options, ...) are recorded too
+instead of failing.
+'''
+class Recorded(object):
+    def __getattribute__(self, name):
+        value = object.__getattribute__(self, name)
+        if name.startswith('_') or not hasattr(value, '__self__') or value.__self__ is not self:
+            return value
+        return RECORDER.wrap(type(self).__name__ + '.' + name, value)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return Stub(type(self).__name__ + '.' + name)
+
+
+# Stands for any object of the API which is not modelled: every attribute is a Stub, every call is recorded
+class Stub(object):
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return Stub(self._name + '.' + name)
+
+    def __call__(self, *args, **kwargs):
+        RECORDER.record(Call(self._name, args, kwargs, 0.0))
+        return Stub(self._name + '()')
@@ -0,0 +1,75 @@
+'''
+On-disk cache of the generated lattice geometry.
+
+A parameter sweep builds the same unit cell for every material, section and load case. The vertex and edge arrays
+of a (structure, edge, tiling) combination are therefore stored once as a compressed .npz file and loaded again by
+every later run, also across CAE sessions. The file name is a hash of the key and of the source of the geometry
+code, so a change in utilities/tilings.py never hands out an outdated geometry.
+
+The cache is bounded by a size budget and a number of entries, the files used least recently are removed first once
+a budget is exceeded (utilities/lrudir.py).
+'''
+import hashlib
+import os
+
+import numpy as np
+
+from utilities import spatialhash, tilings
+from utilities.lrudir import LRUDirectory
+
+
+# Default budgets, can be overwritten with the environment variables LATTICE_GEOMETRY_CACHE_MB and ..._ENTRIES
+MAX_MEGABYTES = 256.0
+MAX_ENTRIES = 1000
+
+
+# Hash of the modules the geometry is computed with, part of every cache key
+def _code_version():
+    digest = hashlib.sha1()
+    for module in (tilings, spatialhash):
+        with open(os.path.splitext(module.__file__)[0] + '.py', 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()[:12]
+
+
+class GeometryCache(LRUDirectory):
+    def __init__(self, directory, max_megabytes=None, max_entries=None):
+        if max_megabytes is None:
+            max_megabytes = float(os.environ.get('LATTICE_GEOMETRY_CACHE_MB', MAX_MEGABYTES))
+        if max_entries is None:
+            max_entries = int(os.environ.get('LATTICE_GEOMETRY_CACHE_ENTRIES', MAX_ENTRIES))
+        LRUDirectory.__init__(self, directory, '.npz', int(max_megabytes * 1024 * 1024), max_entries)
+        self.version = _code_version()
+
+    def path(self, structure, edge, tiling):
+        key = '%s|%r|%dx%d|%s' % (structure, float(edge), tiling[0], tiling[1], self.version)
+        name = '%s_%dx%d_%s.npz' % (structure, tiling[0], tiling[1], hashlib.sha1(key.encode('utf-8')).hexdigest())
+        return os.path.join(self.directory, name)
+
+    # Returns (vertices, edges, vectors) of a cached geometry or None
+    def get(self, structure, edge, tiling):
+        path = self.path(structure, edge, tiling)
+        try:
+            with np.load(path) as data:
+                geometry = data['vertices'], data['edges'].astype(int), data['vectors']
+        except (IOError, OSError, KeyError, ValueError):
+            self.misses += 1
+            return None
+        self.touch(path)
+        self.hits += 1
+        return geometry
+
+    def put(self, structure, edge, tiling, vertices, edges, vectors):
+        edges = np.asarray(edges)
+        if len(edges) and edges.max() < 2 ** 31:
+            edges = edges.astype(np.int32)
+        self.write(self.path(structure, edge, tiling),
+                   lambda target: np.savez_compressed(target, vertices=vertices, edges=edges, vectors=vectors))
+
+    # Returns the cached geometry or builds it with build() and stores it
+    def load_or_build(self, structure, edge, tiling, build):
+        geometry = self.get(structure, edge, tiling)
+        if geometry is None:
+            geometry = build()
+            self.put(structure, edge, tiling, *geometry)
+        return geometry
@@ -0,0 +1,177 @@
+'''
+Unique job names for a working directory shared by several CAE sessions.
+
+The next job number is kept in the counter file .jobcounter of the directory. A session takes the lock, reads the
+number, writes the number after its claim and releases the lock, so two sessions never get the same name and no
+session has to scan the existing results. The lock is the file .jobcounter.lock, created with O_CREAT | O_EXCL, which
+only one session can do, and holding the host, process and time of its owner. While a session holds the lock it
+touches the file every LOCK_TIMEOUT / 4 seconds, so a lock is only untouched for LOCK_TIMEOUT seconds if its owner
+crashed. Such a lock is removed by the first session which takes the break lock .jobcounter.lock.break and still finds
+it stale; a broken lock is never handed back. The counter file is replaced by a renamed temporary file, so a crash
+never leaves a half written counter. It is created on the first claim from the highest Job-N already in the
+directory, which is also how a missing counter is recovered.
+'''
+import errno
+import os
+import re
+import socket
+import tempfile
+import threading
+import time
+
+
+COUNTER = '.jobcounter'
+
+# Seconds without a touch after which a lock is considered left behind by a crashed session
+LOCK_TIMEOUT = 30.0
+
+
+'''
+Claims count consecutive job names <prefix>1, <prefix>2, ... and returns them. A number whose results or input file
+exist anyway, e.g. from a session without the counter, is skipped.
+'''
+def allocate_job_names(directory, count=1, prefix='Job-'):
+    with _CounterLock(os.path.join(directory, COUNTER + '.lock')):
+        path = os.path.join(directory, COUNTER)
+        number = _read_counter(path)
+        if number is None:
+            number = _highest_number(directory, prefix) + 1
+
+        names = []
+        while len(names) < count:
+            name = prefix + str(number)
+            number += 1
+            if not (os.path.exists(os.path.join(directory, name + '.odb')) or
+                    os.path.exists(os.path.join(directory, name + '.inp'))):
+                names.append(name)
+
+        _write_counter(path, number)
+    return names
+
+
+def allocate_job_name(directory, prefix='Job-'):
+    return allocate_job_names(directory, 1, prefix)[0]
+
+
+def _read_counter(path):
+    try:
+        with open(path) as counter:
+            return int(counter.read().strip())
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _write_counter(path, number):
+    handle, temporary = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path) or '.')
+    with os.fdopen(handle, 'w') as counter:
+        counter.write(str(number) + '\n')
+        counter.flush()
+        os.fsync(counter.fileno())
+    if hasattr(os, 'replace'):
+        os.replace(temporary, path)
+        return
+    # Python 2 on Windows cannot rename onto an existing file. Without the counter the next claim scans the directory.
+    if os.name == 'nt' and os.path.exists(path):
+        os.remove(path)
+    os.rename(temporary, path)
+
+
+# Only needed once per directory, when the counter file is created
+def _highest_number(directory, prefix):
+    pattern = re.compile(re.escape(prefix) + r'(\d+)\.')
+    numbers = [int(match.group(1)) for match in map(pattern.match, os.listdir(directory)) if match]
+    return max(numbers) if numbers else 0
+
+
+# Creates the file with the given content, returns False if it exists
+def _create_exclusive(path, content):
+    try:
+        handle = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except OSError as error:
+        if error.errno != errno.EEXIST:
+            raise
+        return False
+    with os.fdopen(handle, 'w') as lock:
+        lock.write(content)
+    return True
+
+
+def _read_owner(path):
+    try:
+        with open(path) as lock:
+            return lock.read()
+    except (IOError, OSError):
+        return None
+
+
+# A lock not touched for LOCK_TIMEOUT seconds, False if there is none
+def _is_stale(path):
+    try:
+        return time.time() - os.path.getmtime(path) > LOCK_TIMEOUT
+    except OSError:
+        return False
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class _CounterLock(object):
+    def __init__(self, path):
+        self.path = path
+        self.owner = '%s %d %d %.6f\n' % (socket.gethostname(), os.getpid(), threading.current_thread().ident or 0,
+                                          time.time())
+        self._stop = threading.Event()
+        self._heartbeat = None
+
+    def __enter__(self):
+        delay = 0.001
+        while not _create_exclusive(self.path, self.owner):
+            if _is_stale(self.path):
+                self._break_stale()
+                continue
+            time.sleep(delay)
+            delay = min(2.0 * delay, 0.1)
+        self._heartbeat = threading.Thread(target=self._touch)
+        self._heartbeat.daemon = True
+        self._heartbeat.start()
+        return self
+
+    def __exit__(self, *exception):
+        self._stop.set()
+        self._heartbeat.join()
+        # Only the own lock is released, a lock broken in the meantime belongs to another session
+        if _read_owner(self.path) == self.owner:
+            _remove(self.path)
+
+    # Keeps the lock fresh while it is held
+    def _touch(self):
+        while not self._stop.wait(LOCK_TIMEOUT / 4.0):
+            if _read_owner(self.path) != self.owner:
+                return
+            try:
+                os.utime(self.path, None)
+            except OSError:
+                return
+
+    '''
+    Removes a stale lock. The sessions which find the lock stale take turns through the break lock, and each checks
+    again under it, so the lock one of them removed and another session then created is never removed as well. A
+    break lock left by a session which crashed while breaking is removed once it is stale itself.
+    '''
+    def _break_stale(self):
+        breaker = self.path + '.break'
+        if not _create_exclusive(breaker, self.owner):
+            if _is_stale(breaker):
+                _remove(breaker)
+            else:
+                time.sleep(0.001)
+            return
+        try:
+            if _is_stale(self.path):
+                _remove(self.path)
+        finally:
+            _remove(breaker)
@@ -0,0 +1,149 @@
+'''
+Waits for Abaqus jobs by watching the files they write.
+
+Inside CAE a job is followed with job.waitForCompletion(), which returns on the JOB_COMPLETED or JOB_ABORTED message
+of the monitor. The solver may still hold the lock file of the ODB for a moment after that, and jobs started outside
+the current CAE session send no messages at all. For both cases the job directory is watched here:
+    - while <job>.lck exists, the ODB is still being written
+    - the last line of <job>.log ("Abaqus JOB <job> COMPLETED" or "... exited with errors") tells how it ended
+A log ending in any other line counts as running, so a truncated log is only noticed through the timeout of
+wait_for_job. Where CAE knows the status of the job, only the lock file has to be waited for (wait_for_release).
+On Linux the directory is watched with inotify, so a change is seen immediately. Elsewhere the directory is polled
+with a delay growing from 10 ms to 0.5 s.
+'''
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+
+RUNNING = 'running'
+COMPLETED = 'completed'
+ABORTED = 'aborted'
+
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+
+
+# Returns None before the job has written anything, otherwise RUNNING, COMPLETED or ABORTED
+def job_state(directory, job_name):
+    base = os.path.join(directory, job_name)
+    if os.path.exists(base + '.lck'):
+        return RUNNING
+
+    ending = _last_line(base + '.log')
+    if ending is None:
+        return None
+    if 'COMPLETED' in ending:
+        return COMPLETED
+    if 'error' in ending.lower() or 'terminated' in ending.lower():
+        return ABORTED
+    return RUNNING
+
+
+def _last_line(path):
+    try:
+        with open(path, 'rb') as log:
+            log.seek(0, os.SEEK_END)
+            log.seek(max(0, log.tell() - 4096))
+            lines = log.read().decode('latin-1').strip().splitlines()
+    except (IOError, OSError):
+        return None
+    return lines[-1] if lines else ''
+
+
+'''
+Blocks until the job has completed or been aborted and its lock file is gone. Returns COMPLETED or ABORTED, or
+raises a RuntimeError after the timeout [s].
+'''
+def wait_for_job(directory, job_name, timeout=None):
+    deadline = None if timeout is None else time.time() + timeout
+    events = DirectoryEvents(directory)
+    try:
+        while True:
+            state = job_state(directory, job_name)
+            if state in (COMPLETED, ABORTED):
+                return state
+            remaining = None if deadline is None else deadline - time.time()
+            if remaining is not None and remaining <= 0.0:
+                raise RuntimeError('The job ' + job_name + ' did not finish within ' + str(timeout) + ' s')
+            events.wait(remaining)
+    finally:
+        events.close()
+
+
+# Blocks until the lock file of the job is gone, returns False if it is still there after the timeout [s]
+def wait_for_release(directory, job_name, timeout):
+    deadline = time.time() + timeout
+    lock = os.path.join(directory, job_name + '.lck')
+    events = DirectoryEvents(directory)
+    try:
+        while os.path.exists(lock):
+            remaining = deadline - time.time()
+            if remaining <= 0.0:
+                return False
+            events.wait(remaining)
+        return True
+    finally:
+        events.close()
+
+
+'''
+Wakes up whenever a file in a directory is created, changed, moved or deleted. Uses inotify where available and
+falls back to polling with a growing delay otherwise.
+'''
+class DirectoryEvents(object):
+    def __init__(self, directory):
+        self.directory = directory
+        self.delay = 0.01
+        self.descriptor = None
+        self._libc = _inotify_library()
+        if self._libc is None:
+            return
+        descriptor = self._libc.inotify_init()
+        if descriptor < 0:
+            return
+        mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+        if self._libc.inotify_add_watch(descriptor, directory.encode(sys.getfilesystemencoding() or 'utf-8'),
+                                        mask) < 0:
+            os.close(descriptor)
+            return
+        self.descriptor = descriptor
+
+    # Waits for the next event, at most timeout seconds (None: no limit for inotify, the polling delay otherwise)
+    def wait(self, timeout=None):
+        if self.descriptor is None:
+            delay = self.delay if timeout is None else min(self.delay, timeout)
+            time.sleep(max(delay, 0.0))
+            self.delay = min(2.0 * self.delay, 0.5)
+            return
+
+        readable = select.select([self.descriptor], [], [], timeout)[0]
+        if readable:
+            # Only the wake-up matters, the events themselves are discarded
+            os.read(self.descriptor, 64 * (struct.calcsize('iIII') + 256))
+
+    def close(self):
+        if self.descriptor is not None:
+            os.close(self.descriptor)
+            self.descriptor = None
+
+
+def _inotify_library():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
@@ -0,0 +1,137 @@
+'''
+Long running CAE kernel which takes run specifications over a local socket.
+
+Starting "abaqus cae noGUI=main.py" costs 10-20 s of kernel start-up per call. A kernel started once with
+    LATTICE_KERNEL_PORT=47001 abaqus cae noGUI=main.py
+serves any number of runs instead: it keeps its templates (see run_batch in main.py) between the requests and builds
+and solves the runs back to back. The protocol is one JSON object per line in both directions:
+    {"command": "run", "run": {...}}    -> {"ok": true, "result": {"state": "done", "job": ..., "odb": ...}}
+    {"command": "ping"}                 -> {"ok": true, "result": {"runs": <runs served so far>}}
+    {"command": "shutdown"}             -> {"ok": true, "result": null}, then the kernel exits
+A request which cannot be served is answered with {"ok": false, "error": "..."}. The runs are completed and checked
+with utilities/runspec.py like the runs of a spec file. Requests are served one after another in the main thread,
+as the CAE kernel is not thread safe; only clients on the same machine (127.0.0.1) can connect.
+
+The command line of this module sends spec files to a kernel, and starts a stand-in kernel without Abaqus, which
+runs the solver command (e.g. utilities/standin_solver.py) for every run:
+    python utilities/kernelserver.py submit runs.json
+    python utilities/kernelserver.py ping|shutdown
+    python utilities/kernelserver.py standin ["python utilities/standin_solver.py"]
+'''
+import json
+import os
+import socket
+import sys
+
+if __name__ == '__main__':
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.runspec import complete_run, load_run_specs
+
+
+PORT = 47001
+
+
+def kernel_port():
+    return int(os.environ.get('LATTICE_KERNEL_PORT') or PORT)
+
+
+'''
+Serves requests until a shutdown request. process(run) builds and solves one completed run and returns its result,
+an exception is sent back as error and does not stop the kernel.
+'''
+def serve(process, port=None):
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(('127.0.0.1', port or kernel_port()))
+    listener.listen(5)
+    served = 0
+    try:
+        while True:
+            connection = listener.accept()[0]
+            stream = connection.makefile('rwb')
+            try:
+                for line in stream:
+                    if not line.strip():
+                        continue
+                    shutdown = False
+                    try:
+                        request = json.loads(line.decode('utf-8'))
+                        command = request.get('command')
+                        if command == 'run':
+                            result = process(complete_run(request['run']))
+                            served += 1
+                        elif command == 'ping':
+                            result = {'runs': served}
+                        elif command == 'shutdown':
+                            result, shutdown = None, True
+                        else:
+                            raise ValueError('Unknown command ' + repr(command))
+                        response = {'ok': True, 'result': result}
+                    except Exception as error:
+                        response = {'ok': False, 'error': str(error)}
+                    stream.write((json.dumps(response, sort_keys=True) + '\n').encode('utf-8'))
+                    stream.flush()
+                    if shutdown:
+                        return served
+            except socket.error:
+                # The client went away, wait for the next one
+                pass
+            finally:
+                stream.close()
+                connection.close()
+    finally:
+        listener.close()
+
+
+class KernelClient(object):
+    def __init__(self, port=None, timeout=None):
+        self.connection = socket.create_connection(('127.0.0.1', port or kernel_port()), timeout)
+        self.stream = self.connection.makefile('rwb')
+
+    # Sends one request and returns the result, a refused request raises a RuntimeError with the error of the kernel
+    def request(self, command, **values):
+        values['command'] = command
+        self.stream.write((json.dumps(values, sort_keys=True) + '\n').encode('utf-8'))
+        self.stream.flush()
+        line = self.stream.readline()
+        if not line:
+            raise RuntimeError('The kernel closed the connection')
+        response = json.loads(line.decode('utf-8'))
+        if not response['ok']:
+            raise RuntimeError(response['error'])
+        return response['result']
+
+    def run(self, run):
+        return self.request('run', run=run)
+
+    def close(self):
+        self.stream.close()
+        self.connection.close()
+
+
+def main(argv):
+    if not argv or argv[0] not in ('submit', 'ping', 'shutdown', 'standin'):
+        sys.stderr.write(__doc__)
+        return 2
+    if argv[0] == 'standin':
+        from utilities.workqueue import standin_process
+        command = argv[1] if len(argv) > 1 else sys.executable + ' ' + os.path.join(os.path.dirname(
+            os.path.abspath(__file__)), 'standin_solver.py')
+        print(str(serve(standin_process(command, os.getcwd()))) + ' runs served')
+        return 0
+
+    client = KernelClient()
+    try:
+        if argv[0] == 'submit':
+            for number, run in enumerate(load_run_specs(argv[1]), 1):
+                print('Run ' + str(number) + ': ' + json.dumps(client.run(run), sort_keys=True))
+        else:
+            print(json.dumps(client.request(argv[0]), sort_keys=True))
+    finally:
+        client.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
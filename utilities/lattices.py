@@ -0,0 +1,76 @@
+'''
+Catalog of the periodic unit cells of the Archimedean lattices of Shimada et al., SR 2015.
+
+Every unit cell is a rectangle with its lower left corner in the origin. The coordinates are computed analytically
+in utilities/tilings.py for an edge length of 1 and get multiplied by the user-selected edge length. The rectangle
+cuts every bond that leaves the cell, the cut points are the vertices on the boundary of the cell. Each of them has a
+periodic image on the opposite side with the same y (left/right) or the same x (bottom/top) coordinate.
+
+Mapple leaf ('j') is turned by atan(sqrt(3) / 5) against the other lattices. Only in this orientation its rectangular
+unit cell holds just two of its primitive cells (12 vertices, like Star).
+'''
+from utilities import periodic, tilings
+
+NAMES = {'a': 'Square', 'b': 'Honeycomb', 'c': 'Triangular', 'd': 'CaVO', 'e': 'Star', 'f': 'SrCuBo', 'g': 'Kagome',
+         'h': 'Bounce', 'i': 'Trellis', 'j': 'Mapple_leaf', 'k': 'SHD'}
+
+CATALOG = dict((structure, {'name': name, 'configuration': tilings.TILINGS[structure]['configuration']})
+               for structure, name in NAMES.items())
+
+# Distance below which a vertex counts as lying on the boundary of the cell
+TOLERANCE = 1e-6
+
+# Optional utilities.geometrycache.GeometryCache, see use_geometry_cache
+_geometry_cache = None
+
+
+# Loads the geometry of later calls of unit_cell from the cache (None switches the cache off again)
+def use_geometry_cache(cache):
+    global _geometry_cache
+    _geometry_cache = cache
+
+
+'''
+Returns the vertices (n x 2), the edges (m x 2) and the cell vectors of the unit cell scaled to the edge length.
+With a tiling (n, m) the unit cell is repeated n times in x and m times in y to a finite sample of the lattice.
+'''
+def cell_arrays(structure, edge, tiling=(1, 1)):
+    def build():
+        vertices, edges, vectors = tilings.unit_cell(structure, edge)
+        return tilings.supercell(vertices, edges, vectors, tiling[0], tiling[1])
+
+    if _geometry_cache is None:
+        return build()
+    return _geometry_cache.load_or_build(structure, edge, tuple(tiling), build)
+
+
+# Returns the vertices, the edges and the width and height of the unit cell as plain Python tuples for the sketch
+def unit_cell(structure, edge, tiling=(1, 1)):
+    vertices, edges, vectors = cell_arrays(structure, edge, tiling)
+    vertices = [tuple(vertex) for vertex in vertices.tolist()]
+    edges = [tuple(pair) for pair in edges.tolist()]
+    return vertices, edges, (float(vectors[0][0]), float(vectors[1][1]))
+
+
+'''
+Sorts the boundary vertices of the scaled unit cell by the side of the cell they lie on. The sides are found by
+matching every vertex with its periodic image (utilities/periodic.py): a vertex whose image along the first cell
+vector exists is a left vertex and its image the right one, likewise bottom and top along the second vector.
+Left and right vertices are sorted by y, bottom and top vertices by x, so the k-th vertex of one side is the
+periodic image of the k-th vertex of the opposite side.
+'''
+def boundary_vertices(structure, edge, tiling=(1, 1)):
+    vertices, edges, vectors = cell_arrays(structure, edge, tiling)
+    tolerance = TOLERANCE * edge
+    pairs = periodic.periodic_pairs(vertices, vectors, tolerance)
+
+    unpaired = periodic.unpaired_vertices(vertices, vectors, pairs, tolerance)
+    if len(unpaired):
+        raise ValueError('The boundary vertex ' + str(tuple(vertices[unpaired[0]])) + ' of structure ' + structure +
+                         ' has no periodic image')
+
+    sides = {}
+    for (first, second), pair in zip((('Left', 'Right'), ('Bottom', 'Top')), pairs):
+        sides[first] = [tuple(point) for point in vertices[pair[:, 0]].tolist()]
+        sides[second] = [tuple(point) for point in vertices[pair[:, 1]].tolist()]
+    return sides
@@ -0,0 +1,277 @@
+'''
+The features each classic load case needs, per structure.
+
+The table holds the loads, boundary conditions and Equation() constraints of the former create-and-suppress macro of
+main.py, one entry per structure, load case and axis, so results stay comparable with runs made with the macro. Only
+the features of the selected load case are created, instead of creating all of them and suppressing the unused ones
+afterwards. The names Load-1, BC-1, Constraint-1, ... are the ones of the macro.
+
+The macro selected single vertices by masks and collected them in the part sets L1, L2, ..., R1, ..., B1, ... and
+T1, .... Here a role like 'L2' is the second vertex of the left side of the cell counted from the bottom, 'B1' the
+first vertex of the bottom side counted from the left, and the vertices are found by their coordinates (see
+create_boundary_conditions in main.py). A role like 'Left' stands for all vertices of that side.
+    loads: (name, roles, direction, sign), the force times sign acts in the direction on every vertex of the roles
+    fixed: (name, roles, dofs), the dofs (1, 2 or 6) of every vertex of the roles are fixed, the others stay free
+    equations: (name, (dependent, independent, independent), dof), u(dependent) - u(independent) - u(independent) = 0
+    periodic: (dependent side, independent side, dof), only for 'j', every vertex of the dependent side follows its
+        periodic image on the independent side (see create_periodic_equations in main.py)
+
+The unit cells of the catalog (utilities/lattices.py) do not always have as many boundary vertices as the cells of
+the macro: the top side of 'c' has 2 instead of 3, the left and right sides of 'e' have 2 instead of 4 and the left
+side of 'f' has 3 instead of 5. Such roles are left out of loads and boundary conditions, and equations with such a
+role are left out (see available_features). The Maple Leaf lattice ('j') was never part of the macro, it is loaded on
+whole sides and its shear cases tie the sides together periodically.
+'''
+
+
+FEATURES = {
+    ('a', 'uniaxial', 'x'): {
+        'loads': [('Load-2', ('T1',), 2, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': []},
+    ('a', 'uniaxial', 'y'): {
+        'loads': [('Load-2', ('T1',), 2, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': []},
+    ('a', 'shear', 'x'): {
+        'loads': [('Load-1', ('T1',), 1, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'B1'), 2)]},
+    ('a', 'shear', 'y'): {
+        'loads': [('Load-1', ('T1',), 1, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'B1'), 2)]},
+    ('b', 'uniaxial', 'x'): {
+        'loads': [('Load-3', ('L1', 'L2'), 1, -1)],
+        'fixed': [('BC-2', ('R1',), (1, 2, 6)), ('BC-3', ('R2',), (1,))],
+        'equations': [('Constraint-3', ('T1', 'B1', 'R1'), 1)]},
+    ('b', 'uniaxial', 'y'): {
+        'loads': [('Load-2', ('T1',), 2, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'B1'), 2), ('Constraint-2', ('L2', 'R2', 'B1'), 2)]},
+    ('b', 'shear', 'x'): {
+        'loads': [('Load-1', ('T1',), 1, -1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'B1'), 2), ('Constraint-2', ('L2', 'R2', 'B1'), 2),
+                      ('Constraint-1-Copy', ('L1', 'R1', 'B1'), 1), ('Constraint-2-Copy', ('L2', 'R2', 'B1'), 1)]},
+    ('b', 'shear', 'y'): {
+        'loads': [('Load-4', ('L1', 'L2'), 2, 1)],
+        'fixed': [('BC-2', ('R1',), (1, 2, 6)), ('BC-3', ('R2',), (1, 2, 6))],
+        'equations': [('Constraint-3', ('T1', 'B1', 'R1'), 1), ('Constraint-3-Copy', ('T1', 'B1', 'R1'), 2),
+                      ('Constraint-shear-y', ('L1', 'L2', 'R1'), 1)]},
+    ('c', 'uniaxial', 'x'): {
+        'loads': [('Load-3', ('T3', 'R1'), 1, 1)],
+        'fixed': [('BC-2', ('T1',), (1,)), ('BC-4', ('L1',), (1, 2, 6))],
+        'equations': [('Constraint-2', ('T2', 'B1', 'L1'), 1)]},
+    ('c', 'uniaxial', 'y'): {
+        'loads': [('Load-2', ('B1',), 2, -1)],
+        'fixed': [('BC-1', ('T2',), (1, 2, 6)), ('BC-2', ('T1',), (2,)), ('BC-3', ('T3',), (2,))],
+        'equations': [('Constraint-uni-y-L', ('T1', 'L1', 'T2'), 1), ('Constraint-uni-y-R', ('T3', 'R1', 'T2'), 1)]},
+    ('c', 'shear', 'x'): {
+        'loads': [('Load-1', ('B1',), 1, 1)],
+        'fixed': [('BC-1', ('T2',), (1, 2, 6)), ('BC-2', ('T1',), (1, 2, 6)), ('BC-3', ('T3',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'T2'), 2), ('Constraint-1-Copy', ('L1', 'R1', 'T2'), 1)]},
+    ('c', 'shear', 'y'): {
+        'loads': [('Load-4', ('T3', 'R1'), 2, -1)],
+        'fixed': [('BC-2', ('T1',), (1, 2, 6)), ('BC-4', ('L1',), (1, 2, 6))],
+        'equations': [('Constraint-2', ('T2', 'B1', 'L1'), 1), ('Constraint-2-Copy', ('T2', 'B1', 'L1'), 2),
+                      ('Constraint-shear-y', ('T3', 'R1', 'L1'), 2)]},
+    ('d', 'uniaxial', 'x'): {
+        'loads': [('Load-2', ('T1',), 2, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': []},
+    ('d', 'uniaxial', 'y'): {
+        'loads': [('Load-2', ('T1',), 2, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': []},
+    ('d', 'shear', 'x'): {
+        'loads': [('Load-1', ('T1',), 1, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'B1'), 2)]},
+    ('d', 'shear', 'y'): {
+        'loads': [('Load-1', ('T1',), 1, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'B1'), 2)]},
+    ('e', 'uniaxial', 'x'): {
+        'loads': [('Load-3', ('L1',), 1, -1), ('Load-4', ('L2',), 1, -1), ('Load-5', ('L3',), 1, -1),
+                  ('Load-6', ('L4',), 1, -1)],
+        'fixed': [('BC-2', ('R1',), (1, 2, 6)), ('BC-3', ('R2',), (1, 2, 6)), ('BC-4', ('R3',), (1, 2, 6)),
+                  ('BC-5', ('R4',), (1, 2, 6))],
+        'equations': [('Constraint-9', ('T1', 'B1', 'R2'), 1)]},
+    ('e', 'uniaxial', 'y'): {
+        'loads': [('Load-1', ('T1',), 2, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': [('Constraint-2', ('L1', 'R1', 'B1'), 2), ('Constraint-4', ('L2', 'R2', 'B1'), 2),
+                      ('Constraint-6', ('L3', 'R3', 'B1'), 2), ('Constraint-8', ('L4', 'R4', 'B1'), 2)]},
+    ('e', 'shear', 'x'): {
+        'loads': [('Load-7', ('L1',), 2, 1), ('Load-8', ('L2',), 2, 1), ('Load-9', ('L3',), 2, 1),
+                  ('Load-10', ('L4',), 2, 1)],
+        'fixed': [('BC-2', ('R1',), (1, 2, 6)), ('BC-3', ('R2',), (1, 2, 6)), ('BC-4', ('R3',), (1, 2, 6)),
+                  ('BC-5', ('R4',), (1, 2, 6))],
+        'equations': [('Constraint-9', ('T1', 'B1', 'R2'), 1)]},
+    ('e', 'shear', 'y'): {
+        'loads': [('Load-2', ('T1',), 1, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'B1'), 1), ('Constraint-2', ('L1', 'R1', 'B1'), 2),
+                      ('Constraint-3', ('L2', 'R2', 'B1'), 1), ('Constraint-4', ('L2', 'R2', 'B1'), 2),
+                      ('Constraint-5', ('L3', 'R3', 'B1'), 1), ('Constraint-6', ('L3', 'R3', 'B1'), 2),
+                      ('Constraint-7', ('L4', 'R4', 'B1'), 1), ('Constraint-8', ('L4', 'R4', 'B1'), 2)]},
+    ('f', 'uniaxial', 'x'): {
+        'loads': [('Load-3', ('R3', 'R1', 'R2'), 1, 1)],
+        'fixed': [('BC-1', ('L1',), (1, 2, 6)), ('BC-2', ('L2',), (1, 2, 6)), ('BC-3', ('L3',), (1, 2, 6)),
+                  ('BC-4', ('L4',), (1, 2, 6)), ('BC-5', ('L5',), (1, 2, 6))],
+        'equations': [('Constraint-4', ('B2', 'T2', 'L3'), 1), ('Constraint-5', ('B1', 'T1', 'L3'), 1)]},
+    ('f', 'uniaxial', 'y'): {
+        'loads': [('Load-2', ('T1', 'T2', 'L1'), 2, 1)],
+        'fixed': [('BC-5', ('L5',), (1, 2, 6)), ('BC-6', ('B1',), (1, 2, 6)), ('BC-7', ('B2',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L2', 'R1', 'B2'), 2), ('Constraint-2', ('L3', 'R2', 'B2'), 2),
+                      ('Constraint-3', ('L4', 'R3', 'B2'), 2)]},
+    ('f', 'shear', 'x'): {
+        'loads': [('Load-1', ('T1', 'T2', 'L1'), 1, 1)],
+        'fixed': [('BC-5', ('L5',), (1, 2, 6)), ('BC-6', ('B1',), (1, 2, 6)), ('BC-7', ('B2',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L2', 'R1', 'B2'), 2), ('Constraint-2', ('L3', 'R2', 'B2'), 2),
+                      ('Constraint-3', ('L4', 'R3', 'B2'), 2)]},
+    ('f', 'shear', 'y'): {
+        'loads': [('Load-4', ('R3', 'R1', 'R2'), 2, 1)],
+        'fixed': [('BC-1', ('L1',), (1, 2, 6)), ('BC-2', ('L2',), (1, 2, 6)), ('BC-3', ('L3',), (1, 2, 6)),
+                  ('BC-4', ('L4',), (1, 2, 6)), ('BC-5', ('L5',), (1, 2, 6))],
+        'equations': [('Constraint-4', ('B2', 'T2', 'L3'), 1), ('Constraint-5', ('B1', 'T1', 'L3'), 1)]},
+    ('g', 'uniaxial', 'x'): {
+        'loads': [('Load-3', ('R1', 'R2', 'R3'), 1, 1)],
+        'fixed': [('BC-2', ('L2',), (1, 2, 6)), ('BC-3', ('L1',), (1,)), ('BC-4', ('L3',), (1,))],
+        'equations': [('Constraint-uni-x-R1', ('R1', 'R2', 'L2'), 1), ('Constraint-uni-x-R3', ('R3', 'R2', 'L2'), 1)]},
+    ('g', 'uniaxial', 'y'): {
+        'loads': [('Load-2', ('T1',), 2, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': [('Constraint-uni-y-L1', ('L1', 'L2', 'B1'), 1), ('Constraint-uni-y-L3', ('L3', 'L2', 'B1'), 1),
+                      ('Constraint-uni-y-R1', ('R1', 'R2', 'B1'), 1), ('Constraint-uni-y-R3', ('R3', 'R2', 'B1'), 1)]},
+    ('g', 'shear', 'x'): {
+        'loads': [('Load-1', ('T1',), 1, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'B1'), 2), ('Constraint-2', ('L2', 'R2', 'B1'), 2),
+                      ('Constraint-3', ('L3', 'R3', 'B1'), 2), ('Constraint-1-Copy', ('L1', 'R1', 'B1'), 1),
+                      ('Constraint-2-Copy', ('L2', 'R2', 'B1'), 1), ('Constraint-3-Copy', ('L3', 'R3', 'B1'), 1)]},
+    ('g', 'shear', 'y'): {
+        'loads': [('Load-4', ('R1', 'R2', 'R3'), 2, 1)],
+        'fixed': [('BC-2', ('L2',), (1, 2, 6)), ('BC-3', ('L1',), (1,)), ('BC-4', ('L3',), (1,))],
+        'equations': [('Constraint-4', ('B1', 'T1', 'L2'), 1), ('Constraint-shear-y-R1', ('R1', 'R2', 'L2'), 2),
+                      ('Constraint-shear-y-R3', ('R3', 'R2', 'L2'), 2)]},
+    ('h', 'uniaxial', 'x'): {
+        'loads': [('Load-3', ('R1', 'R2', 'R3', 'R4'), 1, 1)],
+        'fixed': [('BC-3', ('L4',), (1, 2, 6)), ('BC-4', ('L3',), (1, 2, 6)), ('BC-5', ('L2',), (1, 2, 6)),
+                  ('BC-6', ('L1',), (1, 2, 6))],
+        'equations': []},
+    ('h', 'uniaxial', 'y'): {
+        'loads': [('Load-2', ('T2', 'T1'), 2, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6)), ('BC-2', ('B2',), (1, 2, 6))],
+        'equations': []},
+    ('h', 'shear', 'x'): {
+        'loads': [('Load-1', ('T2', 'T1'), 1, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6)), ('BC-2', ('B2',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'B1'), 2), ('Constraint-2', ('L2', 'R2', 'B1'), 2),
+                      ('Constraint-3', ('L3', 'R3', 'B1'), 2), ('Constraint-4', ('L4', 'R4', 'B1'), 2)]},
+    ('h', 'shear', 'y'): {
+        'loads': [('Load-4', ('R1', 'R2', 'R3', 'R4'), 2, 1)],
+        'fixed': [('BC-3', ('L4',), (1, 2, 6)), ('BC-4', ('L3',), (1, 2, 6)), ('BC-5', ('L2',), (1, 2, 6)),
+                  ('BC-6', ('L1',), (1, 2, 6))],
+        'equations': [('Constraint-5', ('B1', 'T1', 'L3'), 1), ('Constraint-6', ('B2', 'T2', 'L3'), 1)]},
+    ('i', 'uniaxial', 'x'): {
+        'loads': [('Load-3', ('L4', 'L3', 'L2', 'L1'), 1, -1)],
+        'fixed': [('BC-2', ('R1',), (1,)), ('BC-3', ('R2',), (1,)), ('BC-4', ('R3',), (1, 2, 6)),
+                  ('BC-5', ('R4',), (1,))],
+        'equations': [('Constraint-5', ('B1', 'T1', 'R2'), 1)]},
+    ('i', 'uniaxial', 'y'): {
+        'loads': [('Load-2', ('T1',), 2, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'B1'), 2), ('Constraint-2', ('L2', 'R2', 'B1'), 2),
+                      ('Constraint-3', ('L3', 'R3', 'B1'), 2), ('Constraint-4', ('L4', 'R4', 'B1'), 2),
+                      ('Constraint-6', ('L1', 'L2', 'B1'), 1), ('Constraint-7', ('L3', 'L4', 'B1'), 1),
+                      ('Constraint-8', ('R1', 'R2', 'B1'), 1), ('Constraint-9', ('R3', 'R4', 'B1'), 1)]},
+    ('i', 'shear', 'x'): {
+        'loads': [('Load-4', ('L4', 'L3', 'L2', 'L1'), 2, 1)],
+        'fixed': [('BC-6', ('R1',), (1, 2, 6)), ('BC-7', ('R2',), (1, 2, 6)), ('BC-4', ('R3',), (1, 2, 6)),
+                  ('BC-8', ('R4',), (1, 2, 6))],
+        'equations': [('Constraint-5', ('B1', 'T1', 'R2'), 1)]},
+    ('i', 'shear', 'y'): {
+        'loads': [('Load-1', ('T1',), 1, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'B1'), 2), ('Constraint-2', ('L2', 'R2', 'B1'), 2),
+                      ('Constraint-3', ('L3', 'R3', 'B1'), 2), ('Constraint-4', ('L4', 'R4', 'B1'), 2)]},
+    ('j', 'uniaxial', 'x'): {
+        'loads': [('Load-3', ('Right',), 1, 1)],
+        'fixed': [('BC-2', ('Left',), (1, 2, 6))],
+        'equations': []},
+    ('j', 'uniaxial', 'y'): {
+        'loads': [('Load-2', ('Top',), 2, 1)],
+        'fixed': [('BC-1', ('Bottom',), (1, 2, 6))],
+        'equations': []},
+    ('j', 'shear', 'x'): {
+        'loads': [('Load-1', ('Top',), 1, 1)],
+        'fixed': [('BC-1', ('Bottom',), (1, 2, 6))],
+        'equations': [],
+        'periodic': ('Left', 'Right', 2)},
+    ('j', 'shear', 'y'): {
+        'loads': [('Load-4', ('Right',), 2, 1)],
+        'fixed': [('BC-2', ('Left',), (1, 2, 6))],
+        'equations': [],
+        'periodic': ('Top', 'Bottom', 1)},
+    ('k', 'uniaxial', 'x'): {
+        'loads': [('Load-3', ('R4', 'R3', 'R2', 'R1'), 1, 1)],
+        'fixed': [('BC-3', ('L1',), (1, 2, 6)), ('BC-4', ('L2',), (1, 2, 6)), ('BC-5', ('L3',), (1, 2, 6)),
+                  ('BC-6', ('L4',), (1, 2, 6))],
+        'equations': []},
+    ('k', 'uniaxial', 'y'): {
+        'loads': [('Load-2', ('T2', 'T1'), 2, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6)), ('BC-2', ('B2',), (1, 2, 6))],
+        'equations': []},
+    ('k', 'shear', 'x'): {
+        'loads': [('Load-1', ('T2', 'T1'), 1, 1)],
+        'fixed': [('BC-1', ('B1',), (1, 2, 6)), ('BC-2', ('B2',), (1, 2, 6))],
+        'equations': [('Constraint-1', ('L1', 'R1', 'B1'), 2), ('Constraint-2', ('L2', 'R2', 'B1'), 2),
+                      ('Constraint-3', ('L3', 'R3', 'B1'), 2), ('Constraint-4', ('L4', 'R4', 'B1'), 2)]},
+    ('k', 'shear', 'y'): {
+        'loads': [('Load-4', ('R4', 'R3', 'R2', 'R1'), 2, 1)],
+        'fixed': [('BC-3', ('L1',), (1, 2, 6)), ('BC-4', ('L2',), (1, 2, 6)), ('BC-5', ('L3',), (1, 2, 6)),
+                  ('BC-6', ('L4',), (1, 2, 6))],
+        'equations': [('Constraint-5', ('B1', 'T1', 'L3'), 1), ('Constraint-6', ('B2', 'T2', 'L3'), 1)]},
+}
+
+# Sides of the cell the first letter of a role refers to
+ROLE_SIDES = {'L': 'Left', 'R': 'Right', 'B': 'Bottom', 'T': 'Top'}
+
+
+# Returns the features of a load case of a structure
+def required_features(structure, loadcase, axis):
+    try:
+        return FEATURES[(structure, loadcase, axis)]
+    except KeyError:
+        raise ValueError('There is no load case ' + repr(loadcase) + ' along ' + repr(axis) + ' for structure ' +
+                         repr(structure))
+
+
+# Points of a role in the sides of utilities/lattices.boundary_vertices, none if the side has fewer vertices
+def role_points(sides, role):
+    if role in sides:
+        return list(sides[role])
+    points = sides[ROLE_SIDES[role[0]]]
+    number = int(role[1:])
+    return [points[number - 1]] if number <= len(points) else []
+
+
+'''
+The features of a load case which exist on the given sides: roles without a vertex are left out of the loads and
+boundary conditions, which are dropped when none of their roles is left, and equations with such a role are dropped.
+'''
+def available_features(structure, loadcase, axis, sides):
+    features = required_features(structure, loadcase, axis)
+
+    def present(roles):
+        return tuple(role for role in roles if role_points(sides, role))
+
+    loads = [(name, present(roles), direction, sign) for name, roles, direction, sign in features['loads']]
+    fixed = [(name, present(roles), dofs) for name, roles, dofs in features['fixed']]
+    return {'loads': [load for load in loads if load[1]],
+            'fixed': [condition for condition in fixed if condition[1]],
+            'equations': [equation for equation in features['equations']
+                          if len(present(equation[1])) == len(equation[1])],
+            'periodic': features.get('periodic')}
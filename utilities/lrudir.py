@@ -0,0 +1,74 @@
+'''
+A directory of cache files bounded by a size budget and a number of entries, the store of the on-disk caches of
+utilities/geometrycache.py and utilities/resultcache.py.
+
+Every file is written to a temporary file in the directory first and then renamed, so that a parallel run never
+reads a half written file. Every hit touches its file, the modification time is the "last used" time, and the files
+used least recently are removed first once a budget is exceeded. Only the files with the suffix of the cache count,
+other files in the directory are left alone.
+'''
+import os
+import tempfile
+
+
+class LRUDirectory(object):
+    def __init__(self, directory, suffix, max_bytes, max_entries=None):
+        self.directory = directory
+        self.suffix = suffix
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    # Marks a file as just used
+    def touch(self, path):
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    # Writes a file with write(target), where target is the binary file object of a temporary file
+    def write(self, path, write):
+        handle, temporary = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(handle, 'wb') as target:
+                write(target)
+            if os.path.exists(path):
+                os.remove(path)
+            os.rename(temporary, path)
+        except (IOError, OSError):
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        self.evict()
+
+    # Removes the least recently used files until both budgets are kept
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.suffix):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                status = os.stat(path)
+            except OSError:
+                continue
+            entries.append((status.st_mtime, status.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        while entries and (total > self.max_bytes or
+                           (self.max_entries is not None and len(entries) > self.max_entries)):
+            _, size, path = entries.pop(0)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(self.suffix):
+                os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,144 @@
+'''
+Manifest of a sweep, so that a crashed or interrupted batch can be restarted where it stopped.
+
+Every run of a spec file is a row of an SQLite table, identified by the hash of its canonical JSON. The row holds the
+state of the run and where its results are:
+    pending    not started yet
+    claimed    taken by the recorded session, its model is being built
+    built      the model is built, the job not yet submitted
+    submitted  the job is solving (or scheduled) under the recorded job name
+    done       the ODB is at the recorded path
+    failed     the build or the job has failed
+A restarted batch skips the runs which are done. Several sessions may work on one sweep: a session claims every
+pending or failed run before building it, and the UPDATE of the claim succeeds for only one of them. While it works,
+a session writes its time to the table sessions every HEARTBEAT seconds. The runs of a session not heard of for
+STALE_AFTER seconds are settled by the next session: a run left 'submitted' stays so while its job is still running
+(the solver outlives a crashed CAE session), counts as done if its ODB is complete and is run again otherwise, like
+the claimed and built ones. The times all come from the clock of the machine holding the database.
+'''
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import time
+
+from utilities.jobwatch import ABORTED, RUNNING, job_state
+
+
+STATES = ('pending', 'claimed', 'built', 'submitted', 'done', 'failed')
+
+# Seconds between two heartbeats of a session, and without heartbeat after which its runs are taken back
+HEARTBEAT = 10.0
+STALE_AFTER = 60.0
+
+
+# Name of a session, unique across the workstations sharing the manifest
+def session_name():
+    return socket.gethostname() + '-' + str(os.getpid())
+
+
+# Identifies a run by its values, independent of its position in the spec file
+def run_key(run):
+    return hashlib.sha1(json.dumps(run, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+# True if the job has left a complete ODB (a job taken from the result cache has no log file)
+def has_results(directory, job_name):
+    return (os.path.exists(os.path.join(directory, job_name + '.odb')) and
+            job_state(directory, job_name) not in (RUNNING, ABORTED))
+
+
+class SweepManifest(object):
+    def __init__(self, path, owner=None, heartbeat=None, stale_after=None):
+        self.path = path
+        self.owner = owner or session_name()
+        self.heartbeat = float(heartbeat or HEARTBEAT)
+        self.stale_after = float(stale_after or STALE_AFTER)
+        # Several CAE sessions may work on the same sweep, a locked database is waited for
+        self.connection = sqlite3.connect(path, timeout=60.0)
+        with self.connection:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS runs (key TEXT PRIMARY KEY, run TEXT, state TEXT, '
+                                    'job TEXT, odb TEXT, attempts INTEGER, updated REAL, owner TEXT)')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS sessions (owner TEXT PRIMARY KEY, beat REAL)')
+            # Manifests written before the claims have no owner column, their runs belong to no session
+            columns = [row[1] for row in self.connection.execute('PRAGMA table_info(runs)')]
+            if 'owner' not in columns:
+                self.connection.execute('ALTER TABLE runs ADD COLUMN owner TEXT')
+
+    # Adds the runs which are not in the manifest yet as pending and returns the keys of all runs
+    def register(self, runs):
+        keys = [run_key(run) for run in runs]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO runs VALUES (?, ?, 'pending', NULL, NULL, 0, ?, NULL)",
+                [(key, json.dumps(run, sort_keys=True), time.time()) for key, run in zip(keys, runs)])
+        return keys
+
+    def state(self, key):
+        row = self.connection.execute('SELECT state FROM runs WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def mark(self, key, state, job=None, odb=None):
+        if state not in STATES:
+            raise ValueError('Unknown state ' + repr(state) + ', use one of ' + ', '.join(STATES))
+        with self.connection:
+            self.connection.execute(
+                'UPDATE runs SET state = ?, job = COALESCE(?, job), odb = COALESCE(?, odb), '
+                'attempts = attempts + ?, updated = ? WHERE key = ?',
+                (state, job, odb, 1 if state == 'submitted' else 0, time.time(), key))
+
+    # Takes a pending or failed run for this session, False if it is done or another session has taken it
+    def claim(self, key):
+        with self.connection:
+            cursor = self.connection.execute(
+                "UPDATE runs SET state = 'claimed', owner = ?, updated = ? "
+                "WHERE key = ? AND state IN ('pending', 'failed')", (self.owner, time.time(), key))
+        return cursor.rowcount == 1
+
+    # Records that the session is alive, on a connection of its own as it is called by Heartbeat from its thread
+    def beat(self, owner):
+        connection = sqlite3.connect(self.path, timeout=60.0)
+        try:
+            with connection:
+                connection.execute('INSERT OR REPLACE INTO sessions VALUES (?, ?)', (owner, time.time()))
+        finally:
+            connection.close()
+
+    '''
+    Settles the runs left by crashed sessions, i.e. sessions without heartbeat for stale_after seconds. A submitted
+    run stays submitted while its job is running, is done if its ODB is complete and pending otherwise; claimed and
+    built runs are pending again.
+    '''
+    def recover(self, directory):
+        # Runs recorded under the own name were left by an earlier session of the same process
+        alive = set(owner for owner, in self.connection.execute('SELECT owner FROM sessions WHERE beat >= ?',
+                                                                 (time.time() - self.stale_after,)))
+        alive.discard(self.owner)
+        for key, state, job, owner in self.connection.execute(
+                "SELECT key, state, job, owner FROM runs WHERE state IN ('claimed', 'built', 'submitted')").fetchall():
+            if owner in alive:
+                continue
+            if state != 'submitted':
+                self.mark(key, 'pending')
+            elif job and job_state(directory, job) == RUNNING:
+                continue
+            elif job and has_results(directory, job):
+                self.mark(key, 'done', odb=os.path.join(directory, job + '.odb'))
+            else:
+                self.mark(key, 'pending')
+
+    # Keys of the given ones which still have to be run
+    def incomplete(self, keys):
+        return [key for key in keys if self.state(key) != 'done']
+
+    # (state, number of runs) for every state
+    def summary(self):
+        counts = dict(self.connection.execute('SELECT state, COUNT(*) FROM runs GROUP BY state').fetchall())
+        return [(state, counts.get(state, 0)) for state in STATES]
+
+    # The runs still claimed by the session are taken back by the next one right away
+    def close(self):
+        with self.connection:
+            self.connection.execute('DELETE FROM sessions WHERE owner = ?', (self.owner,))
+        self.connection.close()
@@ -0,0 +1,66 @@
+'''
+Parallel settings of the solver: number of CPUs, of domains and of threads per MPI process, and the parallelization
+method ('default', 'threads' or 'mpi'). Every setting can be given explicitly, the CPUs also as 'auto'.
+
+Auto-tuning chooses the CPUs from the size of the model (elements plus equations) and the number of jobs which run
+at the same time:
+    - a core only pays off for about PER_CORE elements and equations, below that the communication between the
+      cores costs more than it saves, so a small unit cell runs on one core
+    - jobs running at the same time share the cores, every job gets at most its share of them (wide and shallow)
+    - a model large enough for all cores runs on all of them (deep); several of them at once would also compete
+      for the memory, so the scheduler runs them one after the other
+Up to THREADS_PER_PROCESS CPUs run as threads of one process, more CPUs as MPI processes with threads each.
+'''
+
+
+METHODS = ('default', 'threads', 'mpi')
+
+# Elements and equations per core for which an additional core still saves time
+PER_CORE = 10000
+
+# Threads of one MPI process, more threads than the cores of one socket slow the solver down
+THREADS_PER_PROCESS = 8
+
+
+def auto_cpus(elements, equations, cores, concurrent_jobs=1):
+    efficient = max(1, min(cores, (elements + equations) // PER_CORE))
+    if efficient == cores:
+        return cores
+    return max(1, min(efficient, cores // max(1, concurrent_jobs)))
+
+
+'''
+Returns {'cpus': ..., 'domains': ..., 'threads': ..., 'method': ...}. Settings which are None are chosen: the
+domains equal the CPUs, threads are used up to THREADS_PER_PROCESS CPUs and MPI processes beyond.
+'''
+def solver_settings(elements, equations, cores, concurrent_jobs=1, cpus='auto', domains=None, threads=None,
+                    method=None):
+    if cpus in (None, 'auto'):
+        cpus = auto_cpus(elements, equations, cores, concurrent_jobs)
+    cpus = int(cpus)
+    if cpus < 1:
+        raise ValueError('The number of CPUs must be at least 1, not ' + str(cpus))
+    if method is None:
+        method = 'threads' if cpus <= THREADS_PER_PROCESS else 'mpi'
+    if method not in METHODS:
+        raise ValueError('Unknown parallelization method ' + repr(method) + ', use one of ' + ', '.join(METHODS))
+    if threads is None:
+        threads = max(t for t in range(1, THREADS_PER_PROCESS + 1) if cpus % t == 0) if method == 'mpi' else 1
+    threads = int(threads)
+    if cpus % threads:
+        raise ValueError(str(cpus) + ' CPUs cannot be split into MPI processes of ' + str(threads) + ' threads')
+    domains = int(domains or cpus)
+    if domains % (cpus // threads):
+        raise ValueError('The number of domains (' + str(domains) + ') must be a multiple of the MPI processes (' +
+                         str(cpus // threads) + ')')
+    return {'cpus': cpus, 'domains': domains, 'threads': threads, 'method': method}
+
+
+# Arguments of the abaqus command for the settings
+def command_options(settings):
+    options = ['cpus=' + str(settings['cpus']), 'domains=' + str(settings['domains'])]
+    if settings['method'] != 'default':
+        options.append('mp_mode=' + settings['method'])
+    if settings['method'] == 'mpi':
+        options.append('threads_per_mpi_process=' + str(settings['threads']))
+    return options
@@ -0,0 +1,138 @@
+'''
+Periodic node pairs of a unit cell.
+
+Every vertex on the boundary of a periodic cell has an image on the opposite boundary, shifted by one of the two
+cell vectors. Instead of relying on both sides holding their vertices in the same order, the image of every vertex
+is looked up directly: all vertices are put into a spatial hash (utilities/selection.PointIndex) and each vertex
+shifted by a cell vector is searched in it. This takes O(n log n) for sorting the bucket keys and searching them,
+instead of O(n^2) for comparing all vertices, and works for any pair of cell vectors, including oblique ones, and for
+supercells and new tilings alike.
+'''
+import numpy as np
+
+from utilities.selection import PointIndex
+
+
+'''
+Returns one array of pairs (i, j) per cell vector: vertex j is the image of vertex i shifted by this vector.
+The pairs are sorted along the boundary, i.e. by the position along the other cell vector.
+'''
+def periodic_pairs(vertices, vectors, tolerance):
+    vertices = np.asarray(vertices, dtype=float).reshape(-1, 2)
+    vectors = np.asarray(vectors, dtype=float)
+    index = PointIndex(vertices, tolerance)
+    fractions = cell_fractions(vertices, vectors)
+
+    pairs = []
+    for axis, vector in enumerate(vectors):
+        images = index.find(vertices + vector)
+        source = np.nonzero(images >= 0)[0]
+        source = source[np.argsort(fractions[source, 1 - axis], kind='mergesort')]
+        pairs.append(np.column_stack((source, images[source])).astype(int))
+    return pairs
+
+
+# Coordinates of the vertices in fractions of the cell vectors
+def cell_fractions(vertices, vectors):
+    return np.linalg.solve(np.asarray(vectors, dtype=float).T, np.asarray(vertices, dtype=float).T).T
+
+
+# Indices of the vertices on the boundary of the cell which have no periodic image
+def unpaired_vertices(vertices, vectors, pairs, tolerance):
+    fractions = cell_fractions(vertices, vectors)
+    lengths = np.sqrt((np.asarray(vectors, dtype=float) ** 2).sum(axis=1))
+    distance = np.minimum(np.abs(fractions), np.abs(1.0 - fractions)) * lengths
+    on_boundary = (distance < tolerance).any(axis=1)
+
+    paired = np.zeros(len(fractions), dtype=bool)
+    for pair in pairs:
+        paired[pair.ravel()] = True
+    return np.nonzero(on_boundary & ~paired)[0]
+
+
+'''
+Writes the equations u_dof(dependent) - u_dof(independent) = 0 for all node pairs as one *Equation keyword block.
+The nodes are given by their labels in the instance, the first node of every equation is the one that gets
+eliminated. Building the text takes milliseconds even for 10^4 pairs, where the CAE API would need one Equation()
+call and one set per pair.
+'''
+def equation_block(dependent, independent, dof, instance='Part-1-1'):
+    dependent = np.asarray(dependent, dtype=int)
+    independent = np.asarray(independent, dtype=int)
+    if len(dependent) != len(independent):
+        raise ValueError('%d dependent but %d independent nodes' % (len(dependent), len(independent)))
+    if len(dependent) == 0:
+        return ''
+    equation = '2\n%s.%%d, %d, 1.\n%s.%%d, %d, -1.' % (instance, dof, instance, dof)
+    return '*Equation\n' + '\n'.join(equation % pair for pair in zip(dependent.tolist(), independent.tolist()))
+
+
+'''
+Macroscopic strain through two dummy reference points. The displacement of RP-1 is the jump of the displacement
+field across the first cell vector (u(right) - u(left)), the one of RP-2 the jump across the second cell vector
+(u(top) - u(bottom)). With the displacement gradient H of the macroscopic deformation they are
+    RP-1: (H11 * width, H21 * width)        RP-2: (H12 * height, H22 * height)
+and their reaction forces are the resultant forces transmitted through the right and the top side of the cell
+    RP-1: (S11 * height, S21 * height)      RP-2: (S12 * width, S22 * width)
+Every component of H or of the macroscopic stress S is therefore a single DOF of a reference point.
+'''
+COMPONENTS = {'11': ('RP-1', 1), '21': ('RP-1', 2), '12': ('RP-2', 1), '22': ('RP-2', 2)}
+
+# Macroscopic component loaded by each of the classic load cases
+LOADCASE_COMPONENTS = {('uniaxial', 'x'): '11', ('uniaxial', 'y'): '22', ('shear', 'x'): '12', ('shear', 'y'): '21'}
+
+
+'''
+Equations tying every node pair to a reference point: u_i(image) - u_i(node) - u_i(reference) = 0 for both
+displacements, and equal rotations (DOF 6) on both sides, as the beams cross the boundary without a hinge.
+'''
+def macro_equation_block(dependent, independent, reference, instance='Part-1-1'):
+    dependent = np.asarray(dependent, dtype=int)
+    independent = np.asarray(independent, dtype=int)
+    if len(dependent) != len(independent):
+        raise ValueError('%d dependent but %d independent nodes' % (len(dependent), len(independent)))
+    if len(dependent) == 0:
+        return ''
+    equation = ''.join('3\n%s.%%(image)d, %d, 1.\n%s.%%(node)d, %d, -1.\n%s, %d, -1.\n' %
+                       (instance, dof, instance, dof, reference, dof) for dof in (1, 2))
+    equation += '2\n%s.%%(image)d, 6, 1.\n%s.%%(node)d, 6, -1.' % (instance, instance)
+    return '*Equation\n' + '\n'.join(equation % {'image': image, 'node': node}
+                                     for image, node in zip(dependent.tolist(), independent.tolist()))
+
+
+'''
+Turns the prescribed components of the macroscopic displacement gradient (strain) and of the macroscopic stress
+into (reference point, dof, 'displacement' or 'force', value). The rigid body rotation is removed by keeping H21 = 0
+(simple shear), or H12 = 0 if H21 is prescribed. Components which are not prescribed stay free (zero force).
+'''
+def reference_conditions(width, height, strain=None, stress=None):
+    strain = dict(strain or {})
+    stress = dict(stress or {})
+    for component in list(strain) + list(stress):
+        if component not in COMPONENTS:
+            raise ValueError('Unknown component ' + repr(component) + ', use one of ' + ', '.join(sorted(COMPONENTS)))
+    both = set(strain) & set(stress)
+    if both:
+        raise ValueError('The component ' + sorted(both)[0] + ' cannot be given as strain and as stress')
+
+    conditions = []
+    for component, value in sorted(strain.items()):
+        reference, dof = COMPONENTS[component]
+        conditions.append((reference, dof, 'displacement', value * (width if reference == 'RP-1' else height)))
+    for component, value in sorted(stress.items()):
+        reference, dof = COMPONENTS[component]
+        conditions.append((reference, dof, 'force', value * (height if reference == 'RP-1' else width)))
+
+    if '21' not in strain and '21' not in stress:
+        conditions.append(('RP-1', 2, 'displacement', 0.0))
+    elif '12' not in strain and '12' not in stress:
+        conditions.append(('RP-2', 1, 'displacement', 0.0))
+    elif '12' in stress and '21' in stress:
+        raise ValueError('With both shear stresses prescribed the rigid body rotation is not restrained')
+    return conditions
+
+
+# Macroscopic stress of a classic load case whose force is the resultant on the loaded side of the cell
+def loadcase_stress(loadcase, axis, force, width, height):
+    component = LOADCASE_COMPONENTS[(loadcase, axis)]
+    return {component: float(force) / (height if COMPONENTS[component][0] == 'RP-1' else width)}
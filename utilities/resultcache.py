@@ -0,0 +1,60 @@
+'''
+On-disk cache of analysis results, addressed by the content of the input file.
+
+A sweep often asks for the same model again, e.g. the same lattice, material, section and load in two spec files.
+The input file written by CAE describes the analysis completely, so its hash identifies the result: the ODB of a
+completed job is stored under the hash of its input file, and a later job with the same input file gets a copy of
+it instead of being solved again. The comment lines (** ...) are left out of the hash, as they hold the job and
+model names and the date.
+
+The cache is bounded by a size budget, the ODBs used least recently are removed first once it is exceeded
+(utilities/lrudir.py).
+'''
+import hashlib
+import os
+import shutil
+
+from utilities.lrudir import LRUDirectory
+
+
+# Default budget, can be overwritten with the environment variable LATTICE_RESULT_CACHE_MB
+MAX_MEGABYTES = 4096.0
+
+
+# Hash of an input file without its comment lines
+def input_key(input_file):
+    digest = hashlib.sha1()
+    with open(input_file, 'rb') as deck:
+        for line in deck:
+            if not line.startswith(b'**'):
+                digest.update(line.rstrip())
+                digest.update(b'\n')
+    return digest.hexdigest()
+
+
+class ResultCache(LRUDirectory):
+    def __init__(self, directory, max_megabytes=None):
+        if max_megabytes is None:
+            max_megabytes = float(os.environ.get('LATTICE_RESULT_CACHE_MB', MAX_MEGABYTES))
+        LRUDirectory.__init__(self, directory, '.odb', int(max_megabytes * 1024 * 1024))
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.odb')
+
+    # Copies the cached ODB of the key to odb_path, returns False if there is none
+    def restore(self, key, odb_path):
+        path = self.path(key)
+        try:
+            shutil.copyfile(path, odb_path)
+        except (IOError, OSError):
+            self.misses += 1
+            return False
+        self.touch(path)
+        self.hits += 1
+        return True
+
+    def put(self, key, odb_path):
+        def copy(target):
+            with open(odb_path, 'rb') as source:
+                shutil.copyfileobj(source, target)
+        self.write(self.path(key), copy)
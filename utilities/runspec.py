@@ -0,0 +1,254 @@
+'''
+Run specifications for the non-interactive batch mode.
+
+A run specification holds exactly the values the dialogs in main.py would ask for. It can be written as
+- a JSON file containing a single run, a list of runs or {"defaults": {...}, "runs": [...]}
+- an INI file in which every section is one run and the [DEFAULT] section holds shared values
+
+Every value that is not given falls back to the value pre-filled in the corresponding dialog, so that a batch run
+and an interactive run where the user only presses "OK" build the same model.
+'''
+import json
+import os
+
+try:
+    from ConfigParser import ConfigParser
+except ImportError:
+    from configparser import ConfigParser
+
+
+STRUCTURES = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k']
+MODELS = ['linear', 'nonlinear']
+SECTIONS = ['box', 'pipe', 'circular', 'rectangular', 'hexagonal', 'trapezoidal', 'i', 'l', 't']
+LOADCASES = ['uniaxial', 'shear']
+AXES = ['x', 'y']
+# classic: loads and fixes on the cell sides, periodic: macroscopic strain/stress on two reference points
+BOUNDARIES = ['classic', 'periodic']
+MACRO_COMPONENTS = ['11', '12', '21', '22']
+
+# Same lists as in select_cross_section: beams in structures with triangles need to be thinner
+TRIANGLE_STRUCTURES = ['b', 'c', 'e', 'f', 'g', 'h', 'i', 'j']
+QUAD_STRUCTURES = ['a', 'd', 'k']
+
+# The dialog defaults of main.py
+DEFAULTS = {'structure': 'g', 'edge': 20.0, 'model': 'nonlinear', 'section': 'circular',
+            'loadcase': 'uniaxial', 'axis': 'x', 'tiling': (1, 1), 'boundary': 'classic', 'strain': None,
+            'stress': None, 'loadcases': None}
+MATERIAL_DEFAULTS = {'linear': {'young_modulus': 210000.0, 'poisson_rate': 0.3},
+                     'nonlinear': {'c10': 0.3339, 'c01': -0.000337, 'd1': 0.0015828}}
+FORCE_DEFAULTS = {'linear': 1000.0, 'nonlinear': 1.0}
+SECTION_DEFAULTS = {'box': {'width': 5.0, 'height': 5.0, 'thickness': 1.0},
+                    'circular': {'radius': 2.0},
+                    'pipe': {'radius': 5.0, 'thickness': 1.0},
+                    'rectangular': {'width': 5.0, 'height': 3.0},
+                    'hexagonal': {'radius': 5.0, 'thickness': 1.0},
+                    'trapezoidal': {'width': 5.0, 'height': 3.0, 'width_2': 2.0, 'd': 1.0},
+                    'i': {'i': 2.0, 'height': 4.0, 'width': 3.0, 'width_2': 3.0, 'thickness': 1.0,
+                          'thickness_2': 1.0, 'thickness_3': 1.0},
+                    'l': {'width': 5.0, 'height': 5.0, 'thickness': 1.0, 'thickness_2': 1.0},
+                    't': {'width': 5.0, 'height': 5.0, 'i': 2.0, 'thickness': 1.0, 'thickness_2': 1.0}}
+
+MATERIAL_KEYS = ['young_modulus', 'poisson_rate', 'c10', 'c01', 'd1']
+SECTION_KEYS = ['width', 'width_2', 'height', 'radius', 'd', 'thickness', 'thickness_2', 'thickness_3', 'i']
+STRING_KEYS = ['structure', 'model', 'section', 'loadcase', 'axis', 'boundary']
+FLOAT_KEYS = ['edge', 'force'] + MATERIAL_KEYS + SECTION_KEYS
+
+
+# Reads a JSON or INI file and returns the list of complete and checked runs
+def load_run_specs(path):
+    if os.path.splitext(path)[1].lower() in ('.ini', '.cfg'):
+        raw_runs = _read_ini(path)
+    else:
+        with open(path) as spec_file:
+            raw_runs = _expand_json(json.load(spec_file))
+
+    if not raw_runs:
+        raise ValueError('The run specification ' + str(path) + ' does not contain any run')
+
+    return [complete_run(raw_run, number) for number, raw_run in enumerate(raw_runs, 1)]
+
+
+def _expand_json(data):
+    if isinstance(data, list):
+        return [dict(run) for run in data]
+    if 'runs' in data:
+        runs = []
+        for run in data['runs']:
+            merged = dict(data.get('defaults', {}))
+            merged.update(run)
+            runs.append(merged)
+        return runs
+    return [dict(data)]
+
+
+def _read_ini(path):
+    parser = ConfigParser()
+    parser.read(path)
+    runs = []
+    for name in parser.sections():
+        run = dict(parser.items(name))
+        run.setdefault('name', name)
+        runs.append(run)
+    return runs
+
+
+'''
+Fills in the dialog defaults, converts all values to the types the create_* functions expect and applies the same
+checks the dialogs apply. A ValueError names the run and the offending value, as there is nobody to ask again.
+'''
+def complete_run(raw_run, number=1):
+    run = dict(DEFAULTS)
+    run.update(dict((key, value) for key, value in raw_run.items() if value is not None))
+    label = 'Run ' + str(run.get('name', number))
+
+    for key in STRING_KEYS:
+        run[key] = str(run[key]).lower()
+
+    _check_choice(label, run, 'structure', STRUCTURES)
+    _check_choice(label, run, 'model', MODELS)
+    _check_choice(label, run, 'section', SECTIONS)
+    _check_choice(label, run, 'loadcase', LOADCASES)
+    _check_choice(label, run, 'axis', AXES)
+    _check_choice(label, run, 'boundary', BOUNDARIES)
+
+    run.setdefault('force', FORCE_DEFAULTS[run['model']])
+    for key, value in MATERIAL_DEFAULTS[run['model']].items():
+        run.setdefault(key, value)
+    for key, value in SECTION_DEFAULTS[run['section']].items():
+        run.setdefault(key, value)
+
+    for key in FLOAT_KEYS:
+        if run.get(key) is None:
+            run[key] = None
+            continue
+        try:
+            run[key] = float(run[key])
+        except (TypeError, ValueError):
+            raise ValueError(label + ': ' + key + ' = ' + repr(run[key]) + ' is not a valid number')
+
+    if run['edge'] <= 0.0:
+        raise ValueError(label + ': The edge length must be larger than Zero')
+
+    run['tiling'] = parse_tiling(run['tiling'], label)
+    for key in ('strain', 'stress'):
+        run[key] = parse_macro(run.get(key), key, label)
+    if (run['strain'] or run['stress']) and run['boundary'] != 'periodic':
+        raise ValueError(label + ': A macroscopic strain or stress needs boundary = periodic')
+    if set(run['strain']) & set(run['stress']):
+        raise ValueError(label + ': A component cannot be given as strain and as stress')
+
+    run['loadcases'] = parse_loadcases(run['loadcases'], label)
+    if run['loadcases'] and (run['boundary'] != 'periodic' or run['strain'] or run['stress']):
+        raise ValueError(label + ': Several load cases in one job need boundary = periodic and no strain or stress')
+
+    message = check_cross_section(run)
+    if message:
+        raise ValueError(label + ': ' + message)
+
+    return run
+
+
+# A tiling is given as [n, m] in JSON or as "n x m" in INI files
+def parse_tiling(value, label):
+    if not isinstance(value, (list, tuple)):
+        value = str(value).lower().replace('x', ' ').replace(',', ' ').split()
+    try:
+        n, m = [int(number) for number in value]
+    except (TypeError, ValueError):
+        raise ValueError(label + ': tiling = ' + repr(value) + ' is not of the form [n, m]')
+    if n < 1 or m < 1:
+        raise ValueError(label + ': The tiling needs at least one cell in each direction')
+    return n, m
+
+
+'''
+A macroscopic strain or stress is given as {"11": 0.01, "12": 0.0} in JSON or as "11: 0.01, 12: 0.0" in INI files.
+The components are the ones of the displacement gradient (strain) or of the stress, see utilities/periodic.py.
+'''
+def parse_macro(value, key, label):
+    if not value:
+        return {}
+    if not isinstance(value, dict):
+        try:
+            value = dict(item.split(':') for item in str(value).replace(';', ',').split(',') if item.strip())
+        except ValueError:
+            raise ValueError(label + ': ' + key + ' = ' + repr(value) + ' is not of the form "11: value, 12: value"')
+
+    macro = {}
+    for component, number in value.items():
+        component = str(component).strip()
+        if component not in MACRO_COMPONENTS:
+            raise ValueError(label + ': ' + key + ' component ' + repr(component) + ' is not one of ' +
+                             ', '.join(MACRO_COMPONENTS))
+        try:
+            macro[component] = float(number)
+        except (TypeError, ValueError):
+            raise ValueError(label + ': ' + key + ' ' + component + ' = ' + repr(number) + ' is not a valid number')
+    return macro
+
+
+'''
+Several load cases for one job are given as a list ["uniaxial x", "shear y"] or as "uniaxial x, shear y" in INI
+files, "all" stands for all four. Returns a list of (loadcase, axis).
+'''
+def parse_loadcases(value, label):
+    if not value:
+        return []
+    if not isinstance(value, (list, tuple)):
+        value = str(value).split(',')
+    if [str(case).strip().lower() for case in value] == ['all']:
+        return [(loadcase, axis) for loadcase in LOADCASES for axis in AXES]
+
+    cases = []
+    for case in value:
+        # A pair (loadcase, axis) as returned here, e.g. of a completed run sent as JSON
+        if isinstance(case, (list, tuple)):
+            case = ' '.join(str(word) for word in case)
+        words = str(case).lower().replace('-', ' ').split()
+        if len(words) != 2 or words[0] not in LOADCASES or words[1] not in AXES:
+            raise ValueError(label + ': The load case ' + repr(case) + ' is not of the form "uniaxial x"')
+        cases.append((words[0], words[1]))
+    return cases
+
+
+def _check_choice(label, run, key, choices):
+    if run[key] not in choices:
+        raise ValueError(label + ': ' + key + ' = ' + repr(run[key]) + ' is not one of ' + ', '.join(choices))
+
+
+'''
+The size limits of select_cross_section. Returns None if the section fits into the lattice, otherwise the reason.
+'''
+def check_cross_section(run):
+    section = run['section']
+    edge = run['edge']
+    too_large = 'The radius/width/height/thickness is too large (in relation to the edge size)'
+
+    if section in ('box',) and (run['thickness'] >= run['width'] / 2.0 or run['thickness'] >= run['height'] / 2.0):
+        return too_large
+    if section in ('pipe', 'hexagonal') and run['thickness'] >= run['radius']:
+        return too_large
+
+    if run['structure'] in QUAD_STRUCTURES:
+        limit = edge / 2.0
+    elif run['structure'] in TRIANGLE_STRUCTURES:
+        limit = edge / 3.0
+    else:
+        return None
+
+    dimensions = {'box': ['width', 'height'], 'circular': ['radius'], 'pipe': ['radius'],
+                  'rectangular': ['width', 'height'], 'hexagonal': ['radius'], 'trapezoidal': ['width', 'height'],
+                  'i': ['width', 'width_2', 'height'], 'l': ['width', 'height'], 't': ['width', 'height']}
+    for key in dimensions[section]:
+        if run[key] >= limit:
+            return too_large
+    return None
+
+
+# Picks the specification file from the arguments following '--' in "abaqus cae noGUI=main.py -- runs.json"
+def spec_file_from_argv(argv):
+    if '--' in argv:
+        arguments = argv[argv.index('--') + 1:]
+        if arguments:
+            return arguments[0]
+    return os.environ.get('LATTICE_RUN_SPEC')
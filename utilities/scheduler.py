@@ -0,0 +1,124 @@
+'''
+Runs prepared Abaqus jobs concurrently.
+
+A job is prepared by writing its input file (mdb.jobs[name].writeInput()). The scheduler then starts the solver for
+as many jobs at once as the limits allow:
+    - cores: the sum of the CPUs of all running jobs
+    - license tokens: the sum of the tokens of all running jobs, int(5 * cpus ** 0.422) per job
+    - memory: every job gets the share of the memory that matches its share of the cores, so the running jobs never
+      ask for more than the configured percentage of the memory together
+Jobs are started in the given order, a job that does not fit lets smaller jobs behind it go first. The solver
+command is configurable, utilities/standin_solver.py replaces Abaqus for tests without a license.
+'''
+import os
+import shlex
+import subprocess
+import sys
+import time
+
+from utilities.jobwatch import ABORTED, COMPLETED, DirectoryEvents, job_state
+
+
+# Tokens Abaqus checks out for an analysis on the given number of CPUs
+def license_tokens(cpus):
+    return int(5 * cpus ** 0.422)
+
+
+class ScheduledJob(object):
+    # options: solver arguments for the CPUs, e.g. from utilities/parallel.command_options, instead of cpus=<cpus>
+    def __init__(self, name, input_file=None, cpus=1, options=None):
+        self.name = name
+        self.input_file = input_file or name + '.inp'
+        self.cpus = int(cpus)
+        self.options = options or ['cpus=' + str(self.cpus)]
+        self.tokens = license_tokens(self.cpus)
+        self.memory = None
+        self.process = None
+        self.output = None
+        self.start = None
+        self.wall_time = None
+        self.state = None
+
+
+'''
+The settings can be given as arguments or by the environment variables LATTICE_CORES, LATTICE_LICENSE_TOKENS,
+LATTICE_MEMORY_PERCENT and LATTICE_SOLVER (the solver command, e.g. "abaqus" or "python standin_solver.py").
+'''
+class Scheduler(object):
+    def __init__(self, directory, cores=None, license_limit=None, memory_percent=None, command=None):
+        self.directory = directory
+        self.cores = int(cores or os.environ.get('LATTICE_CORES') or 1)
+        license_limit = license_limit or os.environ.get('LATTICE_LICENSE_TOKENS')
+        self.license_limit = int(license_limit) if license_limit else None
+        self.memory_percent = float(memory_percent or os.environ.get('LATTICE_MEMORY_PERCENT') or 90.0)
+        command = command or os.environ.get('LATTICE_SOLVER') or 'abaqus'
+        self.command = shlex.split(command) if isinstance(command, str) else list(command)
+
+    def fits(self, job, running):
+        if sum(other.cpus for other in running) + job.cpus > self.cores:
+            return False
+        if self.license_limit is not None and sum(other.tokens for other in running) + job.tokens > self.license_limit:
+            return False
+        return True
+
+    # Runs all jobs and returns them with their state and wall time [s]
+    def run(self, jobs):
+        for job in jobs:
+            if job.cpus > self.cores:
+                raise ValueError('The job ' + job.name + ' needs ' + str(job.cpus) + ' CPUs, but only ' +
+                                 str(self.cores) + ' cores are available')
+            if self.license_limit is not None and job.tokens > self.license_limit:
+                raise ValueError('The job ' + job.name + ' needs ' + str(job.tokens) + ' license tokens, but only ' +
+                                 str(self.license_limit) + ' are available')
+
+        pending = list(jobs)
+        running = []
+        events = DirectoryEvents(self.directory)
+        try:
+            while pending or running:
+                for job in list(pending):
+                    if self.fits(job, running):
+                        self.start(job)
+                        pending.remove(job)
+                        running.append(job)
+
+                for job in list(running):
+                    if job.process.poll() is not None:
+                        self.finish(job)
+                        running.remove(job)
+                if running:
+                    # The solver writes into the directory when a job ends. It exits a moment later, so the timeout
+                    # is kept short to see the exit without waiting for the next file change.
+                    events.wait(0.1)
+        finally:
+            events.close()
+            for job in running:
+                if job.process.poll() is None:
+                    job.process.kill()
+        return jobs
+
+    def start(self, job):
+        job.memory = max(1, int(self.memory_percent * job.cpus / self.cores))
+        arguments = (self.command + ['job=' + job.name, 'input=' + job.input_file] + job.options +
+                     ['memory=' + str(job.memory) + '%', 'interactive'])
+        job.output = open(os.path.join(self.directory, job.name + '.scheduler.log'), 'w')
+        job.start = time.time()
+        job.process = subprocess.Popen(arguments, cwd=self.directory, stdout=job.output, stderr=subprocess.STDOUT,
+                                       shell=sys.platform.startswith('win'))
+
+    def finish(self, job):
+        job.wall_time = time.time() - job.start
+        job.output.close()
+        # The lock file is gone once the solver has exited, the log tells how the job ended
+        if job.process.returncode == 0 and job_state(self.directory, job.name) == COMPLETED:
+            job.state = COMPLETED
+        else:
+            job.state = ABORTED
+
+
+# Table of the jobs with CPUs, memory share, state and wall time
+def report(jobs):
+    lines = ['%-20s %5s %7s %10s %12s' % ('job', 'cpus', 'memory', 'state', 'wall time [s]')]
+    for job in jobs:
+        lines.append('%-20s %5d %6s%% %10s %12.2f' % (job.name, job.cpus, job.memory, job.state, job.wall_time or 0.0))
+    return '\n'.join(lines)
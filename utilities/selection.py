@@ -0,0 +1,100 @@
+'''
+Coordinate based selection of part vertices and mesh nodes.
+
+Recorded macros select geometry with getSequenceFromMask and masks like '[#ffffffff #3ff ]', i.e. by the internal
+numbering of the vertices, which changes with every new lattice or tiling. Here the vertices of a part are
+read once into a spatial hash (see utilities/spatialhash.py) and every query is answered by position, e.g. with the
+boundary points of utilities/lattices.boundary_vertices. The result is turned into a mask again, so that any number
+of vertices is selected with one call instead of one findAt per point.
+'''
+import numpy as np
+
+from utilities.spatialhash import MAX_BUCKET, bucket_keys, neighbour_keys
+
+
+# Mask string of getSequenceFromMask selecting the given indices: 32 indices per hex word, lowest word first
+def mask_from_indices(indices):
+    indices = np.asarray(indices, dtype=int)
+    if len(indices) == 0:
+        raise ValueError('An empty selection has no mask')
+    words = np.zeros(indices.max() // 32 + 1, dtype=np.int64)
+    np.bitwise_or.at(words, indices // 32, np.left_shift(np.ones(len(indices), dtype=np.int64), indices % 32))
+    return '[' + ''.join('#%x ' % word for word in words) + ']'
+
+
+'''
+Finds points by their coordinates. Every indexed point lies in a bucket of the size of the tolerance, so a query
+only compares against the points of its own bucket and the 8 neighbouring buckets.
+'''
+class PointIndex(object):
+    def __init__(self, points, tolerance):
+        self.points = np.asarray(points, dtype=float).reshape(-1, 2)
+        self.tolerance = tolerance
+        keys = bucket_keys(self.points, tolerance)
+        self.order = np.argsort(keys, kind='mergesort')
+        self.keys = keys[self.order]
+
+    # Returns the index of the indexed point within the tolerance of every query point, -1 where there is none
+    def find(self, points):
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        found = np.full(len(points), -1, dtype=int)
+        # Points too far away for a bucket key cannot be close to any indexed point
+        inside = np.nonzero((np.abs(points) / self.tolerance < MAX_BUCKET - 1).all(axis=1))[0]
+        if len(self.keys) == 0 or len(inside) == 0:
+            return found
+
+        keys = bucket_keys(points[inside], self.tolerance)
+        best = np.full(len(inside), np.inf)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                wanted = neighbour_keys(keys, dx, dy)
+                start = np.searchsorted(self.keys, wanted, side='left')
+                stop = np.searchsorted(self.keys, wanted, side='right')
+                # Buckets hold more than one point only if the tolerance is far too large, check them one by one
+                for offset in range(int((stop - start).max())):
+                    query = np.nonzero(start + offset < stop)[0]
+                    candidate = self.order[start[query] + offset]
+                    distance = np.sqrt(((self.points[candidate] - points[inside[query]]) ** 2).sum(axis=1))
+                    closer = (distance <= self.tolerance) & (distance < best[query])
+                    found[inside[query[closer]]] = candidate[closer]
+                    best[query[closer]] = distance[closer]
+        return found
+
+
+'''
+Selection layer for one Abaqus part. The coordinates of all vertices are read once, the ones of the mesh nodes only
+when nodes are queried for the first time.
+'''
+class PartSelection(object):
+    def __init__(self, part, tolerance):
+        self.part = part
+        self.tolerance = tolerance
+        self.index = PointIndex([vertex.pointOn[0][:2] for vertex in part.vertices], tolerance)
+        self._node_index = None
+        self._node_labels = None
+
+    # Indices of the part vertices at the given points, a ValueError names the first point without a vertex
+    def vertex_numbers(self, points):
+        numbers = self.index.find(points)
+        missing = np.nonzero(numbers < 0)[0]
+        if len(missing):
+            raise ValueError('There is no vertex of ' + self.part.name + ' at ' +
+                             str(tuple(np.asarray(points, dtype=float).reshape(-1, 2)[missing[0]].tolist())))
+        return numbers
+
+    def vertices(self, points):
+        return self.part.vertices.getSequenceFromMask(mask=(mask_from_indices(self.vertex_numbers(points)),))
+
+    # Labels of the mesh nodes at the given points
+    def node_labels(self, points):
+        if self._node_index is None:
+            nodes = self.part.nodes
+            self._node_index = PointIndex([node.coordinates[:2] for node in nodes], self.tolerance)
+            self._node_labels = np.array([node.label for node in nodes], dtype=int)
+
+        numbers = self._node_index.find(points)
+        missing = np.nonzero(numbers < 0)[0]
+        if len(missing):
+            raise ValueError('There is no node of ' + self.part.name + ' at ' +
+                             str(tuple(np.asarray(points, dtype=float).reshape(-1, 2)[missing[0]].tolist())))
+        return self._node_labels[numbers]
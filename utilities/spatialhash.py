@@ -0,0 +1,104 @@
+'''
+Spatial hash for merging coincident nodes.
+
+Tiling unit cells or cutting bonds at cell borders produces the same node several times, each copy carrying its own
+floating point noise. Abaqus merges such points implicitly when they are drawn into one sketch, which does not scale
+to samples with millions of nodes. Here every point is put into a square bucket with the side length of the
+tolerance. Two points closer than the tolerance are then always in the same or in neighbouring buckets, so only the
+points of a bucket and of its 8 neighbours have to be compared instead of all pairs of points.
+
+Everything is done on whole arrays, there is no Python loop over the points. The tolerance should scale with the
+geometry, e.g. TOLERANCE * edge, and be far smaller than the shortest distance between two distinct nodes.
+'''
+import numpy as np
+
+
+# Bucket keys combine both bucket indices into one integer, the y index takes the lower 32 bits
+_SHIFT = 2 ** 32
+# Largest bucket index (in both directions) the keys can hold
+MAX_BUCKET = 2 ** 31 - 1
+
+# Half of the 8 neighbouring buckets, the other half is covered by looking from the other side
+_NEIGHBOURS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+
+# Returns the key of the bucket of every point
+def bucket_keys(points, tolerance):
+    buckets = np.floor(np.asarray(points, dtype=float) / tolerance).astype(np.int64)
+    if len(buckets) and np.abs(buckets).max() > MAX_BUCKET:
+        raise ValueError('The tolerance ' + repr(tolerance) + ' is too small for the extent of the points')
+    return buckets[:, 0] * _SHIFT + buckets[:, 1]
+
+
+# Returns the keys of the buckets dx buckets to the right and dy buckets above the given ones
+def neighbour_keys(keys, dx, dy):
+    return keys + dx * _SHIFT + dy
+
+
+'''
+Merges all points closer than the tolerance. Returns the merged points (n x 2), in the order of their first
+occurrence, and the remap array giving for every input point the index of its merged point, so that edges given by
+point indices are renumbered with remap[edges]. Points within the tolerance of each other are always merged, as all
+points of two neighbouring buckets are compared. Points in the same bucket (at most sqrt(2) tolerances apart) and
+chains of points with less than the tolerance between neighbours are merged into one point as well.
+'''
+def merge_points(points, tolerance):
+    points = np.asarray(points, dtype=float)
+    if len(points) == 0:
+        return points.reshape(0, 2), np.zeros(0, dtype=int)
+
+    keys, bucket = np.unique(bucket_keys(points, tolerance), return_inverse=True)
+    bucket = bucket.ravel()
+    # The points sorted by bucket: the points of bucket k are members[start[k]:start[k] + count[k]]
+    members = np.argsort(bucket, kind='mergesort')
+    count = np.bincount(bucket, minlength=len(keys))
+    start = np.cumsum(count) - count
+
+    # Links between occupied neighbouring buckets holding two points within the tolerance
+    linked = [], []
+    for dx, dy in _NEIGHBOURS:
+        wanted = neighbour_keys(keys, dx, dy)
+        position = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+        source = np.nonzero(keys[position] == wanted)[0]
+        target = position[source]
+        first, second, pair = _member_pairs(members, start, count, source, target)
+        close = np.sqrt(((points[first] - points[second]) ** 2).sum(axis=1)) <= tolerance
+        linked[0].append(source[np.unique(pair[close])])
+        linked[1].append(target[np.unique(pair[close])])
+
+    label = _connected_labels(len(keys), np.concatenate(linked[0]), np.concatenate(linked[1]))
+    node = label[bucket]
+
+    # Number the merged points by their first occurrence in the input
+    nodes, first_point, remap = np.unique(node, return_index=True, return_inverse=True)
+    order = np.argsort(first_point)
+    rank = np.empty(len(order), dtype=int)
+    rank[order] = np.arange(len(order))
+    return points[first_point[order]], rank[remap.ravel()]
+
+
+'''
+All pairs of points of the bucket pairs (source[k], target[k]). Returns the indices of both points of every pair
+and the index k of its bucket pair. Buckets hold only the few copies of one node, so there are few pairs.
+'''
+def _member_pairs(members, start, count, source, target):
+    per_pair = count[source] * count[target]
+    pair = np.repeat(np.arange(len(source)), per_pair)
+    within = np.arange(per_pair.sum()) - np.repeat(np.cumsum(per_pair) - per_pair, per_pair)
+    first = members[start[source[pair]] + within // count[target[pair]]]
+    second = members[start[target[pair]] + within % count[target[pair]]]
+    return first, second, pair
+
+
+# Labels every bucket with the smallest bucket index of its group of linked buckets
+def _connected_labels(count, source, target):
+    label = np.arange(count)
+    if len(source) == 0:
+        return label
+    while True:
+        previous = label.copy()
+        np.minimum.at(label, source, label[target])
+        np.minimum.at(label, target, label[source])
+        label = label[label]
+        if np.array_equal(label, previous):
+            return label
@@ -0,0 +1,52 @@
+'''
+Stand-in for the Abaqus solver command, for running the scheduler (utilities/scheduler.py) without a license:
+
+    LATTICE_SOLVER="python utilities/standin_solver.py"
+
+It takes the arguments of "abaqus job=<name> input=<file> cpus=<n> memory=<m>% interactive" and writes the files
+the real solver leaves behind in the working directory: <name>.lck while running, <name>.log ending with
+"Abaqus JOB <name> COMPLETED" or "Abaqus/Analysis exited with errors", and an empty <name>.odb. The run takes
+LATTICE_STANDIN_SECONDS [s] (default 0.2). Jobs named in LATTICE_STANDIN_ABORT (comma separated) and jobs whose input
+file is missing end with errors.
+'''
+import os
+import sys
+import time
+
+
+def arguments(argv):
+    options = {}
+    for argument in argv:
+        key, _, value = argument.partition('=')
+        options[key] = value
+    return options
+
+
+def main(argv):
+    options = arguments(argv)
+    name = options.get('job')
+    if not name:
+        sys.stderr.write('Usage: standin_solver.py job=<name> [input=<file>] [cpus=<n>] [memory=<m>%]\n')
+        return 2
+    input_file = options.get('input') or name + '.inp'
+    aborted = name in os.environ.get('LATTICE_STANDIN_ABORT', '').split(',') or not os.path.exists(input_file)
+
+    with open(name + '.lck', 'w'):
+        pass
+    with open(name + '.log', 'w') as log:
+        log.write('Abaqus JOB ' + name + '\n')
+        log.write('Run standard (cpus=' + options.get('cpus', '1') + ', memory=' + options.get('memory', '90%') +
+                  ')\n')
+        log.flush()
+        time.sleep(float(os.environ.get('LATTICE_STANDIN_SECONDS', '0.2')))
+        if aborted:
+            log.write('Abaqus/Analysis exited with errors\n')
+        else:
+            open(name + '.odb', 'wb').close()
+            log.write('Abaqus JOB ' + name + ' COMPLETED\n')
+    os.remove(name + '.lck')
+    return 1 if aborted else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
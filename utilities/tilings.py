@@ -0,0 +1,306 @@
+'''
+Analytic vertex coordinates of the Archimedean tilings.
+
+Every tiling is described by its vertex configuration, the two vectors spanning its periodic cell and the vertices
+inside that cell. All of them follow in closed form from the regular polygons meeting at each vertex, e.g. the
+dodecagons of 3.12.12 have the circumradius 1 / (2 sin 15deg) for an edge of 1. From this description the bonds of
+the infinite tiling are found as all vertex pairs at the distance of one edge, and the unit cell is cut out of it.
+
+The coordinates are computed for an edge length of 1 and scaled afterwards, so no rounding from a sketch or a table
+enters the geometry. The same arrays are used for the CAE part, the periodic boundary conditions and for checking
+the geometry against the vertex configuration.
+'''
+import math
+
+import numpy as np
+
+from utilities.spatialhash import merge_points
+
+
+SQRT2 = math.sqrt(2.0)
+SQRT3 = math.sqrt(3.0)
+
+# Relative tolerance (in edge lengths) for comparing distances and positions
+TOLERANCE = 1e-6
+
+
+# Vertices of a regular polygon around a center, with the first vertex in the direction of the given angle [deg]
+def _polygon(center, circumradius, corners, start_angle):
+    angles = np.radians(start_angle + 360.0 / corners * np.arange(corners))
+    return np.asarray(center, float) + circumradius * np.column_stack((np.cos(angles), np.sin(angles)))
+
+
+def _square():
+    return np.array([[1.0, 0.0], [0.0, 1.0]]), np.array([[0.0, 0.0]])
+
+
+def _honeycomb():
+    # Two rows of vertical bonds shifted by half a hexagon
+    vectors = np.array([[SQRT3, 0.0], [0.0, 3.0]])
+    basis = np.array([[0.0, 0.0], [0.0, 1.0], [SQRT3 / 2.0, 1.5], [SQRT3 / 2.0, 2.5]])
+    return vectors, basis
+
+
+def _triangular():
+    return np.array([[1.0, 0.0], [0.0, SQRT3]]), np.array([[0.0, 0.0], [0.5, SQRT3 / 2.0]])
+
+
+def _cavo():
+    # Squares standing on a corner, connected by the bonds between two octagons
+    a = 1.0 + SQRT2
+    return np.array([[a, 0.0], [0.0, a]]), _polygon((0.0, 0.0), 1.0 / SQRT2, 4, 0.0)
+
+
+def _star():
+    # Triangles on the vertices of a honeycomb pointing at the neighbouring triangles
+    a = 2.0 + SQRT3
+    up = np.array([a / 2.0, a / (2.0 * SQRT3)])
+    down = np.array([a / 2.0, -a / (2.0 * SQRT3)])
+    shift = np.array([a / 2.0, a * SQRT3 / 2.0])
+    triangles = [_polygon(center, 1.0 / SQRT3, 3, start)
+                 for center, start in ((up, -90.0), (up + shift, -90.0), (down, 90.0), (down + shift, 90.0))]
+    return np.array([[a, 0.0], [0.0, a * SQRT3]]), np.vstack(triangles)
+
+
+def _srcubo():
+    # Checkerboard of squares rotated by +-15deg which share their corners, the gaps are triangles
+    a = 2.0 * math.cos(math.radians(15.0))
+    squares = [_polygon((0.0, 0.0), 1.0 / SQRT2, 4, 60.0), _polygon((a / 2.0, a / 2.0), 1.0 / SQRT2, 4, 30.0)]
+    return np.array([[a, 0.0], [0.0, a]]), np.vstack(squares)
+
+
+def _kagome():
+    triangle = np.array([[0.0, 0.0], [1.0, 0.0], [0.5, SQRT3 / 2.0]])
+    return np.array([[2.0, 0.0], [0.0, 2.0 * SQRT3]]), np.vstack((triangle, triangle + [1.0, SQRT3]))
+
+
+def _bounce():
+    # Hexagons on a triangular lattice, the bonds between them form the squares
+    a = 1.0 + SQRT3
+    hexagons = [_polygon((0.0, 0.0), 1.0, 6, 30.0), _polygon((a / 2.0, a * SQRT3 / 2.0), 1.0, 6, 30.0)]
+    return np.array([[a, 0.0], [0.0, a * SQRT3]]), np.vstack(hexagons)
+
+
+def _trellis():
+    # Rows of squares separated by rows of triangles, every second row shifted by half an edge
+    h = 1.0 + SQRT3 / 2.0
+    basis = np.array([[0.0, 0.0], [0.0, 1.0], [0.5, h], [0.5, h + 1.0]])
+    return np.array([[1.0, 0.0], [0.0, 2.0 * h]]), basis
+
+
+def _shd():
+    # Dodecagons on a triangular lattice, the bonds between them form the squares and hexagons
+    a = 3.0 + SQRT3
+    r = 1.0 / (2.0 * math.sin(math.radians(15.0)))
+    dodecagons = [_polygon((0.0, 0.0), r, 12, 15.0), _polygon((a / 2.0, a * SQRT3 / 2.0), r, 12, 15.0)]
+    return np.array([[a, 0.0], [0.0, a * SQRT3]]), np.vstack(dodecagons)
+
+
+def _maple_leaf():
+    # Triangular lattice with every seventh vertex removed, which leaves hexagons on a triangular lattice of spacing
+    # sqrt(7). The lattice is turned by atan(sqrt(3) / 5) so that this spacing lies along x and the cell is a rectangle.
+    a = math.sqrt(7.0)
+    turn = -math.degrees(math.atan2(SQRT3, 5.0))
+    hexagons = [_polygon((0.0, 0.0), 1.0, 6, turn), _polygon((a / 2.0, a * SQRT3 / 2.0), 1.0, 6, turn)]
+    return np.array([[a, 0.0], [0.0, a * SQRT3]]), np.vstack(hexagons)
+
+
+'''
+The tilings of Shimada et al. with their vertex configuration and the shift of the lattice inside the unit cell.
+The shift (in fractions of the cell vectors) keeps all vertices away from the boundary of the cell and makes every
+cut bond leave the cell far away from its corners.
+'''
+TILINGS = {
+    'a': {'configuration': '4.4.4.4', 'lattice': _square, 'shift': (0.5, 0.5)},
+    'b': {'configuration': '6.6.6', 'lattice': _honeycomb, 'shift': (0.25, 5.0 / 6.0)},
+    'c': {'configuration': '3.3.3.3.3.3', 'lattice': _triangular, 'shift': (0.25, 0.375)},
+    'd': {'configuration': '4.8.8', 'lattice': _cavo, 'shift': (0.5, 0.5)},
+    'e': {'configuration': '3.12.12', 'lattice': _star, 'shift': (0.75, 0.5)},
+    'f': {'configuration': '3.3.4.3.4', 'lattice': _srcubo, 'shift': (0.0, 0.0)},
+    'g': {'configuration': '3.6.3.6', 'lattice': _kagome, 'shift': (0.125, 7.0 / 12.0)},
+    'h': {'configuration': '3.4.6.4', 'lattice': _bounce, 'shift': (1.0 / 12.0, 0.0)},
+    'i': {'configuration': '3.3.3.4.4', 'lattice': _trellis, 'shift': (0.25, 1.0 / 3.0)},
+    'j': {'configuration': '3.3.3.3.6', 'lattice': _maple_leaf, 'shift': (0.5, 0.5)},
+    'k': {'configuration': '4.6.12', 'lattice': _shd, 'shift': (0.0, 0.0)},
+}
+
+
+'''
+Returns the cell vectors (as rows) and the vertices of the cell. All vertices are wrapped into the cell and
+vertices shared by two polygons (e.g. the corners of the squares in 3.3.4.3.4) are only kept once.
+'''
+def lattice(structure):
+    tiling = TILINGS[structure]
+    vectors, basis = tiling['lattice']()
+    basis = basis + np.dot(tiling['shift'], vectors)
+
+    fractions = np.linalg.solve(vectors.T, basis.T).T
+    fractions -= np.floor(fractions + TOLERANCE)
+    fractions[fractions > 1.0 - TOLERANCE] = 0.0
+    return vectors, merge_points(np.dot(fractions, vectors), TOLERANCE)[0]
+
+
+'''
+Finds all bonds of the infinite tiling as pairs of vertices at the distance of one edge. A bond is returned as
+(i, j, n1, n2): vertex i of the cell is connected to vertex j of the cell shifted by n1 and n2 cell vectors.
+Every bond is listed once.
+'''
+def bonds(vectors, basis):
+    shifts = np.array([(n1, n2) for n1 in (-1, 0, 1) for n2 in (-1, 0, 1)])
+    images = basis[None, :, :] + np.dot(shifts, vectors)[:, None, :]
+    distance = np.sqrt(((images[:, None, :, :] - basis[None, :, None, :]) ** 2).sum(axis=-1))
+    shift, i, j = np.nonzero(np.abs(distance - 1.0) < TOLERANCE)
+
+    found = np.column_stack((i, j, shifts[shift]))
+    # Keep one direction of every bond: i < j, or for bonds between images of the same vertex a positive shift
+    keep = (found[:, 0] < found[:, 1]) | ((found[:, 0] == found[:, 1]) &
+                                          ((found[:, 2] > 0) | ((found[:, 2] == 0) & (found[:, 3] > 0))))
+    return found[keep]
+
+
+'''
+Checks every vertex of the cell against the vertex configuration and raises a ValueError for the first one which
+does not match. The polygon between two neighbouring bonds follows from the angle between them (interior angle
+(n - 2) * 180 / n), and the polygons around a vertex have to be the ones of the configuration in the same cyclic
+order. Called by unit_cell, so a wrong lattice description never reaches the model.
+'''
+def check_vertex_configuration(structure, vectors, basis, found):
+    expected = [int(n) for n in TILINGS[structure]['configuration'].split('.')]
+    orders = [expected[k:] + expected[:k] for k in range(len(expected))]
+    orders += [order[::-1] for order in orders]
+
+    directions = [[] for vertex in basis]
+    for i, j, n1, n2 in found:
+        bond = basis[j] + n1 * vectors[0] + n2 * vectors[1] - basis[i]
+        directions[i].append(math.atan2(bond[1], bond[0]))
+        directions[j].append(math.atan2(-bond[1], -bond[0]))
+
+    for vertex, angles in enumerate(directions):
+        angles = np.sort(np.degrees(angles))
+        gaps = np.diff(np.append(angles, angles[0] + 360.0))
+        polygons = [int(round(360.0 / (180.0 - gap))) if gap < 180.0 - TOLERANCE else 0 for gap in gaps]
+        if polygons not in orders:
+            raise ValueError('Vertex ' + str(vertex) + ' of structure ' + structure + ' is surrounded by ' +
+                             '.'.join(str(n) for n in polygons) + ' instead of ' +
+                             TILINGS[structure]['configuration'])
+
+
+'''
+Cuts the unit cell out of the infinite tiling. Every bond is split where it crosses the boundary of the cell and
+each piece is moved back into the cell by whole cell vectors. The cut points become the vertices on the boundary.
+Returns the vertices (interior vertices first) and the edges as index pairs.
+'''
+def cut_cell(vectors, basis, cell_bonds):
+    inverse = np.linalg.inv(vectors.T)
+    points = []
+    pieces = []
+    for i, j, n1, n2 in cell_bonds:
+        start = basis[i]
+        end = basis[j] + n1 * vectors[0] + n2 * vectors[1]
+        frac_start, frac_end = np.dot(inverse, start), np.dot(inverse, end)
+
+        # Bond parameters at which the bond crosses a line of the cell grid
+        steps = [0.0, 1.0]
+        for axis in (0, 1):
+            delta = frac_end[axis] - frac_start[axis]
+            if abs(delta) < TOLERANCE:
+                continue
+            low, high = sorted((frac_start[axis], frac_end[axis]))
+            for line in range(int(math.floor(low)) + 1, int(math.ceil(high))):
+                steps.append((line - frac_start[axis]) / delta)
+        steps = sorted(steps)
+
+        for t0, t1 in zip(steps[:-1], steps[1:]):
+            if t1 - t0 < TOLERANCE:
+                continue
+            p0 = start + t0 * (end - start)
+            p1 = start + t1 * (end - start)
+            home = np.floor(np.dot(inverse, (p0 + p1) / 2.0))
+            offset = np.dot(home, vectors)
+            pieces.append((len(points), len(points) + 1))
+            points.extend((p0 - offset, p1 - offset))
+
+    vertices, remap = merge_points(np.vstack((basis, points)), TOLERANCE)
+    edges = remap[len(basis) + np.array(pieces)]
+    # Order the vertices like the catalog: interior vertices first, both groups by y and then by x
+    rounded = np.round(vertices / TOLERANCE)
+    order = np.lexsort((rounded[:, 0], rounded[:, 1], np.arange(len(vertices)) >= len(basis)))
+    rank = np.empty(len(order), dtype=int)
+    rank[order] = np.arange(len(order))
+    edges = np.sort(rank[edges], axis=1)
+    edges = edges[np.lexsort((edges[:, 1], edges[:, 0]))]
+    return vertices[order], edges
+
+
+'''
+Returns the vertices (n x 2) and edges (m x 2) of the periodic unit cell of a structure scaled to the edge length,
+together with the two cell vectors.
+'''
+def unit_cell(structure, edge):
+    vectors, basis = lattice(structure)
+    cell_bonds = bonds(vectors, basis)
+    check_vertex_configuration(structure, vectors, basis, cell_bonds)
+    vertices, edges = cut_cell(vectors, basis, cell_bonds)
+    return edge * vertices, edges, edge * vectors
+
+
+'''
+Tiles a unit cell n times along the first and m times along the second cell vector. All copies are created in one
+vectorized translation, the cut points on the shared borders of neighbouring cells are merged and the two halves of
+every bond crossing such a border are joined again into one edge. Only the cut points on the outer boundary of the
+sample remain. Returns the vertices, the edges and the cell vectors of the whole sample.
+'''
+def supercell(vertices, edges, vectors, n, m):
+    if (n, m) == (1, 1):
+        return vertices, edges, vectors
+
+    grid = np.array([(i, j) for j in range(m) for i in range(n)], dtype=float)
+    offsets = np.dot(grid, vectors)
+    all_vertices = (vertices[None, :, :] + offsets[:, None, :]).reshape(-1, 2)
+    all_edges = (edges[None, :, :] + len(vertices) * np.arange(len(grid))[:, None, None]).reshape(-1, 2)
+
+    scale = np.sqrt(np.abs(np.linalg.det(vectors)))
+    merged, remap = merge_points(all_vertices, TOLERANCE * scale)
+    merged_vertices, merged_edges = join_cut_bonds(merged, remap[all_edges])
+    return merged_vertices, merged_edges, np.array([n * vectors[0], m * vectors[1]])
+
+
+'''
+Removes every vertex connected to exactly two edges and replaces the two edges by one. In a tiled sample these are
+the former cut points between two cells, as every vertex of an Archimedean tiling has at least three bonds.
+Bonds cut twice (near a corner of the unit cell) need a second pass.
+'''
+def join_cut_bonds(vertices, edges):
+    while True:
+        degree = np.bincount(edges.ravel(), minlength=len(vertices))
+        # Only join at vertices whose neighbours are no joints themselves, so that each pass is unambiguous
+        joint = degree == 2
+        at_joint = joint[edges]
+        candidates = np.nonzero(joint)[0]
+        if len(candidates) == 0:
+            break
+
+        # The two edges of every joint and the vertices at their far ends
+        owner = np.concatenate((np.nonzero(at_joint[:, 0])[0], np.nonzero(at_joint[:, 1])[0]))
+        joint_of = np.concatenate((edges[at_joint[:, 0], 0], edges[at_joint[:, 1], 1]))
+        other_end = np.concatenate((edges[at_joint[:, 0], 1], edges[at_joint[:, 1], 0]))
+        order = np.argsort(joint_of, kind='mergesort')
+        joint_of, owner, other_end = joint_of[order], owner[order], other_end[order]
+
+        first, second = other_end[0::2], other_end[1::2]
+        usable = ~joint[first] & ~joint[second]
+        if not usable.any():
+            usable[0] = True
+        removed_edges = np.concatenate((owner[0::2][usable], owner[1::2][usable]))
+        keep = np.ones(len(edges), dtype=bool)
+        keep[removed_edges] = False
+        edges = np.vstack((edges[keep], np.column_stack((first[usable], second[usable]))))
+
+        if usable.all():
+            break
+
+    # Drop the vertices which are no longer used and renumber the edges
+    used = np.zeros(len(vertices), dtype=bool)
+    used[edges.ravel()] = True
+    index = np.cumsum(used) - 1
+    return vertices[used], index[edges]
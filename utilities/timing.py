@@ -0,0 +1,146 @@
+'''
+Timing of the stages of the model build.
+
+Every function decorated with @timed is a stage. For each call of a stage the wall time, the CPU time of the
+process, the peak resident memory of the process so far and the number of CAE API calls made during the stage are
+collected. Stages may be nested, the numbers of a stage then include the ones of the stages it calls. After a run
+write_run() appends one JSON line with all stages of the run to the timings file, and summary_table() sums up the
+stages of many runs, e.g. of a whole sweep:
+
+    python utilities/timing.py timings.jsonl
+
+The API calls are counted where a counter is set with set_call_counter(), which the recording stand-in of the API
+(utilities/abaqus_standin) does. Inside CAE they are reported as None: counting them there would need a proxy around
+mdb and session, and such proxies would be handed back into the API as regions and parts, which CAE refuses.
+The peak memory comes from getrusage on Linux and macOS and from GetProcessMemoryInfo on Windows.
+'''
+import functools
+import json
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+_stages = []
+_call_counter = [None]
+
+
+# counter() returns the number of API calls made so far
+def set_call_counter(counter):
+    _call_counter[0] = counter
+
+
+# Peak resident memory of the process [MB], None where the platform does not tell
+def peak_rss():
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        return peak / (1024.0 * 1024.0) if sys.platform == 'darwin' else peak / 1024.0
+    if sys.platform == 'win32':
+        return _windows_peak_rss()
+    return None
+
+
+# Peak working set of the process [MB] from GetProcessMemoryInfo, None if the call fails
+def _windows_peak_rss():
+    import ctypes
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD)] + [
+            (name, ctypes.c_size_t) for name in ('PeakWorkingSetSize', 'WorkingSetSize', 'QuotaPeakPagedPoolUsage',
+                                                 'QuotaPagedPoolUsage', 'QuotaPeakNonPagedPoolUsage',
+                                                 'QuotaNonPagedPoolUsage', 'PagefileUsage', 'PeakPagefileUsage')]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    kernel32 = ctypes.windll.kernel32
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    try:
+        # Windows 7 and later export the function from kernel32, older ones only from psapi
+        get_info = kernel32.K32GetProcessMemoryInfo
+    except AttributeError:
+        get_info = ctypes.windll.psapi.GetProcessMemoryInfo
+    get_info.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+    if not get_info(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+        return None
+    return counters.PeakWorkingSetSize / (1024.0 * 1024.0)
+
+
+def _cpu_time():
+    times = os.times()
+    return times[0] + times[1]
+
+
+def _api_calls():
+    return _call_counter[0]() if _call_counter[0] is not None else None
+
+
+def timed(function):
+    @functools.wraps(function)
+    def stage(*args, **kwargs):
+        calls, cpu, start = _api_calls(), _cpu_time(), time.time()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            after = _api_calls()
+            _stages.append({'stage': function.__name__, 'wall': time.time() - start, 'cpu': _cpu_time() - cpu,
+                            'peak_rss_mb': peak_rss(), 'api_calls': after - calls if calls is not None else None})
+    return stage
+
+
+# Returns the stages recorded since the last call and starts over
+def collect_stages():
+    stages = list(_stages)
+    del _stages[:]
+    return stages
+
+
+# Appends {"run": ..., "stages": [...]} with the stages since the last call as one line to the file and returns it
+def write_run(path, run):
+    record = {'run': run, 'stages': collect_stages()}
+    with open(path, 'a') as timings:
+        timings.write(json.dumps(record, sort_keys=True) + '\n')
+    return record
+
+
+def read_runs(path):
+    with open(path) as timings:
+        return [json.loads(line) for line in timings if line.strip()]
+
+
+# Table of the calls, total and mean wall time, CPU time, API calls and highest peak memory of every stage
+def summary_table(records):
+    stages = {}
+    for record in records:
+        for entry in record['stages']:
+            total = stages.setdefault(entry['stage'], {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'api_calls': None,
+                                                       'peak_rss_mb': None})
+            total['calls'] += 1
+            total['wall'] += entry['wall']
+            total['cpu'] += entry['cpu']
+            if entry.get('api_calls') is not None:
+                total['api_calls'] = (total['api_calls'] or 0) + entry['api_calls']
+            if entry['peak_rss_mb'] is not None:
+                total['peak_rss_mb'] = max(total['peak_rss_mb'] or 0.0, entry['peak_rss_mb'])
+
+    lines = ['%-32s %6s %10s %10s %10s %10s %10s' % ('stage', 'calls', 'wall [s]', 'mean [s]', 'cpu [s]',
+                                                      'api calls', 'peak [MB]')]
+    for name, total in sorted(stages.items(), key=lambda item: -item[1]['wall']):
+        lines.append('%-32s %6d %10.3f %10.3f %10.3f %10s %10s' % (
+            name, total['calls'], total['wall'], total['wall'] / total['calls'], total['cpu'],
+            '-' if total['api_calls'] is None else '%d' % total['api_calls'],
+            '-' if total['peak_rss_mb'] is None else '%.1f' % total['peak_rss_mb']))
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        sys.stderr.write('Usage: python utilities/timing.py <timings.jsonl>\n')
+        sys.exit(2)
+    print(summary_table(read_runs(sys.argv[1])))
@@ -0,0 +1,252 @@
+'''
+Work queue on a shared directory, for running one sweep on several workstations without a cluster manager.
+
+Every run is a JSON file, and its state is the folder it is in:
+    pending/<key>.json               waiting for a worker
+    claimed/<key>@<worker>.json      being built and solved by the worker
+    done/<key>.json, failed/<key>.json   the run together with its result (job, ODB, wall time, worker)
+A worker claims a run by renaming it from pending/ to claimed/. A rename is atomic, also on NFS, so exactly one of
+several workers asking for the same run gets it. While it works on a run, a worker touches heartbeats/<worker>
+every HEARTBEAT seconds. A claim whose worker has not been heard of for STALE_AFTER seconds is moved back to
+pending/ by any other worker, so the run of a crashed workstation is picked up again. If its worker was only late
+and completes the run after all, the run is not run a second time: a completed run is removed from pending/, and a
+run which is in done/ is never handed out by a claim. The times are compared with the modification time of a
+freshly touched file in the queue, so the clocks of the workstations need not agree.
+
+Inside CAE a worker is started with LATTICE_QUEUE=<directory> (see run_worker in main.py). Without Abaqus, the
+command line of this module enqueues runs, shows the state of a queue and starts stand-in workers, which run the
+solver command (e.g. utilities/standin_solver.py) on a dummy input file:
+    python utilities/workqueue.py enqueue <queue> runs.json
+    python utilities/workqueue.py work <queue> "python utilities/standin_solver.py"
+    python utilities/workqueue.py status <queue>
+'''
+import json
+import os
+import shlex
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+if __name__ == '__main__':
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.jobnames import allocate_job_name
+from utilities.manifest import run_key
+
+
+# Seconds between two heartbeats of a worker, and without heartbeat after which its claims are taken back
+HEARTBEAT = 10.0
+STALE_AFTER = 60.0
+
+FOLDERS = ('pending', 'claimed', 'done', 'failed', 'heartbeats')
+
+
+# Name of a worker, unique across the workstations sharing the queue
+def worker_name():
+    return socket.gethostname() + '-' + str(os.getpid())
+
+
+class WorkQueue(object):
+    def __init__(self, directory, heartbeat=None, stale_after=None):
+        self.directory = directory
+        self.heartbeat = float(heartbeat or os.environ.get('LATTICE_QUEUE_HEARTBEAT') or HEARTBEAT)
+        self.stale_after = float(stale_after or os.environ.get('LATTICE_QUEUE_STALE') or STALE_AFTER)
+        for folder in FOLDERS:
+            path = os.path.join(directory, folder)
+            if not os.path.isdir(path):
+                try:
+                    os.makedirs(path)
+                except OSError:
+                    # Created by another worker in the meantime
+                    if not os.path.isdir(path):
+                        raise
+
+    def folder(self, name):
+        return os.path.join(self.directory, name)
+
+    # Adds the runs which are neither queued nor done, failed runs are queued again. Returns the number added.
+    def enqueue(self, runs):
+        known = set(name.split('.')[0].split('@')[0] for folder in ('pending', 'claimed', 'done')
+                    for name in os.listdir(self.folder(folder)))
+        added = 0
+        for run in runs:
+            key = run_key(run)
+            if key in known:
+                continue
+            known.add(key)
+            self._write(os.path.join(self.folder('pending'), key + '.json'), {'key': key, 'run': run})
+            failed = os.path.join(self.folder('failed'), key + '.json')
+            if os.path.exists(failed):
+                os.remove(failed)
+            added += 1
+        return added
+
+    '''
+    Returns (claim file, entry) of the next pending run, or None if there is none. A run taken back from a worker
+    which was only late and has completed it meanwhile is done already, its claim is dropped instead of returned.
+    '''
+    def claim(self, worker):
+        for name in sorted(os.listdir(self.folder('pending'))):
+            if not name.endswith('.json'):
+                continue
+            claimed = os.path.join(self.folder('claimed'), name[:-len('.json')] + '@' + worker + '.json')
+            try:
+                os.rename(os.path.join(self.folder('pending'), name), claimed)
+            except OSError:
+                # Another worker was faster
+                continue
+            if os.path.exists(os.path.join(self.folder('done'), name)):
+                _remove(claimed)
+                continue
+            with open(claimed) as source:
+                return claimed, json.load(source)
+        return None
+
+    # Writes the result of a claimed run to done/ or failed/ and drops the claim
+    def complete(self, claimed, entry, result):
+        entry = dict(entry, result=result)
+        folder = 'done' if result.get('state') == 'done' else 'failed'
+        self._write(os.path.join(self.folder(folder), entry['key'] + '.json'), entry)
+        # The claim may have been taken back as stale meanwhile, a done run is not queued once more
+        _remove(claimed)
+        if folder == 'done':
+            _remove(os.path.join(self.folder('pending'), entry['key'] + '.json'))
+
+    def beat(self, worker):
+        with open(os.path.join(self.folder('heartbeats'), worker), 'w') as heartbeat:
+            heartbeat.write(str(time.time()))
+
+    # Moves the claims of workers without heartbeat for stale_after seconds back to pending/, returns their number
+    def recover_stale(self):
+        now = self._now()
+        recovered = 0
+        for name in os.listdir(self.folder('claimed')):
+            key, _, worker = name[:-len('.json')].partition('@')
+            # A worker which never got to its first heartbeat is judged by the time of its claim
+            last = None
+            for path in (os.path.join(self.folder('heartbeats'), worker), os.path.join(self.folder('claimed'), name)):
+                try:
+                    last = os.path.getmtime(path)
+                    break
+                except OSError:
+                    pass
+            if last is None or now - last <= self.stale_after:
+                continue
+            try:
+                os.rename(os.path.join(self.folder('claimed'), name), os.path.join(self.folder('pending'),
+                                                                                  key + '.json'))
+                recovered += 1
+            except OSError:
+                pass
+        return recovered
+
+    # Number of runs in every folder
+    def status(self):
+        return [(folder, len([name for name in os.listdir(self.folder(folder)) if name.endswith('.json')]))
+                for folder in FOLDERS[:-1]]
+
+    '''
+    Claims and processes runs until the queue is empty. process(run) builds and solves one run and returns its
+    result, a dict with at least 'state' ('done' or 'failed'). While runs of other workers are still claimed, the
+    worker waits, in case it has to take them over.
+    '''
+    def work(self, worker, process):
+        processed = 0
+        while True:
+            self.recover_stale()
+            claim = self.claim(worker)
+            if claim is None:
+                if not os.listdir(self.folder('claimed')):
+                    return processed
+                time.sleep(self.heartbeat)
+                continue
+
+            claimed, entry = claim
+            start = time.time()
+            with Heartbeat(self, worker):
+                try:
+                    result = process(entry['run'])
+                except Exception as error:
+                    result = {'state': 'failed', 'error': repr(error)}
+            result.update(worker=worker, wall_time=time.time() - start)
+            self.complete(claimed, entry, result)
+            processed += 1
+
+    # Modification time of a freshly touched file, i.e. the current time of the file server
+    def _now(self):
+        path = os.path.join(self.folder('heartbeats'), '.now')
+        with open(path, 'w'):
+            pass
+        return os.path.getmtime(path)
+
+    # Written to a temporary file first, so that nobody reads a half written file
+    def _write(self, path, data):
+        handle, temporary = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path))
+        with os.fdopen(handle, 'w') as target:
+            json.dump(data, target, sort_keys=True)
+        os.rename(temporary, path)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# Touches the heartbeat of a worker from a background thread while the body of the with statement runs
+class Heartbeat(object):
+    def __init__(self, queue, worker):
+        self.queue = queue
+        self.worker = worker
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._beat)
+        self.thread.daemon = True
+
+    def __enter__(self):
+        self.queue.beat(self.worker)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exception):
+        self.stopped.set()
+        self.thread.join()
+
+    def _beat(self):
+        while not self.stopped.wait(self.queue.heartbeat):
+            self.queue.beat(self.worker)
+
+
+# Stand-in for a CAE worker: writes the run as input file into the working directory and runs the solver command
+def standin_process(command, directory):
+    def process(run):
+        job_name = allocate_job_name(directory)
+        with open(os.path.join(directory, job_name + '.inp'), 'w') as deck:
+            deck.write('** ' + json.dumps(run, sort_keys=True) + '\n')
+        code = subprocess.call(shlex.split(command) + ['job=' + job_name, 'interactive'], cwd=directory)
+        return {'state': 'done' if code == 0 else 'failed', 'job': job_name,
+                'odb': os.path.join(directory, job_name + '.odb')}
+    return process
+
+
+def main(argv):
+    if len(argv) < 2 or argv[0] not in ('enqueue', 'work', 'status'):
+        sys.stderr.write(__doc__)
+        return 2
+    queue = WorkQueue(argv[1])
+    if argv[0] == 'enqueue':
+        from utilities.runspec import load_run_specs
+        print(str(queue.enqueue(load_run_specs(argv[2]))) + ' runs added')
+    elif argv[0] == 'work':
+        command = argv[2] if len(argv) > 2 else sys.executable + ' ' + os.path.join(os.path.dirname(
+            os.path.abspath(__file__)), 'standin_solver.py')
+        print(str(queue.work(worker_name(), standin_process(command, os.getcwd()))) + ' runs processed')
+    print(', '.join(folder + ' ' + str(count) for folder, count in queue.status()))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))